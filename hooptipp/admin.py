@@ -0,0 +1,55 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Job, JobSchedule, OutboundEmail
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'recipient_display', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject', 'idempotency_key', 'recipients')
+    readonly_fields = ('idempotency_key', 'attempts', 'last_error', 'sent_at', 'created_at', 'updated_at')
+    date_hierarchy = 'created_at'
+    ordering = ('-created_at',)
+    actions = ['retry_now']
+
+    def recipient_display(self, obj):
+        return ', '.join(obj.recipients)
+    recipient_display.short_description = 'Recipients'
+
+    @admin.action(description='Retry selected emails now')
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboundEmail.Status.SENT).update(
+            status=OutboundEmail.Status.PENDING,
+            next_attempt_at=timezone.now(),
+        )
+        self.message_user(request, f'{updated} email(s) queued for immediate retry.')
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'progress', 'progress_message', 'attempts', 'run_at', 'started_at', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'dedup_key', 'progress_message', 'last_error')
+    readonly_fields = (
+        'attempts', 'locked_by', 'locked_until', 'progress', 'progress_message', 'result',
+        'last_error', 'started_at', 'finished_at', 'created_at', 'updated_at',
+    )
+    date_hierarchy = 'created_at'
+    ordering = ('-created_at',)
+    actions = ['retry_now']
+
+    @admin.action(description='Run selected jobs again now')
+    def retry_now(self, request, queryset):
+        updated = queryset.filter(status__in=[Job.Status.FAILED, Job.Status.QUEUED]).update(
+            status=Job.Status.QUEUED,
+            run_at=timezone.now(),
+        )
+        self.message_user(request, f'{updated} job(s) queued to run now.')
+
+
+@admin.register(JobSchedule)
+class JobScheduleAdmin(admin.ModelAdmin):
+    list_display = ('name', 'next_run_at', 'last_enqueued_at')
+    ordering = ('name',)
@@ -11,7 +11,6 @@ from django.contrib.auth.forms import PasswordResetForm, SetPasswordForm
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth.views import LoginView, PasswordResetDoneView, PasswordResetConfirmView, PasswordResetCompleteView
 from django.core.cache import cache
-from django.core.mail import send_mail
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
@@ -21,6 +20,7 @@ from django.views.decorators.http import require_http_methods
 from django.views.generic import FormView
 
 from hooptipp.email_verification import send_verification_email, verify_email_token
+from hooptipp.mail_outbox import queue_mail
 from hooptipp.predictions.models import UserPreferences
 
 
@@ -379,15 +379,15 @@ class CustomPasswordResetView(FormView):
         html_message = render_to_string(self.email_template_name, context)
         plain_message = render_to_string('emails/password_reset_email.txt', context)
         
-        # Send email using the same method as verification emails
+        # Queue email using the same method as verification emails
         from_email = django_settings.DEFAULT_FROM_EMAIL
-        send_mail(
+        queue_mail(
             subject=subject,
             message=plain_message,
             from_email=from_email,
             recipient_list=[user.email],
             html_message=html_message,
-            fail_silently=False,
+            idempotency_key=f'password-reset:{user.pk}:{token}',
         )
 
 
@@ -9,6 +9,8 @@ from urllib.parse import urljoin
 
 import requests
 
+from hooptipp.request_metrics import track_external_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,7 +61,8 @@ class SlapiClient:
         url = urljoin(self.base_url, endpoint)
         
         try:
-            response = self.session.get(url, params=params, timeout=90)
+            with track_external_call('slapi'):
+                response = self.session.get(url, params=params, timeout=90)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -635,14 +635,7 @@ class DbbEventSource(EventSource):
                     f'{home_team} {correct_home_score}, {away_team} {correct_away_score}'
                 )
                 outcome.save(update_fields=['metadata', 'winning_option', 'winning_generic_option', 'notes'])
-                
-                # Re-score the event since the winner might have changed
-                try:
-                    from hooptipp.predictions.scoring_service import score_event_outcome
-                    score_event_outcome(outcome)
-                    logger.info(f'Re-scored event after fixing swapped scores: {outcome.prediction_event.name}')
-                except Exception as e:
-                    logger.warning(f'Failed to re-score event after fixing swapped scores: {e}')
+                # Saving a changed winner requests a rescore (see predictions.scoring_queue)
                 
                 return True
         
@@ -0,0 +1,6 @@
+"""Background jobs of the DBB app (see :mod:`hooptipp.jobs`)."""
+
+from hooptipp.jobs import register_command
+
+register_command('update_dbb_matches')
+register_command('process_dbb_results')
@@ -16,6 +16,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from hooptipp.predictions.models import EventOutcome, PredictionEvent, PredictionOption
+from hooptipp.predictions.scoring_queue import scoring_batch
 from hooptipp.dbb.models import DbbMatch
 from hooptipp.dbb.client import build_slapi_client
 
@@ -38,6 +39,7 @@ class Command(BaseCommand):
             help='Look back N hours for completed matches (default: 72)',
         )
 
+    @scoring_batch()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         hours_back = options['hours_back']
@@ -332,21 +334,8 @@ class Command(BaseCommand):
                 notes=f'Auto-generated from match result. Final score: {home_team} {home_score}, {away_team} {away_score}'
             )
 
-            # Auto-score the event
-            try:
-                from hooptipp.predictions.scoring_service import score_event_outcome
-                score_result = score_event_outcome(outcome)
-
-                if score_result.created_count or score_result.updated_count:
-                    self.stdout.write(
-                        f'  Auto-scored: {score_result.created_count} created, {score_result.updated_count} updated scores'
-                    )
-                else:
-                    self.stdout.write('  Auto-scored: No new scores (already scored)')
-
-            except Exception as e:
-                logger.warning(f'Failed to auto-score {event.name}: {e}')
-                self.stdout.write(f'  Warning: Failed to auto-score: {e}')
+            # Saving the outcome requests scoring (see predictions.scoring_queue)
+            self.stdout.write('  Scoring requested')
 
         return 'processed'
 
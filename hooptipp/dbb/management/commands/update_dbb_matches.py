@@ -19,6 +19,7 @@ from hooptipp.dbb.models import TrackedLeague
 from hooptipp.dbb.event_source import DbbEventSource
 from hooptipp.predictions.models import EventOutcome, UserTip
 from hooptipp.predictions.lock_service import LockService
+from hooptipp.predictions.scoring_queue import scoring_batch
 from hooptipp.predictions.event_sources.base import RescheduledEvent
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ class Command(BaseCommand):
             help='Only update matches for a specific league ID',
         )
 
+    @scoring_batch()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         league_id = options.get('league_id')
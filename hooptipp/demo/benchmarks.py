@@ -0,0 +1,164 @@
+"""Microbenchmarks for the prediction hot paths.
+
+Each benchmark size generates a synthetic league (see :mod:`hooptipp.demo.synthetic`)
+inside a transaction, times every hot path and counts its SQL queries, then
+rolls the transaction back so the database is left untouched.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from io import StringIO
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from hooptipp.predictions.lock_service import LockService
+from hooptipp.predictions.models import EventOutcome
+from hooptipp.predictions.scoring_service import process_all_user_scores, score_event_outcome
+from hooptipp.request_metrics import RequestMetrics
+
+from .synthetic import SOURCE_ID, USERNAME_PREFIX, generate_synthetic_league
+
+BENCHMARK_NAMES = (
+    'home',
+    'score_event_outcome',
+    'process_all_user_scores',
+    'lock_service_refresh',
+    'send_reminder_emails',
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing and query count for one hot path at one league size."""
+
+    name: str
+    size: int
+    runs: int
+    median_ms: float
+    min_ms: float
+    max_ms: float
+    queries: int
+
+
+class _Rollback(Exception):
+    """Raised to discard the synthetic league after a benchmark size."""
+
+
+def run_benchmarks(
+    sizes: Iterable[int],
+    *,
+    events: int = 60,
+    repeat: int = 3,
+    seed: int = 42,
+    only: Optional[Iterable[str]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark the hot paths for each league size.
+
+    Args:
+        sizes: Numbers of users to generate
+        events: Number of prediction events per league
+        repeat: Timed runs per hot path (the median is reported)
+        seed: Random seed for the synthetic league
+        only: Optional subset of :data:`BENCHMARK_NAMES` to run
+
+    Returns:
+        One BenchmarkResult per hot path and size.
+    """
+    selected = [name for name in BENCHMARK_NAMES if only is None or name in set(only)]
+    results: List[BenchmarkResult] = []
+
+    # Reminder emails are only queued; the rollback discards them
+    with override_settings(
+        EMAIL_OUTBOX_ENABLED=True,
+        EMAIL_BACKEND='django.core.mail.backends.dummy.EmailBackend',
+    ):
+        for size in sizes:
+            try:
+                with transaction.atomic():
+                    generate_synthetic_league(users=size, events=events, seed=seed)
+                    paths = _build_paths()
+                    for name in selected:
+                        results.append(_measure(name, size, paths[name], repeat))
+                    raise _Rollback
+            except _Rollback:
+                pass
+
+    return results
+
+
+def results_as_json(results: List[BenchmarkResult], *, events: int, repeat: int, seed: int, label: str = '') -> Dict:
+    """Return benchmark results in the JSON layout written by ``run_benchmarks``."""
+
+    return {
+        'label': label,
+        'created_at': timezone.now().isoformat(),
+        'database': connection.vendor,
+        'events': events,
+        'repeat': repeat,
+        'seed': seed,
+        'results': [asdict(result) for result in results],
+    }
+
+
+def _build_paths() -> Dict[str, Callable[[], object]]:
+    User = get_user_model()
+    user = User.objects.filter(username__startswith=USERNAME_PREFIX).order_by('username').first()
+    outcome = (
+        EventOutcome.objects.filter(prediction_event__source_id=SOURCE_ID)
+        .select_related('prediction_event', 'winning_option', 'winning_generic_option')
+        .order_by('-resolved_at')
+        .first()
+    )
+    factory = RequestFactory()
+
+    def home():
+        from hooptipp.predictions.views import home as home_view
+
+        request = factory.get('/')
+        request.user = user
+        request.session = SessionStore()
+        return home_view(request)
+
+    return {
+        'home': home,
+        'score_event_outcome': lambda: score_event_outcome(outcome, force=True),
+        'process_all_user_scores': lambda: process_all_user_scores(force=True),
+        'lock_service_refresh': lambda: LockService(user).refresh(),
+        'send_reminder_emails': lambda: call_command('send_reminder_emails', stdout=StringIO()),
+    }
+
+
+def _measure(name: str, size: int, func: Callable[[], object], repeat: int) -> BenchmarkResult:
+    # Warm-up run: fills caches and lets the idempotent paths reach a steady state
+    func()
+
+    durations = []
+    queries = 0
+    for _ in range(repeat):
+        metrics = RequestMetrics()
+        with connection.execute_wrapper(metrics.query_wrapper):
+            start = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - start) * 1000)
+        queries = metrics.sql_count
+
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        runs=repeat,
+        median_ms=round(statistics.median(durations), 2),
+        min_ms=round(min(durations), 2),
+        max_ms=round(max(durations), 2),
+        queries=queries,
+    )
@@ -0,0 +1,84 @@
+"""
+Management command to generate a reproducible synthetic league.
+
+Creates users, seasons, tip types, events with options, tips with lock states,
+outcomes and scores on top of the demo option categories. Intended for local
+load testing; never run it against production data.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hooptipp.demo.synthetic import clear_synthetic_league, generate_synthetic_league
+
+
+class Command(BaseCommand):
+    help = 'Generate a reproducible synthetic league for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=100,
+            help='Number of users to create (default: 100)',
+        )
+        parser.add_argument(
+            '--events',
+            type=int,
+            default=60,
+            help='Number of prediction events to create (default: 60)',
+        )
+        parser.add_argument(
+            '--tip-types',
+            type=int,
+            default=3,
+            help='Number of tip types to spread the events over (default: 3)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed (default: 42)',
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete previously generated synthetic data first',
+        )
+        parser.add_argument(
+            '--clear-only',
+            action='store_true',
+            help='Only delete previously generated synthetic data',
+        )
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['events'] < 1 or options['tip_types'] < 1:
+            raise CommandError('--users, --events and --tip-types must be at least 1')
+
+        if options['clear'] or options['clear_only']:
+            deleted = clear_synthetic_league()
+            self.stdout.write(f'Deleted {deleted} synthetic row(s)')
+            if options['clear_only']:
+                return
+
+        try:
+            league = generate_synthetic_league(
+                users=options['users'],
+                events=options['events'],
+                tip_types=options['tip_types'],
+                seed=options['seed'],
+            )
+        except Exception as e:
+            raise CommandError(
+                f'Failed to generate synthetic league (use --clear to remove earlier data): {e}'
+            ) from e
+
+        self.stdout.write(self.style.SUCCESS('Synthetic league created:'))
+        self.stdout.write(f'  Users: {league.users}')
+        self.stdout.write(f'  Seasons: {league.seasons}')
+        self.stdout.write(f'  Tip types: {league.tip_types}')
+        self.stdout.write(f'  Events: {league.events} ({league.open_events} open)')
+        self.stdout.write(f'  Tips: {league.tips} ({league.locked_tips} locked)')
+        self.stdout.write(f'  Outcomes: {league.outcomes}')
+        self.stdout.write(f'  Scores: {league.scores}')
@@ -0,0 +1,110 @@
+"""
+Management command to benchmark the prediction hot paths.
+
+For each league size a synthetic league is generated inside a transaction,
+every hot path is timed and its queries counted, and the transaction is
+rolled back. Results are written as JSON so runs can be compared between
+commits. Run it against an otherwise empty database for stable numbers.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hooptipp.demo.benchmarks import BENCHMARK_NAMES, results_as_json, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Time the prediction hot paths against synthetic leagues of several sizes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=str,
+            default='10,100,500',
+            help='Comma-separated numbers of users to benchmark (default: 10,100,500)',
+        )
+        parser.add_argument(
+            '--events',
+            type=int,
+            default=60,
+            help='Number of prediction events per league (default: 60)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Timed runs per hot path; the median is reported (default: 3)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed (default: 42)',
+        )
+        parser.add_argument(
+            '--only',
+            type=str,
+            help=f'Comma-separated subset of benchmarks ({", ".join(BENCHMARK_NAMES)})',
+        )
+        parser.add_argument(
+            '--label',
+            type=str,
+            default='',
+            help='Free-form label stored in the JSON output (e.g. a commit hash)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write JSON results to this file instead of stdout',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',') if size.strip()]
+        except ValueError:
+            raise CommandError('--sizes must be a comma-separated list of integers')
+        if not sizes or any(size < 1 for size in sizes):
+            raise CommandError('--sizes must contain positive integers')
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1')
+
+        only = None
+        if options['only']:
+            only = [name.strip() for name in options['only'].split(',') if name.strip()]
+            unknown = sorted(set(only) - set(BENCHMARK_NAMES))
+            if unknown:
+                raise CommandError(f'Unknown benchmark(s): {", ".join(unknown)}')
+
+        results = run_benchmarks(
+            sizes,
+            events=options['events'],
+            repeat=options['repeat'],
+            seed=options['seed'],
+            only=only,
+        )
+
+        for result in results:
+            self.stderr.write(
+                f'{result.name:<25} users={result.size:<6} '
+                f'median={result.median_ms:>9.2f} ms  queries={result.queries}'
+            )
+
+        payload = json.dumps(
+            results_as_json(
+                results,
+                events=options['events'],
+                repeat=options['repeat'],
+                seed=options['seed'],
+                label=options['label'],
+            ),
+            indent=2,
+        )
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                handle.write(payload + '\n')
+            self.stderr.write(self.style.SUCCESS(f'Wrote {len(results)} result(s) to {options["output"]}'))
+        else:
+            self.stdout.write(payload)
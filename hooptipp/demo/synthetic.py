@@ -0,0 +1,318 @@
+"""Reproducible synthetic league data for load testing and benchmarks.
+
+Builds on the demo option categories created by :mod:`hooptipp.demo.admin`
+and generates users, seasons, tip types, events with options, tips with lock
+states, outcomes and scores. All generated rows are tagged (``synth-`` user
+names, ``synthetic`` event source, ``synthetic-`` tip type slugs and
+``Synthetic`` season names) so they can be removed again with
+:func:`clear_synthetic_league`.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from hooptipp.predictions.lock_service import LOCK_LIMIT, LOCK_RETURN_DELAY
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    Season,
+    SeasonParticipant,
+    TipType,
+    UserEventScore,
+    UserPreferences,
+    UserTip,
+)
+from hooptipp.predictions.pick_stats import rebuild_pick_stats
+from hooptipp.predictions.season_assignment import assign_seasons
+
+from .admin import _setup_demo_options
+
+SOURCE_ID = 'synthetic'
+USERNAME_PREFIX = 'synth-'
+TIP_TYPE_SLUG_PREFIX = 'synthetic-'
+SEASON_NAME_PREFIX = 'Synthetic'
+
+DEMO_CATEGORY_SLUGS = ('demo-yesno', 'demo-colors', 'demo-characters')
+
+
+@dataclass(frozen=True)
+class SyntheticLeague:
+    """Summary of the rows created by :func:`generate_synthetic_league`."""
+
+    users: int
+    seasons: int
+    tip_types: int
+    events: int
+    open_events: int
+    tips: int
+    locked_tips: int
+    outcomes: int
+    scores: int
+
+
+def clear_synthetic_league() -> int:
+    """Delete all previously generated synthetic data and return the number of rows removed."""
+
+    User = get_user_model()
+    deleted = 0
+    with transaction.atomic():
+        deleted += PredictionEvent.objects.filter(source_id=SOURCE_ID).delete()[0]
+        deleted += TipType.objects.filter(slug__startswith=TIP_TYPE_SLUG_PREFIX).delete()[0]
+        deleted += Season.objects.filter(name__startswith=SEASON_NAME_PREFIX).delete()[0]
+        deleted += User.objects.filter(username__startswith=USERNAME_PREFIX).delete()[0]
+    return deleted
+
+
+def generate_synthetic_league(
+    *,
+    users: int,
+    events: int = 60,
+    tip_types: int = 3,
+    open_ratio: float = 0.25,
+    tip_ratio: float = 0.8,
+    seed: int = 42,
+) -> SyntheticLeague:
+    """
+    Generate a synthetic league with bulk inserts.
+
+    The same arguments always produce the same league (relative to the current
+    time), so benchmark numbers are comparable between commits.
+
+    Args:
+        users: Number of users to create
+        events: Number of prediction events to create
+        tip_types: Number of tip types to spread the events over
+        open_ratio: Share of events that are still open for predictions
+        tip_ratio: Probability that a user predicted a given event
+        seed: Random seed
+
+    Returns:
+        SyntheticLeague with the number of created rows per model.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    User = get_user_model()
+
+    with transaction.atomic():
+        _setup_demo_options()
+        options_by_category: Dict[str, List[Option]] = {
+            category.slug: list(category.options.order_by('sort_order', 'slug'))
+            for category in OptionCategory.objects.filter(slug__in=DEMO_CATEGORY_SLUGS)
+        }
+
+        # Seasons: a finished one and the currently active one
+        current_start = (now - timedelta(days=60)).date()
+        seasons = Season.objects.bulk_create([
+            Season(
+                name=f'{SEASON_NAME_PREFIX} Season 1',
+                start_date=current_start - timedelta(days=120),
+                end_date=current_start - timedelta(days=1),
+                description='Synthetic finished season',
+            ),
+            Season(
+                name=f'{SEASON_NAME_PREFIX} Season 2',
+                start_date=current_start,
+                end_date=(now + timedelta(days=60)).date(),
+                description='Synthetic active season',
+            ),
+        ])
+        active_season = Season.objects.get(name=f'{SEASON_NAME_PREFIX} Season 2')
+
+        # Users with preferences and active season enrollment
+        user_objects = []
+        for index in range(users):
+            user = User(
+                username=f'{USERNAME_PREFIX}{index:05d}',
+                email=f'{USERNAME_PREFIX}{index:05d}@example.com',
+            )
+            user.set_unusable_password()
+            user_objects.append(user)
+        User.objects.bulk_create(user_objects, batch_size=500)
+        created_users = list(User.objects.filter(username__startswith=USERNAME_PREFIX).order_by('username'))
+        UserPreferences.objects.bulk_create(
+            [
+                UserPreferences(user=user, nickname=f'Synth {index}')
+                for index, user in enumerate(created_users)
+            ],
+            batch_size=500,
+        )
+        SeasonParticipant.objects.bulk_create(
+            [SeasonParticipant(user=user, season=active_season) for user in created_users],
+            batch_size=500,
+        )
+
+        # Tip types
+        TipType.objects.bulk_create([
+            TipType(
+                slug=f'{TIP_TYPE_SLUG_PREFIX}{index + 1}',
+                name=f'Synthetic Tips {index + 1}',
+                description='Synthetic events for benchmarks',
+                category=TipType.TipCategory.GAME,
+                deadline=now + timedelta(days=index + 1),
+            )
+            for index in range(tip_types)
+        ])
+        created_tip_types = list(
+            TipType.objects.filter(slug__startswith=TIP_TYPE_SLUG_PREFIX).order_by('slug')
+        )
+
+        # Events: resolved ones spread over the active season, open ones in the next two days
+        open_count = int(round(events * open_ratio))
+        resolved_count = events - open_count
+        event_objects = []
+        for index in range(events):
+            if index < resolved_count:
+                deadline = now - timedelta(hours=6 + (resolved_count - index) * 20)
+            else:
+                deadline = now + timedelta(hours=2 + (index - resolved_count) * 46 / max(open_count, 1))
+            category_slug = DEMO_CATEGORY_SLUGS[index % len(DEMO_CATEGORY_SLUGS)]
+            event_objects.append(PredictionEvent(
+                tip_type=created_tip_types[index % len(created_tip_types)],
+                name=f'Synthetic event {index + 1}',
+                target_kind=(
+                    PredictionEvent.TargetKind.PLAYER
+                    if category_slug == 'demo-characters'
+                    else PredictionEvent.TargetKind.GENERIC
+                ),
+                selection_mode=PredictionEvent.SelectionMode.CURATED,
+                source_id=SOURCE_ID,
+                source_event_id=f'{SOURCE_ID}-{index + 1}',
+                metadata={'event_type': category_slug.replace('demo-', ''), 'demo': True},
+                opens_at=deadline - timedelta(days=3),
+                deadline=deadline,
+                reveal_at=deadline - timedelta(days=3),
+                is_bonus_event=rng.random() < 0.1,
+                points=rng.choice((1, 1, 2, 3)),
+            ))
+        PredictionEvent.objects.bulk_create(event_objects, batch_size=500)
+        created_events = list(
+            PredictionEvent.objects.filter(source_id=SOURCE_ID).order_by('deadline', 'id')
+        )
+
+        PredictionOption.objects.bulk_create(
+            [
+                PredictionOption(
+                    event=event,
+                    option=option,
+                    label=option.name,
+                    sort_order=sort_order,
+                )
+                for event in created_events
+                for sort_order, option in enumerate(
+                    options_by_category[f"demo-{event.metadata['event_type']}"],
+                    1,
+                )
+            ],
+            batch_size=500,
+        )
+        options_by_event: Dict[int, List[PredictionOption]] = {}
+        for prediction_option in PredictionOption.objects.filter(event__in=created_events).order_by('sort_order'):
+            options_by_event.setdefault(prediction_option.event_id, []).append(prediction_option)
+
+        # Outcomes for resolved events
+        resolved_events = [event for event in created_events if event.deadline < now]
+        winners: Dict[int, PredictionOption] = {}
+        outcome_objects = []
+        for event in resolved_events:
+            winner = rng.choice(options_by_event[event.id])
+            winners[event.id] = winner
+            outcome_objects.append(EventOutcome(
+                prediction_event=event,
+                winning_option=winner,
+                winning_generic_option=winner.option,
+                resolved_at=event.deadline + timedelta(hours=3),
+                scored_at=event.deadline + timedelta(hours=3),
+            ))
+        EventOutcome.objects.bulk_create(outcome_objects, batch_size=500)
+
+        # Tips with lock states and scores for correct predictions
+        tip_objects: List[UserTip] = []
+        score_objects: List[UserEventScore] = []
+        locked_tips = 0
+        for user in created_users:
+            # Active locks plus forfeited locks not yet returned never exceed LOCK_LIMIT
+            locks_in_use = 0
+            for event in created_events:
+                if rng.random() >= tip_ratio:
+                    continue
+                choice = rng.choice(options_by_event[event.id])
+                tip = UserTip(
+                    user=user,
+                    tip_type_id=event.tip_type_id,
+                    prediction_event=event,
+                    prediction_option=choice,
+                    selected_option=choice.option,
+                    prediction=choice.label,
+                )
+                winner: Optional[PredictionOption] = winners.get(event.id)
+                wants_lock = rng.random() < 0.15
+                if winner is None:
+                    if wants_lock and locks_in_use < LOCK_LIMIT:
+                        _apply_lock(tip, UserTip.LockStatus.ACTIVE, committed_at=event.opens_at)
+                        locks_in_use += 1
+                        locked_tips += 1
+                elif wants_lock:
+                    resolved_at = event.deadline + timedelta(hours=3)
+                    if choice.id == winner.id:
+                        _apply_lock(tip, UserTip.LockStatus.WAS_LOCKED, committed_at=event.opens_at)
+                        tip.lock_released_at = resolved_at
+                    else:
+                        _apply_lock(tip, UserTip.LockStatus.FORFEITED, committed_at=event.opens_at)
+                        tip.lock_forfeited_at = resolved_at
+                        tip.lock_releases_at = resolved_at + LOCK_RETURN_DELAY
+                        if tip.lock_releases_at > now:
+                            locks_in_use += 1
+                    locked_tips += 1
+                tip_objects.append(tip)
+
+                if winner is not None and choice.id == winner.id:
+                    multiplier = 2 if tip.lock_status == UserTip.LockStatus.WAS_LOCKED else 1
+                    score_objects.append(UserEventScore(
+                        user=user,
+                        prediction_event=event,
+                        base_points=event.points,
+                        lock_multiplier=multiplier,
+                        points_awarded=event.points * multiplier,
+                        is_lock_bonus=multiplier > 1,
+                    ))
+        UserTip.objects.bulk_create(tip_objects, batch_size=1000)
+        UserEventScore.objects.bulk_create(score_objects, batch_size=1000)
+        # bulk_create skips the signals that maintain the pick counters
+        rebuild_pick_stats(event_ids=[event.id for event in created_events])
+
+        # awarded_at is auto_now_add; move scores to the time their event was resolved
+        for outcome in outcome_objects:
+            UserEventScore.objects.filter(prediction_event=outcome.prediction_event).update(
+                awarded_at=outcome.resolved_at
+            )
+        # Bulk writes skip the season assignment of scores and tips
+        assign_seasons()
+
+    return SyntheticLeague(
+        users=len(created_users),
+        seasons=len(seasons),
+        tip_types=len(created_tip_types),
+        events=len(created_events),
+        open_events=len(created_events) - len(resolved_events),
+        tips=len(tip_objects),
+        locked_tips=locked_tips,
+        outcomes=len(outcome_objects),
+        scores=len(score_objects),
+    )
+
+
+def _apply_lock(tip: UserTip, status: str, *, committed_at) -> None:
+    tip.lock_status = status
+    tip.is_locked = status == UserTip.LockStatus.ACTIVE
+    tip.lock_committed_at = committed_at
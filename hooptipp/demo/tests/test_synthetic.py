@@ -0,0 +1,105 @@
+"""Tests for the synthetic league generator and benchmark runner."""
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+
+from hooptipp.demo.synthetic import clear_synthetic_league, generate_synthetic_league
+from hooptipp.predictions.lock_service import LOCK_LIMIT
+from hooptipp.predictions.models import (
+    EventOutcome,
+    PredictionEvent,
+    Season,
+    UserEventScore,
+    UserTip,
+)
+
+
+User = get_user_model()
+
+
+class GenerateSyntheticLeagueTests(TestCase):
+    def test_generates_requested_league(self):
+        league = generate_synthetic_league(users=5, events=12, tip_types=2)
+
+        self.assertEqual(league.users, 5)
+        self.assertEqual(league.events, 12)
+        self.assertEqual(league.open_events, 3)
+        self.assertEqual(league.outcomes, 9)
+        self.assertEqual(User.objects.filter(username__startswith='synth-').count(), 5)
+        self.assertEqual(PredictionEvent.objects.filter(source_id='synthetic').count(), 12)
+        self.assertEqual(EventOutcome.objects.count(), 9)
+        self.assertEqual(UserTip.objects.count(), league.tips)
+        self.assertEqual(UserEventScore.objects.count(), league.scores)
+        self.assertIsNotNone(Season.get_active_season())
+
+    def test_scores_only_for_correct_tips(self):
+        generate_synthetic_league(users=5, events=12)
+
+        for score in UserEventScore.objects.select_related('prediction_event__outcome'):
+            tip = UserTip.objects.get(user=score.user, prediction_event=score.prediction_event)
+            self.assertEqual(tip.prediction_option_id, score.prediction_event.outcome.winning_option_id)
+
+    def test_lock_limit_is_respected(self):
+        generate_synthetic_league(users=10, events=30)
+
+        over_limit = User.objects.annotate(
+            active=Count('usertip', filter=Q(usertip__lock_status=UserTip.LockStatus.ACTIVE)),
+        ).filter(active__gt=LOCK_LIMIT)
+        self.assertFalse(over_limit.exists())
+
+    def test_same_seed_is_reproducible(self):
+        first = generate_synthetic_league(users=4, events=10, seed=7)
+        clear_synthetic_league()
+        second = generate_synthetic_league(users=4, events=10, seed=7)
+
+        self.assertEqual(first, second)
+
+    def test_clear_removes_synthetic_rows(self):
+        generate_synthetic_league(users=3, events=6)
+
+        clear_synthetic_league()
+
+        self.assertFalse(User.objects.filter(username__startswith='synth-').exists())
+        self.assertFalse(PredictionEvent.objects.filter(source_id='synthetic').exists())
+        self.assertFalse(Season.objects.filter(name__startswith='Synthetic').exists())
+
+
+class RunBenchmarksCommandTests(TestCase):
+    def test_writes_json_results_and_rolls_back(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'bench.json')
+            call_command(
+                'run_benchmarks',
+                '--sizes', '3',
+                '--events', '6',
+                '--repeat', '1',
+                '--label', 'test',
+                '--output', output,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+            with open(output, encoding='utf-8') as handle:
+                data = json.load(handle)
+
+        self.assertEqual(data['label'], 'test')
+        names = {result['name'] for result in data['results']}
+        self.assertEqual(
+            names,
+            {'home', 'score_event_outcome', 'process_all_user_scores', 'lock_service_refresh', 'send_reminder_emails'},
+        )
+        self.assertTrue(all(result['queries'] > 0 for result in data['results']))
+        self.assertFalse(User.objects.filter(username__startswith='synth-').exists())
+
+    def test_generate_command_prints_summary(self):
+        out = StringIO()
+        call_command('generate_synthetic_data', '--users', '2', '--events', '4', stdout=out)
+
+        self.assertIn('Users: 2', out.getvalue())
+        self.assertIn('Events: 4 (1 open)', out.getvalue())
@@ -10,12 +10,13 @@ from typing import Optional, Tuple
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
+from hooptipp.mail_outbox import queue_mail
+
 # Token expiry: 3 days (259200 seconds)
 EMAIL_VERIFICATION_TIMEOUT = 259200
 
@@ -73,15 +74,15 @@ def send_verification_email(user, request=None) -> None:
     html_message = render_to_string('emails/verification_email.html', context)
     plain_message = render_to_string('emails/verification_email.txt', context)
     
-    # Send email
+    # Queue email (delivered by the mail dispatcher when the outbox is enabled)
     from_email = settings.DEFAULT_FROM_EMAIL
-    send_mail(
+    queue_mail(
         subject=subject,
         message=plain_message,
         from_email=from_email,
         recipient_list=[user.email],
         html_message=html_message,
-        fail_silently=False,
+        idempotency_key=f'verify-email:{user.pk}:{token}',
     )
 
 
@@ -0,0 +1,389 @@
+"""Lightweight database-backed job queue for HindSight.
+
+Background work (outcome processing, scoring, syncs, reminder emails) is
+registered here by name and queued as :class:`~hooptipp.models.Job` rows.
+The ``run_worker`` management command leases due jobs one at a time
+(``SELECT ... FOR UPDATE SKIP LOCKED`` where the database supports it, a
+compare-and-swap update otherwise), runs them in-process and records the
+result, so the interpreter starts once and long syncs never run inside a web
+worker. Claims of jobs with the same name are serialised (an advisory lock on
+PostgreSQL), so two jobs of one name never run at once.
+
+Apps register jobs in a ``jobs`` module, which is discovered on first use::
+
+    from hooptipp.jobs import job, register_command
+
+    register_command('process_scores')
+
+    @job('nba.sync_players')
+    def sync_players(context):
+        context.set_progress(50, 'Halfway')
+        return {'created': 3}
+
+Periodic jobs are configured in ``JOB_SCHEDULES``. Jobs are deduplicated by
+``dedup_key`` (the job name unless given), so the same job is never queued or
+running twice at once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.db import connection as db_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import Job, JobSchedule
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 15 * 60
+DEFAULT_RETRY_BASE_SECONDS = 60
+MAX_RETRY_DELAY = timedelta(hours=1)
+PROGRESS_INTERVAL_SECONDS = 1.0
+OUTPUT_LIMIT = 4000
+CLAIM_CANDIDATES = 10
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    name: str
+    func: Callable[..., Optional[Dict[str, Any]]]
+    max_attempts: int = 1
+
+
+_registry: Dict[str, JobDefinition] = {}
+_discovered = False
+
+
+def job(name: str, *, max_attempts: int = 1):
+    """
+    Register ``func(context, **kwargs)`` as the job ``name``.
+
+    The function may return a JSON-serialisable dict, stored as the job result.
+    """
+
+    def decorator(func):
+        _registry[name] = JobDefinition(name=name, func=func, max_attempts=max_attempts)
+        return func
+
+    return decorator
+
+
+def register_command(name: str, command_name: Optional[str] = None, *, max_attempts: int = 1, **options) -> None:
+    """
+    Register a management command as the job ``name``.
+
+    ``options`` and the job kwargs are passed to ``call_command``; the
+    command's output is kept (truncated) in the job result and its last line
+    is reported as progress.
+    """
+    command_name = command_name or name
+
+    def run_command(context: JobContext, **kwargs) -> Dict[str, Any]:
+        stream = _ProgressStream(context)
+        call_command(command_name, stdout=stream, stderr=stream, **{**options, **kwargs})
+        return {'output': stream.getvalue()[-OUTPUT_LIMIT:]}
+
+    _registry[name] = JobDefinition(name=name, func=run_command, max_attempts=max_attempts)
+
+
+def autodiscover() -> None:
+    """Import the ``jobs`` module of every installed app once."""
+
+    global _discovered
+    if not _discovered:
+        autodiscover_modules('jobs')
+        _discovered = True
+
+
+def get_job_definition(name: str) -> JobDefinition:
+    """
+    Return the registered job ``name``.
+
+    Raises:
+        LookupError: If no job with that name is registered
+    """
+    autodiscover()
+    try:
+        return _registry[name]
+    except KeyError:
+        raise LookupError(f'Unknown job: {name}') from None
+
+
+def registered_jobs() -> List[str]:
+    autodiscover()
+    return sorted(_registry)
+
+
+def enqueue(
+    name: str,
+    *,
+    kwargs: Optional[Dict[str, Any]] = None,
+    dedup_key: Optional[str] = None,
+    run_at=None,
+) -> Job:
+    """
+    Queue the job ``name``.
+
+    Args:
+        name: Registered job name
+        kwargs: JSON-serialisable keyword arguments for the job
+        dedup_key: Deduplication key (defaults to ``name``). While a job with
+            the same key is queued or running, that job is returned instead of
+            queueing another one. Pass ``''`` to allow parallel copies.
+        run_at: Earliest start time (default: now)
+
+    Returns:
+        The queued (or already active) :class:`Job`.
+
+    Raises:
+        LookupError: If no job with that name is registered
+    """
+    definition = get_job_definition(name)
+    dedup_key = name if dedup_key is None else dedup_key
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                kwargs=kwargs or {},
+                dedup_key=dedup_key,
+                run_at=run_at or timezone.now(),
+                max_attempts=definition.max_attempts,
+            )
+    except IntegrityError:
+        existing = Job.objects.filter(dedup_key=dedup_key, status__in=Job.ACTIVE_STATUSES).first()
+        if existing is None:
+            raise
+        return existing
+
+
+class JobContext:
+    """Handle passed to running jobs for progress reports (which also renew the lease)."""
+
+    def __init__(self, job: Job, *, worker_id: str, lease: timedelta) -> None:
+        self.job = job
+        self.worker_id = worker_id
+        self.lease = lease
+        self._last_report = 0.0
+
+    def set_progress(self, percent: Optional[int] = None, message: Optional[str] = None, *, force: bool = False) -> None:
+        """
+        Record progress for the job; writes are throttled to one per second.
+
+        Args:
+            percent: Percent complete (0-100)
+            message: Short status line
+            force: Write even if the last report was less than a second ago
+        """
+        if percent is not None:
+            self.job.progress = max(0, min(100, int(percent)))
+        if message is not None:
+            self.job.progress_message = message[:255]
+
+        now = time.monotonic()
+        if not force and now - self._last_report < PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_report = now
+        Job.objects.filter(pk=self.job.pk, locked_by=self.worker_id).update(
+            progress=self.job.progress,
+            progress_message=self.job.progress_message,
+            locked_until=timezone.now() + self.lease,
+            updated_at=timezone.now(),
+        )
+
+
+class _ProgressStream(io.StringIO):
+    """Output stream that reports the last line written as job progress."""
+
+    def __init__(self, context: JobContext) -> None:
+        super().__init__()
+        self.context = context
+
+    def write(self, text: str) -> int:
+        written = super().write(text)
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if lines:
+            self.context.set_progress(message=lines[-1])
+        return written
+
+
+def default_worker_id() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _lease() -> timedelta:
+    return timedelta(seconds=getattr(settings, 'JOB_LEASE_SECONDS', DEFAULT_LEASE_SECONDS))
+
+
+def _lock_job_name(name: str) -> None:
+    """
+    Serialise the claims of jobs named ``name`` until the transaction ends.
+
+    Under PostgreSQL's READ COMMITTED two workers could each lease a different
+    row of the same name, neither seeing the other's uncommitted RUNNING row.
+    A transaction-level advisory lock makes the second worker wait until the
+    first committed, so its busy-name check sees the running job. SQLite has
+    a single writer, which serialises the claims already.
+    """
+    if db_connection.vendor != 'postgresql':
+        return
+    # hash() differs between processes; the key must match in every worker
+    key = int.from_bytes(hashlib.sha256(f'hooptipp.jobs:{name}'.encode()).digest()[:8], 'big', signed=True)
+    with db_connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s)', [key])
+
+
+def claim_next(worker_id: str, *, lease: Optional[timedelta] = None) -> Optional[Job]:
+    """
+    Lease the next due job for ``worker_id``.
+
+    Due jobs are queued jobs whose ``run_at`` has passed and running jobs
+    whose lease expired; jobs whose name is currently running elsewhere wait.
+    Returns None when nothing is due.
+    """
+    lease = lease or _lease()
+    now = timezone.now()
+    due = Q(status=Job.Status.QUEUED, run_at__lte=now) | Q(status=Job.Status.RUNNING, locked_until__lt=now)
+    # Never start a job while another job of the same name holds a valid lease
+    busy_names = Job.objects.filter(status=Job.Status.RUNNING, locked_until__gte=now).values('name')
+
+    with transaction.atomic():
+        queryset = Job.objects.filter(due).exclude(name__in=busy_names).order_by('run_at', 'id')
+        if db_connection.features.has_select_for_update_skip_locked:
+            # Concurrent workers skip rows another worker already holds
+            queryset = queryset.select_for_update(skip_locked=True)
+        candidates = list(queryset.values_list('id', 'name')[:CLAIM_CANDIDATES])
+        for job_id, name in candidates:
+            # Held until commit: a concurrent claim of the same name waits here
+            # and then sees this job RUNNING in the busy-name check below
+            _lock_job_name(name)
+            # Without row locks (SQLite) this conditional update is the lease:
+            # only one worker can move a due row to RUNNING
+            claimed = Job.objects.filter(due, pk=job_id).exclude(name__in=busy_names).update(
+                status=Job.Status.RUNNING,
+                locked_by=worker_id,
+                locked_until=now + lease,
+                attempts=F('attempts') + 1,
+                progress=0,
+                progress_message='',
+                started_at=now,
+                updated_at=now,
+            )
+            if claimed:
+                return Job.objects.get(pk=job_id)
+    return None
+
+
+def run_job(job: Job, *, worker_id: str, lease: Optional[timedelta] = None) -> Job:
+    """Run a leased job and record its result or failure."""
+
+    lease = lease or _lease()
+    context = JobContext(job, worker_id=worker_id, lease=lease)
+    try:
+        definition = get_job_definition(job.name)
+        result = definition.func(context, **(job.kwargs or {}))
+    except Exception as exc:
+        logger.exception('Job %s (%s) failed: %s', job.pk, job.name, exc)
+        _record_failure(job, exc, worker_id)
+    else:
+        now = timezone.now()
+        Job.objects.filter(pk=job.pk, locked_by=worker_id).update(
+            status=Job.Status.SUCCEEDED,
+            result=result or {},
+            progress=100,
+            progress_message=context.job.progress_message,
+            last_error='',
+            locked_until=None,
+            finished_at=now,
+            updated_at=now,
+        )
+    job.refresh_from_db()
+    return job
+
+
+def run_next(worker_id: Optional[str] = None) -> Optional[Job]:
+    """Claim and run the next due job; returns it, or None when nothing is due."""
+
+    worker_id = worker_id or default_worker_id()
+    job = claim_next(worker_id)
+    if job is None:
+        return None
+    return run_job(job, worker_id=worker_id)
+
+
+def _record_failure(job: Job, exc: Exception, worker_id: str) -> None:
+    """Schedule a retry with exponential backoff, or give up after the max attempts."""
+
+    now = timezone.now()
+    updates: Dict[str, Any] = {
+        'last_error': f'{type(exc).__name__}: {exc}',
+        'locked_until': None,
+        'updated_at': now,
+    }
+    if job.attempts < job.max_attempts:
+        updates.update(status=Job.Status.QUEUED, run_at=now + _retry_delay(job.attempts))
+    else:
+        updates.update(status=Job.Status.FAILED, finished_at=now)
+    Job.objects.filter(pk=job.pk, locked_by=worker_id).update(**updates)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Return the backoff before retry number ``attempts`` (1-based)."""
+
+    base_seconds = getattr(settings, 'JOB_RETRY_BASE_SECONDS', DEFAULT_RETRY_BASE_SECONDS)
+    exponent = min(max(attempts - 1, 0), 20)
+    return min(timedelta(seconds=base_seconds * (2 ** exponent)), MAX_RETRY_DELAY)
+
+
+def enqueue_due_schedules(now=None) -> List[Job]:
+    """
+    Queue every ``JOB_SCHEDULES`` entry that is due.
+
+    ``JOB_SCHEDULES`` maps a schedule name to ``{'interval': seconds}`` plus
+    optional ``'job'`` (defaults to the schedule name) and ``'kwargs'``. Each
+    run is claimed by advancing ``next_run_at`` with a conditional update, so
+    concurrent workers enqueue it once; the job's dedup key keeps a run from
+    being queued while the previous one is still active.
+
+    Returns:
+        Jobs queued (or found already active) for due schedules
+    """
+    schedules: Dict[str, Dict[str, Any]] = getattr(settings, 'JOB_SCHEDULES', {}) or {}
+    if not schedules:
+        return []
+
+    now = now or timezone.now()
+    known = set(JobSchedule.objects.filter(name__in=list(schedules)).values_list('name', flat=True))
+    JobSchedule.objects.bulk_create(
+        [JobSchedule(name=name, next_run_at=now) for name in schedules if name not in known],
+        ignore_conflicts=True,
+    )
+
+    jobs = []
+    for schedule in JobSchedule.objects.filter(name__in=list(schedules), next_run_at__lte=now):
+        config = schedules[schedule.name]
+        claimed = JobSchedule.objects.filter(pk=schedule.pk, next_run_at=schedule.next_run_at).update(
+            next_run_at=now + timedelta(seconds=config['interval']),
+            last_enqueued_at=now,
+        )
+        if not claimed:
+            continue
+        try:
+            jobs.append(enqueue(config.get('job', schedule.name), kwargs=config.get('kwargs')))
+        except LookupError as exc:
+            logger.error('Schedule %s refers to an unknown job: %s', schedule.name, exc)
+    return jobs
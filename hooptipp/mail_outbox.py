@@ -0,0 +1,238 @@
+"""Durable email outbox for HindSight.
+
+Callers queue messages with :func:`queue_mail` instead of talking to the mail
+backend directly. When ``EMAIL_OUTBOX_ENABLED`` is set, queued messages are
+delivered by the ``run_mail_dispatcher`` management command, so a slow SES or
+SMTP call never blocks a web worker. When the outbox is disabled (the default)
+each message is still recorded but delivered immediately in-process, which
+keeps the previous synchronous behaviour for deployments without a dispatcher:
+a failed delivery is raised to the caller and recorded as failed, since no
+dispatcher would retry it.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connection as db_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BASE_SECONDS = 60
+MAX_RETRY_DELAY = timedelta(hours=6)
+# Rows stuck in SENDING longer than this (e.g. a dispatcher crashed mid-batch)
+# are picked up again by the next dispatcher run.
+SENDING_LEASE = timedelta(minutes=10)
+
+
+@dataclass
+class DispatchResult:
+    """Summary of a single dispatcher batch."""
+
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def is_outbox_enabled() -> bool:
+    """Return ``True`` when mail is delivered by the background dispatcher."""
+
+    return bool(getattr(settings, 'EMAIL_OUTBOX_ENABLED', False))
+
+
+def queue_mail(
+    *,
+    subject: str,
+    message: str,
+    recipient_list: Iterable[str],
+    html_message: Optional[str] = None,
+    from_email: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+) -> OutboundEmail:
+    """
+    Store an email in the outbox.
+
+    Args:
+        subject: Email subject line
+        message: Plain text body
+        recipient_list: Recipient addresses
+        html_message: Optional HTML alternative
+        from_email: Sender address (defaults to ``DEFAULT_FROM_EMAIL``)
+        idempotency_key: Deduplication key. Queueing a key that already exists
+            returns the existing row without sending the message again. A random
+            key is used when omitted.
+
+    Returns:
+        The stored :class:`OutboundEmail`.
+
+    Raises:
+        Exception: When the outbox is disabled and immediate delivery fails.
+            The row is marked failed; nothing retries it.
+    """
+    email, created = OutboundEmail.objects.get_or_create(
+        idempotency_key=idempotency_key or uuid.uuid4().hex,
+        defaults={
+            'subject': subject,
+            'body': message,
+            'html_body': html_message or '',
+            'from_email': from_email or settings.DEFAULT_FROM_EMAIL,
+            'recipients': list(recipient_list),
+        },
+    )
+
+    if created and not is_outbox_enabled():
+        error = _deliver_batch([email], connection=get_connection(), retry=False)
+        if error is not None:
+            raise error
+
+    return email
+
+
+def dispatch_pending(
+    *,
+    batch_size: Optional[int] = None,
+    backend: Optional[str] = None,
+) -> DispatchResult:
+    """
+    Claim and deliver one batch of due emails over a single backend connection.
+
+    Args:
+        batch_size: Maximum number of emails to claim (``EMAIL_OUTBOX_BATCH_SIZE``)
+        backend: Optional dotted path of the email backend to use instead of
+            ``EMAIL_BACKEND`` (e.g. the console or locmem backend locally)
+
+    Returns:
+        DispatchResult with per-status counts for the batch.
+    """
+    if batch_size is None:
+        batch_size = getattr(settings, 'EMAIL_OUTBOX_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+
+    batch = _claim_batch(batch_size)
+    result = DispatchResult(claimed=len(batch))
+    if not batch:
+        return result
+
+    _deliver_batch(batch, connection=get_connection(backend), result=result)
+    return result
+
+
+def _claim_batch(batch_size: int) -> List[OutboundEmail]:
+    """Atomically move up to ``batch_size`` due emails to SENDING."""
+
+    now = timezone.now()
+    due = Q(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now) | Q(
+        status=OutboundEmail.Status.SENDING, updated_at__lt=now - SENDING_LEASE
+    )
+
+    with transaction.atomic():
+        queryset = OutboundEmail.objects.filter(due).order_by('next_attempt_at', 'id')
+        if db_connection.features.has_select_for_update_skip_locked:
+            # Concurrent dispatchers skip rows another dispatcher already holds
+            queryset = queryset.select_for_update(skip_locked=True)
+        claimed_ids = list(queryset.values_list('id', flat=True)[:batch_size])
+        if not claimed_ids:
+            return []
+        OutboundEmail.objects.filter(id__in=claimed_ids).update(
+            status=OutboundEmail.Status.SENDING,
+            updated_at=now,
+        )
+
+    return list(OutboundEmail.objects.filter(id__in=claimed_ids).order_by('id'))
+
+
+def _deliver_batch(
+    batch: List[OutboundEmail],
+    *,
+    connection,
+    result: Optional[DispatchResult] = None,
+    retry: bool = True,
+) -> Optional[Exception]:
+    """
+    Send ``batch`` over one open connection and record the outcome per email.
+
+    Failed emails are scheduled for another attempt unless ``retry`` is off.
+    Returns the last delivery exception (if any) so synchronous callers can
+    surface it.
+    """
+    if result is None:
+        result = DispatchResult(claimed=len(batch))
+
+    last_error: Optional[Exception] = None
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning('Unable to open email connection: %s', exc)
+        for email in batch:
+            _record_failure(email, exc, result, retry=retry)
+        return exc
+
+    try:
+        for email in batch:
+            message = EmailMultiAlternatives(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email or None,
+                to=email.recipients,
+                connection=connection,
+            )
+            if email.html_body:
+                message.attach_alternative(email.html_body, 'text/html')
+            try:
+                message.send(fail_silently=False)
+            except Exception as exc:
+                logger.warning('Failed to deliver outbound email %s: %s', email.pk, exc)
+                _record_failure(email, exc, result, retry=retry)
+                last_error = exc
+                continue
+
+            email.status = OutboundEmail.Status.SENT
+            email.attempts += 1
+            email.sent_at = timezone.now()
+            email.last_error = ''
+            email.save(update_fields=['status', 'attempts', 'sent_at', 'last_error', 'updated_at'])
+            result.sent += 1
+    finally:
+        connection.close()
+
+    return last_error
+
+
+def _record_failure(email: OutboundEmail, exc: Exception, result: DispatchResult, *, retry: bool = True) -> None:
+    """Schedule a retry with exponential backoff, or give up after the max attempts (or without ``retry``)."""
+
+    max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+    email.attempts += 1
+    email.last_error = str(exc)
+    if not retry or email.attempts >= max_attempts:
+        email.status = OutboundEmail.Status.FAILED
+        result.failed += 1
+    else:
+        email.status = OutboundEmail.Status.PENDING
+        email.next_attempt_at = timezone.now() + _retry_delay(email.attempts)
+        result.retried += 1
+    result.errors.append(f'{email.pk}: {exc}')
+    email.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at', 'updated_at'])
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Return the backoff before retry number ``attempts`` (1-based)."""
+
+    base_seconds = getattr(settings, 'EMAIL_OUTBOX_RETRY_BASE_SECONDS', DEFAULT_RETRY_BASE_SECONDS)
+    exponent = min(max(attempts - 1, 0), 20)
+    delay = timedelta(seconds=base_seconds * (2 ** exponent))
+    return min(delay, MAX_RETRY_DELAY)
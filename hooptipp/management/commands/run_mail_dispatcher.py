@@ -0,0 +1,94 @@
+"""
+Management command to deliver queued emails from the outbox.
+
+Claims due rows from the email outbox in batches, sends each batch over a
+single backend connection and reschedules failed deliveries with exponential
+backoff. Runs continuously by default; use --once from cron.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from hooptipp.mail_outbox import dispatch_pending
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued emails from the outbox in batches with retries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain all currently due emails and exit instead of polling forever',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Number of emails to send per connection (default: EMAIL_OUTBOX_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5.0,
+            help='Seconds to sleep when the outbox is empty (default: 5)',
+        )
+        parser.add_argument(
+            '--backend',
+            type=str,
+            default=None,
+            help=(
+                'Email backend to deliver with instead of EMAIL_BACKEND, '
+                'e.g. django.core.mail.backends.console.EmailBackend'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        once = options['once']
+        batch_size = options['batch_size']
+        interval = options['interval']
+        backend = options['backend']
+
+        self.stdout.write(
+            f'Mail dispatcher started (backend: {backend or settings.EMAIL_BACKEND})'
+        )
+
+        total_sent = 0
+        total_retried = 0
+        total_failed = 0
+
+        try:
+            while True:
+                result = dispatch_pending(batch_size=batch_size, backend=backend)
+                total_sent += result.sent
+                total_retried += result.retried
+                total_failed += result.failed
+
+                for error in result.errors:
+                    self.stdout.write(self.style.WARNING(f'  [WARNING] {error}'))
+
+                if result.claimed:
+                    self.stdout.write(
+                        f'Batch: sent {result.sent}, retrying {result.retried}, failed {result.failed}'
+                    )
+                    continue
+
+                if once:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write('Mail dispatcher interrupted')
+
+        self.stdout.write('')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Sent: {total_sent}, retrying: {total_retried}, failed: {total_failed}'
+            )
+        )
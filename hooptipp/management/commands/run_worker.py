@@ -0,0 +1,110 @@
+"""
+Management command to run background jobs.
+
+Enqueues due periodic jobs (JOB_SCHEDULES), then leases and runs queued jobs
+one at a time in this process. Several workers can run side by side: leases
+keep them from picking the same job. Runs continuously by default; use --once
+to drain the due jobs and exit.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from hooptipp.jobs import default_worker_id, enqueue, enqueue_due_schedules, registered_jobs, run_next
+from hooptipp.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Run queued and scheduled background jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run all currently due jobs and exit instead of polling forever',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep when no job is due (default: 2)',
+        )
+        parser.add_argument(
+            '--no-schedules',
+            action='store_true',
+            help='Only run queued jobs; do not enqueue JOB_SCHEDULES',
+        )
+        parser.add_argument(
+            '--worker-id',
+            type=str,
+            default=None,
+            help='Name recorded on leased jobs (default: host:pid)',
+        )
+        parser.add_argument(
+            '--enqueue',
+            type=str,
+            metavar='JOB',
+            help='Queue the named job, then run as usual (combine with --once to run it now)',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List the registered jobs and exit',
+        )
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for name in registered_jobs():
+                self.stdout.write(name)
+            return
+
+        if options['enqueue']:
+            try:
+                job = enqueue(options['enqueue'])
+            except LookupError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(f'Queued {job}')
+
+        once = options['once']
+        interval = options['interval']
+        schedules = not options['no_schedules']
+        worker_id = options['worker_id'] or default_worker_id()
+
+        self.stdout.write(f'Worker {worker_id} started')
+
+        succeeded = 0
+        failed = 0
+        try:
+            while True:
+                close_old_connections()
+                if schedules:
+                    enqueue_due_schedules()
+
+                job = run_next(worker_id)
+                if job is not None:
+                    if job.status == Job.Status.SUCCEEDED:
+                        succeeded += 1
+                        self.stdout.write(self.style.SUCCESS(f'[OK] {job.name} #{job.pk}'))
+                    else:
+                        failed += 1
+                        retry = ' (will retry)' if job.status == Job.Status.QUEUED else ''
+                        self.stdout.write(
+                            self.style.ERROR(f'[ERROR] {job.name} #{job.pk}: {job.last_error}{retry}')
+                        )
+                    continue
+
+                if once:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write('Worker interrupted')
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(f'Jobs: {succeeded} succeeded, {failed} failed'))
@@ -1,8 +1,18 @@
 """Custom middleware for HindSight application."""
 
+import json
+import logging
+import time
+from contextlib import ExitStack
+
 from django.conf import settings
+from django.db import connections
 from django.shortcuts import redirect
 
+from .request_metrics import start_request_metrics, stop_request_metrics
+
+metrics_logger = logging.getLogger('hooptipp.request_metrics')
+
 
 class PrivacyGateMiddleware:
     """
@@ -48,3 +58,67 @@ class PrivacyGateMiddleware:
 
         # Redirect anonymous users to the login page
         return redirect(settings.LOGIN_URL)
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware that measures SQL, cache and external API usage per request.
+
+    Every response gets a ``Server-Timing`` header and a structured log line
+    on the ``hooptipp.request_metrics`` logger. Views listed in
+    REQUEST_QUERY_BUDGETS (keyed by URL name, e.g. ``predictions:home``) log a
+    warning when a request exceeds their query count or duration budget.
+
+    The middleware is only installed when REQUEST_METRICS_ENABLED is True.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics, token = start_request_metrics()
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.query_wrapper))
+                response = self.get_response(request)
+        finally:
+            stop_request_metrics(token)
+        total = time.perf_counter() - start
+
+        response['Server-Timing'] = metrics.server_timing(total)
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view_name = resolver_match.view_name if resolver_match else ''
+        log_data = {
+            'method': request.method,
+            'path': request.path,
+            'view': view_name,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 1),
+            **metrics.as_dict(),
+        }
+        metrics_logger.info('request_metrics %s', json.dumps(log_data, sort_keys=True))
+
+        budget = getattr(settings, 'REQUEST_QUERY_BUDGETS', {}).get(view_name)
+        if budget:
+            self._check_budget(view_name, budget, metrics, total)
+
+        return response
+
+    @staticmethod
+    def _check_budget(view_name, budget, metrics, total):
+        max_queries = budget.get('queries')
+        if max_queries is not None and metrics.sql_count > max_queries:
+            metrics_logger.warning(
+                'Query budget exceeded for %s: %d queries (budget %d)',
+                view_name, metrics.sql_count, max_queries,
+            )
+
+        max_ms = budget.get('total_ms')
+        if max_ms is not None and total * 1000 > max_ms:
+            metrics_logger.warning(
+                'Time budget exceeded for %s: %.1f ms (budget %d ms)',
+                view_name, total * 1000, max_ms,
+            )
@@ -0,0 +1,143 @@
+"""Project-wide models that are not tied to a specific feature app."""
+
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+
+class OutboundEmail(models.Model):
+    """
+    Durable outbox entry for a single email.
+
+    Web requests and management commands only queue rows here; the
+    ``run_mail_dispatcher`` management command delivers them in batches,
+    retrying failed deliveries with exponential backoff. The
+    ``idempotency_key`` deduplicates repeated enqueue attempts for the same
+    logical message (e.g. a reminder for the same events on the same day).
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        SENDING = 'sending', 'Sending'
+        SENT = 'sent', 'Sent'
+        FAILED = 'failed', 'Failed'
+
+    idempotency_key = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="Deduplication key - enqueueing the same key twice only stores one email",
+    )
+    subject = models.CharField(max_length=998)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254, blank=True)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['created_at', 'id']
+        verbose_name = 'Outbound email'
+        verbose_name_plural = 'Outbound emails'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
+
+
+class Job(models.Model):
+    """
+    Queued unit of background work, executed by the ``run_worker`` command.
+
+    Jobs refer to a callable registered in :mod:`hooptipp.jobs` by ``name``.
+    A worker leases a job by setting ``locked_by``/``locked_until``; a job
+    whose lease expired (e.g. the worker crashed) is picked up again. Only one
+    queued or running job may exist per non-empty ``dedup_key``, so repeated
+    enqueues (admin double clicks, overlapping schedules) collapse into one.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'Queued'
+        RUNNING = 'running', 'Running'
+        SUCCEEDED = 'succeeded', 'Succeeded'
+        FAILED = 'failed', 'Failed'
+
+    ACTIVE_STATUSES = (Status.QUEUED, Status.RUNNING)
+
+    name = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict, blank=True)
+    dedup_key = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Only one queued or running job may exist per key",
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.QUEUED,
+    )
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=1)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    progress = models.PositiveSmallIntegerField(default=0, help_text="Percent complete")
+    progress_message = models.CharField(max_length=255, blank=True)
+    result = models.JSONField(default=dict, blank=True)
+    last_error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        verbose_name = 'Background job'
+        verbose_name_plural = 'Background jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['dedup_key'],
+                condition=models.Q(status__in=['queued', 'running']) & ~models.Q(dedup_key=''),
+                name='job_active_dedup_key',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} #{self.pk} ({self.status})"
+
+
+class JobSchedule(models.Model):
+    """
+    Run state of a periodic job from ``JOB_SCHEDULES``.
+
+    The schedule definitions live in settings; this table only records when
+    each schedule is due next, so several workers enqueue every run exactly
+    once.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    next_run_at = models.DateTimeField(default=timezone.now)
+    last_enqueued_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Job schedule'
+        verbose_name_plural = 'Job schedules'
+
+    def __str__(self) -> str:
+        return f"{self.name} (next run {self.next_run_at:%Y-%m-%d %H:%M})"
@@ -2,7 +2,6 @@
 
 import json
 import logging
-import threading
 from datetime import datetime, timedelta
 
 from django.contrib import admin, messages
@@ -14,6 +13,8 @@ from django.utils import timezone
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
+from hooptipp.jobs import enqueue
+from hooptipp.models import Job
 from hooptipp.predictions.models import (
     Option,
     OptionCategory,
@@ -22,8 +23,9 @@ from hooptipp.predictions.models import (
     TipType,
 )
 
+from .game_mirror import upcoming_games, upsert_games
 from .models import NbaUserPreferences, ScheduledGame
-from .services import sync_players, sync_players_from_hoopshype, sync_teams, _build_bdl_client
+from .services import sync_players, sync_teams, _build_bdl_client
 
 logger = logging.getLogger(__name__)
 
@@ -116,17 +118,26 @@ class NbaUserPreferencesAdmin(admin.ModelAdmin):
 # as Options in the predictions admin.
 
 
-def add_upcoming_nba_games_view(request: HttpRequest):
-    """Fetch upcoming NBA games from BallDontLie and display for selection."""
-    if not request.user.has_perm('predictions.add_predictionevent'):
-        raise PermissionDenied
-    
+def _mirror_team_dict(team: dict) -> dict:
+    return {
+        field: (team or {}).get(field, None if field == 'id' else '')
+        for field in ('id', 'full_name', 'name', 'abbreviation', 'city', 'conference', 'division')
+    }
+
+
+def _fetch_upcoming_games_from_api(request: HttpRequest):
+    """
+    Fetch the next upcoming games from BallDontLie (1 API call).
+
+    Returns:
+        List of game dicts, or None after reporting an error via messages
+    """
     from balldontlie.exceptions import BallDontLieException
-    
+
     client = _build_bdl_client()
     if client is None:
         messages.error(request, 'BallDontLie API is not configured. Please set BALLDONTLIE_API_TOKEN.')
-        return HttpResponseRedirect(reverse('admin:index'))
+        return None
     
     # Fetch next 100 upcoming games (1 API call)
     today = timezone.localdate()
@@ -142,8 +153,11 @@ def add_upcoming_nba_games_view(request: HttpRequest):
         )
     except BallDontLieException as e:
         messages.error(request, f'Unable to fetch games from BallDontLie API: {str(e)}')
-        return HttpResponseRedirect(reverse('admin:index'))
-    
+        return None
+
+    # Keep the fetched schedule so the next visit reads it locally
+    upsert_games(response.data)
+
     # Process games
     games = []
     for game in response.data:
@@ -191,12 +205,6 @@ def add_upcoming_nba_games_view(request: HttpRequest):
         if game_time < timezone.now():
             continue
         
-        # Check if this game already exists as a PredictionEvent
-        existing_event = PredictionEvent.objects.filter(
-            source_id='nba-balldontlie',
-            source_event_id=game_id
-        ).first()
-        
         # Handle team data access for both dict and object responses
         if isinstance(game, dict):
             home_team_dict = {
@@ -244,28 +252,66 @@ def add_upcoming_nba_games_view(request: HttpRequest):
             
             arena = getattr(game, 'arena', '') or ''
         
-        game_dict = {
+        games.append({
             'game_id': game_id,
-            'game_time': game_time.isoformat(),
+            'game_time': game_time,
             'home_team': home_team_dict,
             'away_team': away_team_dict,
             'arena': arena,
+        })
+
+    return games
+
+
+def add_upcoming_nba_games_view(request: HttpRequest):
+    """
+    Display upcoming NBA games for selection.
+
+    Games are read from the local game mirror (see ``sync_nba_games``); the
+    BallDontLie API is only asked when the mirror has no upcoming games.
+    """
+    if not request.user.has_perm('predictions.add_predictionevent'):
+        raise PermissionDenied
+
+    candidates = [
+        {
+            'game_id': row.game_id,
+            'game_time': row.start_time,
+            'home_team': _mirror_team_dict(row.home_team),
+            'away_team': _mirror_team_dict(row.away_team),
+            'arena': row.arena,
         }
-        
+        for row in upcoming_games(days_ahead=60, limit=100)
+    ]
+    if not candidates:
+        candidates = _fetch_upcoming_games_from_api(request)
+        if candidates is None:
+            return HttpResponseRedirect(reverse('admin:index'))
+
+    existing_events = {
+        source_event_id: event_id
+        for source_event_id, event_id in PredictionEvent.objects.filter(
+            source_id='nba-balldontlie',
+            source_event_id__in=[candidate['game_id'] for candidate in candidates],
+        ).values_list('source_event_id', 'id')
+    }
+
+    games = []
+    for candidate in candidates:
+        game_time = candidate['game_time']
+        game_dict = {**candidate, 'game_time': game_time.isoformat()}
+
         # Serialize to JSON for hidden form field
         json_data = json.dumps(game_dict)
-        
+
+        existing_event_id = existing_events.get(candidate['game_id'])
         games.append({
-            'game_id': game_id,
-            'game_time': game_time,
-            'home_team': home_team_dict,
-            'away_team': away_team_dict,
-            'arena': arena,
-            'already_exists': existing_event is not None,
-            'existing_event_id': existing_event.id if existing_event else None,
+            **candidate,
+            'already_exists': existing_event_id is not None,
+            'existing_event_id': existing_event_id,
             'json_data': json_data,
         })
-    
+
     if not games:
         messages.info(request, 'No upcoming games found.')
         return HttpResponseRedirect(reverse('admin:index'))
@@ -498,54 +544,24 @@ def sync_teams_view(request: HttpRequest):
     return HttpResponseRedirect(reverse('admin:nba_sync'))
 
 
-def _run_player_sync_background():
-    """
-    Background worker function for player sync.
-    
-    Runs the HoopsHype sync and logs results. This function is executed in a separate thread
-    to avoid blocking the admin request.
-    """
-    try:
-        logger.info('Starting background HoopsHype player sync...')
-        result = sync_players_from_hoopshype()
-        
-        if not result.changed:
-            logger.info('HoopsHype player sync completed with no changes.')
-        else:
-            message_parts = []
-            if result.created:
-                message_parts.append(f'{result.created} player(s) created')
-            if result.updated:
-                message_parts.append(f'{result.updated} player(s) updated')
-            if result.removed:
-                message_parts.append(f'{result.removed} player(s) removed')
-            
-            logger.info(f'HoopsHype player sync completed successfully: {", ".join(message_parts)}.')
-    except Exception as e:
-        logger.exception(f'Background HoopsHype player sync failed: {str(e)}')
-
-
 def sync_players_view(request: HttpRequest):
-    """Sync NBA players from HoopsHype in the background."""
+    """Queue a HoopsHype player sync for the background worker."""
     if request.method != 'POST':
         return HttpResponseNotAllowed(['POST'])
     
     if not request.user.has_perm('predictions.add_option'):
         raise PermissionDenied
     
-    # Start the sync in a background thread
-    sync_thread = threading.Thread(
-        target=_run_player_sync_background,
-        daemon=True,
-        name='nba-player-sync'
-    )
-    sync_thread.start()
+    job = enqueue('nba.sync_players')
     
-    messages.info(
-        request,
-        'HoopsHype player sync started in the background. This will take about 30 seconds to complete. '
-        'Check the server logs for completion status. You can continue working normally.'
-    )
+    if job.status == Job.Status.RUNNING:
+        messages.info(request, f'A HoopsHype player sync is already running ({job.progress}% complete).')
+    else:
+        messages.info(
+            request,
+            'HoopsHype player sync queued. The background worker (run_worker) will pick it up shortly; '
+            'its progress is shown under Background jobs. You can continue working normally.'
+        )
     
     return HttpResponseRedirect(reverse('admin:nba_sync'))
 
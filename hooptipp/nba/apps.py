@@ -29,6 +29,14 @@ class NbaConfig(AppConfig):
         )
         from .models import NbaUserPreferences
 
+        # Rebuild the team logo URLs when NBA team options change
+        from django.db.models.signals import post_delete, post_save
+        from hooptipp.predictions.models import Option
+        from .logos import invalidate_on_team_change
+
+        post_save.connect(invalidate_on_team_change, sender=Option, dispatch_uid='nba_logo_urls_save')
+        post_delete.connect(invalidate_on_team_change, sender=Option, dispatch_uid='nba_logo_urls_delete')
+
         preferences_registry.register(
             PreferenceSection(
                 app_name='nba',
@@ -190,21 +190,12 @@ class NbaCardRenderer(CardRenderer):
             except UserEventScore.DoesNotExist:
                 context['user_score'] = None
             
-            # Calculate is_correct for the user's prediction
-            try:
-                user_tip = UserTip.objects.get(
-                    user=user,
-                    prediction_event=outcome.prediction_event
-                )
-                # Check if the user's prediction was correct
-                if outcome.winning_option and user_tip.prediction_option:
-                    context['is_correct'] = (user_tip.prediction_option.id == outcome.winning_option.id)
-                elif outcome.winning_generic_option and user_tip.selected_option:
-                    context['is_correct'] = (user_tip.selected_option.id == outcome.winning_generic_option.id)
-                else:
-                    context['is_correct'] = False
-            except UserTip.DoesNotExist:
-                context['is_correct'] = False
+            # Correctness of the user's prediction, stored when the outcome was scored
+            user_tip = UserTip.objects.filter(
+                user=user,
+                prediction_event=outcome.prediction_event,
+            ).only('result').first()
+            context['is_correct'] = bool(user_tip and user_tip.is_correct)
         else:
             context['user_score'] = None
             context['is_correct'] = False
@@ -13,6 +13,8 @@ from balldontlie.exceptions import BallDontLieException, RateLimitError
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+from hooptipp.request_metrics import record_cache_access, track_external_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,7 +62,8 @@ def _retry_on_rate_limit(func, *args, max_retries: int = 7, retry_delay: float =
     
     for attempt in range(max_retries + 1):
         try:
-            return func(*args, **kwargs)
+            with track_external_call("balldontlie"):
+                return func(*args, **kwargs)
         except RateLimitError as e:
             last_exception = e
             if attempt < max_retries:
@@ -114,10 +117,10 @@ class _CachedGamesAPI:
     def _get(self, key: Tuple[str, Any]) -> Optional[Any]:
         with self._lock:
             entry = self._cache.get(key)
-            if entry is None:
-                return None
-            if entry.is_valid():
+            if entry is not None and entry.is_valid():
+                record_cache_access(True)
                 return entry.value
+            record_cache_access(False)
             self._cache.pop(key, None)
             return None
 
@@ -194,10 +197,10 @@ class _CachedPlayersAPI:
     def _get(self, key: Tuple[str, Any]) -> Optional[Any]:
         with self._lock:
             entry = self._cache.get(key)
-            if entry is None:
-                return None
-            if entry.is_valid():
+            if entry is not None and entry.is_valid():
+                record_cache_access(True)
                 return entry.value
+            record_cache_access(False)
             self._cache.pop(key, None)
             return None
 
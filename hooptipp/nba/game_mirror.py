@@ -0,0 +1,446 @@
+"""Local mirror of the BallDontLie schedule and results.
+
+``sync_nba_games`` keeps :class:`~hooptipp.nba.models.NbaGame` rows up to date
+for a window around today with a few paginated, throttled list calls. Outcome
+processing, metadata backfills, the admin game picker and live cards read the
+mirror first and only go to the API for games it does not know yet (or whose
+in-progress score is stale); games fetched that way are written back so the
+next reader finds them locally.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import NbaGame, ScheduledGame, is_live_status
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100
+TEAM_FIELDS = ('id', 'full_name', 'name', 'abbreviation', 'city', 'conference', 'division')
+MIRROR_FIELDS = (
+    'game_date', 'start_time', 'season', 'postseason', 'status', 'period', 'clock',
+    'home_team', 'away_team', 'home_team_tricode', 'away_team_tricode',
+    'home_score', 'away_score', 'arena',
+)
+DEFAULT_SYNC_THROTTLE_SECONDS = 1.0
+DEFAULT_LIVE_MAX_AGE_SECONDS = 60
+
+
+@dataclass
+class GameSyncResult:
+    fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    pages: int = 0
+
+
+def _get(obj: Any, name: str, default: Any = None) -> Any:
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_str(value: Any) -> str:
+    return value if isinstance(value, str) else ''
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _team_dict(team: Any) -> Dict[str, Any]:
+    if team is None:
+        return {}
+    values = {field: _as_str(_get(team, field)) for field in TEAM_FIELDS}
+    values['id'] = _as_int(_get(team, 'id'))
+    return values
+
+
+def game_fields(game: Any) -> Optional[Dict[str, Any]]:
+    """
+    Map a BallDontLie game (object or dict) to :class:`NbaGame` field values.
+
+    Returns:
+        ``{'game_id': ..., <MIRROR_FIELDS>}`` or None if the game has no usable id or date
+    """
+    game_id = _as_int(_get(game, 'id'))
+    if game_id is None:
+        return None
+
+    status = _as_str(_get(game, 'status'))
+    # Scheduled games carry their tip-off time in ``datetime`` (or, in older
+    # responses, in ``status``)
+    start_time = _parse_datetime(_as_str(_get(game, 'datetime'))) or _parse_datetime(status)
+
+    game_day = None
+    raw_date = _as_str(_get(game, 'date'))
+    if raw_date:
+        try:
+            game_day = date.fromisoformat(raw_date[:10])
+        except ValueError:
+            game_day = None
+    if game_day is None and start_time is not None:
+        game_day = start_time.date()
+    if game_day is None:
+        return None
+
+    home_team = _team_dict(_get(game, 'home_team'))
+    away_team = _team_dict(_get(game, 'visitor_team'))
+    return {
+        'game_id': str(game_id),
+        'game_date': game_day,
+        'start_time': start_time,
+        'season': _as_int(_get(game, 'season')),
+        'postseason': _get(game, 'postseason') is True,
+        'status': status[:50],
+        'period': max(_as_int(_get(game, 'period')) or 0, 0),
+        'clock': _as_str(_get(game, 'time')).strip()[:20],
+        'home_team': home_team,
+        'away_team': away_team,
+        'home_team_tricode': home_team.get('abbreviation', '')[:5],
+        'away_team_tricode': away_team.get('abbreviation', '')[:5],
+        'home_score': _as_int(_get(game, 'home_team_score')),
+        'away_score': _as_int(_get(game, 'visitor_team_score')),
+        'arena': _as_str(_get(game, 'arena'))[:150],
+    }
+
+
+def game_data_from_api(game: Any) -> dict:
+    """Return the game data dict (see ``NbaGame.as_game_data``) of an API game."""
+
+    status = _get(game, 'status', '') or ''
+    return {
+        'away_score': _get(game, 'visitor_team_score'),
+        'home_score': _get(game, 'home_team_score'),
+        'game_status': status,
+        'is_live': is_live_status(status),
+    }
+
+
+def upsert_games(games: Iterable[Any], *, result: Optional[GameSyncResult] = None) -> GameSyncResult:
+    """
+    Write BallDontLie games to the mirror, touching only new or changed rows.
+
+    Args:
+        games: Game objects or dicts as returned by the API
+        result: Optional result to accumulate counts into
+
+    Returns:
+        The (updated) GameSyncResult
+    """
+    result = result or GameSyncResult()
+    incoming: Dict[str, Dict[str, Any]] = {}
+    for game in games:
+        fields = game_fields(game)
+        if fields is not None:
+            incoming[fields.pop('game_id')] = fields
+    result.fetched += len(incoming)
+    if not incoming:
+        return result
+
+    now = timezone.now()
+    existing = {row.game_id: row for row in NbaGame.objects.filter(game_id__in=list(incoming))}
+    to_create: List[NbaGame] = []
+    to_update: List[NbaGame] = []
+    for game_id, fields in incoming.items():
+        row = existing.get(game_id)
+        if row is None:
+            to_create.append(NbaGame(game_id=game_id, synced_at=now, **fields))
+            continue
+        changed = False
+        for field, value in fields.items():
+            if getattr(row, field) != value:
+                setattr(row, field, value)
+                changed = True
+        row.synced_at = now
+        to_update.append(row)
+        if changed:
+            result.updated += 1
+        else:
+            result.unchanged += 1
+
+    if to_create:
+        NbaGame.objects.bulk_create(to_create, batch_size=PAGE_SIZE, ignore_conflicts=True)
+        result.created += len(to_create)
+    if to_update:
+        # synced_at is refreshed for unchanged rows too so freshness checks hold
+        NbaGame.objects.bulk_update(to_update, [*MIRROR_FIELDS, 'synced_at'], batch_size=PAGE_SIZE)
+    return result
+
+
+def _team_ids_for_tricodes(tricodes: Iterable[str]) -> List[int]:
+    from hooptipp.predictions.models import Option
+
+    from .managers import NbaTeamManager
+
+    tricodes = {tricode.upper() for tricode in tricodes if tricode}
+    if not tricodes:
+        return []
+    team_ids = set()
+    for external_id in Option.objects.filter(
+        category__slug=NbaTeamManager.CATEGORY_SLUG,
+        short_name__in=tricodes,
+    ).values_list('external_id', flat=True):
+        team_id = _as_int(external_id)
+        if team_id is not None:
+            team_ids.add(team_id)
+    return sorted(team_ids)
+
+
+def fetch_games(
+    client,
+    *,
+    dates: Optional[Sequence[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    team_ids: Optional[Sequence[int]] = None,
+    game_ids: Optional[Iterable[str]] = None,
+    throttle_seconds: float = 0,
+    result: Optional[GameSyncResult] = None,
+) -> List[Any]:
+    """
+    Fetch games from BallDontLie, following the pagination cursor.
+
+    When ``game_ids`` is given, pagination stops as soon as all of them were
+    seen and games still missing afterwards are fetched one by one.
+
+    Args:
+        client: BallDontLie client
+        dates: Game days (``YYYY-MM-DD``) to filter by
+        start_date: Start of a date range (``YYYY-MM-DD``)
+        end_date: End of a date range (``YYYY-MM-DD``)
+        team_ids: BallDontLie team ids to filter by
+        game_ids: Game ids the caller needs
+        throttle_seconds: Pause between page requests
+        result: Optional result to count pages into
+
+    Returns:
+        List of game objects as returned by the API
+    """
+    wanted = {str(game_id) for game_id in game_ids} if game_ids is not None else None
+    params: Dict[str, Any] = {'per_page': PAGE_SIZE}
+    if dates:
+        params['dates'] = sorted(dates)
+    if start_date:
+        params['start_date'] = start_date
+    if end_date:
+        params['end_date'] = end_date
+    if team_ids:
+        params['team_ids'] = list(team_ids)
+
+    games: List[Any] = []
+    seen: set[str] = set()
+    cursor = None
+    has_filter = bool(dates or start_date or end_date)
+    while has_filter:
+        if cursor is not None and throttle_seconds > 0:
+            time.sleep(throttle_seconds)
+        try:
+            response = client.nba.games.list(**params, **({'cursor': cursor} if cursor is not None else {}))
+        except Exception as exc:
+            logger.warning('Failed to fetch games page (cursor %s): %s', cursor, exc)
+            break
+        if result is not None:
+            result.pages += 1
+        for game in getattr(response, 'data', None) or []:
+            games.append(game)
+            seen.add(str(_get(game, 'id', '')))
+
+        if wanted is not None and wanted <= seen:
+            break
+        meta = getattr(response, 'meta', None)
+        cursor = _get(meta, 'next_cursor')
+        if cursor is None or _as_int(cursor) is None:
+            break
+
+    for game_id in sorted((wanted or set()) - seen):
+        try:
+            game = getattr(client.nba.games.get(int(game_id)), 'data', None)
+        except Exception as exc:
+            logger.warning('Failed to fetch data for game %s: %s', game_id, exc)
+            continue
+        if game is not None:
+            games.append(game)
+    return games
+
+
+def _fetch_params_for(scheduled_games: Sequence[ScheduledGame]) -> Dict[str, Any]:
+    dates = set()
+    for game in scheduled_games:
+        if game.game_date:
+            # Games are stored in UTC; in US local time they may be on the previous
+            # day, and BallDontLie reports the US date, so look at both days
+            day = game.game_date.date()
+            dates.add(day.isoformat())
+            dates.add((day + timedelta(days=1)).isoformat())
+    team_ids = _team_ids_for_tricodes(
+        tricode
+        for game in scheduled_games
+        for tricode in (game.home_team_tricode, game.away_team_tricode)
+    )
+    return {'dates': sorted(dates), 'team_ids': team_ids}
+
+
+def get_games_data(
+    scheduled_games: Iterable[ScheduledGame],
+    *,
+    client_factory: Callable[[], Any],
+    max_age: Optional[timedelta] = None,
+) -> Dict[str, dict]:
+    """
+    Return game data for scheduled games, reading the mirror first.
+
+    Final games are always served from the mirror; other mirrored games only
+    while they were synced within ``max_age``. The remaining games are fetched
+    from BallDontLie in as few calls as possible and written to the mirror.
+
+    Args:
+        scheduled_games: ScheduledGames to look up
+        client_factory: Returns a BallDontLie client (or None when not configured)
+        max_age: How old a non-final mirrored game may be (default: never fresh)
+
+    Returns:
+        Dictionary mapping nba_game_id to game data (see ``NbaGame.as_game_data``)
+    """
+    scheduled_games = list(scheduled_games)
+    wanted = {game.nba_game_id for game in scheduled_games}
+    if not wanted:
+        return {}
+
+    fresh_after = timezone.now() - max_age if max_age is not None else None
+    game_data: Dict[str, dict] = {}
+    for row in NbaGame.objects.filter(game_id__in=list(wanted)):
+        if row.is_final or (fresh_after is not None and row.synced_at >= fresh_after):
+            game_data[row.game_id] = row.as_game_data()
+
+    missing = [game for game in scheduled_games if game.nba_game_id not in game_data]
+    if not missing:
+        return game_data
+
+    client = client_factory()
+    if client is None:
+        logger.warning('BallDontLie API client not available; %d games not in the mirror', len(missing))
+        return game_data
+
+    fetched = fetch_games(
+        client,
+        game_ids=[game.nba_game_id for game in missing],
+        **_fetch_params_for(missing),
+    )
+    upsert_games(fetched)
+    missing_ids = {game.nba_game_id for game in missing}
+    for game in fetched:
+        game_id = str(_get(game, 'id', ''))
+        if game_id in missing_ids:
+            game_data[game_id] = game_data_from_api(game)
+    return game_data
+
+
+def sync_games(
+    *,
+    days_back: int = 2,
+    days_ahead: int = 14,
+    client=None,
+    throttle_seconds: Optional[float] = None,
+) -> GameSyncResult:
+    """
+    Mirror all games from ``days_back`` days ago to ``days_ahead`` days ahead.
+
+    Args:
+        days_back: Days before today to include (recent results)
+        days_ahead: Days after today to include (schedule)
+        client: BallDontLie client (built from settings when omitted)
+        throttle_seconds: Pause between page requests (default: NBA_GAME_SYNC_THROTTLE_SECONDS)
+
+    Returns:
+        GameSyncResult with counts
+
+    Raises:
+        RuntimeError: If no BallDontLie client is available
+    """
+    if client is None:
+        from .services import _build_bdl_client
+
+        client = _build_bdl_client()
+    if client is None:
+        raise RuntimeError('BallDontLie API client not available')
+
+    if throttle_seconds is None:
+        throttle_seconds = getattr(settings, 'NBA_GAME_SYNC_THROTTLE_SECONDS', DEFAULT_SYNC_THROTTLE_SECONDS)
+
+    today = timezone.localdate()
+    result = GameSyncResult()
+    games = fetch_games(
+        client,
+        start_date=(today - timedelta(days=days_back)).isoformat(),
+        end_date=(today + timedelta(days=days_ahead)).isoformat(),
+        throttle_seconds=throttle_seconds,
+        result=result,
+    )
+    upsert_games(games, result=result)
+    return result
+
+
+def get_mirrored_game(nba_game_id: str, *, max_age: Optional[timedelta] = None) -> Optional[NbaGame]:
+    """
+    Return the mirrored game if it can be shown without asking the API.
+
+    Final games and games that have not started yet are always usable; games
+    in progress only while synced within ``max_age`` (default:
+    NBA_LIVE_GAME_MAX_AGE_SECONDS).
+    """
+    row = NbaGame.objects.filter(game_id=str(nba_game_id)).first()
+    if row is None:
+        return None
+    if row.is_final:
+        return row
+
+    now = timezone.now()
+    if max_age is None:
+        max_age = timedelta(
+            seconds=getattr(settings, 'NBA_LIVE_GAME_MAX_AGE_SECONDS', DEFAULT_LIVE_MAX_AGE_SECONDS)
+        )
+    if row.synced_at >= now - max_age:
+        return row
+    if row.start_time is not None and row.start_time > now and not row.is_live:
+        return row
+    return None
+
+
+def upcoming_games(*, days_ahead: int = 60, limit: int = 100) -> List[NbaGame]:
+    """Return mirrored games that have not started yet, soonest first."""
+
+    now = timezone.now()
+    rows = NbaGame.objects.filter(
+        start_time__gt=now,
+        start_time__lte=now + timedelta(days=days_ahead),
+    ).order_by('start_time', 'game_id')
+    return [row for row in rows[:limit] if not row.is_final]
@@ -0,0 +1,238 @@
+"""HoopsHype roster scraping: polite concurrent fetching, HTML cache and parsing.
+
+Team salary pages are fetched through a per-host limiter (bounded concurrency
+and a minimum interval between request starts). Raw HTML is cached by URL
+together with its ``ETag``/``Last-Modified`` validators, so later runs send
+conditional requests and reuse the cached page on ``304 Not Modified``.
+Parsing only builds a tree for the roster table (``SoupStrainer``) instead of
+the whole page.
+
+For benchmarks and tests, pages can be recorded to and replayed from a
+directory of HTML files (one ``<team-slug>.html`` per team).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from django.conf import settings
+from django.core.cache import cache
+
+from hooptipp.request_metrics import track_external_call
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+ROSTER_TABLE_CLASS = 'hh-salaries-ranking-table'
+HTML_CACHE_PREFIX = 'hoopshype:html:'
+DEFAULT_HTML_CACHE_TIMEOUT = 7 * 24 * 3600
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MIN_INTERVAL = 0.25
+
+
+class HostRateLimiter:
+    """
+    Limit concurrent requests and request rate per host.
+
+    At most ``max_concurrency`` requests to the same host run at once, and two
+    requests to the same host start at least ``min_interval`` seconds apart.
+    """
+
+    def __init__(self, *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_concurrency)
+            return self._semaphores[host]
+
+    def _reserve_start(self, host: str) -> float:
+        """Return how long to wait so this request starts ``min_interval`` after the previous one."""
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+            return start - now
+
+    def request(self, url: str, func, *args, **kwargs):
+        """Call ``func(*args, **kwargs)`` for ``url`` within the host's limits."""
+
+        host = urlparse(url).netloc
+        with self._semaphore(host):
+            delay = self._reserve_start(host)
+            if delay > 0:
+                time.sleep(delay)
+            return func(*args, **kwargs)
+
+
+_default_limiter: Optional[HostRateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> HostRateLimiter:
+    """Return the process-wide limiter configured from settings."""
+
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = HostRateLimiter(
+                max_concurrency=getattr(settings, 'HOOPSHYPE_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY),
+                min_interval=getattr(settings, 'HOOPSHYPE_MIN_INTERVAL', DEFAULT_MIN_INTERVAL),
+            )
+        return _default_limiter
+
+
+def team_slug_from_url(url: str) -> str:
+    """Return the team slug of a HoopsHype team URL (``.../teams/boston-celtics/2/`` → ``boston-celtics``)."""
+
+    parts = [part for part in urlparse(url).path.split('/') if part]
+    if 'teams' in parts and parts.index('teams') + 1 < len(parts):
+        return parts[parts.index('teams') + 1]
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+
+
+def _cache_key(url: str) -> str:
+    return HTML_CACHE_PREFIX + hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def fetch_html(
+    url: str,
+    *,
+    session: Optional[requests.Session] = None,
+    limiter: Optional[HostRateLimiter] = None,
+    replay_dir: Optional[Path] = None,
+    record_dir: Optional[Path] = None,
+    timeout: float = 10,
+) -> str:
+    """
+    Return the HTML of ``url``, revalidating a cached copy when available.
+
+    Args:
+        url: Page to fetch
+        session: Optional requests session (connection reuse across threads)
+        limiter: Per-host limiter (defaults to the process-wide one)
+        replay_dir: Read ``<team-slug>.html`` from this directory instead of the network
+        record_dir: Also write the fetched page to ``<team-slug>.html`` in this directory
+        timeout: Request timeout in seconds
+
+    Raises:
+        requests.RequestException: If the page cannot be fetched and no cached copy exists
+        FileNotFoundError: In replay mode when the page was never recorded
+    """
+    if replay_dir is not None:
+        return (Path(replay_dir) / f'{team_slug_from_url(url)}.html').read_text(encoding='utf-8')
+
+    key = _cache_key(url)
+    cached: Optional[Dict[str, Any]] = cache.get(key)
+    headers = {'User-Agent': USER_AGENT}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    getter = session.get if session is not None else requests.get
+
+    def _get():
+        with track_external_call('hoopshype'):
+            return getter(url, headers=headers, timeout=timeout)
+
+    response = (limiter or get_limiter()).request(url, _get)
+
+    if response.status_code == 304 and cached:
+        logger.debug('HoopsHype page not modified: %s', url)
+        html = cached['html']
+    else:
+        response.raise_for_status()
+        html = response.text
+        cache.set(
+            key,
+            {
+                'html': html,
+                'etag': response.headers.get('ETag', ''),
+                'last_modified': response.headers.get('Last-Modified', ''),
+            },
+            getattr(settings, 'HOOPSHYPE_HTML_CACHE_TIMEOUT', DEFAULT_HTML_CACHE_TIMEOUT),
+        )
+
+    if record_dir is not None:
+        record_dir = Path(record_dir)
+        record_dir.mkdir(parents=True, exist_ok=True)
+        (record_dir / f'{team_slug_from_url(url)}.html').write_text(html, encoding='utf-8')
+    return html
+
+
+def parse_roster_html(html: str, team_name: str) -> List[Dict[str, Any]]:
+    """
+    Extract the players of a HoopsHype team salary page.
+
+    Only the roster table (identified by its class) is parsed; pages without it
+    fall back to the first ``<table>`` of the page.
+
+    Returns:
+        List of player dicts with ``name``, ``position``, ``salary`` and ``team``.
+    """
+    # Tokenising dominates parse time, so cut the roster table out of the page
+    # first and only hand the whole document to the parser if that fails
+    fragment = _slice_roster_table(html)
+    soup = BeautifulSoup(fragment or html, 'html.parser', parse_only=SoupStrainer('table'))
+    roster_table = soup.find('table', class_=ROSTER_TABLE_CLASS) or soup.find('table')
+    if roster_table is None:
+        return []
+
+    players = []
+    for row in roster_table.find_all('tr')[1:]:  # Skip header row
+        cells = row.find_all(['td', 'th'])
+        if len(cells) < 2:
+            continue
+
+        # Cell 0 is the row number, cell 1 the player name, cell 2 the current season salary
+        player_name = cells[1].get_text(strip=True)
+        if (not player_name or
+                player_name.lower() in ['player', 'name'] or
+                player_name.startswith('$') or
+                cells[0].get_text(strip=True).lower() == 'total'):
+            continue
+
+        salary = cells[2].get_text(strip=True) if len(cells) > 2 else ''
+        player_name = re.sub(r'\s+', ' ', player_name).strip()
+        if player_name:
+            players.append({
+                'name': player_name,
+                # HoopsHype salary pages do not show positions
+                'position': '',
+                'salary': re.sub(r'\s+', ' ', salary).strip(),
+                'team': team_name,
+            })
+    return players
+
+
+def _slice_roster_table(html: str) -> Optional[str]:
+    """Return the markup of the roster table, or None if it cannot be located."""
+
+    marker = html.find(ROSTER_TABLE_CLASS)
+    if marker < 0:
+        return None
+    start = html.rfind('<table', 0, marker)
+    end = html.find('</table>', marker)
+    if start < 0 or end < 0:
+        return None
+    return html[start:end + len('</table>')]
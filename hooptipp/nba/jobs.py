@@ -0,0 +1,37 @@
+"""Background jobs of the NBA app (see :mod:`hooptipp.jobs`)."""
+
+from __future__ import annotations
+
+import logging
+
+from hooptipp.jobs import JobContext, job, register_command
+
+from .services import sync_players_from_hoopshype
+
+logger = logging.getLogger(__name__)
+
+register_command('sync_nba_games')
+register_command('process_game_outcomes')
+
+
+@job('nba.sync_players')
+def sync_players(context: JobContext) -> dict:
+    """Sync NBA players from HoopsHype (queued from the NBA sync admin page)."""
+
+    logger.info('Starting HoopsHype player sync...')
+    context.set_progress(0, 'Fetching HoopsHype rosters', force=True)
+    result = sync_players_from_hoopshype()
+
+    if not result.changed:
+        logger.info('HoopsHype player sync completed with no changes.')
+    else:
+        message_parts = []
+        if result.created:
+            message_parts.append(f'{result.created} player(s) created')
+        if result.updated:
+            message_parts.append(f'{result.updated} player(s) updated')
+        if result.removed:
+            message_parts.append(f'{result.removed} player(s) removed')
+        logger.info(f'HoopsHype player sync completed successfully: {", ".join(message_parts)}.')
+
+    return {'created': result.created, 'updated': result.updated, 'removed': result.removed}
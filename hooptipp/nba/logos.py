@@ -0,0 +1,133 @@
+"""Team logo manifest.
+
+``download_team_logos`` writes ``manifest.json`` next to the downloaded logos
+(tricode → file name and SHA-256). At runtime the manifest and the NBA team
+Options are combined once per process into a tricode → URL dict, so
+:func:`hooptipp.nba.services.get_team_logo_url` is a dict lookup that does not
+touch the database, the cache or the filesystem while rendering cards.
+
+The dict is rebuilt in the process that changes a team Option or runs
+``download_team_logos``. Other processes keep theirs until they restart, so
+logos downloaded outside a deploy show up in the web workers after their
+next restart.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.json'
+LOGO_EXTENSION = 'svg'
+CDN_LOGO_URL = 'https://cdn.nba.com/logos/nba/{nba_team_id}/global/L/logo.svg'
+
+_logo_urls: Optional[Dict[str, str]] = None
+_logo_urls_lock = threading.Lock()
+
+
+def get_logos_dir() -> Path:
+    """Return the static directory the team logos are stored in."""
+
+    static_dir = Path(settings.STATICFILES_DIRS[0]) if settings.STATICFILES_DIRS else Path(settings.STATIC_ROOT)
+    return static_dir / 'nba' / 'logos'
+
+
+def hash_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def read_manifest(logos_dir: Optional[Path] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Return the logo manifest as ``{tricode: {'file': ..., 'sha256': ...}}``.
+
+    Falls back to scanning the directory (without hashes) when no manifest has
+    been written yet.
+    """
+    logos_dir = logos_dir or get_logos_dir()
+    manifest_path = logos_dir / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, encoding='utf-8') as handle:
+            return json.load(handle).get('logos', {})
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as exc:
+        logger.warning('Ignoring unreadable logo manifest %s: %s', manifest_path, exc)
+
+    if not logos_dir.is_dir():
+        return {}
+    return {
+        path.stem.upper(): {'file': path.name}
+        for path in sorted(logos_dir.glob(f'*.{LOGO_EXTENSION}'))
+    }
+
+
+def write_manifest(logos_dir: Optional[Path] = None) -> Dict[str, Dict[str, str]]:
+    """Hash every logo in ``logos_dir``, write ``manifest.json`` and reset the URL cache."""
+
+    logos_dir = logos_dir or get_logos_dir()
+    logos = {
+        path.stem.upper(): {'file': path.name, 'sha256': hash_bytes(path.read_bytes())}
+        for path in sorted(logos_dir.glob(f'*.{LOGO_EXTENSION}'))
+    }
+    with open(logos_dir / MANIFEST_FILENAME, 'w', encoding='utf-8') as handle:
+        json.dump({'logos': logos}, handle, indent=2, sort_keys=True)
+        handle.write('\n')
+    invalidate_logo_urls()
+    return logos
+
+
+def build_logo_urls() -> Dict[str, str]:
+    """Resolve every known tricode to its local static URL or CDN URL."""
+
+    from hooptipp.predictions.models import Option
+
+    from .managers import NbaTeamManager
+
+    urls: Dict[str, str] = {}
+    for short_name, metadata in Option.objects.filter(
+        category__slug=NbaTeamManager.CATEGORY_SLUG
+    ).values_list('short_name', 'metadata'):
+        nba_team_id = (metadata or {}).get('nba_team_id')
+        if short_name and nba_team_id:
+            urls[short_name.upper()] = CDN_LOGO_URL.format(nba_team_id=nba_team_id)
+
+    # Local logos win over the CDN
+    for tricode, entry in read_manifest().items():
+        urls[tricode.upper()] = f"{settings.STATIC_URL}nba/logos/{entry['file']}"
+    return urls
+
+
+def get_logo_urls() -> Dict[str, str]:
+    """Return the tricode → URL dict, building it on first use in this process."""
+
+    global _logo_urls
+    urls = _logo_urls
+    if urls is None:
+        with _logo_urls_lock:
+            if _logo_urls is None:
+                _logo_urls = build_logo_urls()
+            urls = _logo_urls
+    return urls
+
+
+def invalidate_logo_urls(*args, **kwargs) -> None:
+    """Drop the tricode → URL dict; usable as a signal receiver."""
+
+    global _logo_urls
+    with _logo_urls_lock:
+        _logo_urls = None
+
+
+def invalidate_on_team_change(sender, instance, **kwargs) -> None:
+    """Option save/delete receiver that resets the URLs when an NBA team changes."""
+
+    if 'nba_team_id' in (instance.metadata or {}):
+        invalidate_logo_urls()
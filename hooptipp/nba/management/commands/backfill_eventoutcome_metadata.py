@@ -1,8 +1,9 @@
 """
 Management command to backfill metadata for existing EventOutcomes.
 
-This command fetches live game data from the BallDontLie API to populate
-metadata for EventOutcomes that were created before the metadata field was added.
+This command reads final game data from the local game mirror (falling back to
+the BallDontLie API for games not mirrored yet) to populate metadata for
+EventOutcomes that were created before the metadata field was added.
 """
 
 from __future__ import annotations
@@ -10,12 +11,12 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from django.core.management.base import BaseCommand, CommandError
+from django.core.management.base import BaseCommand
 from django.db import models, transaction
-from django.utils import timezone
 
 from hooptipp.predictions.models import EventOutcome
-from hooptipp.nba.services import get_live_game_data
+from hooptipp.nba.game_mirror import get_games_data
+from hooptipp.nba.services import _build_bdl_client, get_live_game_data
 
 logger = logging.getLogger(__name__)
 
@@ -163,160 +164,23 @@ class Command(BaseCommand):
 
     def batch_fetch_game_data(self, outcomes: list[EventOutcome]) -> dict[str, dict]:
         """
-        Batch fetch game data for multiple EventOutcomes to minimize API calls.
-        
+        Get game data for multiple EventOutcomes from the local game mirror.
+
+        Games missing from the mirror are fetched from BallDontLie in as few
+        calls as possible and written back to the mirror.
+
         Args:
             outcomes: List of EventOutcomes to fetch data for
-            
+
         Returns:
             Dictionary mapping nba_game_id to game data
         """
-        from hooptipp.nba.services import _build_bdl_client
-        from datetime import datetime, timedelta
-        
-        game_data_map = {}
-        
-        # Group outcomes by unique game IDs and collect team IDs and dates
-        unique_game_ids = set()
-        team_ids = set()
-        dates = set()
-        
-        for outcome in outcomes:
-            game = outcome.prediction_event.scheduled_game
-            game_id = game.nba_game_id
-            unique_game_ids.add(game_id)
-            
-            # Extract dates from the game
-            if hasattr(game, 'game_date') and game.game_date:
-                dates.add(game.game_date.strftime('%Y-%m-%d'))
-            
-            # Extract team IDs from the game
-            # We need to map team names to BallDontLie team IDs
-            # For now, we'll focus on date filtering which is more reliable
-            # TODO: Add team ID mapping for even more precise filtering
-        
-        if not unique_game_ids:
-            return game_data_map
-        
-        self.stdout.write(f'Fetching data for {len(unique_game_ids)} unique games...')
-        
-        try:
-            client = _build_bdl_client()
-            if client is None:
-                self.stdout.write(self.style.ERROR('BallDontLie API client not available'))
-                return game_data_map
-            
-            # Single API call with all dates and team IDs
-            if dates:
-                date_list = list(dates)
-                self.stdout.write(f'Filtering by dates: {date_list}')
-                
-                # Single API call with all dates at once
-                try:
-                    response = client.nba.games.list(
-                        per_page=100,
-                        dates=date_list  # Pass all dates in one call
-                    )
-                    
-                    # Process the response to extract game data
-                    for game in getattr(response, "data", []) or []:
-                        game_id = str(getattr(game, "id", ""))
-                        if game_id in unique_game_ids:
-                            game_data_map[game_id] = self._extract_game_data_from_response(game)
-                            self.stdout.write(f'  Found data for game {game_id}')
-                            
-                except Exception as e:
-                    logger.warning(f'Failed to fetch games for dates {date_list}: {e}')
-                    # Fall back to individual date calls if the combined call fails
-                    self.stdout.write('Falling back to individual date calls...')
-                    for date_str in date_list:
-                        try:
-                            response = client.nba.games.list(
-                                per_page=100,
-                                dates=[date_str]
-                            )
-                            
-                            for game in getattr(response, "data", []) or []:
-                                game_id = str(getattr(game, "id", ""))
-                                if game_id in unique_game_ids:
-                                    game_data_map[game_id] = self._extract_game_data_from_response(game)
-                                    self.stdout.write(f'  Found data for game {game_id}')
-                        except Exception as e:
-                            logger.warning(f'Failed to fetch games for date {date_str}: {e}')
-                            continue
-            else:
-                # Fallback: fetch recent games and filter client-side
-                self.stdout.write('No specific dates found, fetching recent games...')
-                try:
-                    response = client.nba.games.list(
-                        per_page=100,
-                        # Fetch recent games (last 30 days)
-                        start_date=(datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
-                        end_date=datetime.now().strftime('%Y-%m-%d')
-                    )
-                    
-                    # Process the response to extract game data
-                    for game in getattr(response, "data", []) or []:
-                        game_id = str(getattr(game, "id", ""))
-                        if game_id in unique_game_ids:
-                            game_data_map[game_id] = self._extract_game_data_from_response(game)
-                            self.stdout.write(f'  Found data for game {game_id}')
-                except Exception as e:
-                    logger.warning(f'Failed to fetch recent games: {e}')
-            
-            # If we still don't have all the games we need, fall back to individual calls
-            missing_games = unique_game_ids - set(game_data_map.keys())
-            if missing_games:
-                self.stdout.write(f'Fetching {len(missing_games)} remaining games individually...')
-                for game_id in missing_games:
-                    try:
-                        response = client.nba.games.get(int(game_id))
-                        game = getattr(response, "data", None)
-                        if game:
-                            game_data_map[game_id] = self._extract_game_data_from_response(game)
-                            self.stdout.write(f'  Found data for game {game_id}')
-                    except Exception as e:
-                        logger.warning(f'Failed to fetch data for game {game_id}: {e}')
-                        continue
-                        
-        except Exception as e:
-            logger.exception(f'Failed to batch fetch game data: {e}')
-            self.stdout.write(self.style.ERROR(f'Failed to fetch game data: {e}'))
-        
+        scheduled_games = [outcome.prediction_event.scheduled_game for outcome in outcomes]
+        self.stdout.write(f'Fetching data for {len({game.nba_game_id for game in scheduled_games})} unique games...')
+        game_data_map = get_games_data(scheduled_games, client_factory=_build_bdl_client)
         self.stdout.write(f'Successfully fetched data for {len(game_data_map)} games')
         return game_data_map
 
-    def _extract_game_data_from_response(self, game) -> dict:
-        """
-        Extract game data from BallDontLie API response.
-        
-        Args:
-            game: Game object from BallDontLie API
-            
-        Returns:
-            Dictionary with game data
-        """
-        # Extract scores
-        home_score = getattr(game, "home_team_score", None)
-        away_score = getattr(game, "visitor_team_score", None)
-        
-        # Extract status
-        status = getattr(game, "status", "")
-        
-        # Determine if game is live
-        status_lower = str(status).lower()
-        is_live = any(
-            keyword in status_lower
-            for keyword in ["q1", "q2", "q3", "q4", "ot", "halftime"]
-        )
-        
-        return {
-            "away_score": away_score,
-            "home_score": home_score,
-            "game_status": status,
-            "is_live": is_live,
-        }
-
     def update_eventoutcome_metadata_batched(self, outcome: EventOutcome, game_data_map: dict[str, dict], dry_run: bool = False) -> Optional[str]:
         """
         Update metadata for a single EventOutcome using pre-fetched game data.
@@ -3,23 +3,23 @@ Management command to download NBA team logos and store them locally.
 
 This command fetches team logos from the NBA CDN and stores them in the static
 directory for local use, eliminating the need to fetch them from external sources.
+Downloads run in parallel; with --force, logos whose content hash did not change
+are left untouched. Afterwards the logo manifest (see hooptipp.nba.logos) is
+rewritten so get_team_logo_url resolves the new files.
 """
 
 from __future__ import annotations
 
 import logging
-import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
 
-from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
-from django.core.files.storage import default_storage
 
+from hooptipp.nba.logos import MANIFEST_FILENAME, get_logos_dir, hash_bytes, write_manifest
 from hooptipp.nba.managers import NbaTeamManager
-from hooptipp.nba.services import BALLDONTLIE_TO_NBA_TEAM_ID_MAP
 
 logger = logging.getLogger(__name__)
 
@@ -50,16 +50,22 @@ class Command(BaseCommand):
             default='svg',
             help='Logo format to download (default: svg)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Number of parallel downloads (default: 8)',
+        )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         force = options['force']
         team_filter = options['team']
         logo_format = options['format']
+        workers = max(1, options['workers'])
         
         # Get static directory
-        static_dir = Path(settings.STATICFILES_DIRS[0]) if settings.STATICFILES_DIRS else Path(settings.STATIC_ROOT)
-        logos_dir = static_dir / 'nba' / 'logos'
+        logos_dir = get_logos_dir()
         
         # Create logos directory if it doesn't exist
         if not dry_run:
@@ -82,11 +88,22 @@ class Command(BaseCommand):
         downloaded_count = 0
         skipped_count = 0
         error_count = 0
-        
-        for team in teams:
+        changed = False
+        
+        # Only the HTTP requests and file writes run in worker threads; results
+        # are reported in team order
+        teams = list(teams)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.download_team_logo, team, logos_dir, logo_format, force, dry_run)
+                for team in teams
+            ]
+
+        for team, future in zip(teams, futures):
             try:
-                result = self.download_team_logo(team, logos_dir, logo_format, force, dry_run)
+                result = future.result()
                 if result == 'downloaded':
+                    changed = True
                     downloaded_count += 1
                     self.stdout.write(
                         self.style.SUCCESS(f'[OK] Downloaded: {team.short_name} ({team.name})')
@@ -96,6 +113,11 @@ class Command(BaseCommand):
                     self.stdout.write(
                         self.style.WARNING(f'[SKIP] Skipped: {team.short_name} (already exists)')
                     )
+                elif result == 'unchanged':
+                    skipped_count += 1
+                    self.stdout.write(
+                        self.style.WARNING(f'[SKIP] Unchanged: {team.short_name} (same content hash)')
+                    )
                 else:
                     self.stdout.write(
                         self.style.WARNING(f'[SKIP] Skipped: {team.short_name} (no NBA team ID)')
@@ -116,24 +138,30 @@ class Command(BaseCommand):
             )
         )
         
-        if not dry_run and downloaded_count > 0:
+        if not dry_run and (changed or not (logos_dir / MANIFEST_FILENAME).exists()):
+            write_manifest(logos_dir)
             self.stdout.write('')
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'Logos saved to: {logos_dir}'
+                    f'Logos saved to: {logos_dir} (manifest updated)'
                 )
             )
-            self.stdout.write(
-                'You can now update the get_team_logo_url function to use local logos instead of CDN URLs.'
-            )
 
-    def download_team_logo(self, team, logos_dir: Path, logo_format: str, force: bool, dry_run: bool) -> Optional[str]:
+    def download_team_logo(
+        self,
+        team,
+        logos_dir: Path,
+        logo_format: str,
+        force: bool,
+        dry_run: bool,
+    ) -> Optional[str]:
         """
         Download a team logo and save it locally.
         
         Returns:
             'downloaded' if logo was downloaded
             'skipped' if logo already exists and force=False
+            'unchanged' if the downloaded logo has the same content hash as the local file
             None if no NBA team ID available
         """
         # Get NBA team ID from metadata
@@ -169,6 +197,10 @@ class Command(BaseCommand):
             response = requests.get(cdn_url, timeout=30)
             response.raise_for_status()
             
+            # Skip the write (and the manifest update) when the logo did not change
+            if local_path.exists() and hash_bytes(local_path.read_bytes()) == hash_bytes(response.content):
+                return 'unchanged'
+            
             # Save the file
             with open(local_path, 'wb') as f:
                 f.write(response.content)
@@ -9,20 +9,23 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 
-from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
 from hooptipp.predictions.models import EventOutcome, PredictionEvent, PredictionOption
-from hooptipp.nba.models import ScheduledGame
+from hooptipp.predictions.scoring_queue import scoring_batch
+from hooptipp.nba.game_mirror import get_games_data
 from hooptipp.nba.services import _build_bdl_client
-from hooptipp.nba.managers import NbaTeamManager
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MIRROR_MAX_AGE_SECONDS = 600
+
 
 class Command(BaseCommand):
     help = 'Process completed NBA games and create EventOutcome records'
@@ -45,6 +48,7 @@ class Command(BaseCommand):
             help='Process games even if automation is disabled via environment variable',
         )
 
+    @scoring_batch()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         hours_back = options['hours_back']
@@ -140,199 +144,29 @@ class Command(BaseCommand):
 
     def batch_fetch_game_data(self, events) -> dict[str, dict]:
         """
-        Batch fetch game data for multiple events to minimize API calls.
-        
+        Get game data for multiple events from the local game mirror.
+
+        Final games (and other games synced within NBA_GAME_MIRROR_MAX_AGE_SECONDS)
+        come from the mirror; only the rest is fetched from BallDontLie, in as
+        few calls as possible, and written back to the mirror.
+
         Args:
             events: QuerySet or list of PredictionEvents to fetch data for
-            
+
         Returns:
             Dictionary mapping nba_game_id to game data dict
         """
-        game_data_map = {}
-        
-        # Collect unique game IDs, dates, and team tricodes from events
-        unique_game_ids = set()
-        dates = set()
-        team_tricodes = set()
-        
-        for event in events:
-            game = event.scheduled_game
-            game_id = game.nba_game_id
-            unique_game_ids.add(game_id)
-            
-            # Extract date from game_date
-            if hasattr(game, 'game_date') and game.game_date:
-                date_str = game.game_date.strftime('%Y-%m-%d')
-                dates.add(date_str)
-            
-            # Collect team tricodes
-            if hasattr(game, 'home_team_tricode') and game.home_team_tricode:
-                team_tricodes.add(game.home_team_tricode)
-            if hasattr(game, 'away_team_tricode') and game.away_team_tricode:
-                team_tricodes.add(game.away_team_tricode)
-        
-        if not unique_game_ids:
-            return game_data_map
-        
-        # Add the next day to each date to handle timezone differences
-        # Games stored in GMT might be on the next day in US local time (EST/PST)
-        extended_dates = set(dates)
-        for date_str in dates:
-            try:
-                # Parse the date string and add one day
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                next_date = date_obj + timedelta(days=1)
-                next_date_str = next_date.strftime('%Y-%m-%d')
-                extended_dates.add(next_date_str)
-            except (ValueError, TypeError) as e:
-                logger.warning(f'Failed to add next day for date {date_str}: {e}')
-                continue
-        
-        dates = extended_dates
-        
-        self.stdout.write(f'Fetching data for {len(unique_game_ids)} unique games...')
-        
-        # Look up BallDontLie team IDs from team tricodes
-        team_ids = []
-        if team_tricodes:
-            for tricode in team_tricodes:
-                team_option = NbaTeamManager.get_by_abbreviation(tricode)
-                if team_option and team_option.external_id:
-                    try:
-                        team_id = int(team_option.external_id)
-                        if team_id not in team_ids:
-                            team_ids.append(team_id)
-                    except (ValueError, TypeError):
-                        logger.warning(f'Invalid external_id for team {tricode}: {team_option.external_id}')
-                        continue
-        
+        scheduled_games = [event.scheduled_game for event in events]
+        self.stdout.write(f'Fetching data for {len({game.nba_game_id for game in scheduled_games})} unique games...')
+        max_age = timedelta(
+            seconds=getattr(settings, 'NBA_GAME_MIRROR_MAX_AGE_SECONDS', DEFAULT_MIRROR_MAX_AGE_SECONDS)
+        )
         try:
-            client = _build_bdl_client()
-            if client is None:
-                self.stdout.write(self.style.WARNING('BallDontLie API client not available'))
-                return game_data_map
-            
-            # Single API call with all dates and team IDs
-            if dates:
-                date_list = list(dates)
-                self.stdout.write(f'Filtering by dates: {sorted(date_list)}')
-                if team_ids:
-                    self.stdout.write(f'Filtering by team IDs: {sorted(team_ids)}')
-                
-                try:
-                    # Build API call parameters
-                    api_params = {
-                        'per_page': 100,
-                        'dates': date_list
-                    }
-                    
-                    # Add team_ids if we have them
-                    if team_ids:
-                        api_params['team_ids'] = team_ids
-                    
-                    # Use per_page=100 (maximum allowed) to get all games in one call
-                    response = client.nba.games.list(**api_params)
-                    
-                    # Process the response to extract game data
-                    games_found = 0
-                    for game in getattr(response, "data", []) or []:
-                        game_id = str(getattr(game, "id", ""))
-                        if game_id in unique_game_ids:
-                            game_data_map[game_id] = self._extract_game_data_from_response(game)
-                            games_found += 1
-                    
-                    self.stdout.write(f'Found data for {games_found} games in batch fetch')
-                    
-                    # Check if we need to handle pagination
-                    meta = getattr(response, "meta", None)
-                    next_cursor = getattr(meta, "next_cursor", None) if meta else None
-                    
-                    # If there's a next cursor and we're missing some games, fetch next page
-                    while next_cursor is not None:
-                        missing_games = unique_game_ids - set(game_data_map.keys())
-                        if not missing_games:
-                            break  # We have all the games we need
-                        
-                        try:
-                            # Build API call parameters for pagination
-                            api_params = {
-                                'per_page': 100,
-                                'dates': date_list,
-                                'cursor': next_cursor
-                            }
-                            
-                            # Add team_ids if we have them
-                            if team_ids:
-                                api_params['team_ids'] = team_ids
-                            
-                            response = client.nba.games.list(**api_params)
-                            
-                            for game in getattr(response, "data", []) or []:
-                                game_id = str(getattr(game, "id", ""))
-                                if game_id in unique_game_ids:
-                                    game_data_map[game_id] = self._extract_game_data_from_response(game)
-                                    games_found += 1
-                            
-                            meta = getattr(response, "meta", None)
-                            next_cursor = getattr(meta, "next_cursor", None) if meta else None
-                        except Exception as e:
-                            logger.warning(f'Failed to fetch next page with cursor {next_cursor}: {e}')
-                            break
-                        
-                except Exception as e:
-                    logger.warning(f'Failed to batch fetch games for dates {date_list}: {e}')
-                    self.stdout.write(self.style.WARNING(f'Batch fetch failed: {e}'))
-            
-            # Fallback: if we still don't have all games, fetch missing ones individually
-            missing_games = unique_game_ids - set(game_data_map.keys())
-            if missing_games:
-                self.stdout.write(f'Fetching {len(missing_games)} remaining games individually...')
-                for game_id in missing_games:
-                    try:
-                        response = client.nba.games.get(int(game_id))
-                        game = getattr(response, "data", None)
-                        if game:
-                            game_data_map[game_id] = self._extract_game_data_from_response(game)
-                    except Exception as e:
-                        logger.warning(f'Failed to fetch data for game {game_id}: {e}')
-                        continue
-                        
+            return get_games_data(scheduled_games, client_factory=_build_bdl_client, max_age=max_age)
         except Exception as e:
             logger.exception(f'Failed to batch fetch game data: {e}')
             self.stdout.write(self.style.ERROR(f'Failed to fetch game data: {e}'))
-        
-        return game_data_map
-
-    def _extract_game_data_from_response(self, game) -> dict:
-        """
-        Extract game data from BallDontLie API response.
-        
-        Args:
-            game: Game object from BallDontLie API
-            
-        Returns:
-            Dictionary with game data in the same format as get_live_game_data
-        """
-        # Extract scores
-        home_score = getattr(game, "home_team_score", None)
-        away_score = getattr(game, "visitor_team_score", None)
-        
-        # Extract status
-        status = getattr(game, "status", "")
-        
-        # Determine if game is live
-        status_lower = str(status).lower()
-        is_live = any(
-            keyword in status_lower
-            for keyword in ["q1", "q2", "q3", "q4", "ot", "halftime"]
-        )
-        
-        return {
-            "away_score": away_score,
-            "home_score": home_score,
-            "game_status": status,
-            "is_live": is_live,
-        }
+            return {}
 
     def process_single_game(self, event: PredictionEvent, game_data: dict, dry_run: bool = False) -> Optional[str]:
         """
@@ -413,20 +247,7 @@ class Command(BaseCommand):
                 notes=f'Auto-generated from game result. Final score: {game.away_team_tricode} {away_score}, {game.home_team_tricode} {home_score}'
             )
             
-            # Auto-score the event
-            try:
-                from hooptipp.predictions.scoring_service import score_event_outcome
-                score_result = score_event_outcome(outcome)
-                
-                if score_result.created_count or score_result.updated_count:
-                    self.stdout.write(
-                        f'  Auto-scored: {score_result.created_count} created, {score_result.updated_count} updated scores'
-                    )
-                else:
-                    self.stdout.write('  Auto-scored: No new scores (already scored)')
-                    
-            except Exception as e:
-                logger.warning(f'Failed to auto-score {event.name}: {e}')
-                self.stdout.write(f'  Warning: Failed to auto-score: {e}')
+            # Saving the outcome requests scoring (see predictions.scoring_queue)
+            self.stdout.write('  Scoring requested')
         
         return 'processed'
@@ -0,0 +1,104 @@
+"""
+Management command to sync NBA players from HoopsHype team salary pages.
+
+Pages are fetched concurrently through the per-host limiter and cached with
+conditional revalidation. Pages can be recorded to a directory and replayed
+later, which allows benchmarking the scraper without network access, e.g.
+with the fixtures in hooptipp/nba/tests/fixtures/hoopshype.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hooptipp.nba import hoopshype
+from hooptipp.nba.services import _get_hoopshype_team_urls, sync_players_from_hoopshype
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Scrape NBA rosters from HoopsHype and sync players'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Concurrent page fetches (default: HOOPSHYPE_MAX_CONCURRENCY)',
+        )
+        parser.add_argument(
+            '--replay',
+            type=str,
+            help='Read recorded pages (<team-slug>.html) from this directory instead of the network',
+        )
+        parser.add_argument(
+            '--record',
+            type=str,
+            help='Save fetched pages to this directory',
+        )
+        parser.add_argument(
+            '--parse-only',
+            action='store_true',
+            help='Fetch and parse all pages and report timings without writing players',
+        )
+
+    def handle(self, *args, **options):
+        replay_dir = options['replay']
+        record_dir = options['record']
+        if replay_dir and not Path(replay_dir).is_dir():
+            raise CommandError(f'Replay directory does not exist: {replay_dir}')
+        if replay_dir and record_dir:
+            raise CommandError('--replay and --record cannot be combined')
+
+        start = time.perf_counter()
+        if options['parse_only']:
+            self._parse_only(options['workers'], replay_dir, record_dir)
+        else:
+            result = sync_players_from_hoopshype(
+                max_workers=options['workers'],
+                replay_dir=replay_dir,
+                record_dir=record_dir,
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Players synced: {result.created} created, {result.updated} updated'
+                )
+            )
+        self.stdout.write(f'Completed in {time.perf_counter() - start:.2f}s')
+
+    def _parse_only(self, workers, replay_dir, record_dir):
+        team_urls = _get_hoopshype_team_urls()
+        if replay_dir:
+            recorded = {path.stem for path in Path(replay_dir).glob('*.html')}
+            team_urls = {
+                name: url for name, url in team_urls.items()
+                if hoopshype.team_slug_from_url(url) in recorded
+            }
+
+        def scrape(item):
+            team_name, team_url = item
+            fetched = time.perf_counter()
+            html = hoopshype.fetch_html(team_url, replay_dir=replay_dir, record_dir=record_dir)
+            parsed = time.perf_counter()
+            players = hoopshype.parse_roster_html(html, team_name)
+            return team_name, len(players), parsed - fetched, time.perf_counter() - parsed
+
+        with ThreadPoolExecutor(max_workers=max(1, workers or hoopshype.DEFAULT_MAX_CONCURRENCY)) as executor:
+            results = list(executor.map(scrape, team_urls.items()))
+
+        for team_name, player_count, fetch_time, parse_time in results:
+            self.stdout.write(
+                f'  {team_name}: {player_count} players '
+                f'(fetch {fetch_time * 1000:.1f} ms, parse {parse_time * 1000:.1f} ms)'
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Parsed {sum(result[1] for result in results)} players from {len(results)} pages'
+            )
+        )
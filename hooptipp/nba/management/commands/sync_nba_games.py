@@ -0,0 +1,90 @@
+"""
+Management command to mirror the NBA schedule and results locally.
+
+Fetches all games in a window around today from BallDontLie with paginated,
+throttled list calls and upserts them into the NbaGame mirror. Outcome
+processing, backfills, the admin game picker and live cards read the mirror,
+so this is the one job that should talk to the games API regularly (e.g.
+every few minutes during game nights).
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from hooptipp.nba.game_mirror import fetch_games, sync_games
+from hooptipp.nba.services import _build_bdl_client
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Mirror NBA games (schedule, status and scores) from BallDontLie'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days-back',
+            type=int,
+            default=2,
+            help='Include games from N days ago (default: 2)',
+        )
+        parser.add_argument(
+            '--days-ahead',
+            type=int,
+            default=14,
+            help='Include games up to N days ahead (default: 14)',
+        )
+        parser.add_argument(
+            '--throttle',
+            type=float,
+            default=None,
+            help='Seconds to wait between page requests (default: NBA_GAME_SYNC_THROTTLE_SECONDS)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Fetch games and report how many were found without writing them',
+        )
+
+    def handle(self, *args, **options):
+        days_back = options['days_back']
+        days_ahead = options['days_ahead']
+        if days_back < 0 or days_ahead < 0:
+            raise CommandError('--days-back and --days-ahead must not be negative')
+
+        client = _build_bdl_client()
+        if client is None:
+            raise CommandError('BallDontLie API client not available. Please set BALLDONTLIE_API_TOKEN.')
+
+        if options['dry_run']:
+            today = timezone.localdate()
+            games = fetch_games(
+                client,
+                start_date=(today - timedelta(days=days_back)).isoformat(),
+                end_date=(today + timedelta(days=days_ahead)).isoformat(),
+                throttle_seconds=options['throttle'] or 0,
+            )
+            self.stdout.write(f'Would mirror {len(games)} games')
+            return
+
+        try:
+            result = sync_games(
+                days_back=days_back,
+                days_ahead=days_ahead,
+                client=client,
+                throttle_seconds=options['throttle'],
+            )
+        except Exception as exc:
+            logger.exception('NBA game sync failed: %s', exc)
+            raise CommandError(f'NBA game sync failed: {exc}') from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Mirrored {result.fetched} games in {result.pages} pages: '
+                f'{result.created} created, {result.updated} updated, {result.unchanged} unchanged'
+            )
+        )
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nba', '0003_remove_nbateam_nbaplayer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NbaGame',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('game_id', models.CharField(max_length=20, unique=True)),
+                ('game_date', models.DateField(help_text='Game day in US local time, as reported by BallDontLie.')),
+                ('start_time', models.DateTimeField(blank=True, null=True)),
+                ('season', models.PositiveIntegerField(blank=True, null=True)),
+                ('postseason', models.BooleanField(default=False)),
+                ('status', models.CharField(blank=True, max_length=50)),
+                ('period', models.PositiveSmallIntegerField(default=0)),
+                ('clock', models.CharField(blank=True, max_length=20)),
+                ('home_team', models.JSONField(blank=True, default=dict)),
+                ('away_team', models.JSONField(blank=True, default=dict)),
+                ('home_team_tricode', models.CharField(blank=True, max_length=5)),
+                ('away_team_tricode', models.CharField(blank=True, max_length=5)),
+                ('home_score', models.PositiveIntegerField(blank=True, null=True)),
+                ('away_score', models.PositiveIntegerField(blank=True, null=True)),
+                ('arena', models.CharField(blank=True, max_length=150)),
+                ('synced_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'NBA game',
+                'verbose_name_plural': 'NBA games',
+                'ordering': ['start_time', 'game_id'],
+                'indexes': [models.Index(fields=['game_date'], name='nba_game_date_idx'), models.Index(fields=['start_time'], name='nba_game_start_idx')],
+            },
+        ),
+    ]
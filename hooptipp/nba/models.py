@@ -39,6 +39,75 @@ class ScheduledGame(models.Model):
         return f"{self.away_team} @ {self.home_team}"
 
 
+LIVE_STATUS_KEYWORDS = ('q1', 'q2', 'q3', 'q4', 'ot', 'halftime')
+
+
+def is_live_status(status: str) -> bool:
+    """Return whether a BallDontLie game status describes a game in progress."""
+
+    status_lower = str(status or '').lower()
+    return any(keyword in status_lower for keyword in LIVE_STATUS_KEYWORDS)
+
+
+class NbaGame(models.Model):
+    """
+    Local mirror of a BallDontLie game (schedule, status and score).
+
+    Rows are written by the ``sync_nba_games`` job (and by API fallbacks), so
+    outcome processing, backfills, the admin game picker and live cards read
+    games from the database instead of calling BallDontLie on every request.
+    ``game_id`` matches :attr:`ScheduledGame.nba_game_id`.
+    """
+
+    game_id = models.CharField(max_length=20, unique=True)
+    game_date = models.DateField(help_text='Game day in US local time, as reported by BallDontLie.')
+    start_time = models.DateTimeField(null=True, blank=True)
+    season = models.PositiveIntegerField(null=True, blank=True)
+    postseason = models.BooleanField(default=False)
+    status = models.CharField(max_length=50, blank=True)
+    period = models.PositiveSmallIntegerField(default=0)
+    clock = models.CharField(max_length=20, blank=True)
+    home_team = models.JSONField(default=dict, blank=True)
+    away_team = models.JSONField(default=dict, blank=True)
+    home_team_tricode = models.CharField(max_length=5, blank=True)
+    away_team_tricode = models.CharField(max_length=5, blank=True)
+    home_score = models.PositiveIntegerField(null=True, blank=True)
+    away_score = models.PositiveIntegerField(null=True, blank=True)
+    arena = models.CharField(max_length=150, blank=True)
+    synced_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['start_time', 'game_id']
+        verbose_name = 'NBA game'
+        verbose_name_plural = 'NBA games'
+        app_label = 'nba'
+        indexes = [
+            models.Index(fields=['game_date'], name='nba_game_date_idx'),
+            models.Index(fields=['start_time'], name='nba_game_start_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.away_team_tricode} @ {self.home_team_tricode} ({self.game_date})"
+
+    @property
+    def is_final(self) -> bool:
+        return 'final' in self.status.lower()
+
+    @property
+    def is_live(self) -> bool:
+        return is_live_status(self.status)
+
+    def as_game_data(self) -> dict:
+        """Return the game in the format of :func:`hooptipp.nba.services.get_live_game_data`."""
+
+        return {
+            'away_score': self.away_score,
+            'home_score': self.home_score,
+            'game_status': self.status,
+            'is_live': self.is_live,
+        }
+
+
 class NbaUserPreferences(models.Model):
     """
     NBA-specific user preferences.
@@ -0,0 +1,166 @@
+"""Bulk upsert of synced Options with change detection.
+
+Player syncs touch thousands of Options per run, almost all unchanged. The
+:class:`OptionUpserter` loads the existing Options of a category once, keyed by
+``external_id``, compares a content hash of the synced fields and writes only
+new or changed rows with ``bulk_create``/``bulk_update`` when a page is
+flushed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Mapping
+
+from django.db import transaction
+from django.utils import timezone
+
+from hooptipp.predictions.models import Option, OptionCategory
+
+logger = logging.getLogger(__name__)
+
+SYNCED_FIELDS = ('slug', 'name', 'short_name', 'description', 'metadata', 'is_active', 'sort_order')
+BATCH_SIZE = 500
+
+
+def content_hash(values: Mapping[str, Any]) -> str:
+    """Return a stable hash of the synced field values."""
+
+    payload = json.dumps(
+        {field: values.get(field) for field in SYNCED_FIELDS},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _option_values(option: Option) -> Dict[str, Any]:
+    return {field: getattr(option, field) for field in SYNCED_FIELDS}
+
+
+class OptionUpserter:
+    """
+    Collect synced Options of one category and write only what changed.
+
+    Usage::
+
+        upserter = OptionUpserter(category)
+        for page in pages:
+            for item in page:
+                upserter.add(external_id, {'slug': ..., 'name': ..., ...})
+            upserter.flush()
+        upserter.remove_unseen()
+
+    ``created``, ``updated`` and ``unchanged`` count the rows seen so far.
+    """
+
+    def __init__(self, category: OptionCategory, *, batch_size: int = BATCH_SIZE) -> None:
+        self.category = category
+        self.batch_size = batch_size
+        self.existing: Dict[str, Option] = {}
+        self.hashes: Dict[str, str] = {}
+        for option in Option.objects.filter(category=category).only('id', 'external_id', *SYNCED_FIELDS):
+            self.existing[option.external_id] = option
+            self.hashes[option.external_id] = content_hash(_option_values(option))
+
+        self.seen: set[str] = set()
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self._to_create: List[Option] = []
+        self._to_update: Dict[str, Option] = {}
+
+    def add(self, external_id: str, values: Mapping[str, Any]) -> None:
+        """Queue the Option identified by ``external_id`` with the given field values."""
+
+        self.seen.add(external_id)
+        new_hash = content_hash(values)
+        if self.hashes.get(external_id) == new_hash:
+            self.unchanged += 1
+            return
+
+        option = self.existing.get(external_id)
+        if option is None:
+            option = Option(category=self.category, external_id=external_id, **values)
+            self.existing[external_id] = option
+            self._to_create.append(option)
+            self.created += 1
+        else:
+            for field, value in values.items():
+                setattr(option, field, value)
+            if option.pk is not None and external_id not in self._to_update:
+                self._to_update[external_id] = option
+                self.updated += 1
+        self.hashes[external_id] = new_hash
+
+    def rekey(self, old_external_id: str, new_external_id: str) -> bool:
+        """
+        Move the stored Option ``old_external_id`` to ``new_external_id``.
+
+        The row (and every tip pointing at it) is kept; the new id is written
+        with the next :meth:`add` of ``new_external_id``. Returns ``False`` if
+        there is no stored Option under the old id or one under the new id.
+        """
+
+        option = self.existing.get(old_external_id)
+        if option is None or option.pk is None or new_external_id in self.existing:
+            return False
+        del self.existing[old_external_id]
+        self.hashes.pop(old_external_id, None)
+        option.external_id = new_external_id
+        self.existing[new_external_id] = option
+        return True
+
+    def flush(self) -> None:
+        """
+        Write the queued creates and updates.
+
+        The page is written atomically. If it fails, its rows are dropped
+        from the counts and compared again on the next sync, and the error
+        is raised.
+        """
+
+        if not self._to_create and not self._to_update:
+            return
+        to_create, self._to_create = self._to_create, []
+        to_update, self._to_update = self._to_update, {}
+        try:
+            with transaction.atomic():
+                if to_create:
+                    Option.objects.bulk_create(to_create, batch_size=self.batch_size)
+                if to_update:
+                    now = timezone.now()
+                    options = list(to_update.values())
+                    for option in options:
+                        option.updated_at = now
+                    Option.objects.bulk_update(
+                        options,
+                        ['external_id', *SYNCED_FIELDS, 'updated_at'],
+                        batch_size=self.batch_size,
+                    )
+        except Exception:
+            for option in to_create:
+                self.existing.pop(option.external_id, None)
+                self.hashes.pop(option.external_id, None)
+            for external_id in to_update:
+                self.hashes.pop(external_id, None)
+            self.created -= len(to_create)
+            self.updated -= len(to_update)
+            raise
+
+    def remove_unseen(self) -> int:
+        """Delete Options of the category that were not seen in this sync."""
+
+        self.flush()
+        stale_ids = [
+            option.pk
+            for external_id, option in self.existing.items()
+            if external_id not in self.seen and option.pk is not None
+        ]
+        removed = 0
+        for start in range(0, len(stale_ids), self.batch_size):
+            deleted, _ = Option.objects.filter(pk__in=stale_ids[start:start + self.batch_size]).delete()
+            removed += deleted
+        return removed
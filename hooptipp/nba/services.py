@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 
+import requests
 from balldontlie.exceptions import BallDontLieException
+from django.conf import settings
 from django.utils import timezone
 
 from hooptipp.predictions.models import Option, OptionCategory
+from hooptipp.request_metrics import record_cache_access
 
+from . import hoopshype
 from .client import CachedBallDontLieAPI, build_cached_bdl_client
+from .game_mirror import get_mirrored_game
+from .logos import CDN_LOGO_URL, get_logo_urls
+from .option_sync import OptionUpserter
 from .managers import NbaPlayerManager, NbaTeamManager
+from .models import is_live_status
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +50,9 @@ class SyncResult:
 # seconds leaves a small safety margin between requests.
 PLAYER_SYNC_THROTTLE_SECONDS = 12.5
 
+# HoopsHype player ids of older syncs end in a decimal hash() instead of 16 hex digits
+LEGACY_HOOPSHYPE_ID = re.compile(r'^hoopshype-[a-z0-9-]+-(?![0-9a-f]{16}$)\d+$')
+
 _BDL_CLIENT_CACHE: dict[str, CachedBallDontLieAPI] = {}
 _BDL_CLIENT_LOCK = threading.Lock()
 
@@ -226,21 +239,21 @@ def sync_players(throttle_seconds: float = PLAYER_SYNC_THROTTLE_SECONDS) -> Sync
 
     The API is rate limited to five requests per minute. ``throttle_seconds``
     governs the sleep interval between subsequent requests to stay within that
-    budget.
+    budget. Existing players are loaded once and only new or changed players
+    are written (see :class:`~hooptipp.nba.option_sync.OptionUpserter`), so
+    ``updated`` counts players whose data actually changed.
     """
     client = _build_bdl_client()
     if client is None:
         return SyncResult()
 
-    seen_ids: set[str] = set()
-    created = 0
-    updated = 0
     processed = 0
 
     cursor: Optional[int] = None
     seen_cursors: set[Optional[int]] = set()
 
     players_cat = NbaPlayerManager.get_category()
+    upserter = OptionUpserter(players_cat)
 
     while True:
         params: dict[str, Any] = {"per_page": 100}
@@ -294,21 +307,12 @@ def sync_players(throttle_seconds: float = PLAYER_SYNC_THROTTLE_SECONDS) -> Sync
                 "sort_order": 0,
             }
 
-            external_id = str(player_id)
-            _, created_flag = Option.objects.update_or_create(
-                category=players_cat,
-                external_id=external_id,
-                defaults=defaults,
-            )
-
-            if created_flag:
-                created += 1
-            else:
-                updated += 1
-
-            seen_ids.add(external_id)
+            upserter.add(str(player_id), defaults)
             processed += 1
 
+        # Write the page's new and changed players before waiting for the next one
+        upserter.flush()
+
         meta = getattr(response, "meta", None)
         next_cursor = _extract_next_cursor(meta)
         if next_cursor is None or next_cursor in seen_cursors:
@@ -321,14 +325,9 @@ def sync_players(throttle_seconds: float = PLAYER_SYNC_THROTTLE_SECONDS) -> Sync
             time.sleep(throttle_seconds)
 
     # Remove players that no longer exist
-    removed = 0
-    if processed:
-        query = Option.objects.filter(category=players_cat)
-        if seen_ids:
-            query = query.exclude(external_id__in=seen_ids)
-        removed, _ = query.delete()
+    removed = upserter.remove_unseen() if processed else 0
 
-    return SyncResult(created=created, updated=updated, removed=removed)
+    return SyncResult(created=upserter.created, updated=upserter.updated, removed=removed)
 
 
 def _extract_next_cursor(meta: Any) -> Optional[int | str]:
@@ -379,58 +378,27 @@ def get_team_logo_url(team_identifier: str) -> str:
         team_identifier: Team abbreviation (e.g., 'LAL', 'BOS') or NBA team ID
 
     Returns:
-        URL to team logo image (local if available, otherwise CDN)
+        URL to team logo image (local if available, otherwise CDN), resolved
+        from the in-memory logo manifest (see :mod:`hooptipp.nba.logos`)
     """
-    from django.core.cache import cache
-    from django.conf import settings
-    from pathlib import Path
-    
-    # Check if it's already a numeric NBA team ID
+    # Already a numeric NBA team ID
     if team_identifier.isdigit():
-        nba_team_id = team_identifier
-        team_abbr = None
-    else:
-        # Look up NBA team ID from abbreviation
-        cache_key = f"nba_team_id_{team_identifier}"
-        nba_team_id = cache.get(cache_key)
-        team_abbr = team_identifier
-        
-        if nba_team_id is None:
-            # Query the database for the team
-            teams_cat = NbaTeamManager.get_category()
-            team_option = Option.objects.filter(
-                category=teams_cat,
-                short_name__iexact=team_identifier
-            ).first()
-            
-            if team_option and team_option.metadata:
-                nba_team_id = team_option.metadata.get("nba_team_id")
-                # Cache for 1 hour
-                if nba_team_id:
-                    cache.set(cache_key, nba_team_id, 3600)
-    
-    # Fallback to abbreviation if we couldn't find the NBA team ID
-    if not nba_team_id:
-        nba_team_id = team_identifier
-    
-    # Check for local logo first
-    if team_abbr:
-        static_dir = Path(settings.STATICFILES_DIRS[0]) if settings.STATICFILES_DIRS else Path(settings.STATIC_ROOT)
-        local_logo_path = static_dir / 'nba' / 'logos' / f"{team_abbr.lower()}.svg"
-        
-        if local_logo_path.exists():
-            # Return static URL for local logo
-            return f"/static/nba/logos/{team_abbr.lower()}.svg"
-    
-    # Fallback to NBA's official CDN for team logos
-    return f"https://cdn.nba.com/logos/nba/{nba_team_id}/global/L/logo.svg"
+        return CDN_LOGO_URL.format(nba_team_id=team_identifier)
+
+    url = get_logo_urls().get(team_identifier.upper())
+    if url is None:
+        # Unknown team: fall back to the abbreviation
+        url = CDN_LOGO_URL.format(nba_team_id=team_identifier)
+    return url
 
 
 def get_live_game_data(nba_game_id: str) -> dict:
     """
     Fetch live game data (scores, status).
 
-    Cached for 30 seconds to avoid rate limits.
+    Read from the local game mirror when it has the game (final, not started
+    yet, or synced within NBA_LIVE_GAME_MAX_AGE_SECONDS); otherwise fetched
+    from BallDontLie. Cached for 30 seconds to avoid rate limits.
 
     Args:
         nba_game_id: NBA game identifier
@@ -448,10 +416,17 @@ def get_live_game_data(nba_game_id: str) -> dict:
 
     cache_key = f"nba_live_game_{nba_game_id}"
     cached_data = cache.get(cache_key)
+    record_cache_access(bool(cached_data))
 
     if cached_data:
         return cached_data
 
+    mirrored = get_mirrored_game(nba_game_id)
+    if mirrored is not None:
+        data = mirrored.as_game_data()
+        cache.set(cache_key, data, 30)
+        return data
+
     # Default data structure
     data = {
         "away_score": None,
@@ -483,11 +458,7 @@ def get_live_game_data(nba_game_id: str) -> dict:
         data["game_status"] = status
 
         # Determine if game is live
-        status_lower = str(status).lower()
-        data["is_live"] = any(
-            keyword in status_lower
-            for keyword in ["q1", "q2", "q3", "q4", "ot", "halftime"]
-        )
+        data["is_live"] = is_live_status(status)
 
         # Cache for 30 seconds
         cache.set(cache_key, data, 30)
@@ -519,6 +490,7 @@ def get_player_card_data(player_external_id: str) -> dict:
 
     cache_key = f"nba_player_card_{player_external_id}"
     cached_data = cache.get(cache_key)
+    record_cache_access(bool(cached_data))
 
     if cached_data:
         return cached_data
@@ -618,72 +590,22 @@ def _get_hoopshype_team_urls() -> Dict[str, str]:
     }
 
 
-def _scrape_team_roster(team_name: str, team_url: str) -> List[Dict[str, Any]]:
+def _scrape_team_roster(team_name: str, team_url: str, **fetch_options: Any) -> List[Dict[str, Any]]:
     """
     Scrape a single team's roster from HoopsHype.
     
     Args:
         team_name: Name of the team
         team_url: URL to the team's salary page on HoopsHype
+        **fetch_options: Passed to :func:`hooptipp.nba.hoopshype.fetch_html`
+            (``session``, ``replay_dir``, ``record_dir``)
     
     Returns:
         List of player dictionaries with name, position, salary, etc.
     """
     try:
-        import requests
-        from bs4 import BeautifulSoup
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(team_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        players = []
-        
-        # Look for the roster table - this selector may need adjustment based on actual HTML
-        roster_table = soup.find('table', class_='hh-salaries-ranking-table')
-        if not roster_table:
-            # Try alternative selectors
-            roster_table = soup.find('table')
-        
-        if roster_table:
-            rows = roster_table.find_all('tr')
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    # Extract player name (in cell 1, cell 0 is just row number)
-                    name_cell = cells[1]
-                    player_name = name_cell.get_text(strip=True)
-                    
-                    # Skip if this looks like a header, empty row, or team total
-                    if (not player_name or 
-                        player_name.lower() in ['player', 'name', ''] or
-                        player_name.startswith('$') or  # Skip salary amounts
-                        cells[0].get_text(strip=True).lower() == 'total'):  # Skip total rows
-                        continue
-                    
-                    # Extract current season salary (cell 2 is 2025-26 salary)
-                    salary = cells[2].get_text(strip=True) if len(cells) > 2 else ''
-                    
-                    # For position, we'll need to get it from the player's individual page
-                    # or use a default since HoopsHype salary pages don't show position
-                    position = ''  # Will be filled from other sources or left empty
-                    
-                    # Clean up the data
-                    player_name = re.sub(r'\s+', ' ', player_name).strip()
-                    salary = re.sub(r'\s+', ' ', salary).strip()
-                    
-                    if player_name:  # Only add if we have a valid name
-                        players.append({
-                            'name': player_name,
-                            'position': position,
-                            'salary': salary,
-                            'team': team_name,
-                        })
-        
+        html = hoopshype.fetch_html(team_url, **fetch_options)
+        players = hoopshype.parse_roster_html(html, team_name)
         logger.info(f"Scraped {len(players)} players from {team_name}")
         return players
         
@@ -716,28 +638,78 @@ def _parse_player_name(full_name: str) -> tuple[str, str]:
     return first_name, last_name
 
 
-def sync_players_from_hoopshype() -> SyncResult:
+def sync_players_from_hoopshype(
+    *,
+    max_workers: Optional[int] = None,
+    replay_dir: Optional[str] = None,
+    record_dir: Optional[str] = None,
+) -> SyncResult:
     """
     Scrape all NBA team rosters from HoopsHype and sync to database.
     
     This function scrapes player data from HoopsHype salary pages for all 30 NBA teams.
     It's designed to be run once or twice per season to seed initial player data.
+    Pages are fetched concurrently through the per-host limiter in
+    :mod:`hooptipp.nba.hoopshype` and written to the database as each team
+    finishes.
+    
+    Args:
+        max_workers: Concurrent page fetches (defaults to ``HOOPSHYPE_MAX_CONCURRENCY``)
+        replay_dir: Read recorded pages from this directory instead of the network
+        record_dir: Save fetched pages to this directory
     
     Returns:
-        SyncResult with created and updated player counts
+        SyncResult with created and (actually changed) updated player counts
     """
     logger.info("Starting HoopsHype player sync...")
     
     team_urls = _get_hoopshype_team_urls()
     players_cat = NbaPlayerManager.get_category()
-    created = 0
-    updated = 0
+    upserter = OptionUpserter(players_cat)
     total_players = 0
     
-    for team_name, team_url in team_urls.items():
-        logger.info(f"Scraping roster for {team_name}")
-        
-        players = _scrape_team_roster(team_name, team_url)
+    if max_workers is None:
+        max_workers = getattr(settings, 'HOOPSHYPE_MAX_CONCURRENCY', hoopshype.DEFAULT_MAX_CONCURRENCY)
+    fetch_options: Dict[str, Any] = {'replay_dir': replay_dir, 'record_dir': record_dir}
+    
+    # Workers only fetch and parse; database writes stay on this thread
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        if replay_dir is None:
+            fetch_options['session'] = session
+        futures = {
+            executor.submit(_scrape_team_roster, team_name, team_url, **fetch_options): team_name
+            for team_name, team_url in team_urls.items()
+        }
+        rosters = ((futures[future], future.result()) for future in as_completed(futures))
+        total_players += _upsert_hoopshype_rosters(upserter, rosters)
+    
+    logger.info(
+        f"HoopsHype sync completed: {upserter.created} created, {upserter.updated} updated, "
+        f"{upserter.unchanged} unchanged, {total_players} total players processed"
+    )
+    return SyncResult(created=upserter.created, updated=upserter.updated, removed=0)
+
+
+def _legacy_hoopshype_ids(upserter: OptionUpserter) -> Dict[Tuple[str, str], str]:
+    """
+    External ids of players stored by syncs before the ids were stable.
+
+    Those syncs used the per-process ``hash()`` of name and team, so their ids
+    never match again. Keyed by ``(team, name)`` to move the rows to the
+    stable id instead of duplicating the players.
+    """
+    return {
+        ((option.metadata or {}).get('team'), option.name): external_id
+        for external_id, option in upserter.existing.items()
+        if LEGACY_HOOPSHYPE_ID.match(external_id)
+    }
+
+
+def _upsert_hoopshype_rosters(upserter: OptionUpserter, rosters) -> int:
+    """Queue the players of each ``(team_name, players)`` roster and flush per team."""
+    total_players = 0
+    legacy_ids = _legacy_hoopshype_ids(upserter)
+    for team_name, players in rosters:
         total_players += len(players)
         
         for player_data in players:
@@ -755,7 +727,9 @@ def sync_players_from_hoopshype() -> SyncResult:
                 # Use team name and full name hash for better uniqueness
                 team_slug = team_name.lower().replace(" ", "-").replace(".", "")
                 team_slug = re.sub(r'[^a-z0-9\-]', '', team_slug)
-                unique_slug = f"{base_slug}-{team_slug}-{abs(hash(player_data['name'] + team_name)) % 10000}"
+                # hashlib instead of hash(): string hashes change between processes
+                name_digest = hashlib.sha1((player_data['name'] + team_name).encode('utf-8')).hexdigest()
+                unique_slug = f"{base_slug}-{team_slug}-{int(name_digest, 16) % 10000}"
                 
                 # Create display name and short name
                 display_name = f"{first_name} {last_name}".strip()
@@ -765,7 +739,10 @@ def sync_players_from_hoopshype() -> SyncResult:
                 description = f"{player_data['position']} - {team_name}" if player_data['position'] else team_name
                 
                 # Use team name + player name hash as external ID for better uniqueness
-                external_id = f"hoopshype-{team_slug}-{abs(hash(player_data['name'] + team_name))}"
+                external_id = f"hoopshype-{team_slug}-{name_digest[:16]}"
+                legacy_id = legacy_ids.pop((team_name, display_name), None)
+                if legacy_id:
+                    upserter.rekey(legacy_id, external_id)
                 
                 defaults = {
                     "slug": unique_slug,
@@ -782,23 +759,15 @@ def sync_players_from_hoopshype() -> SyncResult:
                     "sort_order": 0,
                 }
                 
-                _, created_flag = Option.objects.update_or_create(
-                    category=players_cat,
-                    external_id=external_id,
-                    defaults=defaults,
-                )
-                
-                if created_flag:
-                    created += 1
-                else:
-                    updated += 1
+                upserter.add(external_id, defaults)
                     
             except Exception as e:
                 logger.error(f"Failed to process player {player_data}: {e}")
                 continue
         
-        # Small delay to be respectful to the server
-        time.sleep(1)
+        try:
+            upserter.flush()
+        except Exception as e:
+            logger.error(f"Failed to save the {team_name} roster: {e}")
     
-    logger.info(f"HoopsHype sync completed: {created} created, {updated} updated, {total_players} total players processed")
-    return SyncResult(created=created, updated=updated, removed=0)
+    return total_players
@@ -5,6 +5,8 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 
+from hooptipp.jobs import enqueue, run_next
+from hooptipp.models import Job
 from hooptipp.nba.services import SyncResult
 from hooptipp.predictions.models import Option, OptionCategory
 
@@ -119,68 +121,48 @@ class NbaSyncViewTest(TestCase):
         self.assertIn('Failed to sync teams', str(messages[0]))
         self.assertIn('API connection failed', str(messages[0]))
 
-    @patch('hooptipp.nba.admin.threading.Thread')
-    def test_sync_players_success(self, mock_thread_class):
-        """Test player synchronization starts in background thread."""
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
-        
+    def test_sync_players_success(self):
+        """Test player synchronization is queued as a background job."""
         url = reverse('admin:nba_sync_players')
         response = self.client.post(url)
         
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, reverse('admin:nba_sync'))
         
-        # Verify thread was created and started
-        mock_thread_class.assert_called_once()
-        mock_thread.start.assert_called_once()
-        
-        # Check that thread was created with correct parameters
-        call_kwargs = mock_thread_class.call_args[1]
-        self.assertTrue(call_kwargs.get('daemon'))
-        self.assertEqual(call_kwargs.get('name'), 'nba-player-sync')
+        job = Job.objects.get()
+        self.assertEqual(job.name, 'nba.sync_players')
+        self.assertEqual(job.status, Job.Status.QUEUED)
         
-        # Check messages - should indicate background sync started
+        # Check messages - should indicate the sync was queued
         messages = list(response.wsgi_request._messages)
         self.assertEqual(len(messages), 1)
-        self.assertIn('started in the background', str(messages[0]).lower())
+        self.assertIn('sync queued', str(messages[0]).lower())
 
-    @patch('hooptipp.nba.admin.threading.Thread')
-    def test_sync_players_no_changes(self, mock_thread_class):
-        """Test player sync starts in background."""
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
-        
+    def test_sync_players_deduplicates_queued_job(self):
+        """Test repeated sync requests do not queue a second job."""
         url = reverse('admin:nba_sync_players')
+        self.client.post(url)
         response = self.client.post(url)
         
         self.assertEqual(response.status_code, 302)
-        
-        # Verify thread was started
-        mock_thread.start.assert_called_once()
-        
-        messages = list(response.wsgi_request._messages)
-        self.assertEqual(len(messages), 1)
-        self.assertIn('started in the background', str(messages[0]).lower())
+        self.assertEqual(Job.objects.count(), 1)
 
-    @patch('hooptipp.nba.admin.threading.Thread')
-    def test_sync_players_starts_thread(self, mock_thread_class):
-        """Test player sync starts background thread."""
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
+    def test_sync_players_reports_running_job(self):
+        """Test the view reports a sync that is already running."""
+        Job.objects.create(
+            name='nba.sync_players',
+            dedup_key='nba.sync_players',
+            status=Job.Status.RUNNING,
+            progress=40,
+        )
         
         url = reverse('admin:nba_sync_players')
         response = self.client.post(url)
         
         self.assertEqual(response.status_code, 302)
-        
-        # Verify thread was created and started
-        mock_thread_class.assert_called_once()
-        mock_thread.start.assert_called_once()
-        
+        self.assertEqual(Job.objects.count(), 1)
         messages = list(response.wsgi_request._messages)
-        self.assertEqual(len(messages), 1)
-        self.assertIn('started in the background', str(messages[0]).lower())
+        self.assertIn('already running (40% complete)', str(messages[0]))
 
     def test_sync_teams_get_not_allowed(self):
         """Test that GET requests to sync_teams are not allowed."""
@@ -242,37 +224,28 @@ class NbaSyncViewTest(TestCase):
         self.assertNotIn('updated', message_text.lower())
         self.assertNotIn('removed', message_text.lower())
 
-    @patch('hooptipp.nba.admin.threading.Thread')
-    def test_sync_players_returns_immediately(self, mock_thread_class):
-        """Test player sync returns immediately without waiting for completion."""
-        mock_thread = MagicMock()
-        mock_thread_class.return_value = mock_thread
-        
+    @patch('hooptipp.nba.jobs.sync_players_from_hoopshype')
+    def test_sync_players_returns_immediately(self, mock_sync_players):
+        """Test player sync returns without running the sync in the request."""
         url = reverse('admin:nba_sync_players')
         response = self.client.post(url)
         
-        # Should return immediately (302) without waiting for sync to complete
         self.assertEqual(response.status_code, 302)
-        
-        # Thread should be started but we don't wait for it
-        mock_thread.start.assert_called_once()
-        
-        messages = list(response.wsgi_request._messages)
-        self.assertEqual(len(messages), 1)
-        self.assertIn('started in the background', str(messages[0]).lower())
+        mock_sync_players.assert_not_called()
 
-    @patch('hooptipp.nba.admin.sync_players_from_hoopshype')
-    @patch('hooptipp.nba.admin.logger')
+    @patch('hooptipp.nba.jobs.sync_players_from_hoopshype')
+    @patch('hooptipp.nba.jobs.logger')
     def test_background_sync_logs_success(self, mock_logger, mock_sync_players):
-        """Test background sync function logs results."""
-        from hooptipp.nba.admin import _run_player_sync_background
-        
+        """Test the sync job logs and returns its results."""
         mock_sync_players.return_value = SyncResult(created=10, updated=20, removed=5)
+        enqueue('nba.sync_players')
         
-        _run_player_sync_background()
+        job = run_next('test-worker')
         
         # Verify sync was called
         mock_sync_players.assert_called_once()
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(job.result, {'created': 10, 'updated': 20, 'removed': 5})
         
         # Verify logging
         mock_logger.info.assert_called()
@@ -282,17 +255,13 @@ class NbaSyncViewTest(TestCase):
         self.assertIn('20 player(s) updated', log_text)
         self.assertIn('5 player(s) removed', log_text)
 
-    @patch('hooptipp.nba.admin.sync_players_from_hoopshype')
-    @patch('hooptipp.nba.admin.logger')
-    def test_background_sync_logs_errors(self, mock_logger, mock_sync_players):
-        """Test background sync function logs errors."""
-        from hooptipp.nba.admin import _run_player_sync_background
-        
+    @patch('hooptipp.nba.jobs.sync_players_from_hoopshype')
+    def test_background_sync_records_errors(self, mock_sync_players):
+        """Test a failing sync marks the job as failed."""
         mock_sync_players.side_effect = Exception('API failed')
+        enqueue('nba.sync_players')
         
-        _run_player_sync_background()
+        job = run_next('test-worker')
         
-        # Verify error was logged
-        mock_logger.exception.assert_called_once()
-        log_call = str(mock_logger.exception.call_args)
-        self.assertIn('API failed', log_call)
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertIn('API failed', job.last_error)
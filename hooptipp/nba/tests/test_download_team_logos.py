@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+from io import StringIO
 from pathlib import Path
 from unittest import mock
 from unittest.mock import Mock, patch
@@ -254,3 +255,64 @@ class DownloadTeamLogosCommandTests(TestCase):
         # Directory should exist but should be empty
         self.assertTrue(logos_dir.exists())
         self.assertEqual(len(list(logos_dir.glob('*.svg'))), 0)
+
+    @override_settings(STATICFILES_DIRS=[tempfile.mkdtemp()])
+    @patch('hooptipp.nba.management.commands.download_team_logos.requests.get')
+    def test_download_writes_manifest(self, mock_get):
+        """The logo manifest lists every downloaded logo with its content hash."""
+        mock_response = Mock()
+        mock_response.content = b'<svg>test logo</svg>'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        call_command('download_team_logos', verbosity=0)
+
+        logos_dir = Path(settings.STATICFILES_DIRS[0]) / 'nba' / 'logos'
+        manifest = json.loads((logos_dir / 'manifest.json').read_text())['logos']
+        self.assertEqual(set(manifest), {'BOS', 'LAL'})
+        self.assertEqual(manifest['BOS']['file'], 'bos.svg')
+        self.assertEqual(len(manifest['BOS']['sha256']), 64)
+
+    @override_settings(STATICFILES_DIRS=[tempfile.mkdtemp()])
+    @patch('hooptipp.nba.management.commands.download_team_logos.write_manifest')
+    @patch('hooptipp.nba.management.commands.download_team_logos.requests.get')
+    def test_force_skips_logos_with_unchanged_hash(self, mock_get, mock_write_manifest):
+        """Forced downloads leave files alone when their content hash did not change."""
+        logos_dir = Path(settings.STATICFILES_DIRS[0]) / 'nba' / 'logos'
+        logos_dir.mkdir(parents=True, exist_ok=True)
+        (logos_dir / 'bos.svg').write_bytes(b'<svg>same</svg>')
+        (logos_dir / 'lal.svg').write_bytes(b'<svg>same</svg>')
+        (logos_dir / 'manifest.json').write_text('{"logos": {}}')
+
+        mock_response = Mock()
+        mock_response.content = b'<svg>same</svg>'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        with patch('pathlib.Path.write_bytes') as write_bytes, patch('builtins.open', wraps=open) as open_file:
+            out = StringIO()
+            call_command('download_team_logos', '--force', stdout=out)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertIn('Unchanged: BOS', out.getvalue())
+        self.assertIn('0 downloaded, 2 skipped', out.getvalue())
+        write_bytes.assert_not_called()
+        self.assertFalse(any('wb' in call.args for call in open_file.call_args_list))
+        mock_write_manifest.assert_not_called()
+
+    @override_settings(STATICFILES_DIRS=[tempfile.mkdtemp()])
+    @patch('hooptipp.nba.management.commands.download_team_logos.requests.get')
+    def test_parallel_workers_download_all_teams(self, mock_get):
+        """Downloads with several workers still fetch each team exactly once."""
+        mock_response = Mock()
+        mock_response.content = b'<svg>logo</svg>'
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        call_command('download_team_logos', '--workers', '4', verbosity=0)
+
+        urls = sorted(call.args[0] for call in mock_get.call_args_list)
+        self.assertEqual(urls, [
+            'https://cdn.nba.com/logos/nba/1610612738/global/L/logo.svg',
+            'https://cdn.nba.com/logos/nba/1610612747/global/L/logo.svg',
+        ])
@@ -0,0 +1,215 @@
+"""Tests for the local NBA game mirror."""
+
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from hooptipp.nba import game_mirror
+from hooptipp.nba.models import NbaGame, ScheduledGame
+from hooptipp.nba.services import get_live_game_data
+from hooptipp.predictions.models import TipType
+
+
+def _team(team_id, abbreviation, full_name):
+    return SimpleNamespace(
+        id=team_id,
+        abbreviation=abbreviation,
+        full_name=full_name,
+        name=full_name.split()[-1],
+        city=' '.join(full_name.split()[:-1]),
+        conference='East',
+        division='Atlantic',
+    )
+
+
+def _game(game_id, *, status='Final', home_score=110, away_score=102, start=None):
+    start = start or timezone.now() - timedelta(hours=5)
+    return SimpleNamespace(
+        id=game_id,
+        date=start.date().isoformat(),
+        datetime=start.isoformat().replace('+00:00', 'Z'),
+        season=2025,
+        status=status,
+        period=4 if status == 'Final' else 0,
+        time='Final' if status == 'Final' else '',
+        postseason=False,
+        home_team_score=home_score,
+        visitor_team_score=away_score,
+        home_team=_team(2, 'BOS', 'Boston Celtics'),
+        visitor_team=_team(14, 'LAL', 'Los Angeles Lakers'),
+    )
+
+
+def _page(games, next_cursor=None):
+    return SimpleNamespace(data=games, meta=SimpleNamespace(next_cursor=next_cursor))
+
+
+class UpsertGamesTests(TestCase):
+    def test_creates_updates_and_skips_unchanged(self):
+        start = timezone.now() - timedelta(hours=3)
+        first = game_mirror.upsert_games([
+            _game(1, status='Q3', home_score=70, away_score=65, start=start),
+            _game(2, start=start),
+        ])
+        self.assertEqual((first.created, first.updated), (2, 0))
+
+        row = NbaGame.objects.get(game_id='1')
+        self.assertEqual(row.home_team_tricode, 'BOS')
+        self.assertEqual(row.away_team['full_name'], 'Los Angeles Lakers')
+        self.assertTrue(row.is_live)
+
+        second = game_mirror.upsert_games([_game(1, start=start), _game(2, start=start)])
+        self.assertEqual((second.created, second.updated, second.unchanged), (0, 1, 1))
+        row.refresh_from_db()
+        self.assertTrue(row.is_final)
+        self.assertEqual(row.as_game_data(), {
+            'away_score': 102,
+            'home_score': 110,
+            'game_status': 'Final',
+            'is_live': False,
+        })
+
+    def test_skips_games_without_id(self):
+        result = game_mirror.upsert_games([{'status': 'Final'}])
+
+        self.assertEqual(result.fetched, 0)
+        self.assertFalse(NbaGame.objects.exists())
+
+
+class SyncGamesTests(TestCase):
+    def test_follows_pagination_cursor(self):
+        client = mock.Mock()
+        client.nba.games.list.side_effect = [
+            _page([_game(1), _game(2)], next_cursor=3),
+            _page([_game(3)]),
+        ]
+
+        result = game_mirror.sync_games(days_back=1, days_ahead=3, client=client, throttle_seconds=0)
+
+        self.assertEqual((result.pages, result.fetched, result.created), (2, 3, 3))
+        self.assertEqual(client.nba.games.list.call_args_list[1].kwargs['cursor'], 3)
+        self.assertEqual(NbaGame.objects.count(), 3)
+
+    @mock.patch('hooptipp.nba.management.commands.sync_nba_games._build_bdl_client')
+    def test_command_reports_counts(self, mock_build_client):
+        client = mock.Mock()
+        client.nba.games.list.return_value = _page([_game(1)])
+        mock_build_client.return_value = client
+        out = StringIO()
+
+        call_command('sync_nba_games', '--throttle', '0', stdout=out)
+
+        self.assertIn('Mirrored 1 games in 1 pages: 1 created', out.getvalue())
+
+
+class MirrorReadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tip_type = TipType.objects.create(
+            name='Games', slug='games', deadline=timezone.now(),
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _scheduled(self, game_id):
+        return ScheduledGame.objects.create(
+            tip_type=self.tip_type,
+            nba_game_id=str(game_id),
+            game_date=timezone.now() - timedelta(hours=5),
+            home_team='Boston Celtics',
+            home_team_tricode='BOS',
+            away_team='Los Angeles Lakers',
+            away_team_tricode='LAL',
+        )
+
+    def test_final_games_are_read_locally(self):
+        game_mirror.upsert_games([_game(1)])
+        client_factory = mock.Mock()
+
+        data = game_mirror.get_games_data([self._scheduled(1)], client_factory=client_factory)
+
+        client_factory.assert_not_called()
+        self.assertEqual(data['1']['home_score'], 110)
+
+    def test_missing_games_are_fetched_and_mirrored(self):
+        game_mirror.upsert_games([_game(1)])
+        client = mock.Mock()
+        client.nba.games.list.return_value = _page([_game(2, home_score=99, away_score=101)])
+
+        data = game_mirror.get_games_data(
+            [self._scheduled(1), self._scheduled(2)],
+            client_factory=lambda: client,
+        )
+
+        self.assertEqual(data['2']['away_score'], 101)
+        client.nba.games.list.assert_called_once()
+        client.nba.games.get.assert_not_called()
+        self.assertTrue(NbaGame.objects.get(game_id='2').is_final)
+
+    def test_stale_live_game_is_refetched(self):
+        game_mirror.upsert_games([_game(1, status='Q2', home_score=40, away_score=38)])
+        NbaGame.objects.update(synced_at=timezone.now() - timedelta(hours=1))
+        client = mock.Mock()
+        client.nba.games.list.return_value = _page([_game(1, status='Q4', home_score=90, away_score=88)])
+
+        data = game_mirror.get_games_data(
+            [self._scheduled(1)],
+            client_factory=lambda: client,
+            max_age=timedelta(minutes=10),
+        )
+
+        self.assertEqual(data['1']['game_status'], 'Q4')
+        self.assertEqual(NbaGame.objects.get(game_id='1').home_score, 90)
+
+    @mock.patch('hooptipp.nba.services._build_bdl_client')
+    def test_live_card_reads_final_game_locally(self, mock_build_client):
+        game_mirror.upsert_games([_game(1)])
+
+        data = get_live_game_data('1')
+
+        mock_build_client.assert_not_called()
+        self.assertEqual(data['game_status'], 'Final')
+        self.assertFalse(data['is_live'])
+
+    @mock.patch('hooptipp.nba.services._build_bdl_client')
+    def test_live_card_refetches_stale_live_game(self, mock_build_client):
+        game_mirror.upsert_games([_game(1, status='Q2')])
+        NbaGame.objects.update(synced_at=timezone.now() - timedelta(minutes=5))
+        client = mock.Mock()
+        client.nba.games.get.return_value = SimpleNamespace(data=_game(1, status='Q3'))
+        mock_build_client.return_value = client
+
+        data = get_live_game_data('1')
+
+        client.nba.games.get.assert_called_once_with(1)
+        self.assertEqual(data['game_status'], 'Q3')
+
+
+class AdminPickerMirrorTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_superuser('admin', 'admin@test.com', 'pw')
+        self.client.force_login(user)
+
+    @mock.patch('hooptipp.nba.admin._build_bdl_client')
+    def test_picker_reads_upcoming_games_from_mirror(self, mock_build_client):
+        start = timezone.now() + timedelta(days=1)
+        game_mirror.upsert_games([
+            _game(10, status=start.isoformat(), home_score=None, away_score=None, start=start),
+            _game(11, start=timezone.now() - timedelta(days=1)),
+        ])
+
+        response = self.client.get(reverse('admin:nba_add_upcoming_games'))
+
+        mock_build_client.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['game_id'] for game in response.context['games']], ['10'])
+        self.assertEqual(response.context['games'][0]['home_team']['abbreviation'], 'BOS')
@@ -0,0 +1,155 @@
+"""Tests for HoopsHype roster fetching and parsing."""
+
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from hooptipp.nba import hoopshype
+from hooptipp.nba.managers import NbaPlayerManager
+from hooptipp.nba.services import sync_players_from_hoopshype
+from hooptipp.predictions.models import Option
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'hoopshype'
+CELTICS_URL = 'https://eu.hoopshype.com/salaries/teams/boston-celtics/2/'
+LAKERS_URL = 'https://eu.hoopshype.com/salaries/teams/los-angeles-lakers/13/'
+
+
+def _response(status_code=200, text='', headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    response.raise_for_status.return_value = None
+    return response
+
+
+class ParseRosterHtmlTests(TestCase):
+    def test_parses_recorded_team_page(self):
+        html = (FIXTURES_DIR / 'boston-celtics.html').read_text()
+
+        players = hoopshype.parse_roster_html(html, 'Boston Celtics')
+
+        self.assertEqual(len(players), 13)
+        self.assertEqual(players[0], {
+            'name': 'Jayson Tatum',
+            'position': '',
+            'salary': '$54,000,000',
+            'team': 'Boston Celtics',
+        })
+        self.assertNotIn('Total', [player['name'] for player in players])
+
+    def test_falls_back_to_first_table(self):
+        html = (
+            '<html><body><table><tr><th></th><th>Player</th></tr>'
+            '<tr><td>1</td><td>Some   Player</td><td>$1</td></tr></table></body></html>'
+        )
+
+        players = hoopshype.parse_roster_html(html, 'Team')
+
+        self.assertEqual([player['name'] for player in players], ['Some Player'])
+
+    def test_page_without_table_returns_no_players(self):
+        self.assertEqual(hoopshype.parse_roster_html('<html><p>Down</p></html>', 'Team'), [])
+
+
+class FetchHtmlTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.limiter = hoopshype.HostRateLimiter(max_concurrency=1, min_interval=0)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_revalidates_cached_page(self):
+        session = mock.Mock()
+        session.get.side_effect = [
+            _response(200, '<html>v1</html>', {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Sep 2025 00:00:00 GMT'}),
+            _response(304),
+        ]
+
+        first = hoopshype.fetch_html(CELTICS_URL, session=session, limiter=self.limiter)
+        second = hoopshype.fetch_html(CELTICS_URL, session=session, limiter=self.limiter)
+
+        self.assertEqual(first, '<html>v1</html>')
+        self.assertEqual(second, '<html>v1</html>')
+        self.assertNotIn('If-None-Match', session.get.call_args_list[0].kwargs['headers'])
+        revalidation_headers = session.get.call_args_list[1].kwargs['headers']
+        self.assertEqual(revalidation_headers['If-None-Match'], '"abc"')
+        self.assertEqual(revalidation_headers['If-Modified-Since'], 'Mon, 01 Sep 2025 00:00:00 GMT')
+
+    def test_changed_page_replaces_cached_copy(self):
+        session = mock.Mock()
+        session.get.side_effect = [
+            _response(200, '<html>v1</html>', {'ETag': '"v1"'}),
+            _response(200, '<html>v2</html>', {'ETag': '"v2"'}),
+            _response(304),
+        ]
+
+        hoopshype.fetch_html(CELTICS_URL, session=session, limiter=self.limiter)
+        hoopshype.fetch_html(CELTICS_URL, session=session, limiter=self.limiter)
+        third = hoopshype.fetch_html(CELTICS_URL, session=session, limiter=self.limiter)
+
+        self.assertEqual(third, '<html>v2</html>')
+        self.assertEqual(session.get.call_args_list[2].kwargs['headers']['If-None-Match'], '"v2"')
+
+    def test_replay_reads_recorded_page_without_network(self):
+        with mock.patch('hooptipp.nba.hoopshype.requests.get') as get:
+            html = hoopshype.fetch_html(CELTICS_URL, replay_dir=FIXTURES_DIR)
+
+        get.assert_not_called()
+        self.assertIn('hh-salaries-ranking-table', html)
+
+
+class HostRateLimiterTests(TestCase):
+    def test_limits_concurrent_requests_per_host(self):
+        limiter = hoopshype.HostRateLimiter(max_concurrency=2, min_interval=0)
+        lock = threading.Lock()
+        in_flight = {'current': 0, 'max': 0}
+
+        def request():
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.02)
+            with lock:
+                in_flight['current'] -= 1
+
+        threads = [
+            threading.Thread(target=limiter.request, args=(CELTICS_URL, request))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(in_flight['max'], 2)
+
+    def test_spaces_request_starts(self):
+        limiter = hoopshype.HostRateLimiter(max_concurrency=4, min_interval=0.05)
+        starts = []
+
+        for _ in range(3):
+            limiter.request(CELTICS_URL, lambda: starts.append(time.monotonic()))
+
+        self.assertGreaterEqual(starts[2] - starts[0], 0.09)
+
+
+class SyncFromRecordedPagesTests(TestCase):
+    @mock.patch('hooptipp.nba.services._get_hoopshype_team_urls')
+    def test_sync_players_from_recorded_pages(self, mock_urls):
+        mock_urls.return_value = {
+            'Boston Celtics': CELTICS_URL,
+            'Los Angeles Lakers': LAKERS_URL,
+        }
+
+        result = sync_players_from_hoopshype(max_workers=2, replay_dir=str(FIXTURES_DIR))
+
+        self.assertEqual(result.created, 25)
+        players = Option.objects.filter(category=NbaPlayerManager.get_category())
+        self.assertEqual(players.count(), 25)
+        self.assertEqual(players.get(name='LeBron James').metadata['team'], 'Los Angeles Lakers')
@@ -10,7 +10,7 @@ from unittest.mock import patch, MagicMock
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from django.contrib.auth import get_user_model
@@ -19,6 +19,7 @@ from hooptipp.predictions.models import (
     EventOutcome, Option, OptionCategory, PredictionEvent, 
     PredictionOption, TipType, UserTip
 )
+from hooptipp.jobs import run_next
 from hooptipp.nba.models import ScheduledGame
 
 User = get_user_model()
@@ -510,8 +511,9 @@ class ProcessGameOutcomesCommandTest(TestCase):
                 # Verify EventOutcome was created
                 self.assertEqual(EventOutcome.objects.count(), 1)
 
+    @override_settings(SCORING_QUEUE_ENABLED=True, SCORING_DEBOUNCE_SECONDS=0)
     def test_auto_scoring_integration(self):
-        """Test that the command automatically scores events after creating outcomes."""
+        """Test that new outcomes are scored by the queued background job."""
         # Create a user tip
         UserTip.objects.create(
             user=self.user,
@@ -532,12 +534,48 @@ class ProcessGameOutcomesCommandTest(TestCase):
             }
         }
         with self._mock_build_client_with_games(game_data):
-            call_command('process_game_outcomes')
-            
-            # Verify EventOutcome was created and scored
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('process_game_outcomes')
+
+            # The outcome waits for the scoring job, which scores it
             self.assertEqual(EventOutcome.objects.count(), 1)
             outcome = EventOutcome.objects.first()
+            self.assertIsNone(outcome.scored_at)
+            self.assertIsNotNone(outcome.score_requested_at)
+
+            run_next('worker-1')
+
+            outcome.refresh_from_db()
             self.assertIsNotNone(outcome.scored_at)
+            self.assertIsNone(outcome.score_requested_at)
+
+    def test_auto_scoring_without_worker(self):
+        """Test that new outcomes are scored in-process when the scoring queue is disabled."""
+        UserTip.objects.create(
+            user=self.user,
+            tip_type=self.tip_type,
+            prediction_event=self.prediction_event,
+            prediction_option=self.home_option,
+            selected_option=self.home_team,
+            prediction='Los Angeles Lakers will win',
+            is_locked=False
+        )
+
+        game_data = {
+            '12345': {
+                'game_status': 'Final',
+                'home_score': 110,
+                'away_score': 105,
+                'is_live': False
+            }
+        }
+        with self._mock_build_client_with_games(game_data):
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('process_game_outcomes')
+
+        outcome = EventOutcome.objects.get()
+        self.assertIsNotNone(outcome.scored_at)
+        self.assertIsNone(outcome.score_requested_at)
 
     def test_error_handling(self):
         """Test that errors are handled gracefully."""
@@ -633,8 +671,13 @@ class ProcessGameOutcomesCommandTest(TestCase):
                 'is_live': False
             }
         }
-        with self._mock_build_client_with_games(game_data_multi):
-            call_command('process_game_outcomes')
+        with self._mock_build_client_with_games(game_data_multi), patch(
+            'hooptipp.predictions.scoring_queue.score_pending_outcomes'
+        ) as score_pending:
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('process_game_outcomes')
             
             # Verify both EventOutcomes were created
             self.assertEqual(EventOutcome.objects.count(), 2)
+            # ...and scored in one pass at the end of the run
+            score_pending.assert_called_once()
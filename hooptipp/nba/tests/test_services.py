@@ -12,6 +12,7 @@ from hooptipp.nba.services import (
     get_team_logo_url,
     sync_players,
 )
+from hooptipp.nba.logos import invalidate_logo_urls
 from hooptipp.nba.managers import NbaPlayerManager
 from hooptipp.predictions.models import Option, OptionCategory
 
@@ -21,6 +22,7 @@ class GetTeamLogoUrlTests(TestCase):
 
     def setUp(self):
         cache.clear()
+        invalidate_logo_urls()
         self.teams_cat = OptionCategory.objects.create(
             slug="nba-teams",
             name="NBA Teams",
@@ -28,6 +30,7 @@ class GetTeamLogoUrlTests(TestCase):
 
     def tearDown(self):
         cache.clear()
+        invalidate_logo_urls()
 
     def test_returns_logo_url_for_nba_team_id(self):
         """Function should return CDN URL using NBA team ID."""
@@ -167,6 +170,43 @@ class GetTeamLogoUrlTests(TestCase):
             self.assertIn("1610612738", url_lower)
 
 
+    def test_repeated_lookups_do_not_query_the_database(self):
+        """Logo URLs are resolved from the in-memory manifest after the first lookup."""
+        Option.objects.create(
+            category=self.teams_cat,
+            slug="boston-celtics",
+            name="Boston Celtics",
+            short_name="BOS",
+            external_id="2",
+            metadata={"nba_team_id": 1610612738},
+        )
+        get_team_logo_url("BOS")
+
+        with self.assertNumQueries(0):
+            get_team_logo_url("BOS")
+            get_team_logo_url("LAL")
+            get_team_logo_url("UNKNOWN")
+
+    @mock.patch("hooptipp.nba.logos.read_manifest", return_value={})
+    def test_team_change_refreshes_manifest(self, _read_manifest):
+        """Saving an NBA team rebuilds the URLs so new teams resolve to the CDN by NBA ID."""
+        self.assertIn("XYZ", get_team_logo_url("XYZ"))
+
+        Option.objects.create(
+            category=self.teams_cat,
+            slug="xyz-team",
+            name="XYZ Team",
+            short_name="XYZ",
+            external_id="99",
+            metadata={"nba_team_id": 1610612999},
+        )
+
+        self.assertEqual(
+            get_team_logo_url("xyz"),
+            "https://cdn.nba.com/logos/nba/1610612999/global/L/logo.svg",
+        )
+
+
 class GetLiveGameDataTests(TestCase):
     """Tests for get_live_game_data function."""
 
@@ -498,3 +538,136 @@ class PlayerSyncSlugUniquenessTests(TestCase):
                 player = Option.objects.filter(category=self.players_cat).first()
                 # Special characters should be removed from slug
                 self.assertEqual(player.slug, 'dangelo-russell-3')
+
+
+class PlayerSyncBulkUpsertTests(TestCase):
+    """Tests for the bulk, change-detecting player sync."""
+
+    def setUp(self):
+        self.players_cat = NbaPlayerManager.get_category()
+        from hooptipp.nba.services import _BDL_CLIENT_CACHE
+        _BDL_CLIENT_CACHE.clear()
+
+    def _mock_player(self, player_id, first_name, last_name, team='LAL'):
+        player = mock.Mock()
+        player.id = player_id
+        player.first_name = first_name
+        player.last_name = last_name
+        player.position = 'G'
+        player.team.abbreviation = team
+        player.team.full_name = f'{team} Team'
+        return player
+
+    def _sync(self, players):
+        with mock.patch('hooptipp.nba.services._get_bdl_api_key', return_value='test-api-key'):
+            from hooptipp.nba.services import _build_bdl_client
+            client = _build_bdl_client()
+            response = mock.Mock()
+            response.data = players
+            response.meta = None
+            with mock.patch.object(client.nba.players, 'list', return_value=response):
+                return sync_players(throttle_seconds=0)
+
+    def test_unchanged_players_are_not_written(self):
+        players = [self._mock_player(index, 'Player', f'Number{index}') for index in range(1, 21)]
+        first = self._sync(players)
+        self.assertEqual((first.created, first.updated, first.removed), (20, 0, 0))
+
+        # Category lookup, loading the existing players and nothing else
+        with self.assertNumQueries(2):
+            second = self._sync(players)
+        self.assertEqual((second.created, second.updated, second.removed), (0, 0, 0))
+        self.assertFalse(second.changed)
+
+    def test_changed_and_removed_players_are_detected(self):
+        self._sync([
+            self._mock_player(1, 'John', 'Smith'),
+            self._mock_player(2, 'Jane', 'Doe'),
+        ])
+
+        result = self._sync([
+            self._mock_player(1, 'John', 'Smith', team='BOS'),
+            self._mock_player(3, 'New', 'Player'),
+        ])
+
+        self.assertEqual((result.created, result.updated, result.removed), (1, 1, 1))
+        moved = Option.objects.get(category=self.players_cat, external_id='1')
+        self.assertEqual(moved.metadata['team_abbreviation'], 'BOS')
+        self.assertEqual(moved.description, 'G - BOS')
+        self.assertFalse(Option.objects.filter(category=self.players_cat, external_id='2').exists())
+
+    @mock.patch('hooptipp.nba.services.time.sleep')
+    @mock.patch('hooptipp.nba.services._scrape_team_roster')
+    @mock.patch('hooptipp.nba.services._get_hoopshype_team_urls')
+    def test_hoopshype_sync_uses_stable_ids_and_skips_unchanged(self, mock_urls, mock_scrape, _sleep):
+        from hooptipp.nba.services import sync_players_from_hoopshype
+
+        mock_urls.return_value = {'Boston Celtics': 'https://example.com/celtics/'}
+        mock_scrape.return_value = [
+            {'name': 'Jayson Tatum', 'position': '', 'salary': '$1', 'team': 'Boston Celtics'},
+            {'name': 'Jaylen Brown', 'position': '', 'salary': '$2', 'team': 'Boston Celtics'},
+        ]
+
+        first = sync_players_from_hoopshype()
+        second = sync_players_from_hoopshype()
+
+        self.assertEqual(first.created, 2)
+        self.assertEqual((second.created, second.updated), (0, 0))
+        self.assertEqual(Option.objects.filter(category=self.players_cat).count(), 2)
+
+        mock_scrape.return_value[0]['salary'] = '$3'
+        third = sync_players_from_hoopshype()
+        self.assertEqual((third.created, third.updated), (0, 1))
+
+    @mock.patch('hooptipp.nba.services._scrape_team_roster')
+    @mock.patch('hooptipp.nba.services._get_hoopshype_team_urls')
+    def test_hoopshype_sync_keeps_players_of_older_syncs(self, mock_urls, mock_scrape):
+        from hooptipp.nba.services import sync_players_from_hoopshype
+
+        legacy = Option.objects.create(
+            category=self.players_cat,
+            external_id='hoopshype-boston-celtics-8392017465523810977',
+            slug='jayson-tatum-boston-celtics-4711',
+            name='Jayson Tatum',
+            metadata={'team': 'Boston Celtics', 'source': 'hoopshype'},
+        )
+        mock_urls.return_value = {'Boston Celtics': 'https://example.com/celtics/'}
+        mock_scrape.return_value = [
+            {'name': 'Jayson Tatum', 'position': '', 'salary': '$1', 'team': 'Boston Celtics'},
+            {'name': 'Jaylen Brown', 'position': '', 'salary': '$2', 'team': 'Boston Celtics'},
+        ]
+
+        result = sync_players_from_hoopshype()
+
+        self.assertEqual((result.created, result.updated), (1, 1))
+        self.assertEqual(Option.objects.filter(category=self.players_cat).count(), 2)
+        legacy.refresh_from_db()
+        self.assertRegex(legacy.external_id, r'^hoopshype-boston-celtics-[0-9a-f]{16}$')
+
+        second = sync_players_from_hoopshype()
+        self.assertEqual((second.created, second.updated), (0, 0))
+
+    @mock.patch('hooptipp.nba.services._scrape_team_roster')
+    @mock.patch('hooptipp.nba.services._get_hoopshype_team_urls')
+    def test_hoopshype_sync_skips_a_roster_that_fails_to_save(self, mock_urls, mock_scrape):
+        from hooptipp.nba.services import sync_players_from_hoopshype
+
+        mock_urls.return_value = {
+            'Boston Celtics': 'https://example.com/celtics/',
+            'Los Angeles Lakers': 'https://example.com/lakers/',
+        }
+        mock_scrape.side_effect = lambda team_name, team_url, **kwargs: [
+            {'name': f'{team_name} Player', 'position': '', 'salary': '$1', 'team': team_name},
+        ]
+        # Another player already holds the slug of the Celtics player
+        sync_players_from_hoopshype()
+        celtics_player = Option.objects.get(category=self.players_cat, metadata__team='Boston Celtics')
+        Option.objects.filter(pk=celtics_player.pk).update(external_id='manual-player')
+        Option.objects.filter(category=self.players_cat, metadata__team='Los Angeles Lakers').delete()
+
+        result = sync_players_from_hoopshype()
+
+        self.assertEqual(result.created, 1)
+        self.assertTrue(
+            Option.objects.filter(category=self.players_cat, metadata__team='Los Angeles Lakers').exists()
+        )
@@ -27,6 +27,8 @@ from .models import (
     PredictionOption,
     Season,
     SeasonParticipant,
+    SeasonRecap,
+    StandingsSnapshot,
     TeilnahmebedingungenSection,
     TipType,
     UserEventScore,
@@ -35,6 +37,7 @@ from .models import (
     UserPreferences,
     UserTip,
 )
+from .scoring_queue import scoring_batch
 
 
 @admin.register(OptionCategory)
@@ -458,7 +461,7 @@ class EventOutcomeAdmin(admin.ModelAdmin):
         """Process the batch outcomes form submission."""
         outcomes_created = 0
         
-        with transaction.atomic():
+        with scoring_batch(), transaction.atomic():
             for event in events_queryset:
                 winning_option_id = request.POST.get(f'winning_option_{event.id}')
                 
@@ -526,6 +529,8 @@ class EventOutcomeAdmin(admin.ModelAdmin):
 
         try:
             result = scoring_service.score_event_outcome(outcome, force=force)
+        except scoring_service.ScoringLeaseError as exc:
+            self.message_user(request, str(exc), level=messages.WARNING)
         except ValueError as exc:
             message = str(exc)
             outcome.score_error = message
@@ -659,6 +664,7 @@ class UserTipAdmin(admin.ModelAdmin):
         'option_display',
         'is_locked',
         'lock_status',
+        'result',
         'updated_at',
     )
     list_filter = (
@@ -666,6 +672,7 @@ class UserTipAdmin(admin.ModelAdmin):
         'prediction_event__tip_type',
         'is_locked',
         'lock_status',
+        'result',
     )
     search_fields = ('user__username', 'prediction')
     autocomplete_fields = ('user', 'prediction_event', 'prediction_option', 'selected_option')
@@ -950,6 +957,33 @@ class HotnessKudosAdmin(admin.ModelAdmin):
     ordering = ('-created_at',)
 
 
+@admin.register(StandingsSnapshot)
+class StandingsSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('day', 'season', 'rank', 'user', 'total_points', 'event_count', 'updated_at')
+    list_filter = ('season', 'day')
+    search_fields = ('user__username',)
+    date_hierarchy = 'day'
+    ordering = ('-day', 'rank')
+    readonly_fields = ('season', 'user', 'day', 'rank', 'total_points', 'event_count', 'updated_at')
+
+
+@admin.register(SeasonRecap)
+class SeasonRecapAdmin(admin.ModelAdmin):
+    """Read-only: recaps are written once by process_achievements."""
+
+    list_display = ('season', 'participant_count', 'total_matches', 'correct_pick_count', 'resolved_pick_count', 'created_at')
+    readonly_fields = (
+        'season', 'participant_count', 'total_matches', 'pick_count', 'resolved_pick_count',
+        'correct_pick_count', 'podium', 'user_stats', 'created_at',
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(HotnessSettings)
 class HotnessSettingsAdmin(admin.ModelAdmin):
     """Admin for HotnessSettings singleton model."""
@@ -5,3 +5,55 @@ class PredictionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hooptipp.predictions'
     verbose_name = 'Predictions'
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+        from django.db.models.signals import post_delete, post_save
+
+        from .models import (
+            Achievement,
+            EventOutcome,
+            HotnessKudos,
+            HotnessSettings,
+            Season,
+            SeasonParticipant,
+            UserEventScore,
+            UserHotness,
+            UserPreferences,
+            UserTip,
+        )
+        from .pick_stats import tip_deleted, tip_saved
+        from .scoring_queue import outcome_saved
+        from .scoring_service import clear_tip_results
+        from .season_assignment import season_saved
+        from .standings_version import settings_changed, standings_changed
+
+        # Queue debounced background scoring when an outcome's winner is set
+        post_save.connect(outcome_saved, sender=EventOutcome, dispatch_uid='predictions_outcome_scoring')
+        # Tips of a deleted outcome are no longer correct or incorrect
+        post_delete.connect(clear_tip_results, sender=EventOutcome, dispatch_uid='predictions_outcome_tip_results')
+
+        # Keep the per-option pick counters in step with tips
+        post_save.connect(tip_saved, sender=UserTip, dispatch_uid='predictions_tip_pick_stats_save')
+        post_delete.connect(tip_deleted, sender=UserTip, dispatch_uid='predictions_tip_pick_stats_delete')
+
+        # Move scores and tips into or out of a season when its timeframe changes
+        post_save.connect(season_saved, sender=Season, dispatch_uid='predictions_season_assignment')
+
+        # Move the leaderboard and projection caches to a new version
+        for model in (
+            get_user_model(),
+            Achievement,
+            EventOutcome,
+            HotnessKudos,
+            Season,
+            SeasonParticipant,
+            UserEventScore,
+            UserHotness,
+            UserPreferences,
+            UserTip,
+        ):
+            label = model._meta.label_lower
+            post_save.connect(standings_changed, sender=model, dispatch_uid=f'predictions_standings_save_{label}')
+            post_delete.connect(standings_changed, sender=model, dispatch_uid=f'predictions_standings_delete_{label}')
+        post_save.connect(settings_changed, sender=HotnessSettings, dispatch_uid='predictions_standings_hotness_settings')
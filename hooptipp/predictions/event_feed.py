@@ -0,0 +1,110 @@
+"""Open prediction events for the home page, loaded with one query.
+
+The home page shows the open events three ways: grouped by tip type, in
+seven weekday slots and as the short "open predictions" list. :func:`load_event_feed`
+loads every open event once, with the relations the cards need, and builds
+all three views in memory, so the number of queries does not depend on how
+many tip types or event sources are active.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .models import EventOutcome, PredictionEvent
+
+# The open predictions list is filled up to this many events from beyond the week
+OPEN_PREDICTIONS_MIN = 5
+
+
+@dataclass
+class EventFeed:
+    """Open events grouped for the home page."""
+
+    week_start: date
+    week_end: date
+    sections: List[dict] = field(default_factory=list)
+    visible_events: List[PredictionEvent] = field(default_factory=list)
+    weekday_slots: List[dict] = field(default_factory=list)
+    open_predictions: List[PredictionEvent] = field(default_factory=list)
+
+
+def _event_sort_key(event: PredictionEvent) -> tuple:
+    return (event.deadline, event.sort_order, event.name.lower())
+
+
+def load_event_feed(now: Optional[datetime] = None) -> EventFeed:
+    """
+    Load the open events and group them for the home page.
+
+    Args:
+        now: Reference time (default: now)
+
+    Returns:
+        EventFeed with:
+
+        - ``sections``: ``{'tip_type', 'events'}`` per active tip type, ordered
+          by the tip type deadline
+        - ``visible_events``: the events of all sections
+        - ``weekday_slots``: ``{'date', 'events'}`` for each of the next seven
+          days, by local deadline date
+        - ``open_predictions``: unresolved events due this week, filled up to
+          OPEN_PREDICTIONS_MIN with later events
+    """
+    now = now or timezone.now()
+    week_start = timezone.localdate(now)
+    week_end = week_start + timedelta(days=6)
+    feed = EventFeed(week_start=week_start, week_end=week_end)
+
+    events = list(
+        PredictionEvent.objects.filter(is_active=True, opens_at__lte=now, deadline__gte=now)
+        .annotate(has_outcome=Exists(EventOutcome.objects.filter(prediction_event=OuterRef('pk'))))
+        .select_related('scheduled_game', 'tip_type')
+        .prefetch_related('options__option__category')
+        .order_by('deadline', 'sort_order', 'name')
+    )
+
+    events_by_tip_type: Dict[int, List[PredictionEvent]] = defaultdict(list)
+    for event in events:
+        if event.tip_type.is_active:
+            events_by_tip_type[event.tip_type_id].append(event)
+    tip_types = sorted(
+        (tip_type_events[0].tip_type for tip_type_events in events_by_tip_type.values()),
+        key=lambda tip_type: (tip_type.deadline, tip_type.pk),
+    )
+    for tip_type in tip_types:
+        section_events = events_by_tip_type[tip_type.pk]
+        feed.sections.append({'tip_type': tip_type, 'events': section_events})
+        feed.visible_events.extend(section_events)
+
+    events_by_day: Dict[date, List[PredictionEvent]] = defaultdict(list)
+    for event in feed.visible_events:
+        deadline_date = timezone.localdate(event.deadline)
+        if week_start <= deadline_date <= week_end:
+            events_by_day[deadline_date].append(event)
+    for offset in range(7):
+        slot_date = week_start + timedelta(days=offset)
+        feed.weekday_slots.append({
+            'date': slot_date,
+            'events': sorted(events_by_day.get(slot_date, []), key=_event_sort_key),
+        })
+
+    later_events: List[PredictionEvent] = []
+    for event in events:
+        if event.has_outcome:
+            continue
+        deadline_date = timezone.localdate(event.deadline)
+        if week_start <= deadline_date <= week_end:
+            feed.open_predictions.append(event)
+        elif deadline_date > week_end:
+            later_events.append(event)
+    if len(feed.open_predictions) < OPEN_PREDICTIONS_MIN:
+        feed.open_predictions.extend(later_events[:OPEN_PREDICTIONS_MIN - len(feed.open_predictions)])
+
+    return feed
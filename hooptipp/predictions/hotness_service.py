@@ -1,16 +1,29 @@
 """Service for managing user hotness scores."""
 
 from __future__ import annotations
-from datetime import date
+from datetime import date, datetime, time, timedelta
 from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
+from .standings_version import invalidate_standings
 from .models import UserHotness, HotnessKudos, Season, UserTip, UserEventScore, EventOutcome, HotnessSettings
 
 User = get_user_model()
 
 
+def day_bounds(day: date) -> tuple[datetime, datetime]:
+    """
+    Return the start of ``day`` and of the next day in the current timezone.
+
+    ``created_at__gte=start, created_at__lt=end`` matches the same rows as
+    ``created_at__date=day`` but can use the ``created_at`` indexes.
+    """
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+
+
 def get_or_create_hotness(user: User, season: Season | None = None) -> UserHotness:
     """Get or create hotness record for user in current season."""
     hotness, created = UserHotness.objects.get_or_create(
@@ -31,7 +44,7 @@ def give_kudos(from_user: User, to_user: User) -> dict:
     if from_user == to_user:
         return {'success': False, 'message': 'Cannot give kudos to yourself'}
     
-    today = timezone.now().date()
+    today_start, today_end = day_bounds(timezone.now().date())
     active_season = Season.get_active_season()
     
     # Check if already gave kudos today (skip for admin users)
@@ -39,7 +52,8 @@ def give_kudos(from_user: User, to_user: User) -> dict:
         existing = HotnessKudos.objects.filter(
             from_user=from_user,
             to_user=to_user,
-            created_at__date=today
+            created_at__gte=today_start,
+            created_at__lt=today_end,
         ).exists()
         
         if existing:
@@ -77,11 +91,11 @@ def award_hotness_for_correct_prediction(
     hotness = get_or_create_hotness(user, season)
     
     # Base hotness for correct prediction
-    hotness.score += settings.correct_prediction_points
+    points = settings.correct_prediction_points
     
     # Bonus for locked prediction
     if was_locked:
-        hotness.score += settings.lock_win_points
+        points += settings.lock_win_points
     
     # Check for streak bonus
     # Get the most recent streak_length resolved events for which the user made a tip
@@ -103,22 +117,26 @@ def award_hotness_for_correct_prediction(
         
         # Only award streak bonus if all streak_length most recent resolved predictions were correct
         if correct_count >= settings.streak_length:
-            hotness.score += settings.streak_bonus_points
+            points += settings.streak_bonus_points
     
-    hotness.save(update_fields=['score'])
+    # Add in the database: events of one user may be scored concurrently
+    UserHotness.objects.filter(pk=hotness.pk).update(score=F('score') + points)
+    invalidate_standings()
+    hotness.score += points
 
 
 def get_user_kudos_given_today(user: User, target_users: list[User]) -> dict[int, bool]:
     """
     Get dict of user_id -> bool indicating if current user gave kudos today.
     """
-    today = timezone.now().date()
+    today_start, today_end = day_bounds(timezone.now().date())
     target_ids = [u.id for u in target_users]
     
     kudos = HotnessKudos.objects.filter(
         from_user=user,
         to_user_id__in=target_ids,
-        created_at__date=today
+        created_at__gte=today_start,
+        created_at__lt=today_end,
     ).values_list('to_user_id', flat=True)
     
     return {user_id: user_id in kudos for user_id in target_ids}
@@ -126,9 +144,10 @@ def get_user_kudos_given_today(user: User, target_users: list[User]) -> dict[int
 
 def get_kudos_count_today(user: User) -> int:
     """Get count of kudos received by user today."""
-    today = timezone.now().date()
+    today_start, today_end = day_bounds(timezone.now().date())
     return HotnessKudos.objects.filter(
         to_user=user,
-        created_at__date=today
+        created_at__gte=today_start,
+        created_at__lt=today_end,
     ).count()
 
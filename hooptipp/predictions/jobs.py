@@ -0,0 +1,21 @@
+"""Background jobs of the predictions app (see :mod:`hooptipp.jobs`)."""
+
+from dataclasses import asdict
+
+from hooptipp.jobs import job, register_command
+
+from .scoring_queue import SCORING_JOB, score_pending_outcomes
+
+register_command('process_scores')
+register_command('process_achievements')
+register_command('send_reminder_emails')
+register_command('process_profile_pictures')
+register_command('snapshot_standings')
+
+
+@job(SCORING_JOB, max_attempts=3)
+def score_outcomes(context):
+    """Score outcomes queued by :func:`~hooptipp.predictions.scoring_queue.request_scoring`."""
+
+    result = score_pending_outcomes(progress=lambda percent, message: context.set_progress(percent, message))
+    return asdict(result)
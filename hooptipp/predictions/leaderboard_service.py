@@ -0,0 +1,508 @@
+"""Season leaderboard computation, caching and per-viewer windowing.
+
+The full ranked standings for a season are viewer-independent, so they are
+computed with a fixed number of bulk queries and cached under a change stamp
+built from the standings version token, which every score, kudos, lock,
+hotness, enrollment and achievement write moves. Per-viewer data (kudos
+given, the window around the viewer) is applied on top of the cached
+standings.
+
+Pages that only show the window use :func:`get_leaderboard_slice`, which is
+cached under the same stamp; on a miss it ranks with ``RANK() OVER`` in the
+database and fetches and enriches only the rows of the window, so its cost
+does not grow with the number of users.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, F, Q, QuerySet, Sum, Window
+from django.db.models.functions import Coalesce, FirstValue, Rank
+from django.utils import timezone
+
+from .hotness_service import day_bounds
+from .lock_service import LockSummary, get_lock_summaries
+from .profile_pictures import LEADERBOARD_AVATAR_SIZE, Avatar, get_avatar
+from .standings_snapshots import StandingsChange, get_standings_changes
+from .standings_version import get_standings_version
+from .models import (
+    Achievement,
+    HotnessKudos,
+    HotnessSettings,
+    Season,
+    SeasonParticipant,
+    UserEventScore,
+    UserHotness,
+    UserPreferences,
+)
+
+LEADERBOARD_WINDOW_SIZE = 6
+DEFAULT_CACHE_TIMEOUT = 300
+# Hotness decay and the 3-day point change move with time alone, so the change
+# stamp also rolls over at this interval.
+STAMP_TIME_BUCKET = timedelta(minutes=15)
+
+
+@dataclass
+class LeaderboardRow:
+    """One ranked user in the standings."""
+
+    id: int
+    username: str
+    display_name: str
+    rank: int
+    total_points: int
+    event_count: int
+    points_change_3d: int
+    hotness_score: float
+    hotness_level: int
+    kudos_today: int
+    lock_summary: LockSummary
+    user_achievements: List[Achievement] = field(default_factory=list)
+    avatar: Optional[Avatar] = None
+    is_active_user: bool = False
+    points_change_7d: int = 0
+    # Places gained (positive) or lost since the snapshot 3 days ago, if any
+    rank_change_3d: Optional[int] = None
+
+    def as_dict(self, *, kudos_given: bool = False) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'rank': self.rank,
+            'display_name': self.display_name,
+            'total_points': self.total_points,
+            'event_count': self.event_count,
+            'points_change_3d': self.points_change_3d,
+            'points_change_7d': self.points_change_7d,
+            'rank_change_3d': self.rank_change_3d,
+            'hotness_score': round(self.hotness_score, 2),
+            'hotness_level': self.hotness_level,
+            'kudos_today': self.kudos_today,
+            'kudos_given': kudos_given,
+            'is_viewer': self.is_active_user,
+            'avatar': self.avatar.as_dict() if self.avatar else None,
+            'locks': {
+                'total': self.lock_summary.total,
+                'available': self.lock_summary.available,
+                'active': self.lock_summary.active,
+                'pending': self.lock_summary.pending,
+                'next_return_at': (
+                    self.lock_summary.next_return_at.isoformat()
+                    if self.lock_summary.next_return_at
+                    else None
+                ),
+            },
+            'achievements': [
+                {
+                    'emoji': achievement.emoji,
+                    'name': achievement.name,
+                    'description': achievement.description,
+                    'season': achievement.season.name if achievement.season else None,
+                }
+                for achievement in self.user_achievements
+            ],
+        }
+
+
+class LeaderboardDivider:
+    """Marker rendered between rank 1 and the window around the viewer."""
+
+    is_divider = True
+
+
+@dataclass
+class LeaderboardSlice:
+    """Rank 1 and the rows around the viewer, with the size of the standings."""
+
+    rows: List[LeaderboardRow | LeaderboardDivider]
+    total: int
+    viewer_rank: Optional[int] = None
+
+
+def get_change_stamp(season: Optional[Season], *, now: Optional[datetime] = None) -> str:
+    """
+    Return a short hash that changes whenever the standings of ``season`` may change.
+
+    Reads the single standings version row (see :mod:`.standings_version`)
+    instead of aggregating the tables behind the standings, so it costs one
+    primary key lookup however many rows they hold.
+
+    Args:
+        season: Season to build the stamp for (``None`` for all-time standings)
+        now: Reference time (defaults to now)
+
+    Returns:
+        Hex digest of the season, the standings version and the time bucket.
+    """
+    if now is None:
+        now = timezone.now()
+
+    parts: List[Any] = [
+        season.pk if season else 'all',
+        season.updated_at.isoformat() if season else '',
+        int(now.timestamp() // STAMP_TIME_BUCKET.total_seconds()),
+        timezone.localdate(now).isoformat(),
+        get_standings_version(),
+    ]
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def _cache_timeout() -> int:
+    return getattr(settings, 'LEADERBOARD_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT)
+
+
+def _leaderboard_cache_key(season: Optional[Season], stamp: str) -> str:
+    return f"leaderboard:{season.pk if season else 'all'}:{stamp}"
+
+
+def get_leaderboard(
+    season: Optional[Season],
+    *,
+    now: Optional[datetime] = None,
+    stamp: Optional[str] = None,
+) -> List[LeaderboardRow]:
+    """
+    Return the full ranked standings for ``season``, cached by change stamp.
+
+    Args:
+        season: Season to rank (``None`` ranks all users over all scores)
+        now: Reference time (defaults to now)
+        stamp: Precomputed :func:`get_change_stamp` value, if available
+
+    Returns:
+        LeaderboardRow list ordered by rank.
+    """
+    if now is None:
+        now = timezone.now()
+    if stamp is None:
+        stamp = get_change_stamp(season, now=now)
+
+    cache_key = _leaderboard_cache_key(season, stamp)
+    rows = cache.get(cache_key)
+    if rows is None:
+        rows = build_leaderboard(season, now=now)
+        cache.set(cache_key, rows, _cache_timeout())
+    return rows
+
+
+def ranked_users(season: Optional[Season]) -> QuerySet:
+    """
+    Return the users of the standings with their totals and ``RANK()``.
+
+    Ties on points and events are broken by username, so ranks are unique.
+    The ``rank`` annotation is a window function: filtering on it (or on
+    ``ranked_id``) happens after ranking, other filters before.
+    """
+    User = get_user_model()
+    if season:
+        # Only count the season's scores and only rank enrolled users
+        season_filter = Q(usereventscore__season=season)
+        enrolled_user_ids = SeasonParticipant.objects.filter(season=season).values_list('user_id', flat=True)
+        users = User.objects.filter(id__in=enrolled_user_ids).annotate(
+            total_points=Coalesce(Sum('usereventscore__points_awarded', filter=season_filter), 0),
+            event_count=Coalesce(
+                Count('usereventscore__prediction_event', distinct=True, filter=season_filter),
+                0,
+            ),
+        )
+    else:
+        users = User.objects.annotate(
+            total_points=Coalesce(Sum('usereventscore__points_awarded'), 0),
+            event_count=Coalesce(Count('usereventscore__prediction_event', distinct=True), 0),
+        )
+    return users.annotate(
+        rank=Window(Rank(), order_by=[F('total_points').desc(), F('event_count').desc(), F('username').asc()]),
+        ranked_id=Window(FirstValue('id'), partition_by=[F('id')]),
+    ).order_by('rank')
+
+
+def build_leaderboard(season: Optional[Season], *, now: Optional[datetime] = None) -> List[LeaderboardRow]:
+    """Compute the full ranked standings for ``season`` with bulk queries."""
+
+    users = list(ranked_users(season).values('id', 'username', 'total_points', 'event_count', 'rank'))
+    return _build_rows(users, season, now=now)
+
+
+def get_leaderboard_slice(
+    season: Optional[Season],
+    viewer_id: Optional[int],
+    *,
+    size: int = LEADERBOARD_WINDOW_SIZE,
+    now: Optional[datetime] = None,
+    stamp: Optional[str] = None,
+) -> LeaderboardSlice:
+    """
+    Return the same window as :func:`window_leaderboard` without loading every row.
+
+    Slices are cached under the same change stamp as :func:`get_leaderboard`;
+    when the full standings are cached already the window is cut from them.
+    Otherwise ranks come from ``RANK() OVER`` in the database, so only the
+    viewer's rank, the total and at most ``size`` users are fetched and
+    enriched.
+
+    Args:
+        season: Season to rank (``None`` ranks all users over all scores)
+        viewer_id: Id of the viewing user, if any
+        size: Maximum number of rows
+        now: Reference time (defaults to now)
+        stamp: Precomputed :func:`get_change_stamp` value, if available
+
+    Returns:
+        LeaderboardSlice with the rows (and divider), the number of ranked
+        users and the viewer's rank.
+    """
+    if now is None:
+        now = timezone.now()
+    if stamp is None:
+        stamp = get_change_stamp(season, now=now)
+
+    full_key = _leaderboard_cache_key(season, stamp)
+    slice_key = f'{full_key}:slice:{viewer_id or 0}:{size}'
+    cached = cache.get_many([full_key, slice_key])
+    if full_key in cached:
+        rows = cached[full_key]
+        viewer_rank = next((row.rank for row in rows if row.id == viewer_id), None) if viewer_id else None
+        return LeaderboardSlice(
+            rows=window_leaderboard(rows, viewer_id, size=size),
+            total=len(rows),
+            viewer_rank=viewer_rank,
+        )
+    if slice_key in cached:
+        return cached[slice_key]
+
+    leaderboard_slice = _build_slice(season, viewer_id, size=size, now=now)
+    cache.set(slice_key, leaderboard_slice, _cache_timeout())
+    return leaderboard_slice
+
+
+def _build_slice(
+    season: Optional[Season],
+    viewer_id: Optional[int],
+    *,
+    size: int,
+    now: datetime,
+) -> LeaderboardSlice:
+    """Rank in the database and enrich only the rows of the viewer's window."""
+
+    ranked = ranked_users(season)
+    if season:
+        total = SeasonParticipant.objects.filter(season=season).count()
+    else:
+        total = get_user_model().objects.count()
+
+    viewer_rank = None
+    if viewer_id:
+        viewer_rank = ranked.filter(ranked_id=viewer_id).values_list('rank', flat=True).first()
+
+    fields = ('id', 'username', 'total_points', 'event_count', 'rank')
+    if total <= size or viewer_rank is None or viewer_rank < size:
+        users = list(ranked.filter(rank__lte=size).values(*fields))
+        divider_after = None
+    else:
+        neighbours = size - 2
+        after = min(neighbours // 2, total - viewer_rank)
+        before = neighbours - after
+        users = list(
+            ranked.filter(Q(rank=1) | Q(rank__gte=viewer_rank - before, rank__lte=viewer_rank + after))
+            .values(*fields)
+        )
+        divider_after = 1
+
+    rows: List[LeaderboardRow | LeaderboardDivider] = []
+    for row in _build_rows(users, season, now=now):
+        if row.id == viewer_id:
+            row.is_active_user = True
+        rows.append(row)
+        if row.rank == divider_after:
+            rows.append(LeaderboardDivider())
+    return LeaderboardSlice(rows=rows, total=total, viewer_rank=viewer_rank)
+
+
+def _build_rows(
+    users: List[Dict[str, Any]],
+    season: Optional[Season],
+    *,
+    now: Optional[datetime] = None,
+) -> List[LeaderboardRow]:
+    """Enrich ranked user values with names, avatars, hotness, kudos and locks."""
+
+    if now is None:
+        now = timezone.now()
+    user_ids = [user['id'] for user in users]
+    if not user_ids:
+        return []
+
+    nicknames: Dict[int, str] = {}
+    avatars: Dict[int, Avatar] = {}
+    for user_id, nickname, avatar_hash in (
+        UserPreferences.objects.filter(user_id__in=user_ids).values_list('user_id', 'nickname', 'avatar_hash')
+    ):
+        if nickname and nickname.strip():
+            nicknames[user_id] = nickname.strip()
+        if avatar_hash:
+            avatars[user_id] = get_avatar(avatar_hash, LEADERBOARD_AVATAR_SIZE)
+
+    achievements_by_user: Dict[int, List[Achievement]] = {}
+    for achievement in (
+        Achievement.objects.filter(user_id__in=user_ids).select_related('season').order_by('awarded_at')
+    ):
+        achievements_by_user.setdefault(achievement.user_id, []).append(achievement)
+
+    # Point and rank changes from the daily snapshots; users without a
+    # snapshot that old (or all-time standings) sum their recent scores
+    changes_3d: Dict[int, StandingsChange] = {}
+    changes_7d: Dict[int, StandingsChange] = {}
+    if season:
+        current = {user['id']: (int(user['rank']), int(user['total_points'])) for user in users}
+        changes_3d = get_standings_changes(season, current, days=3, now=now)
+        changes_7d = get_standings_changes(season, current, days=7, now=now)
+    recent_points: Dict[int, Tuple[int, int]] = {}
+    missing_ids = [user_id for user_id in user_ids if user_id not in changes_3d or user_id not in changes_7d]
+    if missing_ids:
+        recent_points = {
+            user_id: (total_3d or 0, total_7d or 0)
+            for user_id, total_3d, total_7d in recent_points_by_user(missing_ids, season, now=now)
+        }
+
+    kudos_today = dict(kudos_received_today(user_ids, now=now))
+
+    hotness_by_user = {
+        hotness.user_id: hotness
+        for hotness in UserHotness.objects.filter(user_id__in=user_ids, season=season)
+    }
+    decay_per_hour = HotnessSettings.get_settings().decay_per_hour
+
+    lock_summaries = get_lock_summaries(user_ids, now=now, active_season=Season.get_active_season(now))
+
+    rows: List[LeaderboardRow] = []
+    for user in users:
+        hotness = hotness_by_user.get(user['id']) or UserHotness(user_id=user['id'], season=season, score=0.0)
+        if hotness.pk:
+            # Same result as UserHotness.decay(), without writing on a read path
+            hours_elapsed = (now - hotness.last_decay).total_seconds() / 3600
+            if hours_elapsed > 0:
+                hotness.score = max(0.0, hotness.score - hours_elapsed * decay_per_hour)
+
+        rows.append(LeaderboardRow(
+            id=user['id'],
+            username=user['username'],
+            display_name=nicknames.get(user['id'], user['username']),
+            rank=int(user['rank']),
+            total_points=int(user['total_points']),
+            event_count=int(user['event_count']),
+            points_change_3d=(
+                changes_3d[user['id']].points if user['id'] in changes_3d
+                else int(recent_points.get(user['id'], (0, 0))[0])
+            ),
+            points_change_7d=(
+                changes_7d[user['id']].points if user['id'] in changes_7d
+                else int(recent_points.get(user['id'], (0, 0))[1])
+            ),
+            rank_change_3d=changes_3d[user['id']].rank if user['id'] in changes_3d else None,
+            hotness_score=hotness.score,
+            hotness_level=hotness.get_level(),
+            kudos_today=kudos_today.get(user['id'], 0),
+            lock_summary=lock_summaries[user['id']],
+            user_achievements=achievements_by_user.get(user['id'], []),
+            avatar=avatars.get(user['id']),
+        ))
+    return rows
+
+
+def recent_points_by_user(user_ids: Iterable[int], season: Optional[Season], *, now: datetime) -> QuerySet:
+    """``(user_id, points of the last 3 days, points of the last 7 days)`` per user."""
+
+    recent_filter = Q(user_id__in=user_ids, awarded_at__gte=now - timedelta(days=7))
+    if season:
+        recent_filter &= Q(season=season)
+    return (
+        UserEventScore.objects.filter(recent_filter)
+        .values('user_id')
+        .annotate(
+            total_3d=Sum('points_awarded', filter=Q(awarded_at__gte=now - timedelta(days=3))),
+            total_7d=Sum('points_awarded'),
+        )
+        .values_list('user_id', 'total_3d', 'total_7d')
+    )
+
+
+def kudos_received_today(user_ids: Iterable[int], *, now: datetime) -> QuerySet:
+    """``(user_id, count)`` of the kudos each user received today."""
+
+    today_start, today_end = day_bounds(now.date())
+    return (
+        HotnessKudos.objects.filter(to_user_id__in=user_ids, created_at__gte=today_start, created_at__lt=today_end)
+        .values('to_user_id')
+        .annotate(count=Count('id'))
+        .values_list('to_user_id', 'count')
+    )
+
+
+def kudos_given_today(viewer, target_ids: Iterable[int], *, now: datetime) -> QuerySet:
+    """Ids of the users among ``target_ids`` that ``viewer`` gave kudos to today."""
+
+    today_start, today_end = day_bounds(now.date())
+    return HotnessKudos.objects.filter(
+        from_user=viewer,
+        to_user_id__in=target_ids,
+        created_at__gte=today_start,
+        created_at__lt=today_end,
+    ).values_list('to_user_id', flat=True)
+
+
+def get_kudos_given_today(viewer, rows: Iterable[LeaderboardRow], *, now: Optional[datetime] = None) -> Dict[int, bool]:
+    """Return ``{user_id: bool}`` telling whether ``viewer`` gave kudos to each row today."""
+
+    if now is None:
+        now = timezone.now()
+    target_ids = [row.id for row in rows]
+    given = set(kudos_given_today(viewer, target_ids, now=now))
+    return {user_id: user_id in given for user_id in target_ids}
+
+
+def window_leaderboard(
+    rows: List[LeaderboardRow],
+    viewer_id: Optional[int],
+    *,
+    size: int = LEADERBOARD_WINDOW_SIZE,
+) -> List[LeaderboardRow | LeaderboardDivider]:
+    """
+    Return at most ``size`` rows: rank 1 plus the rows around the viewer.
+
+    - ``size`` users or fewer: all rows
+    - Viewer unknown or ranked within the first ``size - 1``: the top ``size``
+    - Otherwise: rank 1, a divider, then the viewer with two neighbours on each
+      side when possible (more above when the viewer is near the bottom)
+
+    The viewer's row is returned as a copy with ``is_active_user`` set, so
+    cached rows are never modified.
+    """
+    viewer_rank = next((row.rank for row in rows if row.id == viewer_id), None) if viewer_id else None
+
+    if len(rows) <= size or viewer_rank is None or viewer_rank < size:
+        window: List[LeaderboardRow | LeaderboardDivider] = list(rows[:size])
+    else:
+        neighbours = size - 2
+        after = min(neighbours // 2, len(rows) - viewer_rank)
+        before = neighbours - after
+        window = (
+            [rows[0], LeaderboardDivider()]
+            + rows[viewer_rank - 1 - before:viewer_rank - 1]
+            + [rows[viewer_rank - 1]]
+            + rows[viewer_rank:viewer_rank + after]
+        )
+
+    return [
+        replace(row, is_active_user=True)
+        if isinstance(row, LeaderboardRow) and row.id == viewer_id
+        else row
+        for row in window
+    ]
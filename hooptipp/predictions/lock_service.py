@@ -3,11 +3,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
+from django.db import transaction
+from django.db.models import Count, Min, Q, QuerySet
 from django.utils import timezone
 
 from .models import Season, UserTip
+from .pick_stats import apply_pick_changes, as_pick
+from .standings_version import invalidate_standings
 
 
 LOCK_LIMIT = 3
@@ -29,6 +33,86 @@ class LockSummary:
     next_return_at: Optional[datetime]
 
 
+def expired_forfeits(user, now: datetime) -> QuerySet:
+    """Ids of ``user``'s forfeited locks whose return date has passed."""
+
+    return UserTip.objects.filter(
+        user=user,
+        lock_status=UserTip.LockStatus.FORFEITED,
+        lock_releases_at__isnull=False,
+        lock_releases_at__lte=now,
+    ).values_list("id", flat=True)
+
+
+def pending_forfeit_counts(
+    user_ids: Iterable[int],
+    *,
+    now: datetime,
+    active_season: Optional[Season] = None,
+) -> QuerySet:
+    """Per user: the number of forfeited locks still to be returned and the next return date."""
+
+    pending_filter = Q(
+        user_id__in=user_ids,
+        lock_status=UserTip.LockStatus.FORFEITED,
+        lock_releases_at__gt=now,
+    )
+    if active_season:
+        pending_filter &= ~Q(
+            lock_forfeited_at__isnull=False,
+            lock_forfeited_at__lt=active_season.start_datetime,
+        )
+    return (
+        UserTip.objects.filter(pending_filter)
+        .values("user_id")
+        .annotate(count=Count("id"), next_return_at=Min("lock_releases_at"))
+    )
+
+
+def get_lock_summaries(
+    user_ids: Iterable[int],
+    *,
+    now: Optional[datetime] = None,
+    active_season: Optional[Season] = None,
+) -> Dict[int, LockSummary]:
+    """Return lock summaries for many users without per-user queries.
+
+    Mirrors :meth:`LockService.refresh` read-only: forfeited locks whose return
+    date has passed, or that were forfeited before ``active_season`` started,
+    count as returned even if ``refresh`` has not persisted that yet.
+    """
+
+    user_ids = list(user_ids)
+    if now is None:
+        now = timezone.now()
+
+    active_counts = dict(
+        UserTip.objects.filter(user_id__in=user_ids, is_locked=True)
+        .values("user_id")
+        .annotate(count=Count("id"))
+        .values_list("user_id", "count")
+    )
+
+    pending = {
+        row["user_id"]: row
+        for row in pending_forfeit_counts(user_ids, now=now, active_season=active_season)
+    }
+
+    summaries: Dict[int, LockSummary] = {}
+    for user_id in user_ids:
+        active = active_counts.get(user_id, 0)
+        pending_row = pending.get(user_id)
+        pending_count = pending_row["count"] if pending_row else 0
+        summaries[user_id] = LockSummary(
+            total=LOCK_LIMIT,
+            available=max(0, LOCK_LIMIT - active - pending_count),
+            active=active,
+            pending=pending_count,
+            next_return_at=pending_row["next_return_at"] if pending_row else None,
+        )
+    return summaries
+
+
 class LockService:
     """Coordinate prediction lock allocation for a user."""
 
@@ -45,20 +129,14 @@ class LockService:
         """Synchronise lock state and return a summary."""
 
         now = timezone.now()
-        expired_ids = list(
-            UserTip.objects.filter(
-                user=self.user,
-                lock_status=UserTip.LockStatus.FORFEITED,
-                lock_releases_at__isnull=False,
-                lock_releases_at__lte=now,
-            ).values_list("id", flat=True)
-        )
+        expired_ids = list(expired_forfeits(self.user, now))
         if expired_ids:
             UserTip.objects.filter(id__in=expired_ids).update(
                 lock_status=UserTip.LockStatus.RETURNED,
                 lock_released_at=now,
                 lock_releases_at=None,
             )
+            invalidate_standings()
 
         # Check for active season and restore locks forfeited before season start
         active_season = Season.get_active_season()
@@ -78,6 +156,7 @@ class LockService:
                     lock_released_at=now,
                     lock_releases_at=None,
                 )
+                invalidate_standings()
 
         active_ids = set(
             UserTip.objects.filter(user=self.user, is_locked=True).values_list("id", flat=True)
@@ -158,6 +237,90 @@ class LockService:
         self.available = max(0, self.available - 1)
         return True
 
+    def ensure_locked_many(self, tips: Iterable[UserTip]) -> List[UserTip]:
+        """Lock ``tips`` in order while capacity allows, with one update.
+
+        Tips that are already locked are left alone. Returns the tips that
+        could not be locked because no locks were left.
+        """
+
+        if not self._initialised:
+            self.refresh()
+
+        to_lock: List[UserTip] = []
+        refused: List[UserTip] = []
+        for tip in tips:
+            if tip.id in self._active_ids or tip.is_locked:
+                continue
+            if len(to_lock) >= self.available:
+                refused.append(tip)
+                continue
+            to_lock.append(tip)
+        if not to_lock:
+            return refused
+
+        now = timezone.now()
+        changes = [
+            (tip.user_id, as_pick(tip.prediction_option_id, tip.lock_status),
+             as_pick(tip.prediction_option_id, UserTip.LockStatus.ACTIVE))
+            for tip in to_lock
+        ]
+        with transaction.atomic():
+            UserTip.objects.filter(pk__in=[tip.id for tip in to_lock]).update(
+                is_locked=True,
+                lock_status=UserTip.LockStatus.ACTIVE,
+                lock_committed_at=now,
+                lock_released_at=None,
+                lock_releases_at=None,
+            )
+            apply_pick_changes(changes)
+            invalidate_standings()
+        for tip in to_lock:
+            tip.is_locked = True
+            tip.lock_status = UserTip.LockStatus.ACTIVE
+            tip.lock_committed_at = now
+            tip.lock_released_at = None
+            tip.lock_releases_at = None
+            tip._loaded_pick = (tip.prediction_option_id, tip.lock_status)
+            self._active_ids.add(tip.id)
+        self.available = max(0, self.available - len(to_lock))
+        return refused
+
+    def release_locks(self, tips: Iterable[UserTip]) -> int:
+        """Return the locks of ``tips`` immediately with one update (see :meth:`release_lock`)."""
+
+        if not self._initialised:
+            self.refresh()
+
+        to_release = [tip for tip in tips if tip.id in self._active_ids or tip.is_locked]
+        if not to_release:
+            return 0
+
+        now = timezone.now()
+        changes = [
+            (tip.user_id, as_pick(tip.prediction_option_id, tip.lock_status),
+             as_pick(tip.prediction_option_id, UserTip.LockStatus.NONE))
+            for tip in to_release
+        ]
+        with transaction.atomic():
+            UserTip.objects.filter(pk__in=[tip.id for tip in to_release]).update(
+                is_locked=False,
+                lock_status=UserTip.LockStatus.NONE,
+                lock_released_at=now,
+                lock_releases_at=None,
+            )
+            apply_pick_changes(changes)
+            invalidate_standings()
+        for tip in to_release:
+            tip.is_locked = False
+            tip.lock_status = UserTip.LockStatus.NONE
+            tip.lock_released_at = now
+            tip.lock_releases_at = None
+            tip._loaded_pick = (tip.prediction_option_id, tip.lock_status)
+            self._active_ids.discard(tip.id)
+        self.available = min(self.total, self.available + len(to_release))
+        return len(to_release)
+
     def release_lock(self, tip: UserTip) -> bool:
         """Return a lock associated with ``tip`` immediately.
         
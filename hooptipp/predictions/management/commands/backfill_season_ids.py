@@ -0,0 +1,37 @@
+"""
+Management command to backfill the season of scores and tips.
+
+Scores and tips get their season when they are created, and saving a
+season's timeframe moves the affected rows. Rows written before the season
+column existed, or without model saves (bulk imports, raw SQL), are
+assigned here.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from hooptipp.predictions.season_assignment import assign_seasons
+
+
+class Command(BaseCommand):
+    help = 'Assign every score and tip to the season it belongs to'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report how many rows have the wrong season without changing them',
+        )
+
+    def handle(self, *args, **options):
+        result = assign_seasons(dry_run=options['dry_run'])
+
+        if options['dry_run']:
+            self.stdout.write(
+                f'{result.scores_updated} scores and {result.tips_updated} tips have the wrong season'
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Updated the season of {result.scores_updated} scores and {result.tips_updated} tips'
+            ))
@@ -2,7 +2,8 @@
 Management command to process and award achievements to users.
 
 This command processes different types of achievements (season rankings,
-registration milestones, etc.) and creates/updates achievement records.
+registration milestones, etc.) and creates/updates achievement records. It
+also stores the recap of every season that ended since the last run.
 Designed to be run periodically via cron job.
 """
 
@@ -14,14 +15,32 @@ from typing import Optional
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from django.db.models import Sum, Q, Count
+from django.db.models import Sum, Q, Count, QuerySet
 from django.utils import timezone
 from django.db.models.functions import Coalesce
 
-from hooptipp.predictions.models import Achievement, Season, UserEventScore
+from hooptipp.predictions.models import Achievement, ProcessingWatermark, Season, UserEventScore
+from hooptipp.predictions.season_recap import create_season_recaps
+from hooptipp.predictions.standings_version import invalidate_standings
 
 logger = logging.getLogger(__name__)
 
+SEASON_ACHIEVEMENTS_PROCESSOR = 'season_achievements'
+
+
+def season_point_totals(season: Season) -> QuerySet:
+    """Total points and scored events per user of ``season``, best first."""
+
+    return (
+        UserEventScore.objects.filter(season=season)
+        .values('user')
+        .annotate(
+            total_points=Coalesce(Sum('points_awarded'), 0),
+            event_count=Count('prediction_event', distinct=True)
+        )
+        .order_by('-total_points', '-event_count', 'user__username')
+    )
+
 
 @dataclass
 class AchievementProcessorResult:
@@ -49,7 +68,7 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force',
             action='store_true',
-            help='Recalculate all achievements (may create duplicates if not careful)',
+            help='Re-rank all completed seasons, not only those changed since the last run',
         )
         parser.add_argument(
             '--type',
@@ -141,8 +160,29 @@ class Command(BaseCommand):
         """Get dictionary of achievement processors."""
         return {
             'season_achievements': self._process_season_achievements,
+            'season_recaps': self._process_season_recaps,
         }
 
+    def _process_season_recaps(
+        self,
+        dry_run: bool = False,
+        force: bool = False,
+    ) -> AchievementProcessorResult:
+        """
+        Store the recap (podium, accuracy, pick counts) of every settled ended season.
+
+        Seasons with events still waiting for a scored outcome get their recap
+        later; recaps whose season or scores changed since are rebuilt, and
+        ``force`` rebuilds all of them.
+        """
+        recap_result = create_season_recaps(force=force, dry_run=dry_run)
+        return AchievementProcessorResult(
+            achievement_type='season_recaps',
+            created=recap_result.created,
+            updated=recap_result.updated,
+            skipped=recap_result.skipped,
+        )
+
     def _process_season_achievements(
         self,
         dry_run: bool = False,
@@ -152,6 +192,11 @@ class Command(BaseCommand):
         Process season achievements (Gold, Silver, Bronze for top 3 finishers).
         
         This method processes all three medal types in one pass for efficiency.
+        Only seasons that completed or had score changes since the last
+        successful run are re-ranked (all completed seasons with ``force``).
+        In one transaction, medals nobody holds any more are deleted and the
+        current ones are upserted, so unchanged medals keep their id and
+        ``awarded_at``.
         """
         result = AchievementProcessorResult(achievement_type='season_achievements')
         
@@ -163,6 +208,11 @@ class Command(BaseCommand):
             result.skipped = 1
             return result
 
+        processed_until = None if force else ProcessingWatermark.get_processed_until(
+            SEASON_ACHIEVEMENTS_PROCESSOR
+        )
+        seasons_to_process = self._get_seasons_to_process(completed_seasons, processed_until)
+
         # Achievement type configuration
         achievement_configs = [
             {
@@ -187,66 +237,99 @@ class Command(BaseCommand):
                 'emoji': '🥉',
             },
         ]
+        config_by_rank = {config['rank']: config for config in achievement_configs}
 
-        with transaction.atomic():
-            for season in completed_seasons:
-                # Calculate rankings for this season
-                rankings = self._calculate_season_rankings(season)
-                
-                if not rankings:
+        # Load existing medals for all seasons being processed in one query
+        medal_types = [config['type'] for config in achievement_configs]
+        existing_medals = {
+            (user_id, season_id, medal_type): medal_id
+            for medal_id, user_id, season_id, medal_type in Achievement.objects.filter(
+                season__in=seasons_to_process,
+                achievement_type__in=medal_types,
+            ).values_list('id', 'user_id', 'season_id', 'achievement_type')
+        }
+
+        medals: list[Achievement] = []
+        current_medals = set()
+
+        for season in seasons_to_process:
+            # Calculate rankings for this season
+            rankings = self._calculate_season_rankings(season)
+
+            for user_data in rankings:
+                # Rankings are ordered, so nobody after this point earns a medal
+                if user_data['rank'] > len(achievement_configs):
+                    break
+                config = config_by_rank.get(user_data['rank'])
+                if config is None:
+                    # Rank skipped by a tie (e.g. two golds, no silver)
                     continue
-                
-                # Award achievements for each rank
-                for config in achievement_configs:
-                    rank = config['rank']
-                    
-                    # Get all users at this rank (handles ties)
-                    users_at_rank = [
-                        user_data for user_data in rankings
-                        if user_data['rank'] == rank
-                    ]
-                    
-                    if not users_at_rank:
-                        continue
-                    
-                    # Award achievement to all users at this rank
-                    for user_data in users_at_rank:
-                        user = user_data['user']
-                        
-                        # Check if achievement already exists
-                        existing = Achievement.objects.filter(
-                            user=user,
-                            season=season,
-                            achievement_type=config['type']
-                        ).first()
-                        
-                        if existing and not force:
-                            result.skipped += 1
-                            continue
-                        
-                        if dry_run:
-                            result.created += 1
-                            continue
-                        
-                        # Create or update achievement
-                        achievement, created = Achievement.objects.update_or_create(
-                            user=user,
-                            season=season,
-                            achievement_type=config['type'],
-                            defaults={
-                                'name': config['name'],
-                                'description': f"{config['description']} in {season.name}",
-                                'emoji': config['emoji'],
-                            }
-                        )
-                        
-                        if created:
-                            result.created += 1
-                        else:
-                            result.updated += 1
+
+                user = user_data['user']
+                medal_key = (user.id, season.id, config['type'])
+                current_medals.add(medal_key)
+                if medal_key in existing_medals:
+                    result.updated += 1
+                else:
+                    result.created += 1
+                medals.append(
+                    Achievement(
+                        user=user,
+                        season=season,
+                        achievement_type=config['type'],
+                        name=config['name'],
+                        description=f"{config['description']} in {season.name}",
+                        emoji=config['emoji'],
+                    )
+                )
+
+        if dry_run:
+            return result
+
+        stale_medal_ids = [
+            medal_id for medal_key, medal_id in existing_medals.items() if medal_key not in current_medals
+        ]
+        with transaction.atomic():
+            # Users who dropped off the podium of a re-ranked season lose their
+            # medal, so no season ends up with two golds
+            Achievement.objects.filter(pk__in=stale_medal_ids).delete()
+            Achievement.objects.bulk_create(
+                medals,
+                update_conflicts=True,
+                unique_fields=['user', 'season', 'achievement_type'],
+                update_fields=['name', 'description', 'emoji'],
+            )
+            invalidate_standings()
+            ProcessingWatermark.advance(SEASON_ACHIEVEMENTS_PROCESSOR, now)
 
         return result
 
+    def _get_seasons_to_process(self, completed_seasons, processed_until) -> list[Season]:
+        """
+        Return completed seasons that need (re-)ranking since ``processed_until``.
+
+        A season needs processing when it was not yet completed at the last
+        run, when it was edited, or when any score inside its timeframe was
+        created or updated. Without a watermark every completed season is
+        returned.
+        """
+        seasons = list(completed_seasons)
+        if processed_until is None:
+            return seasons
+
+        changed_season_ids = set(
+            UserEventScore.objects.filter(updated_at__gt=processed_until)
+            .values_list('season_id', flat=True)
+            .distinct()
+        )
+        return [
+            season
+            for season in seasons
+            if season.end_date >= processed_until.date()
+            or season.updated_at > processed_until
+            or season.pk in changed_season_ids
+        ]
+
     def _calculate_season_rankings(self, season: Season) -> list[dict]:
         """
         Calculate user rankings for a season based on total points.
@@ -257,22 +340,11 @@ class Command(BaseCommand):
         from django.contrib.auth import get_user_model
         User = get_user_model()
         
-        # Get all scores within season timeframe
-        season_scores = UserEventScore.objects.filter(
-            awarded_at__gte=season.start_datetime,
-            awarded_at__lte=season.end_datetime
-        )
-        
         # Calculate total points per user
-        user_totals = (
-            season_scores
-            .values('user')
-            .annotate(
-                total_points=Coalesce(Sum('points_awarded'), 0),
-                event_count=Count('prediction_event', distinct=True)
-            )
-            .order_by('-total_points', '-event_count', 'user__username')
-        )
+        user_totals = list(season_point_totals(season))
+
+        # Fetch all ranked users in a single query
+        users_by_id = User.objects.in_bulk([user_data['user'] for user_data in user_totals])
         
         # Convert to list and assign ranks (handling ties)
         rankings = []
@@ -298,10 +370,8 @@ class Command(BaseCommand):
                 rank = len(rankings) + 1
                 current_rank = rank
             
-            # Get user object
-            try:
-                user = User.objects.get(id=user_id)
-            except User.DoesNotExist:
+            user = users_by_id.get(user_id)
+            if user is None:
                 continue
             
             rankings.append({
@@ -315,5 +385,3 @@ class Command(BaseCommand):
             previous_event_count = event_count
         
         return rankings
-
-
@@ -0,0 +1,82 @@
+"""
+Management command to generate resized profile picture variants.
+
+Uploads are only hashed during the request; this command (run from cron or a
+worker) decodes each new or changed picture once and writes the WebP and JPEG
+variants used for avatars. Pictures whose content hash already has variants
+are skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from hooptipp.predictions.models import UserPreferences
+from hooptipp.predictions.profile_pictures import pending_profile_pictures, process_profile_picture
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Generate resized avatar variants for new or changed profile pictures'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List pictures that would be processed without writing variants',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-encode the variants of every profile picture',
+        )
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only process the given user id (can be repeated)',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        force = options['force']
+        user_ids = options['user_ids']
+
+        if force:
+            queryset = UserPreferences.objects.exclude(profile_picture='').exclude(profile_picture__isnull=True)
+            if user_ids:
+                queryset = queryset.filter(user_id__in=user_ids)
+        else:
+            queryset = pending_profile_pictures(user_ids)
+        queryset = queryset.select_related('user').order_by('user_id')
+
+        pending = list(queryset)
+        if not pending:
+            self.stdout.write(self.style.SUCCESS('No profile pictures need processing'))
+            return
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('DRY RUN MODE - No changes will be made'))
+            for preferences in pending:
+                self.stdout.write(f'  Would process {preferences.user.username}: {preferences.profile_picture.name}')
+            return
+
+        processed = 0
+        errors = 0
+        for preferences in pending:
+            result = process_profile_picture(preferences, force=force)
+            if result.error:
+                errors += 1
+                self.stdout.write(
+                    self.style.ERROR(f'[ERROR] {preferences.user.username}: {result.error}')
+                )
+            elif result.processed:
+                processed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Processed {processed} profile picture(s), {errors} error(s)')
+        )
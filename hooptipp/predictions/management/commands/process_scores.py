@@ -3,6 +3,8 @@ Management command to process scores for prediction events with outcomes.
 
 This command processes scores for all user tips that have corresponding event outcomes,
 similar to the admin action but with time-based filtering and automation support.
+Events are leased while they are scored, so several copies of the command (and
+the admin buttons or scoring job) can run at once; ``--workers`` adds threads.
 """
 
 from __future__ import annotations
@@ -12,7 +14,6 @@ import os
 from typing import Optional
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 from django.utils import timezone
 
 from hooptipp.predictions.models import EventOutcome, PredictionEvent
@@ -41,6 +42,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Delete existing scores and recalculate from scratch',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of scoring threads (default: SCORING_WORKERS setting)',
+        )
         parser.add_argument(
             '--force-automation',
             action='store_true',
@@ -52,6 +59,7 @@ class Command(BaseCommand):
         hours_back = options['hours_back']
         force = options['force']
         force_automation = options['force_automation']
+        workers = options['workers']
         
         # Check if automation is enabled
         if not force_automation and not self._is_automation_enabled():
@@ -81,7 +89,7 @@ class Command(BaseCommand):
         
         # Process scores
         try:
-            result = self._process_scores(events_to_process, force)
+            result = self._process_scores(events_to_process, force, workers)
             self._show_results(result)
         except Exception as e:
             logger.exception(f'Error processing scores: {e}')
@@ -132,144 +140,22 @@ class Command(BaseCommand):
             f'Would process {total_outcomes} events with {total_tips} total tips'
         )
 
-    def _process_scores(self, events_queryset, force: bool) -> ProcessAllScoresResult:
-        """Process scores for the given events."""
-        # We need to modify the scoring service to work with a subset of events
-        # For now, we'll use the existing service but filter the results
-        
-        if force:
-            # If force is True, we need to be more careful about what we delete
-            # We'll only delete scores for events we're processing
-            event_ids = list(events_queryset.values_list('id', flat=True))
-            from hooptipp.predictions.models import UserEventScore
-            UserEventScore.objects.filter(prediction_event_id__in=event_ids).delete()
-        
-        # Process scores using the existing service
-        # Note: The current service processes ALL events with outcomes
-        # We'll need to modify it or create a filtered version
-        result = self._process_filtered_scores(events_queryset, force)
-        
-        return result
-
-    def _process_filtered_scores(self, events_queryset, force: bool) -> ProcessAllScoresResult:
-        """Process scores for a filtered set of events."""
-        from hooptipp.predictions.models import UserEventScore, UserTip
-        from hooptipp.predictions.scoring_service import (
-            _tip_matches_outcome, _calculate_lock_multiplier, _outcome_has_selection,
-            _is_forfeited_match, _return_locks_for_forfeited_match
-        )
-        from hooptipp.predictions.lock_service import LockService
-        
-        total_events_processed = 0
-        total_scores_created = 0
-        total_scores_updated = 0
-        total_tips_skipped = 0
-        total_locks_returned = 0
-        total_locks_forfeited = 0
-        events_with_errors = []
-        
-        with transaction.atomic():
-            for event in events_queryset:
-                try:
-                    outcome = event.outcome
-                    
-                    # Check if this is a forfeited match - if so, return locks but don't score
-                    if _is_forfeited_match(outcome):
-                        # Count locks before returning them
-                        locks_count = event.tips.filter(lock_status=UserTip.LockStatus.ACTIVE).count()
-                        # Return locks
-                        locks_returned_count = _return_locks_for_forfeited_match(outcome)
-                        total_locks_returned += locks_returned_count
-                        # Count all tips as skipped since no scoring occurred
-                        total_tips_skipped += event.tips.count()
-                        total_events_processed += 1
-                        
-                        # Mark outcome as "scored" (processed) to avoid re-processing
-                        outcome.scored_at = timezone.now()
-                        outcome.score_error = 'Forfeited match - no scoring'
-                        outcome.save(update_fields=['scored_at', 'score_error'])
-                        continue
-                    
-                    if not _outcome_has_selection(outcome):
-                        events_with_errors.append(f"{event.name}: No winning option specified")
-                        continue
-                    
-                    total_events_processed += 1
-                    
-                    # Get all tips for this event
-                    tips = list(event.tips.all())
-                    
-                    for tip in tips:
-                        if not _tip_matches_outcome(tip, outcome):
-                            # Handle incorrect predictions with locks - forfeit them
-                            if tip.lock_status == UserTip.LockStatus.ACTIVE:
-                                lock_service = LockService(tip.user)
-                                lock_service.schedule_forfeit(tip, resolved_at=outcome.resolved_at)
-                                total_locks_forfeited += 1
-                            total_tips_skipped += 1
-                            continue
-                        
-                        base_points = event.points
-                        multiplier = _calculate_lock_multiplier(tip)
-                        total_points = base_points * multiplier
-                        defaults = {
-                            'base_points': base_points,
-                            'lock_multiplier': multiplier,
-                            'points_awarded': total_points,
-                            'is_lock_bonus': multiplier > 1,
-                        }
-                        
-                        score, created = UserEventScore.objects.update_or_create(
-                            user=tip.user,
-                            prediction_event=event,
-                            defaults=defaults,
-                        )
-                        
-                        if created:
-                            total_scores_created += 1
-                            # Award hotness for correct prediction (only when score is first created)
-                            from hooptipp.predictions.hotness_service import award_hotness_for_correct_prediction
-                            from hooptipp.predictions.models import Season
-                            active_season = Season.get_active_season()
-                            award_hotness_for_correct_prediction(
-                                user=tip.user,
-                                was_locked=multiplier > 1,
-                                season=active_season
-                            )
-                        else:
-                            total_scores_updated += 1
-                        
-                        # Return lock to user if they had an active lock
-                        # Use WAS_LOCKED status to preserve bonus points for idempotency
-                        if tip.lock_status == UserTip.LockStatus.ACTIVE:
-                            lock_service = LockService(tip.user)
-                            if lock_service.release_lock_after_scoring(tip):
-                                total_locks_returned += 1
-                    
-                    # Mark outcome as scored
-                    outcome.scored_at = timezone.now()
-                    outcome.score_error = ''
-                    outcome.save(update_fields=['scored_at', 'score_error'])
-                    
-                except Exception as e:
-                    error_msg = f"{event.name}: {str(e)}"
-                    events_with_errors.append(error_msg)
-                    logger.exception(f'Error processing scores for {event.name}: {e}')
-        
-        return ProcessAllScoresResult(
-            total_events_processed=total_events_processed,
-            total_scores_created=total_scores_created,
-            total_scores_updated=total_scores_updated,
-            total_tips_skipped=total_tips_skipped,
-            total_locks_returned=total_locks_returned,
-            total_locks_forfeited=total_locks_forfeited,
-            events_with_errors=events_with_errors,
-        )
+    def _process_scores(self, events_queryset, force: bool, workers: Optional[int]) -> ProcessAllScoresResult:
+        """Score the given events, each under its own lease and transaction."""
+        outcome_ids = EventOutcome.objects.filter(
+            prediction_event__in=events_queryset.values('id'),
+        ).values_list('id', flat=True)
+        return process_all_user_scores(force=force, outcome_ids=outcome_ids, workers=workers)
 
     def _show_results(self, result: ProcessAllScoresResult):
         """Display the results of score processing."""
         self.stdout.write('')
         
+        if result.total_events_busy:
+            self.stdout.write(
+                self.style.WARNING(f'Skipped {result.total_events_busy} events being scored by another worker')
+            )
+
         if result.events_with_errors:
             self.stdout.write(self.style.WARNING('Events with errors:'))
             for error in result.events_with_errors:
@@ -0,0 +1,74 @@
+"""
+Management command to show who can still win a season.
+
+Prints every participant's current and maximum possible points, whether
+they clinched the season or were eliminated, and their simulated win
+probability (see :mod:`hooptipp.predictions.season_projection`).
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hooptipp.predictions.models import Season
+from hooptipp.predictions.season_projection import get_season_projection, project_season
+
+
+class Command(BaseCommand):
+    help = 'Project the final standings of the active (or given) season'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--season',
+            type=int,
+            help='Season id (default: the active season)',
+        )
+        parser.add_argument(
+            '--simulations',
+            type=int,
+            help='Number of simulated seasons (bypasses the cache)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed for reproducible probabilities (bypasses the cache)',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the projection as JSON',
+        )
+
+    def handle(self, *args, **options):
+        if options['season']:
+            try:
+                season = Season.objects.get(pk=options['season'])
+            except Season.DoesNotExist:
+                raise CommandError(f"Season {options['season']} does not exist")
+        else:
+            season = Season.get_active_season()
+            if season is None:
+                raise CommandError('No active season, pass --season')
+
+        if options['simulations'] is not None or options['seed'] is not None:
+            projection = project_season(season, simulations=options['simulations'], seed=options['seed'])
+        else:
+            projection = get_season_projection(season)
+
+        if options['json']:
+            self.stdout.write(json.dumps(projection.as_dict(), indent=2))
+            return
+
+        self.stdout.write(
+            f'{season.name}: {projection.remaining_events} remaining events, '
+            f'{projection.simulations} simulations ({projection.duration_ms} ms)'
+        )
+        for row in projection.rows:
+            status = 'clinched' if row.clinched else 'eliminated' if row.eliminated else ''
+            self.stdout.write(
+                f'{row.rank:>4}  {row.display_name:<24} {row.total_points:>5} pts  '
+                f'max {row.max_points:>5}  win {row.win_probability:6.1%}  {status}'.rstrip()
+            )
+        self.stdout.write(self.style.SUCCESS(f'Projected {len(projection.rows)} participants'))
@@ -0,0 +1,40 @@
+"""
+Management command to rebuild the denormalised pick statistics.
+
+Tip counts, lock counts and recent pickers per prediction option are kept up
+to date when tips are saved or deleted. Tips written without model signals
+(bulk imports, raw SQL, fixtures) bypass that; this command recomputes the
+statistics from the tips.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from hooptipp.predictions.pick_stats import rebuild_pick_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute tip counts, lock counts and recent pickers per prediction option'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--event',
+            type=int,
+            action='append',
+            dest='event_ids',
+            help='Only rebuild options of this prediction event (repeatable)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report how many options are out of date without changing them',
+        )
+
+    def handle(self, *args, **options):
+        changed = rebuild_pick_stats(event_ids=options['event_ids'], dry_run=options['dry_run'])
+
+        if options['dry_run']:
+            self.stdout.write(f'{changed} options have out-of-date pick statistics')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt pick statistics for {changed} options'))
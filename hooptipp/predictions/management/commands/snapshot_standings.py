@@ -0,0 +1,48 @@
+"""
+Management command to store today's season standings.
+
+The snapshot is also taken after every scoring batch; running it on a
+schedule makes sure every day has one even when nothing was scored, so
+point and rank changes always have a baseline.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hooptipp.predictions.models import Season
+from hooptipp.predictions.standings_snapshots import snapshot_standings
+
+
+class Command(BaseCommand):
+    help = "Store today's standings of the active (or given) season"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--season',
+            type=int,
+            help='Season id (default: the active season)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Compute the standings without storing them',
+        )
+
+    def handle(self, *args, **options):
+        season = None
+        if options['season']:
+            try:
+                season = Season.objects.get(pk=options['season'])
+            except Season.DoesNotExist:
+                raise CommandError(f"Season {options['season']} does not exist")
+        elif Season.get_active_season() is None:
+            self.stdout.write('No active season, nothing to snapshot')
+            return
+
+        count = snapshot_standings(season, dry_run=options['dry_run'])
+
+        if options['dry_run']:
+            self.stdout.write(f'Would store the standings of {count} users')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Stored the standings of {count} users'))
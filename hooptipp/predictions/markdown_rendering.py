@@ -0,0 +1,51 @@
+"""Markdown rendering for admin-authored content (season descriptions, legal pages).
+
+Rendered HTML is stored next to the Markdown source when a model is saved, so
+request handlers never run the Markdown parser.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import markdown2
+
+MARKDOWN_EXTRAS = ['fenced-code-blocks', 'tables', 'break-on-newline', 'cuddled-lists']
+
+
+def render_markdown(text: str) -> str:
+    """
+    Render Markdown to sanitised HTML.
+
+    Raw HTML in the source is escaped and unsafe link schemes (e.g.
+    ``javascript:``) are neutralised by markdown2's safe mode.
+
+    Args:
+        text: Markdown source
+
+    Returns:
+        HTML string (empty when ``text`` is empty)
+    """
+    if not text:
+        return ''
+    return markdown2.markdown(text, extras=MARKDOWN_EXTRAS, safe_mode='escape')
+
+
+def with_rendered_fields(update_fields: Optional[Iterable[str]], field_map: dict[str, str]):
+    """
+    Extend ``save(update_fields=...)`` with the HTML fields of changed sources.
+
+    Args:
+        update_fields: The ``update_fields`` passed to ``save`` (``None`` saves all fields)
+        field_map: Mapping of Markdown source field to rendered HTML field
+
+    Returns:
+        The update_fields to pass on to ``Model.save``.
+    """
+    if update_fields is None:
+        return None
+    update_fields = set(update_fields)
+    for source, target in field_map.items():
+        if source in update_fields:
+            update_fields.add(target)
+    return update_fields
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0029_userpreferences_reminder_emails_enabled'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessingWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('processor', models.CharField(help_text="Identifier of the processor (e.g. 'season_achievements')", max_length=100, unique=True)),
+                ('processed_until', models.DateTimeField(help_text='Start time of the last successful run')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Processing watermark',
+                'verbose_name_plural': 'Processing watermarks',
+            },
+        ),
+        migrations.AlterField(
+            model_name='userpreferences',
+            name='theme',
+            field=models.CharField(choices=[('classic', 'HindSight Classic (Gold & Midnight)'), ('bg-biba', 'BG Biba (Red & Purple)'), ('atlanta-hawks', 'Atlanta Hawks (Red & Black)'), ('boston-celtics', 'Boston Celtics (Green & Black)'), ('brooklyn-nets', 'Brooklyn Nets (Black & White)'), ('charlotte-hornets', 'Charlotte Hornets (Teal & Purple)'), ('chicago-bulls', 'Chicago Bulls (Red & Black)'), ('cleveland-cavaliers', 'Cleveland Cavaliers (Wine & Navy)'), ('dallas-mavericks', 'Dallas Mavericks (Royal & Navy)'), ('denver-nuggets', 'Denver Nuggets (Navy & Gold)'), ('detroit-pistons', 'Detroit Pistons (Blue & Red)'), ('golden-state-warriors', 'Golden State Warriors (Blue & Gold)'), ('houston-rockets', 'Houston Rockets (Red & Black)'), ('indiana-pacers', 'Indiana Pacers (Navy & Gold)'), ('los-angeles-clippers', 'LA Clippers (Blue & Red)'), ('los-angeles-lakers', 'Los Angeles Lakers (Purple & Gold)'), ('memphis-grizzlies', 'Memphis Grizzlies (Blue & Navy)'), ('miami-heat', 'Miami Heat (Red & Gold)'), ('milwaukee-bucks', 'Milwaukee Bucks (Green & Cream)'), ('minnesota-timberwolves', 'Minnesota Timberwolves (Navy & Green)'), ('new-orleans-pelicans', 'New Orleans Pelicans (Navy & Red)'), ('new-york-knicks', 'New York Knicks (Blue & Orange)'), ('oklahoma-city-thunder', 'Oklahoma City Thunder (Blue & Orange)'), ('orlando-magic', 'Orlando Magic (Blue & Black)'), ('philadelphia-76ers', 'Philadelphia 76ers (Blue & Red)'), ('phoenix-suns', 'Phoenix Suns (Purple & Orange)'), ('portland-trail-blazers', 'Portland Trail Blazers (Red & Black)'), ('sacramento-kings', 'Sacramento Kings (Purple & Black)'), ('san-antonio-spurs', 'San Antonio Spurs (Black & Silver)'), ('toronto-raptors', 'Toronto Raptors (Red & Black)'), ('utah-jazz', 'Utah Jazz (Navy & Gold)'), ('washington-wizards', 'Washington Wizards (Navy & Red)')], default='classic', max_length=32),
+        ),
+    ]
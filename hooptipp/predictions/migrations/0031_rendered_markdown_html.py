@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:23
+
+from django.db import migrations, models
+
+from hooptipp.predictions.markdown_rendering import render_markdown
+
+
+def render_existing_markdown(apps, schema_editor):
+    """Render the stored HTML for existing seasons and legal sections."""
+    Season = apps.get_model('predictions', 'Season')
+    for season in Season.objects.all():
+        season.description_html = render_markdown(season.description)
+        season.season_end_description_html = render_markdown(season.season_end_description)
+        season.save(update_fields=['description_html', 'season_end_description_html'])
+
+    for model_name in ('ImpressumSection', 'DatenschutzSection', 'TeilnahmebedingungenSection'):
+        model = apps.get_model('predictions', model_name)
+        for section in model.objects.all():
+            section.text_html = render_markdown(section.text)
+            section.save(update_fields=['text_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0030_processingwatermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datenschutzsection',
+            name='text_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered HTML of text (generated on save)'),
+        ),
+        migrations.AddField(
+            model_name='impressumsection',
+            name='text_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered HTML of text (generated on save)'),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered HTML of description (generated on save)'),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='season_end_description_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered HTML of season_end_description (generated on save)'),
+        ),
+        migrations.AddField(
+            model_name='teilnahmebedingungensection',
+            name='text_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered HTML of text (generated on save)'),
+        ),
+        migrations.RunPython(render_existing_markdown, migrations.RunPython.noop),
+    ]
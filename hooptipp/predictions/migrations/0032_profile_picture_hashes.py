@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:27
+
+import hooptipp.predictions.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0031_rendered_markdown_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userpreferences',
+            name='avatar_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Content hash the resized avatar variants were generated from', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='userpreferences',
+            name='profile_picture_hash',
+            field=models.CharField(blank=True, editable=False, help_text='SHA-256 of the uploaded profile picture', max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='userpreferences',
+            name='profile_picture',
+            field=models.ImageField(blank=True, help_text='User profile picture (must be square, resized variants are generated in the background)', null=True, upload_to='profile_pictures/', validators=[hooptipp.predictions.models.validate_square_image]),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0032_profile_picture_hashes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventoutcome',
+            name='score_requested_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='Set while the outcome waits for the background scoring job', null=True),
+        ),
+    ]
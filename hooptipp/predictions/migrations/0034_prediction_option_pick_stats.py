@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:04
+
+from django.db import migrations, models
+
+RECENT_PICKERS_LIMIT = 8
+
+
+def backfill_pick_stats(apps, schema_editor):
+    """Count the existing tips per option (see hooptipp.predictions.pick_stats)."""
+    PredictionOption = apps.get_model('predictions', 'PredictionOption')
+    UserTip = apps.get_model('predictions', 'UserTip')
+
+    stats = {}
+    tips = (
+        UserTip.objects.filter(prediction_option__isnull=False)
+        .order_by('prediction_option_id', '-updated_at', '-id')
+        .values_list('prediction_option_id', 'user_id', 'lock_status')
+    )
+    for option_id, user_id, lock_status in tips.iterator():
+        entry = stats.setdefault(option_id, {'tip_count': 0, 'lock_count': 0, 'recent_pickers': []})
+        locked = bool(lock_status) and lock_status != 'none'
+        entry['tip_count'] += 1
+        entry['lock_count'] += int(locked)
+        if len(entry['recent_pickers']) < RECENT_PICKERS_LIMIT:
+            entry['recent_pickers'].append([user_id, locked])
+
+    for option_id, values in stats.items():
+        PredictionOption.objects.filter(pk=option_id).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0033_outcome_score_requested_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='predictionoption',
+            name='lock_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Tips on this option that were locked (active, used or forfeited)'),
+        ),
+        migrations.AddField(
+            model_name='predictionoption',
+            name='recent_pickers',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Most recent pickers as [user_id, locked] pairs (capped)'),
+        ),
+        migrations.AddField(
+            model_name='predictionoption',
+            name='tip_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_pick_stats, migrations.RunPython.noop),
+    ]
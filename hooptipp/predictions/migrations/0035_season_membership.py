@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:31
+
+from datetime import datetime, time
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def _aware(day, moment):
+    value = datetime.combine(day, moment)
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def backfill_seasons(apps, schema_editor):
+    """Assign existing scores and tips (see hooptipp.predictions.season_assignment)."""
+    Season = apps.get_model('predictions', 'Season')
+    UserEventScore = apps.get_model('predictions', 'UserEventScore')
+    UserTip = apps.get_model('predictions', 'UserTip')
+
+    for season in Season.objects.exclude(start_date__isnull=True).exclude(end_date__isnull=True):
+        start = _aware(season.start_date, season.start_time or time(0, 0, 0))
+        end = _aware(season.end_date, season.end_time or time(23, 59, 59))
+        UserEventScore.objects.filter(prediction_event__deadline__range=(start, end)).update(season=season)
+        UserTip.objects.filter(prediction_event__deadline__range=(start, end)).update(season=season)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0034_prediction_option_pick_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usereventscore',
+            name='season',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Season containing the event deadline (set when the score is created).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='scores', to='predictions.season'),
+        ),
+        migrations.AddField(
+            model_name='usertip',
+            name='season',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Season containing the event deadline (set when the tip is created).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tips', to='predictions.season'),
+        ),
+        migrations.AddIndex(
+            model_name='usereventscore',
+            index=models.Index(fields=['season', 'user'], name='predictions_season__e2dd07_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertip',
+            index=models.Index(fields=['season', 'user'], name='predictions_season__7ba45c_idx'),
+        ),
+        migrations.RunPython(backfill_seasons, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0035_season_membership'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventoutcome',
+            index=models.Index(fields=['resolved_at'], name='predictions_resolve_057495_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usereventscore',
+            index=models.Index(fields=['user', 'awarded_at'], name='predictions_user_id_35a587_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertip',
+            index=models.Index(condition=models.Q(('lock_status', 'forfeited')), fields=['user', 'lock_releases_at'], name='usertip_forfeited_lock_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0036_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StandingsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('rank', models.PositiveIntegerField()),
+                ('total_points', models.IntegerField(default=0)),
+                ('event_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='standings_snapshots', to='predictions.season')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='standings_snapshots', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Standings snapshot',
+                'verbose_name_plural': 'Standings snapshots',
+                'ordering': ['season', 'day', 'rank'],
+                'indexes': [models.Index(fields=['user', 'season', 'day'], name='predictions_user_id_17b2a7_idx')],
+                'unique_together': {('season', 'day', 'user')},
+            },
+        ),
+    ]
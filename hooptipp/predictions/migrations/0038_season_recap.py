@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0037_standings_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeasonRecap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('participant_count', models.PositiveIntegerField(default=0)),
+                ('total_matches', models.PositiveIntegerField(default=0)),
+                ('pick_count', models.PositiveIntegerField(default=0)),
+                ('resolved_pick_count', models.PositiveIntegerField(default=0)),
+                ('correct_pick_count', models.PositiveIntegerField(default=0)),
+                ('podium', models.JSONField(default=list, help_text="Top 3 as [{'user_id', 'username', 'rank', 'total_points'}]")),
+                ('user_stats', models.JSONField(default=dict, help_text="Per participant: {user_id: {'rank', 'total_points', 'picks', 'resolved', 'correct', 'accuracy'}}")),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('season', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='recap', to='predictions.season')),
+            ],
+            options={
+                'verbose_name': 'Season recap',
+                'verbose_name_plural': 'Season recaps',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
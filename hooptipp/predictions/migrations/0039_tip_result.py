@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:25
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q
+
+
+def backfill_tip_results(apps, schema_editor):
+    """Store the result of tips on scored outcomes (see scoring_service.store_tip_results)."""
+    EventOutcome = apps.get_model('predictions', 'EventOutcome')
+    UserTip = apps.get_model('predictions', 'UserTip')
+
+    for outcome in EventOutcome.objects.filter(scored_at__isnull=False).select_related('winning_option'):
+        tips = UserTip.objects.filter(prediction_event_id=outcome.prediction_event_id)
+        if (outcome.metadata or {}).get('is_forfeit', False):
+            tips.update(result='void')
+            continue
+        if outcome.winning_option_id:
+            correct = Q(prediction_option_id=outcome.winning_option_id)
+            if outcome.winning_option.option_id:
+                correct |= Q(selected_option_id=outcome.winning_option.option_id)
+        elif outcome.winning_generic_option_id:
+            correct = Q(selected_option_id=outcome.winning_generic_option_id)
+        else:
+            continue
+        tips.update(result='incorrect')
+        tips.filter(correct).update(result='correct')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0038_season_recap'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usertip',
+            name='result',
+            field=models.CharField(blank=True, choices=[('', 'Not scored'), ('correct', 'Correct'), ('incorrect', 'Incorrect'), ('void', 'Void')], default='', editable=False, help_text='Correctness against the event outcome, stored when the outcome is scored.', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='usertip',
+            index=models.Index(fields=['user', 'result'], name='predictions_user_id_2d39b7_idx'),
+        ),
+        migrations.RunPython(backfill_tip_results, migrations.RunPython.noop),
+    ]
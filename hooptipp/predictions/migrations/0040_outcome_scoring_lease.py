@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0039_tip_result'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventoutcome',
+            name='score_locked_by',
+            field=models.CharField(blank=True, editable=False, help_text='Worker currently scoring this outcome', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='eventoutcome',
+            name='score_locked_until',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Scoring lease expiry; other workers skip the outcome until then', null=True),
+        ),
+    ]
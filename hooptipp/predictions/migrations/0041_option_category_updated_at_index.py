@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0040_outcome_scoring_lease'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='option',
+            index=models.Index(fields=['category', 'updated_at'], name='predictions_categor_730363_idx'),
+        ),
+    ]
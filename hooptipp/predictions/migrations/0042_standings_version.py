@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:26
+
+from django.db import migrations, models
+
+
+def create_standings_version(apps, schema_editor):
+    StandingsVersion = apps.get_model('predictions', 'StandingsVersion')
+    StandingsVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0041_option_category_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StandingsVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.CharField(blank=True, max_length=32)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Standings version',
+                'verbose_name_plural': 'Standings version',
+            },
+        ),
+        migrations.RunPython(create_standings_version, migrations.RunPython.noop),
+    ]
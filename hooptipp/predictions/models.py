@@ -5,56 +5,31 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from PIL import Image
-import os
 
+from .markdown_rendering import render_markdown, with_rendered_fields
 from .theme_palettes import DEFAULT_THEME_KEY, THEME_CHOICES, get_theme_palette
 
 
 def validate_square_image(image):
-    """Validate that the uploaded image is square (1:1 ratio)."""
-    try:
-        with Image.open(image) as img:
-            width, height = img.size
-            if width != height:
-                raise ValidationError(
-                    f"Image must be square (1:1 ratio). Current dimensions: {width}x{height}. "
-                    f"Please crop your image to be square before uploading."
-                )
-    except Exception as e:
-        raise ValidationError(f"Invalid image file: {str(e)}")
-
+    """
+    Validate that the uploaded image is square (1:1 ratio).
 
-def process_profile_picture(instance, filename):
-    """Process and resize profile picture to 256x256 pixels."""
-    # Validate the image is square first
-    validate_square_image(instance.profile_picture.file)
-    
+    Only the dimensions are checked, taken from the image the upload form
+    already verified (or the file header), so the pixels are decoded once, by
+    the variant pipeline in :mod:`hooptipp.predictions.profile_pictures`.
+    """
+    verified = getattr(getattr(image, 'file', None), 'image', None)
     try:
-        with Image.open(instance.profile_picture.file) as img:
-            # Convert to RGB if necessary (handles RGBA, P mode images)
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            
-            # Resize to 256x256
-            img = img.resize((256, 256), Image.Resampling.LANCZOS)
-            
-            # Save to a new file
-            output = ContentFile(b'')
-            img.save(output, format='JPEG', quality=95, optimize=True)
-            output.seek(0)
-            
-            # Update the file content
-            instance.profile_picture.save(
-                filename,
-                ContentFile(output.read()),
-                save=False
-            )
+        width, height = verified.size if verified is not None else (image.width, image.height)
     except Exception as e:
-        raise ValidationError(f"Failed to process image: {str(e)}")
+        raise ValidationError(f"Invalid image file: {str(e)}")
+    if width is None or height is None:
+        raise ValidationError("Invalid image file: the dimensions could not be read.")
+    if width != height:
+        raise ValidationError(
+            f"Image must be square (1:1 ratio). Current dimensions: {width}x{height}. "
+            f"Please crop your image to be square before uploading."
+        )
 
 
 class OptionCategory(models.Model):
@@ -129,6 +104,7 @@ class Option(models.Model):
         indexes = [
             models.Index(fields=['category', 'is_active']),
             models.Index(fields=['external_id']),
+            models.Index(fields=['category', 'updated_at']),
         ]
 
     def __str__(self) -> str:
@@ -271,6 +247,19 @@ class PredictionOption(models.Model):
     )
     is_active = models.BooleanField(default=True)
     sort_order = models.PositiveIntegerField(default=0)
+    # Denormalised pick statistics, maintained by hooptipp.predictions.pick_stats
+    tip_count = models.PositiveIntegerField(default=0, editable=False)
+    lock_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Tips on this option that were locked (active, used or forfeited)",
+    )
+    recent_pickers = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        help_text="Most recent pickers as [user_id, locked] pairs (capped)",
+    )
 
     class Meta:
         ordering = ["sort_order", "label"]
@@ -288,6 +277,13 @@ class UserTip(models.Model):
         RETURNED = "returned", "Returned"
         FORFEITED = "forfeited", "Forfeited"
 
+    class Result(models.TextChoices):
+        PENDING = "", "Not scored"
+        CORRECT = "correct", "Correct"
+        INCORRECT = "incorrect", "Incorrect"
+        # The event's outcome was voided (forfeited match)
+        VOID = "void", "Void"
+
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     tip_type = models.ForeignKey(TipType, on_delete=models.CASCADE)
     prediction_event = models.ForeignKey(
@@ -332,6 +328,23 @@ class UserTip(models.Model):
         blank=True,
         help_text="Timestamp when the lock was forfeited (used for season-aware restoration).",
     )
+    season = models.ForeignKey(
+        'Season',
+        on_delete=models.SET_NULL,
+        related_name='tips',
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Season containing the event deadline (set when the tip is created).",
+    )
+    result = models.CharField(
+        max_length=10,
+        choices=Result.choices,
+        default=Result.PENDING,
+        blank=True,
+        editable=False,
+        help_text="Correctness against the event outcome, stored when the outcome is scored.",
+    )
 
     class Meta:
         unique_together = (('user', 'prediction_event'),)
@@ -340,11 +353,42 @@ class UserTip(models.Model):
         indexes = [
             models.Index(fields=['user', 'is_locked']),
             models.Index(fields=['prediction_event', 'user']),
+            models.Index(fields=['season', 'user']),
+            models.Index(fields=['user', 'result']),
+            # Forfeited locks waiting to be returned (LockService.refresh)
+            models.Index(
+                fields=['user', 'lock_releases_at'],
+                condition=models.Q(lock_status='forfeited'),
+                name='usertip_forfeited_lock_idx',
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.prediction_event}: {self.prediction}"
 
+    @property
+    def is_correct(self) -> bool | None:
+        """True/False once scored, None while pending or when the outcome was voided."""
+        if self.result == self.Result.CORRECT:
+            return True
+        if self.result == self.Result.INCORRECT:
+            return False
+        return None
+
+    def save(self, *args, **kwargs) -> None:
+        """Assign the season of the event deadline to new tips."""
+        if self._state.adding and self.season_id is None and self.prediction_event_id:
+            self.season = Season.for_datetime(self.prediction_event.deadline)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded pick so saves can update the option pick counters
+        if 'prediction_option_id' in instance.__dict__ and 'lock_status' in instance.__dict__:
+            instance._loaded_pick = (instance.prediction_option_id, instance.lock_status)
+        return instance
+
 
 class EventOutcome(models.Model):
     prediction_event = models.OneToOneField(
@@ -384,14 +428,53 @@ class EventOutcome(models.Model):
     )
     scored_at = models.DateTimeField(null=True, blank=True)
     score_error = models.TextField(blank=True)
+    score_requested_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Set while the outcome waits for the background scoring job",
+    )
+    score_locked_by = models.CharField(
+        max_length=100,
+        blank=True,
+        editable=False,
+        help_text="Worker currently scoring this outcome",
+    )
+    score_locked_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Scoring lease expiry; other workers skip the outcome until then",
+    )
 
     class Meta:
         verbose_name = "Event outcome"
         verbose_name_plural = "Event outcomes"
+        indexes = [
+            models.Index(fields=["resolved_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"Outcome for {self.prediction_event}" if self.prediction_event else "Event outcome"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded winner so saves can tell whether it changed
+        instance._loaded_winner = (
+            instance.__dict__.get('winning_option_id'),
+            instance.__dict__.get('winning_generic_option_id'),
+        )
+        return instance
+
+    @property
+    def winner_changed(self) -> bool:
+        """Whether the winning selection differs from the one loaded from the database."""
+
+        loaded = getattr(self, '_loaded_winner', None)
+        return loaded is None or loaded != (self.winning_option_id, self.winning_generic_option_id)
+
     def clean(self) -> None:
         from django.core.exceptions import ValidationError
 
@@ -415,16 +498,35 @@ class UserEventScore(models.Model):
     awarded_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     notes = models.TextField(blank=True)
+    season = models.ForeignKey(
+        'Season',
+        on_delete=models.SET_NULL,
+        related_name='scores',
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Season containing the event deadline (set when the score is created).",
+    )
 
     class Meta:
         unique_together = ("user", "prediction_event")
         ordering = ["-awarded_at", "user__username"]
         verbose_name = "User event score"
         verbose_name_plural = "User event scores"
+        indexes = [
+            models.Index(fields=["season", "user"]),
+            models.Index(fields=["user", "awarded_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} - {self.prediction_event}: {self.points_awarded} pts"
 
+    def save(self, *args, **kwargs) -> None:
+        """Assign the season of the event deadline to new scores."""
+        if self._state.adding and self.season_id is None and self.prediction_event_id:
+            self.season = Season.for_datetime(self.prediction_event.deadline)
+        super().save(*args, **kwargs)
+
 
 class UserFavorite(models.Model):
     """
@@ -489,9 +591,21 @@ class UserPreferences(models.Model):
         upload_to='profile_pictures/',
         blank=True,
         null=True,
-        help_text="User profile picture (must be square, will be resized to 256x256px)",
+        help_text="User profile picture (must be square, resized variants are generated in the background)",
         validators=[validate_square_image]
     )
+    profile_picture_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="SHA-256 of the uploaded profile picture",
+    )
+    avatar_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        help_text="Content hash the resized avatar variants were generated from",
+    )
     reminder_emails_enabled = models.BooleanField(
         default=True,
         help_text="Receive reminder emails for unpredicted events with upcoming deadlines",
@@ -506,9 +620,30 @@ class UserPreferences(models.Model):
     def __str__(self) -> str:
         return f"Preferences for {self.user}"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'profile_picture' in update_fields:
+            if not self.profile_picture:
+                self.profile_picture_hash = ''
+                self.avatar_hash = ''
+            elif not self.profile_picture._committed:
+                # New upload: hash it now, variants are built by process_profile_pictures
+                from .profile_pictures import hash_file
+
+                self.profile_picture_hash = hash_file(self.profile_picture.file)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'profile_picture_hash', 'avatar_hash'}
+        super().save(*args, **kwargs)
+
     def theme_palette(self) -> dict[str, str]:
         return get_theme_palette(self.theme)
 
+    def get_avatar(self, size: int):
+        """Return avatar variant URLs for ``size`` pixels, or None if not processed yet."""
+        from .profile_pictures import get_avatar
+
+        return get_avatar(self.avatar_hash, size)
+
 
 class Season(models.Model):
     """
@@ -538,6 +673,16 @@ class Season(models.Model):
         blank=True,
         help_text="Description to display when the season has ended (replaces normal description)"
     )
+    description_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Rendered HTML of description (generated on save)"
+    )
+    season_end_description_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Rendered HTML of season_end_description (generated on save)"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -606,8 +751,17 @@ class Season(models.Model):
                 )
 
     def save(self, *args, **kwargs) -> None:
-        """Override save to call clean() for validation."""
+        """Override save to call clean() for validation and render the descriptions."""
         self.full_clean()
+        self.description_html = render_markdown(self.description)
+        self.season_end_description_html = render_markdown(self.season_end_description)
+        kwargs['update_fields'] = with_rendered_fields(
+            kwargs.get('update_fields'),
+            {
+                'description': 'description_html',
+                'season_end_description': 'season_end_description_html',
+            },
+        )
         super().save(*args, **kwargs)
 
     def is_active(self, check_datetime: timezone.datetime | None = None) -> bool:
@@ -622,6 +776,17 @@ class Season(models.Model):
             check_datetime = timezone.make_aware(check_datetime)
         return self.start_datetime <= check_datetime <= self.end_datetime
 
+    @classmethod
+    def for_datetime(cls, moment: timezone.datetime) -> 'Season | None':
+        """Get the season whose timeframe contains ``moment``, if any."""
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        local_date = timezone.localdate(moment)
+        for season in cls.objects.filter(start_date__lte=local_date, end_date__gte=local_date):
+            if season.start_datetime <= moment <= season.end_datetime:
+                return season
+        return None
+
     @classmethod
     def get_active_season(cls, check_datetime: timezone.datetime | None = None) -> 'Season | None':
         """Get the currently active season, if any."""
@@ -660,6 +825,80 @@ class SeasonParticipant(models.Model):
         return f"{self.user.username} - {self.season.name}"
 
 
+class StandingsSnapshot(models.Model):
+    """
+    A user's season rank and totals as of one day.
+
+    Written by :mod:`hooptipp.predictions.standings_snapshots` (repeatedly
+    during the day, so each row holds the day's last standings). Point and
+    rank changes are the difference to an older snapshot.
+    """
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name='standings_snapshots')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='standings_snapshots')
+    day = models.DateField()
+    rank = models.PositiveIntegerField()
+    total_points = models.IntegerField(default=0)
+    event_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('season', 'day', 'user')
+        ordering = ['season', 'day', 'rank']
+        verbose_name = 'Standings snapshot'
+        verbose_name_plural = 'Standings snapshots'
+        indexes = [
+            models.Index(fields=['user', 'season', 'day']),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user.username} #{self.rank} ({self.season.name}, {self.day})"
+
+
+class SeasonRecap(models.Model):
+    """
+    Final results of an ended season.
+
+    Written by :mod:`hooptipp.predictions.season_recap` once the season has
+    ended and all its events are scored, and rebuilt only when the season or
+    one of its scores changes afterwards, so pages showing the results read a
+    single row.
+    """
+    season = models.OneToOneField(Season, on_delete=models.CASCADE, related_name='recap')
+    participant_count = models.PositiveIntegerField(default=0)
+    total_matches = models.PositiveIntegerField(default=0)
+    pick_count = models.PositiveIntegerField(default=0)
+    resolved_pick_count = models.PositiveIntegerField(default=0)
+    correct_pick_count = models.PositiveIntegerField(default=0)
+    podium = models.JSONField(
+        default=list,
+        help_text="Top 3 as [{'user_id', 'username', 'rank', 'total_points'}]",
+    )
+    user_stats = models.JSONField(
+        default=dict,
+        help_text="Per participant: {user_id: {'rank', 'total_points', 'picks', 'resolved', 'correct', 'accuracy'}}",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Season recap'
+        verbose_name_plural = 'Season recaps'
+
+    def __str__(self) -> str:
+        return f"Recap of {self.season.name}"
+
+    @property
+    def correct_pick_rate(self) -> float:
+        """Percentage of the season's resolved picks that were correct."""
+        if not self.resolved_pick_count:
+            return 0.0
+        return round(self.correct_pick_count / self.resolved_pick_count * 100, 1)
+
+    def stats_for(self, user_id: int) -> dict | None:
+        """Return the recap entry of ``user_id`` (JSON keys are strings)."""
+        return self.user_stats.get(str(user_id))
+
+
 class Achievement(models.Model):
     """
     Represents an achievement awarded to a user.
@@ -725,6 +964,70 @@ class Achievement(models.Model):
         return f"{self.user.username}: {self.name}{season_str}"
 
 
+class ProcessingWatermark(models.Model):
+    """
+    Records how far a periodic processor has already processed data.
+
+    Used by incremental jobs (e.g. achievement processing) to only look at
+    seasons and scores that changed since their last successful run.
+    """
+    processor = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Identifier of the processor (e.g. 'season_achievements')"
+    )
+    processed_until = models.DateTimeField(
+        help_text="Start time of the last successful run"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Processing watermark'
+        verbose_name_plural = 'Processing watermarks'
+
+    def __str__(self) -> str:
+        return f"{self.processor}: {self.processed_until}"
+
+    @classmethod
+    def get_processed_until(cls, processor: str) -> datetime | None:
+        """Return the watermark for ``processor`` or ``None`` if it never ran."""
+        return (
+            cls.objects.filter(processor=processor)
+            .values_list('processed_until', flat=True)
+            .first()
+        )
+
+    @classmethod
+    def advance(cls, processor: str, processed_until: datetime) -> None:
+        """Move the watermark for ``processor`` to ``processed_until``."""
+        cls.objects.update_or_create(
+            processor=processor,
+            defaults={'processed_until': processed_until},
+        )
+
+
+class StandingsVersion(models.Model):
+    """
+    Single row counting the changes to everything the standings show.
+
+    Leaderboard and projection caches are keyed by ``version``, which every
+    write to scores, tips, outcomes, kudos, hotness and enrollments sets to
+    a new random token inside its own transaction (see
+    :mod:`hooptipp.predictions.standings_version`), so every process sees a
+    change as soon as it commits. Random tokens never repeat, also after a
+    rolled back change.
+    """
+    version = models.CharField(max_length=32, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Standings version'
+        verbose_name_plural = 'Standings version'
+
+    def __str__(self) -> str:
+        return f"Standings version {self.version}"
+
+
 class ImpressumSection(models.Model):
     """
     Represents a section of the Impressum (legal notice).
@@ -734,6 +1037,11 @@ class ImpressumSection(models.Model):
     """
     caption = models.CharField(max_length=200)
     text = models.TextField(help_text="Markdown content for this section")
+    text_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Rendered HTML of text (generated on save)"
+    )
     order_number = models.PositiveIntegerField(
         default=0,
         help_text="Lower numbers appear first. Sections with the same order_number are ordered by caption."
@@ -749,6 +1057,11 @@ class ImpressumSection(models.Model):
     def __str__(self) -> str:
         return self.caption
 
+    def save(self, *args, **kwargs) -> None:
+        self.text_html = render_markdown(self.text)
+        kwargs['update_fields'] = with_rendered_fields(kwargs.get('update_fields'), {'text': 'text_html'})
+        super().save(*args, **kwargs)
+
 
 class DatenschutzSection(models.Model):
     """
@@ -759,6 +1072,11 @@ class DatenschutzSection(models.Model):
     """
     caption = models.CharField(max_length=200)
     text = models.TextField(help_text="Markdown content for this section")
+    text_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Rendered HTML of text (generated on save)"
+    )
     order_number = models.PositiveIntegerField(
         default=0,
         help_text="Lower numbers appear first. Sections with the same order_number are ordered by caption."
@@ -774,6 +1092,11 @@ class DatenschutzSection(models.Model):
     def __str__(self) -> str:
         return self.caption
 
+    def save(self, *args, **kwargs) -> None:
+        self.text_html = render_markdown(self.text)
+        kwargs['update_fields'] = with_rendered_fields(kwargs.get('update_fields'), {'text': 'text_html'})
+        super().save(*args, **kwargs)
+
 
 class TeilnahmebedingungenSection(models.Model):
     """
@@ -784,6 +1107,11 @@ class TeilnahmebedingungenSection(models.Model):
     """
     caption = models.CharField(max_length=200)
     text = models.TextField(help_text="Markdown content for this section")
+    text_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Rendered HTML of text (generated on save)"
+    )
     order_number = models.PositiveIntegerField(
         default=0,
         help_text="Lower numbers appear first. Sections with the same order_number are ordered by caption."
@@ -799,6 +1127,11 @@ class TeilnahmebedingungenSection(models.Model):
     def __str__(self) -> str:
         return self.caption
 
+    def save(self, *args, **kwargs) -> None:
+        self.text_html = render_markdown(self.text)
+        kwargs['update_fields'] = with_rendered_fields(kwargs.get('update_fields'), {'text': 'text_html'})
+        super().save(*args, **kwargs)
+
 
 class UserHotness(models.Model):
     """
@@ -967,29 +1300,3 @@ class HotnessSettings(models.Model):
             }
         )
         return settings
-
-
-@receiver(post_save, sender=UserPreferences)
-def process_profile_picture_signal(sender, instance, created, **kwargs):
-    """Automatically process and resize profile pictures when saved."""
-    if instance.profile_picture and hasattr(instance.profile_picture, 'file'):
-        try:
-            # Get the current file path
-            current_path = instance.profile_picture.path
-            
-            # Open and process the image
-            with Image.open(current_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'P'):
-                    img = img.convert('RGB')
-                
-                # Resize to 256x256
-                img = img.resize((256, 256), Image.Resampling.LANCZOS)
-                
-                # Save the processed image back to the same file
-                img.save(current_path, format='JPEG', quality=95, optimize=True)
-                
-        except Exception as e:
-            # If processing fails, we'll let the validation error handle it
-            # This prevents the signal from breaking the save process
-            pass
@@ -0,0 +1,235 @@
+"""Cached compact choice lists and typeahead search for Options.
+
+Large categories such as NBA players hold thousands of Options with JSON
+metadata. Pickers only need ``id``, ``name``, ``short_name`` and ``team``, so
+:func:`get_option_choices` caches those compact rows per category under a
+version read from the database (the category's Option count and latest
+``updated_at``), so a sync in any process or worker moves every process to
+the new list.
+
+:func:`search_option_choices` serves the ``/api/options/search/`` typeahead
+from an in-process prefix/trigram index built from the cached rows, rebuilt
+only when the category version changes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import unicodedata
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .models import Option, OptionCategory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TIMEOUT = 24 * 3600
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+# Minimum share of the query's trigrams a name must contain to match fuzzily
+TRIGRAM_THRESHOLD = 0.3
+
+
+@dataclass(frozen=True)
+class OptionChoice:
+    """Compact, cacheable representation of a selectable Option."""
+
+    id: int
+    name: str
+    short_name: str
+    team: str
+
+    def as_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+def get_choices_version(category_id: int) -> str:
+    """
+    Return the current version of a category's choice list.
+
+    Derived from the category's Option count (deletes) and latest
+    ``updated_at`` (creates and updates, including bulk writes that skip
+    signals) in one query on the ``(category, updated_at)`` index.
+    """
+    stats = Option.objects.filter(category_id=category_id).aggregate(
+        count=Count('id'),
+        changed_at=Max('updated_at'),
+    )
+    changed_at = stats['changed_at']
+    return f"{stats['count']}-{changed_at.timestamp() if changed_at else 0}"
+
+
+def _load_choices(category_id: int) -> List[OptionChoice]:
+    rows = (
+        Option.objects.filter(category_id=category_id, is_active=True)
+        .order_by('sort_order', 'name')
+        .values_list('id', 'name', 'short_name', 'metadata__team_abbreviation')
+    )
+    return [
+        OptionChoice(id=option_id, name=name, short_name=short_name or '', team=team or '')
+        for option_id, name, short_name, team in rows
+    ]
+
+
+def _resolve_category_id(category) -> Optional[int]:
+    if isinstance(category, OptionCategory):
+        return category.pk
+    if isinstance(category, int):
+        return category
+    return OptionCategory.objects.filter(slug=category).values_list('pk', flat=True).first()
+
+
+def get_option_choices(category) -> List[OptionChoice]:
+    """
+    Return the active choices of a category, cached per category version.
+
+    Args:
+        category: OptionCategory, its primary key or its slug
+
+    Returns:
+        OptionChoice list ordered like the category's Options (empty for an
+        unknown category).
+    """
+    category_id = _resolve_category_id(category)
+    if category_id is None:
+        return []
+
+    cache_key = f'option_choices:{category_id}:{get_choices_version(category_id)}'
+    choices = cache.get(cache_key)
+    if choices is None:
+        choices = _load_choices(category_id)
+        cache.set(
+            cache_key,
+            choices,
+            getattr(settings, 'OPTION_CHOICES_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT),
+        )
+    return choices
+
+
+def normalize(text: str) -> str:
+    """Lowercase ``text`` and strip accents so "Dončić" matches "doncic"."""
+
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold().strip()
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f'  {text} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class OptionSearchIndex:
+    """
+    In-memory prefix and trigram index over a list of choices.
+
+    Every word of a choice's name and its short name is kept in a sorted list,
+    so a prefix lookup is a binary search. Queries with no prefix hits fall
+    back to trigram overlap, which tolerates typos and missing letters.
+    """
+
+    def __init__(self, choices: Iterable[OptionChoice]) -> None:
+        self.choices: List[OptionChoice] = list(choices)
+        self._names: List[str] = [normalize(choice.name) for choice in self.choices]
+        tokens: List[Tuple[str, int]] = []
+        trigram_postings: Dict[str, set[int]] = defaultdict(set)
+        for index, choice in enumerate(self.choices):
+            words = set(self._names[index].split())
+            if choice.short_name:
+                words.add(normalize(choice.short_name))
+            tokens.extend((word, index) for word in words)
+            for trigram in _trigrams(self._names[index]):
+                trigram_postings[trigram].add(index)
+        tokens.sort()
+        self._tokens = tokens
+        self._token_keys = [token for token, _ in tokens]
+        self._trigrams = dict(trigram_postings)
+
+    def _prefix_matches(self, word: str) -> set[int]:
+        start = bisect.bisect_left(self._token_keys, word)
+        matches = set()
+        for token, index in self._tokens[start:]:
+            if not token.startswith(word):
+                break
+            matches.add(index)
+        return matches
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[OptionChoice]:
+        """Return up to ``limit`` choices matching ``query``, best matches first."""
+
+        text = normalize(query)
+        if not text:
+            return self.choices[:limit]
+
+        # Every query word has to prefix-match a word of the choice
+        matches: Optional[set[int]] = None
+        for word in text.split():
+            word_matches = self._prefix_matches(word)
+            matches = word_matches if matches is None else matches & word_matches
+            if not matches:
+                break
+        if matches:
+            ranked = sorted(
+                matches,
+                key=lambda index: (not self._names[index].startswith(text), self._names[index]),
+            )
+            return [self.choices[index] for index in ranked[:limit]]
+
+        query_trigrams = _trigrams(text)
+        overlap: Dict[int, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for index in self._trigrams.get(trigram, ()):
+                overlap[index] += 1
+        minimum = TRIGRAM_THRESHOLD * len(query_trigrams)
+        ranked = sorted(
+            (index for index, shared in overlap.items() if shared >= minimum),
+            key=lambda index: (-overlap[index], self._names[index]),
+        )
+        return [self.choices[index] for index in ranked[:limit]]
+
+
+_indexes: Dict[int, Tuple[str, OptionSearchIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(category_id: int) -> OptionSearchIndex:
+    """Return the process-local search index for the current category version."""
+
+    version = get_choices_version(category_id)
+    entry = _indexes.get(category_id)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _indexes_lock:
+        entry = _indexes.get(category_id)
+        if entry is None or entry[0] != version:
+            index = OptionSearchIndex(get_option_choices(category_id))
+            _indexes[category_id] = (version, index)
+            logger.debug('Built option search index for category %s (%d choices)', category_id, len(index.choices))
+            entry = _indexes[category_id]
+    return entry[1]
+
+
+def search_option_choices(category, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[OptionChoice]:
+    """
+    Search a category's active choices for typeahead pickers.
+
+    Args:
+        category: OptionCategory, its primary key or its slug
+        query: Text typed by the user (accents and case are ignored)
+        limit: Maximum number of results (capped at MAX_SEARCH_LIMIT)
+
+    Returns:
+        Matching OptionChoice list, prefix matches before fuzzy matches.
+    """
+    category_id = _resolve_category_id(category)
+    if category_id is None:
+        return []
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+    return get_search_index(category_id).search(query, limit)
@@ -0,0 +1,284 @@
+"""Denormalised pick statistics per prediction option.
+
+Each :class:`~hooptipp.predictions.models.PredictionOption` carries the number
+of tips on it (``tip_count``), how many of those were locked
+(``lock_count``) and the most recent pickers (``recent_pickers``, a capped
+list of ``[user_id, locked]`` pairs). The counters are updated in the same
+transaction as the tip save, lock toggle or delete, so prediction and result
+cards can show pick distribution and avatars without loading every tip row.
+
+A tip counts as locked when its ``lock_status`` is anything but ``NONE``:
+active locks, locks used for a bonus and forfeited (or later returned) locks
+all mark a locked pick, and the lock service only moves between those states
+with bulk updates. ``rebuild_pick_stats`` (and the ``rebuild_pick_stats``
+command) recompute everything from the tips, e.g. after bulk imports.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+from .models import PredictionEvent, PredictionOption, UserTip
+
+logger = logging.getLogger(__name__)
+
+RECENT_PICKERS_LIMIT = 8
+REBUILD_BATCH_SIZE = 500
+
+# (prediction_option_id, locked) of a tip; None when the tip does not exist
+Pick = Optional[Tuple[Optional[int], bool]]
+
+
+def is_locked_pick(lock_status: str) -> bool:
+    """Whether a tip with ``lock_status`` counts as a locked pick."""
+
+    return bool(lock_status) and lock_status != UserTip.LockStatus.NONE
+
+
+@dataclass(frozen=True)
+class Picker:
+    user_id: int
+    option_id: int
+    locked: bool
+
+
+@dataclass
+class EventPicks:
+    """Pick statistics of one event, summed over its options."""
+
+    tip_count: int = 0
+    lock_count: int = 0
+    option_counts: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+    option_targets: Dict[int, int] = field(default_factory=dict)
+    pickers: List[Picker] = field(default_factory=list)
+
+    def winning_option_ids(self, outcome) -> Set[int]:
+        """Prediction options of this event that match ``outcome``'s winner."""
+
+        if outcome.winning_option_id:
+            target = self.option_targets.get(outcome.winning_option_id)
+            return {outcome.winning_option_id} | {
+                option_id for option_id, option_target in self.option_targets.items()
+                if target and option_target == target
+            }
+        if outcome.winning_generic_option_id:
+            return {
+                option_id for option_id, option_target in self.option_targets.items()
+                if option_target == outcome.winning_generic_option_id
+            }
+        return set()
+
+    def option_share(self, option_id: int) -> int:
+        """Percentage of tips on ``option_id`` (0-100)."""
+
+        if not self.tip_count:
+            return 0
+        tips, _locks = self.option_counts.get(option_id, (0, 0))
+        return round(100 * tips / self.tip_count)
+
+
+def load_event_picks(events: Iterable[PredictionEvent]) -> Dict[int, EventPicks]:
+    """
+    Load pick statistics for ``events`` with one query.
+
+    Only curated events are included: their tips always reference a
+    prediction option. Tips on events with free selection are not counted.
+
+    Returns:
+        Dict mapping event id to :class:`EventPicks`
+    """
+    event_ids = [
+        event.id for event in events
+        if event.selection_mode == PredictionEvent.SelectionMode.CURATED
+    ]
+    picks: Dict[int, EventPicks] = {event_id: EventPicks() for event_id in event_ids}
+    if not event_ids:
+        return picks
+
+    rows = PredictionOption.objects.filter(event_id__in=event_ids).values_list(
+        'id', 'event_id', 'option_id', 'tip_count', 'lock_count', 'recent_pickers',
+    )
+    for option_id, event_id, target_id, tip_count, lock_count, recent in rows:
+        summary = picks[event_id]
+        summary.tip_count += tip_count
+        summary.lock_count += lock_count
+        summary.option_counts[option_id] = (tip_count, lock_count)
+        summary.option_targets[option_id] = target_id
+        summary.pickers.extend(
+            Picker(user_id=user_id, option_id=option_id, locked=bool(locked))
+            for user_id, locked in recent or []
+        )
+    return picks
+
+
+def tip_saved(sender, instance: UserTip, created: bool, update_fields=None, **kwargs) -> None:
+    """``post_save`` receiver that keeps the option counters in step with a tip."""
+
+    if kwargs.get('raw'):
+        return
+    if update_fields is not None and not {
+        'prediction_option', 'prediction_option_id', 'lock_status',
+    } & set(update_fields):
+        return
+
+    after = (instance.prediction_option_id, instance.lock_status)
+    if created:
+        apply_pick_change(instance.user_id, None, as_pick(*after))
+    elif hasattr(instance, '_loaded_pick'):
+        apply_pick_change(instance.user_id, as_pick(*instance._loaded_pick), as_pick(*after))
+    else:
+        # Loaded with deferred fields; the previous pick is unknown
+        rebuild_pick_stats(event_ids=[instance.prediction_event_id])
+    instance._loaded_pick = after
+
+
+def tip_deleted(sender, instance: UserTip, **kwargs) -> None:
+    """``post_delete`` receiver that removes a tip from the option counters."""
+
+    if instance.prediction_option_id:
+        apply_pick_change(instance.user_id, as_pick(instance.prediction_option_id, instance.lock_status), None)
+
+
+def as_pick(option_id: Optional[int], lock_status: str) -> Pick:
+    """Return the ``(option_id, locked)`` pick of a tip."""
+
+    return (option_id, is_locked_pick(lock_status))
+
+
+def apply_pick_change(user_id: int, before: Pick, after: Pick) -> None:
+    """
+    Move one user's pick between options and update the counters.
+
+    Args:
+        user_id: The picking user
+        before: ``(option_id, locked)`` before the change, or None for a new tip
+        after: ``(option_id, locked)`` after the change, or None for a deleted tip
+    """
+    apply_pick_changes([(user_id, before, after)])
+
+
+def apply_pick_changes(changes: Iterable[Tuple[int, Pick, Pick]]) -> None:
+    """
+    Apply many ``(user_id, before, after)`` pick changes at once.
+
+    The affected options are locked and rewritten together, so a batch costs
+    a few queries regardless of its size.
+    """
+    deltas: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+    arrivals: Dict[int, List[Tuple[int, bool]]] = defaultdict(list)
+    departures: Set[int] = set()
+    for user_id, before, after in changes:
+        old_option, old_locked = before or (None, False)
+        new_option, new_locked = after or (None, False)
+        if (old_option, old_locked) == (new_option, new_locked):
+            continue
+        if old_option and old_option != new_option:
+            deltas[old_option][0] -= 1
+            deltas[old_option][1] -= int(old_locked)
+            departures.add(old_option)
+        if new_option:
+            if new_option == old_option:
+                deltas[new_option][1] += int(new_locked) - int(old_locked)
+            else:
+                deltas[new_option][0] += 1
+                deltas[new_option][1] += int(new_locked)
+            arrivals[new_option].append((user_id, new_locked))
+
+    option_ids = set(deltas) | set(arrivals)
+    if not option_ids:
+        return
+
+    with transaction.atomic():
+        # Lock the rows so concurrent pickers do not overwrite each other
+        options = list(
+            PredictionOption.objects.select_for_update()
+            .filter(pk__in=option_ids)
+            .only('id', 'tip_count', 'lock_count', 'recent_pickers')
+            .order_by('pk')
+        )
+        # A picker who left may be replaced by an older one, so reload those lists
+        refilled = _recent_pickers_from_tips(departures) if departures else {}
+        for option in options:
+            tip_delta, lock_delta = deltas.get(option.id, (0, 0))
+            option.tip_count = max(option.tip_count + tip_delta, 0)
+            option.lock_count = max(option.lock_count + lock_delta, 0)
+            recent = refilled.get(option.id, []) if option.id in departures else list(option.recent_pickers or [])
+            for user_id, locked in arrivals.get(option.id, []):
+                recent = _with_picker(recent, user_id, locked)
+            option.recent_pickers = recent
+        PredictionOption.objects.bulk_update(options, ['tip_count', 'lock_count', 'recent_pickers'])
+
+
+def _with_picker(recent: List[list], user_id: int, locked: bool) -> List[list]:
+    """Return ``recent`` with ``user_id`` moved to the front."""
+
+    others = [entry for entry in recent if entry[0] != user_id]
+    return [[user_id, locked], *others][:RECENT_PICKERS_LIMIT]
+
+
+def _recent_pickers_from_tips(option_ids: Iterable[int]) -> Dict[int, List[list]]:
+    recent: Dict[int, List[list]] = defaultdict(list)
+    tips = (
+        UserTip.objects.filter(prediction_option_id__in=list(option_ids))
+        .order_by('prediction_option_id', '-updated_at', '-id')
+        .values_list('prediction_option_id', 'user_id', 'lock_status')
+    )
+    for option_id, user_id, lock_status in tips:
+        if len(recent[option_id]) < RECENT_PICKERS_LIMIT:
+            recent[option_id].append([user_id, is_locked_pick(lock_status)])
+    return recent
+
+
+def rebuild_pick_stats(*, event_ids: Optional[Iterable[int]] = None, dry_run: bool = False) -> int:
+    """
+    Recompute the pick statistics of every option from the tips.
+
+    Args:
+        event_ids: Limit the rebuild to options of these events
+        dry_run: Only count the options that are out of date
+
+    Returns:
+        Number of options whose statistics changed
+    """
+    options = PredictionOption.objects.order_by('id')
+    tips = UserTip.objects.filter(prediction_option__isnull=False)
+    if event_ids is not None:
+        event_ids = list(event_ids)
+        options = options.filter(event_id__in=event_ids)
+        tips = tips.filter(prediction_option__event_id__in=event_ids)
+
+    stats: Dict[int, Tuple[int, int, List[list]]] = {}
+    rows = tips.order_by('prediction_option_id', '-updated_at', '-id').values_list(
+        'prediction_option_id', 'user_id', 'lock_status',
+    )
+    for option_id, user_id, lock_status in rows.iterator(chunk_size=2000):
+        tip_count, lock_count, recent = stats.get(option_id, (0, 0, []))
+        locked = is_locked_pick(lock_status)
+        if len(recent) < RECENT_PICKERS_LIMIT:
+            recent.append([user_id, locked])
+        stats[option_id] = (tip_count + 1, lock_count + int(locked), recent)
+
+    changed: List[PredictionOption] = []
+    with transaction.atomic():
+        for option in options.only('id', 'tip_count', 'lock_count', 'recent_pickers'):
+            tip_count, lock_count, recent = stats.get(option.id, (0, 0, []))
+            if (option.tip_count, option.lock_count, option.recent_pickers) == (tip_count, lock_count, recent):
+                continue
+            option.tip_count = tip_count
+            option.lock_count = lock_count
+            option.recent_pickers = recent
+            changed.append(option)
+        if dry_run:
+            return len(changed)
+        PredictionOption.objects.bulk_update(
+            changed,
+            ['tip_count', 'lock_count', 'recent_pickers'],
+            batch_size=REBUILD_BATCH_SIZE,
+        )
+    if changed:
+        logger.info('Rebuilt pick statistics for %d options', len(changed))
+    return len(changed)
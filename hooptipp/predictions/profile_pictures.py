@@ -0,0 +1,230 @@
+"""Content-addressed profile picture variants.
+
+Uploads are hashed when :class:`~hooptipp.predictions.models.UserPreferences`
+is saved (``profile_picture_hash``). Resizing happens outside the request in
+the ``process_profile_pictures`` management command: each original is decoded
+once and written as WebP and JPEG variants for every size in
+:data:`AVATAR_SIZES`. Variant paths are derived from the content hash, so
+identical uploads share files and unchanged pictures are never reprocessed.
+``avatar_hash`` records the hash the current variants were built from.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import F, Q
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+AVATAR_SIZES = (256, 64, 32)
+VARIANT_DIRECTORY = 'profile_pictures/variants'
+# Leaderboard avatars are rendered at 32 CSS pixels (``h-8 w-8``)
+LEADERBOARD_AVATAR_SIZE = 32
+
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+
+@dataclass(frozen=True)
+class Avatar:
+    """Variant URLs for one displayed avatar size (1x and 2x density).
+
+    The WebP URLs are empty when this Pillow build cannot encode WebP, since
+    no WebP variants were generated then.
+    """
+
+    size: int
+    jpeg: str
+    webp: str
+    jpeg_2x: str
+    webp_2x: str
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            'size': self.size,
+            'jpeg': self.jpeg,
+            'webp': self.webp,
+            'jpeg_2x': self.jpeg_2x,
+            'webp_2x': self.webp_2x,
+        }
+
+
+@dataclass
+class ProfilePictureResult:
+    """Result of processing one user's profile picture."""
+
+    user_id: int
+    content_hash: str
+    processed: bool
+    variants: List[str]
+    error: Optional[str] = None
+
+
+def hash_file(file) -> str:
+    """Return the SHA-256 hex digest of an uploaded or stored file."""
+
+    digest = hashlib.sha256()
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    for chunk in file.chunks() if hasattr(file, 'chunks') else iter(lambda: file.read(65536), b''):
+        digest.update(chunk)
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return digest.hexdigest()
+
+
+def variant_name(content_hash: str, size: int, extension: str) -> str:
+    """Return the storage name of one variant."""
+
+    return f'{VARIANT_DIRECTORY}/{content_hash[:2]}/{content_hash}-{size}.{extension}'
+
+
+def variant_formats() -> List[tuple[str, str]]:
+    """Return ``(PIL format, extension)`` pairs to encode; WebP only if Pillow supports it."""
+
+    formats = [('JPEG', 'jpg')]
+    if features.check('webp'):
+        formats.insert(0, ('WEBP', 'webp'))
+    return formats
+
+
+def get_avatar(content_hash: str, size: int = LEADERBOARD_AVATAR_SIZE) -> Optional[Avatar]:
+    """
+    Return the variant URLs for an avatar displayed at ``size`` pixels.
+
+    Args:
+        content_hash: ``UserPreferences.avatar_hash`` (empty if no variants exist)
+        size: Displayed size in CSS pixels
+
+    Returns:
+        Avatar with the smallest variant covering ``size`` and ``2 * size``,
+        or None when no variants have been generated.
+    """
+    if not content_hash:
+        return None
+
+    def pick(target: int) -> int:
+        return min((s for s in AVATAR_SIZES if s >= target), default=max(AVATAR_SIZES))
+
+    one_x, two_x = pick(size), pick(size * 2)
+    extensions = {extension for _, extension in variant_formats()}
+
+    def url(target: int, extension: str) -> str:
+        if extension not in extensions:
+            return ''
+        return default_storage.url(variant_name(content_hash, target, extension))
+
+    return Avatar(
+        size=size,
+        jpeg=url(one_x, 'jpg'),
+        webp=url(one_x, 'webp'),
+        jpeg_2x=url(two_x, 'jpg'),
+        webp_2x=url(two_x, 'webp'),
+    )
+
+
+def render_variants(file) -> Dict[str, bytes]:
+    """
+    Decode ``file`` once and encode every size and format.
+
+    Non-square images (uploaded before square validation existed) are
+    center-cropped. Each size is resized from the next larger one, which is
+    much cheaper than resizing the original repeatedly.
+
+    Returns:
+        Mapping of ``'{size}.{extension}'`` to encoded bytes.
+    """
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    with Image.open(file) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        side = min(image.size)
+        if image.size != (side, side):
+            image = ImageOps.fit(image, (side, side), Image.Resampling.LANCZOS)
+
+        encoded: Dict[str, bytes] = {}
+        current = image
+        for size in sorted(AVATAR_SIZES, reverse=True):
+            if current.size[0] != size:
+                current = current.resize((size, size), Image.Resampling.LANCZOS)
+            for pil_format, extension in variant_formats():
+                buffer = BytesIO()
+                if pil_format == 'JPEG':
+                    current.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+                else:
+                    current.save(buffer, format='WEBP', quality=WEBP_QUALITY, method=4)
+                encoded[f'{size}.{extension}'] = buffer.getvalue()
+    return encoded
+
+
+def process_profile_picture(preferences, *, force: bool = False) -> ProfilePictureResult:
+    """
+    Build the variants of ``preferences.profile_picture`` if its content changed.
+
+    Args:
+        preferences: UserPreferences with a profile picture
+        force: Re-encode even if variants for the content hash already exist
+
+    Returns:
+        ProfilePictureResult describing what was done.
+    """
+    field_file = preferences.profile_picture
+    content_hash = preferences.profile_picture_hash
+    try:
+        if not content_hash:
+            # Legacy uploads saved before hashing was introduced
+            with field_file.open('rb') as stored:
+                content_hash = hash_file(stored)
+
+        if not force and content_hash == preferences.avatar_hash:
+            return ProfilePictureResult(preferences.user_id, content_hash, False, [])
+
+        names = [
+            variant_name(content_hash, size, extension)
+            for size in AVATAR_SIZES
+            for _, extension in variant_formats()
+        ]
+        written: List[str] = []
+        if force or not all(default_storage.exists(name) for name in names):
+            with field_file.open('rb') as stored:
+                encoded = render_variants(stored)
+            for key, data in encoded.items():
+                size, extension = key.split('.')
+                name = variant_name(content_hash, int(size), extension)
+                if default_storage.exists(name):
+                    default_storage.delete(name)
+                written.append(default_storage.save(name, ContentFile(data)))
+    except Exception as exc:  # noqa: BLE001 - a broken upload must not stop the batch
+        logger.warning('Failed to process profile picture of user %s: %s', preferences.user_id, exc)
+        return ProfilePictureResult(preferences.user_id, content_hash, False, [], error=str(exc))
+
+    preferences.profile_picture_hash = content_hash
+    preferences.avatar_hash = content_hash
+    # updated_at is part of the leaderboard change stamp, so cached rows pick up the avatar
+    preferences.save(update_fields=['profile_picture_hash', 'avatar_hash', 'updated_at'])
+    return ProfilePictureResult(preferences.user_id, content_hash, True, written)
+
+
+def pending_profile_pictures(user_ids: Optional[Iterable[int]] = None):
+    """Return preferences whose picture has no variants for its current content."""
+
+    from .models import UserPreferences
+
+    queryset = (
+        UserPreferences.objects.exclude(profile_picture='')
+        .exclude(profile_picture__isnull=True)
+        .filter(Q(profile_picture_hash='') | ~Q(avatar_hash=F('profile_picture_hash')))
+    )
+    if user_ids is not None:
+        queryset = queryset.filter(user_id__in=list(user_ids))
+    return queryset
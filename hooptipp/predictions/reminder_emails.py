@@ -10,12 +10,14 @@ from typing import List, Optional
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from hooptipp.mail_outbox import queue_mail
+
 from .models import PredictionEvent, Season
 
 
@@ -70,15 +72,16 @@ def send_reminder_email(user, events: List[PredictionEvent], request=None) -> No
     html_message = render_to_string('emails/reminder_email.html', context)
     plain_message = render_to_string('emails/reminder_email.txt', context)
     
-    # Send email
+    # Queue email - one reminder per user, day and set of events
+    event_ids = ','.join(str(event.pk) for event in sorted(events, key=lambda event: event.pk))
     from_email = settings.DEFAULT_FROM_EMAIL
-    send_mail(
+    queue_mail(
         subject=subject,
         message=plain_message,
         from_email=from_email,
         recipient_list=[user.email],
         html_message=html_message,
-        fail_silently=False,
+        idempotency_key=f'reminder:{user.pk}:{timezone.localdate().isoformat()}:{event_ids}',
     )
 
 
@@ -138,14 +141,14 @@ def send_season_enrollment_reminder(user, season: Season, events: List[Predictio
     html_message = render_to_string('emails/season_enrollment_reminder.html', context)
     plain_message = render_to_string('emails/season_enrollment_reminder.txt', context)
     
-    # Send email
+    # Queue email - at most one enrollment reminder per user, season and day
     from_email = settings.DEFAULT_FROM_EMAIL
-    send_mail(
+    queue_mail(
         subject=subject,
         message=plain_message,
         from_email=from_email,
         recipient_list=[user.email],
         html_message=html_message,
-        fail_silently=False,
+        idempotency_key=f'season-enrollment:{user.pk}:{season.pk}:{timezone.localdate().isoformat()}',
     )
 
@@ -0,0 +1,189 @@
+"""Event-driven scoring of new and changed event outcomes.
+
+Saving an :class:`~hooptipp.predictions.models.EventOutcome` with a new
+winner marks it with ``score_requested_at``. Once the transaction commits,
+the pending outcomes are scored:
+
+- with ``SCORING_QUEUE_ENABLED``, by the ``predictions.score_outcomes`` job
+  of ``run_worker``, queued a few seconds in the future
+  (``SCORING_DEBOUNCE_SECONDS``). Further outcomes saved before the job
+  starts are picked up by the same job, so a sync that resolves ten matches
+  is scored in one batch.
+- otherwise in the process that saved them, so deployments without a
+  worker still score results as they come in. Syncs and admin forms that
+  save one outcome after the other run inside :func:`scoring_batch`, which
+  scores everything they requested in a single pass when the batch ends.
+
+Either way the leaderboard updates within seconds without a periodic full
+rescan.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import EventOutcome
+
+logger = logging.getLogger(__name__)
+
+SCORING_JOB = 'predictions.score_outcomes'
+DEFAULT_DEBOUNCE_SECONDS = 5
+
+_batch = threading.local()
+
+
+@dataclass
+class PendingScoringResult:
+    """Summary of one scoring batch."""
+
+    scored: int = 0
+    busy: int = 0
+    scores_created: int = 0
+    scores_updated: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def scoring_queue_enabled() -> bool:
+    """Whether requested scoring is left to the background job (``SCORING_QUEUE_ENABLED``)."""
+
+    return getattr(settings, 'SCORING_QUEUE_ENABLED', False)
+
+
+def request_scoring(outcome_ids: Iterable[int]):
+    """
+    Mark outcomes as waiting for scoring and score them after commit.
+
+    The scoring job is queued when the queue is enabled; without a worker
+    the pending outcomes are scored in this process, at the end of the
+    surrounding :func:`scoring_batch` if there is one.
+
+    Returns:
+        The ``score_requested_at`` timestamp written, or None if no ids were given
+    """
+    outcome_ids = list(outcome_ids)
+    if not outcome_ids:
+        return None
+    requested_at = timezone.now()
+    EventOutcome.objects.filter(pk__in=outcome_ids).update(score_requested_at=requested_at)
+    if scoring_queue_enabled():
+        transaction.on_commit(enqueue_scoring_job)
+    elif getattr(_batch, 'depth', 0):
+        _batch.requested = True
+    else:
+        # A failed scoring run must not fail the save; the outcomes stay pending
+        transaction.on_commit(score_pending_outcomes, robust=True)
+    return requested_at
+
+
+@contextmanager
+def scoring_batch() -> Iterator[None]:
+    """
+    Score the outcomes requested inside the block in one pass when it ends.
+
+    Without the scoring queue, every committed outcome would otherwise start
+    its own scoring pass and standings snapshot. Usable as a decorator, e.g.
+    on a sync command's ``handle``; nested batches join the outermost one.
+    """
+    depth = getattr(_batch, 'depth', 0)
+    _batch.depth = depth + 1
+    try:
+        yield
+    finally:
+        _batch.depth = depth
+        if depth == 0 and getattr(_batch, 'requested', False):
+            _batch.requested = False
+            # Outcomes committed before an error are scored all the same
+            transaction.on_commit(score_pending_outcomes, robust=True)
+
+
+def enqueue_scoring_job() -> None:
+    """Queue the debounced scoring job (joining a queued one if present)."""
+
+    from hooptipp.jobs import enqueue
+    from hooptipp.models import Job
+
+    debounce = timedelta(seconds=getattr(settings, 'SCORING_DEBOUNCE_SECONDS', DEFAULT_DEBOUNCE_SECONDS))
+    run_at = timezone.now() + debounce
+    job = enqueue(SCORING_JOB, run_at=run_at)
+    if job.status == Job.Status.RUNNING:
+        # The running batch may already have read the pending outcomes; queue
+        # a follow-up, which workers start only after the running one finishes
+        enqueue(SCORING_JOB, dedup_key=f'{SCORING_JOB}:next', run_at=run_at)
+
+
+def outcome_saved(sender, instance: EventOutcome, created: bool, update_fields=None, **kwargs) -> None:
+    """``post_save`` receiver that requests scoring when an outcome's winner is new or changed."""
+
+    if kwargs.get('raw'):
+        return
+    if update_fields is not None and not {'winning_option', 'winning_generic_option'} & set(update_fields):
+        return
+    if created or instance.winner_changed:
+        instance.score_requested_at = request_scoring([instance.pk])
+    instance._loaded_winner = (instance.winning_option_id, instance.winning_generic_option_id)
+
+
+def score_pending_outcomes(
+    *,
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> PendingScoringResult:
+    """
+    Score every outcome waiting for scoring.
+
+    Outcomes that were scored before (their winner changed since) are
+    rescored from scratch so points for the previous winner are revoked.
+    Outcomes requested again while being scored, or leased by another
+    scoring worker right now, stay pending for the next batch.
+
+    Args:
+        progress: Optional ``callback(percent, message)`` for progress reports
+
+    Returns:
+        PendingScoringResult with counts and per-outcome errors
+    """
+    from .scoring_service import ScoringLeaseError, score_event_outcome
+    from .standings_snapshots import snapshot_standings
+
+    result = PendingScoringResult()
+    pending = list(
+        EventOutcome.objects.filter(score_requested_at__isnull=False)
+        .select_related('prediction_event', 'winning_option', 'winning_generic_option')
+        .order_by('score_requested_at', 'pk')
+    )
+    for index, outcome in enumerate(pending):
+        requested_at = outcome.score_requested_at
+        if progress is not None:
+            progress(int(100 * index / len(pending)), f'Scoring {outcome.prediction_event.name}')
+        try:
+            score_result = score_event_outcome(outcome, force=outcome.scored_at is not None)
+        except ScoringLeaseError:
+            logger.info('Deferring %s: another worker is scoring it', outcome.prediction_event)
+            result.busy += 1
+            continue
+        except ValueError as exc:
+            logger.warning('Failed to score %s: %s', outcome.prediction_event, exc)
+            result.errors.append(f'{outcome.prediction_event.name}: {exc}')
+            EventOutcome.objects.filter(pk=outcome.pk).update(score_error=str(exc))
+        else:
+            result.scored += 1
+            result.scores_created += score_result.created_count
+            result.scores_updated += score_result.updated_count
+        EventOutcome.objects.filter(pk=outcome.pk, score_requested_at=requested_at).update(
+            score_requested_at=None,
+        )
+    if result.scored:
+        # Keep today's standings snapshot current for the rank changes
+        snapshot_standings()
+    if result.busy and scoring_queue_enabled():
+        # Score the deferred outcomes once the other worker is done
+        enqueue_scoring_job()
+    return result
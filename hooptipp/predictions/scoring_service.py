@@ -1,16 +1,37 @@
-"""Utility functions for awarding prediction scores."""
+"""Utility functions for awarding prediction scores.
+
+Every event is scored in its own transaction while its outcome holds a
+scoring lease (``score_locked_by``/``score_locked_until``, claimed with a
+conditional update like :func:`hooptipp.jobs.claim_next`). The admin
+buttons, the background scoring job and ``process_scores`` can therefore
+run at the same time, from one or several processes, without scoring an
+event twice; ``process_all_user_scores(workers=N)`` spreads a backfill over
+several threads.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Iterable, List, Optional
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
-from .models import EventOutcome, PredictionEvent, UserEventScore, UserTip
+from .models import EventOutcome, PredictionEvent, Season, UserEventScore, UserTip
 from .lock_service import LockService
+from .standings_version import batched_invalidation
+
+logger = logging.getLogger(__name__)
 
+DEFAULT_SCORING_LEASE_SECONDS = 5 * 60
+# Tips scored between renewals of the scoring lease
+LEASE_RENEWAL_TIPS = 200
+FORFEIT_SCORE_ERROR = 'Forfeited match - no scoring'
 LOCK_MULTIPLIER = 2
 _LOCK_BONUS_STATUSES = {
     UserTip.LockStatus.ACTIVE,
@@ -34,6 +55,9 @@ class ScoreEventResult:
     outcome: EventOutcome
     awarded_scores: List[AwardedScore]
     skipped_tips: int
+    locks_returned: int = 0
+    locks_forfeited: int = 0
+    forfeited: bool = False
 
     @property
     def total_awarded_points(self) -> int:
@@ -48,36 +72,158 @@ class ScoreEventResult:
         return len(self.awarded_scores) - self.created_count
 
 
-def score_event_outcome(outcome: EventOutcome, *, force: bool = False) -> ScoreEventResult:
+class ScoringLeaseError(ValueError):
+    """Raised when another worker is scoring the outcome right now."""
+
+
+class MissingWinnerError(ValueError):
+    """Raised when an outcome without a winner (and no forfeit) is scored."""
+
+
+@dataclass
+class _EventScoring:
+    """Per-event tallies shared by the single-event and bulk scoring paths."""
+
+    awarded: List[AwardedScore] = field(default_factory=list)
+    skipped: int = 0
+    locks_returned: int = 0
+    locks_forfeited: int = 0
+
+
+def _scoring_lease() -> timedelta:
+    return timedelta(seconds=getattr(settings, 'SCORING_LEASE_SECONDS', DEFAULT_SCORING_LEASE_SECONDS))
+
+
+def _default_worker_id() -> str:
+    from hooptipp.jobs import default_worker_id
+
+    return default_worker_id()
+
+
+def claim_outcome(outcome_id: int, worker_id: str, *, lease: Optional[timedelta] = None) -> bool:
+    """
+    Lease ``outcome_id`` for scoring by ``worker_id``.
+
+    The conditional update is the lease: only one worker can take an outcome
+    whose lease is free or expired, on every database backend.
+
+    Returns:
+        True if the lease was claimed, False if another worker holds it
+    """
+    now = timezone.now()
+    free = Q(score_locked_until__isnull=True) | Q(score_locked_until__lt=now)
+    return bool(
+        EventOutcome.objects.filter(free, pk=outcome_id).update(
+            score_locked_by=worker_id,
+            score_locked_until=now + (lease or _scoring_lease()),
+        )
+    )
+
+
+def renew_outcome(outcome_id: int, worker_id: str, *, lease: Optional[timedelta] = None) -> None:
+    """
+    Extend the scoring lease ``worker_id`` holds on ``outcome_id``.
+
+    Raises:
+        ScoringLeaseError: If the lease expired and another worker took it over
+    """
+    renewed = EventOutcome.objects.filter(pk=outcome_id, score_locked_by=worker_id).update(
+        score_locked_until=timezone.now() + (lease or _scoring_lease()),
+    )
+    if not renewed:
+        raise ScoringLeaseError(f"Lost the scoring lease of outcome {outcome_id}.")
+
+
+def release_outcome(outcome_id: int, worker_id: str) -> None:
+    """Release the scoring lease of ``outcome_id`` if ``worker_id`` still holds it."""
+
+    EventOutcome.objects.filter(pk=outcome_id, score_locked_by=worker_id).update(
+        score_locked_by='',
+        score_locked_until=None,
+    )
+
+
+def score_event_outcome(
+    outcome: EventOutcome,
+    *,
+    force: bool = False,
+    worker_id: Optional[str] = None,
+) -> ScoreEventResult:
     """Award scores for all tips linked to ``outcome``.
 
     When ``force`` is ``True`` any existing :class:`~UserEventScore` rows linked to
     the outcome's prediction event are removed prior to recalculating results.
     This is useful when the winning selection changes and previous points must be
     revoked.
+
+    Raises:
+        ScoringLeaseError: If another worker is scoring the outcome
     """
 
     event = outcome.prediction_event
     if event is None:
         raise ValueError("EventOutcome must be associated with a PredictionEvent before scoring.")
 
+    worker_id = worker_id or _default_worker_id()
+    if not claim_outcome(outcome.pk, worker_id):
+        raise ScoringLeaseError(f"{event} is being scored by another worker.")
+    try:
+        return _score_leased_outcome(outcome, force=force, worker_id=worker_id)
+    finally:
+        release_outcome(outcome.pk, worker_id)
+
+
+def _mark_outcome_scored(outcome: EventOutcome, *, score_error: str = '') -> None:
+    outcome.scored_at = timezone.now()
+    outcome.score_error = score_error
+    outcome.save(update_fields=['scored_at', 'score_error'])
+    if outcome.score_requested_at is not None:
+        # Scored here already; leave it pending only if requested again since
+        EventOutcome.objects.filter(
+            pk=outcome.pk,
+            score_requested_at=outcome.score_requested_at,
+        ).update(score_requested_at=None)
+        outcome.score_requested_at = None
+
+
+def _score_leased_outcome(
+    outcome: EventOutcome,
+    *,
+    force: bool,
+    worker_id: str,
+    reuse_scored: bool = True,
+) -> ScoreEventResult:
+    """Score ``outcome`` under the lease ``worker_id`` already holds, in one transaction.
+
+    With ``reuse_scored`` an outcome that was scored before returns its
+    existing scores; the bulk rescan passes ``False`` to recompute them.
+    """
+    event = outcome.prediction_event
+
     # Check if this is a forfeited match - if so, don't score it
     if _is_forfeited_match(outcome):
-        # Return all locks for forfeited matches without scoring
-        locks_returned = _return_locks_for_forfeited_match(outcome)
+        with transaction.atomic(), batched_invalidation():
+            if force:
+                UserEventScore.objects.filter(prediction_event=event).delete()
+            # Return all locks for forfeited matches without scoring
+            locks_returned = _return_locks_for_forfeited_match(outcome)
+            store_tip_results(outcome)
+            _mark_outcome_scored(outcome, score_error=FORFEIT_SCORE_ERROR)
         # Return empty result since no scoring occurred
-        return ScoreEventResult(event=event, outcome=outcome, awarded_scores=[], skipped_tips=0)
+        return ScoreEventResult(
+            event=event,
+            outcome=outcome,
+            awarded_scores=[],
+            skipped_tips=0,
+            locks_returned=locks_returned,
+            forfeited=True,
+        )
 
     if not _outcome_has_selection(outcome):
-        raise ValueError("EventOutcome must specify a winning option, team, or player before scoring.")
-
-    awarded: List[AwardedScore] = []
-    skipped = 0
+        raise MissingWinnerError("EventOutcome must specify a winning option, team, or player before scoring.")
 
-    with transaction.atomic():
-        if force:
-            UserEventScore.objects.filter(prediction_event=event).delete()
-        elif outcome.scored_at:
+    with transaction.atomic(), batched_invalidation():
+        if not force and reuse_scored and outcome.scored_at:
             existing_scores = list(UserEventScore.objects.filter(prediction_event=event))
             if existing_scores:
                 return ScoreEventResult(
@@ -89,64 +235,131 @@ def score_event_outcome(outcome: EventOutcome, *, force: bool = False) -> ScoreE
                     skipped_tips=0,
                 )
 
-        tips = list(
-            UserTip.objects.filter(prediction_event=event)
-            .select_related('user', 'prediction_option', 'selected_option')
-        )
+        scoring = _award_event_scores(outcome, force=force, worker_id=worker_id)
+        _mark_outcome_scored(outcome)
 
-        for tip in tips:
-            if not _tip_matches_outcome(tip, outcome):
-                # Handle incorrect predictions with locks - forfeit them
-                if tip.lock_status == UserTip.LockStatus.ACTIVE:
-                    lock_service = LockService(tip.user)
-                    lock_service.schedule_forfeit(tip, resolved_at=outcome.resolved_at)
-                skipped += 1
-                continue
+    return ScoreEventResult(
+        event=event,
+        outcome=outcome,
+        awarded_scores=scoring.awarded,
+        skipped_tips=scoring.skipped,
+        locks_returned=scoring.locks_returned,
+        locks_forfeited=scoring.locks_forfeited,
+    )
 
-            base_points = event.points
-            multiplier = _calculate_lock_multiplier(tip)
-            total_points = base_points * multiplier
-            defaults = {
-                'base_points': base_points,
-                'lock_multiplier': multiplier,
-                'points_awarded': total_points,
-                'is_lock_bonus': multiplier > 1,
-            }
-
-            score, created = UserEventScore.objects.update_or_create(
-                user=tip.user,
-                prediction_event=event,
-                defaults=defaults,
-            )
-            awarded.append(AwardedScore(score=score, created=created))
-            
-            # Award hotness for correct prediction
+
+def _award_event_scores(outcome: EventOutcome, *, force: bool, worker_id: str) -> _EventScoring:
+    """Create or update the scores of every correct tip on ``outcome``'s event.
+
+    Runs inside the caller's transaction. Hotness is awarded only to users
+    who had no score for the event before, so rescoring (forced or not)
+    never awards it twice. The scoring lease of ``worker_id`` is renewed
+    every ``LEASE_RENEWAL_TIPS`` tips, so events with many tips are not
+    taken over by another worker halfway through.
+    """
+    event = outcome.prediction_event
+    scores = UserEventScore.objects.filter(prediction_event=event)
+    previously_scored = set(scores.values_list('user_id', flat=True))
+    if force:
+        scores.delete()
+
+    tips = list(
+        UserTip.objects.filter(prediction_event=event)
+        .select_related('user', 'prediction_option', 'selected_option')
+    )
+    # Scores and hotness belong to the season of the event, like its tips
+    event_season = Season.for_datetime(event.deadline)
+
+    scoring = _EventScoring()
+    for index, tip in enumerate(tips):
+        if index % LEASE_RENEWAL_TIPS == 0:
+            renew_outcome(outcome.pk, worker_id)
+        if not _tip_matches_outcome(tip, outcome):
+            # Handle incorrect predictions with locks - forfeit them
+            if tip.lock_status == UserTip.LockStatus.ACTIVE:
+                lock_service = LockService(tip.user)
+                lock_service.schedule_forfeit(tip, resolved_at=outcome.resolved_at)
+                scoring.locks_forfeited += 1
+            scoring.skipped += 1
+            continue
+
+        base_points = event.points
+        multiplier = _calculate_lock_multiplier(tip)
+        total_points = base_points * multiplier
+        defaults = {
+            'base_points': base_points,
+            'lock_multiplier': multiplier,
+            'points_awarded': total_points,
+            'is_lock_bonus': multiplier > 1,
+        }
+
+        score, created = UserEventScore.objects.update_or_create(
+            user=tip.user,
+            prediction_event=event,
+            defaults=defaults,
+            create_defaults={**defaults, 'season': event_season},
+        )
+        scoring.awarded.append(AwardedScore(score=score, created=created))
+
+        if tip.user_id not in previously_scored:
+            # Award hotness for correct prediction (only the first time it is scored)
             from .hotness_service import award_hotness_for_correct_prediction
-            from .models import Season
-            active_season = Season.get_active_season()
             award_hotness_for_correct_prediction(
                 user=tip.user,
                 was_locked=multiplier > 1,
-                season=active_season
+                season=event_season
             )
-            
-            # Return lock to user if they had an active lock
-            # Use WAS_LOCKED status to preserve bonus points for idempotency
-            if tip.lock_status == UserTip.LockStatus.ACTIVE:
-                lock_service = LockService(tip.user)
-                lock_service.release_lock_after_scoring(tip)
 
-        outcome.scored_at = timezone.now()
-        outcome.score_error = ''
-        outcome.save(update_fields=['scored_at', 'score_error'])
+        # Return lock to user if they had an active lock
+        # Use WAS_LOCKED status to preserve bonus points for idempotency
+        if tip.lock_status == UserTip.LockStatus.ACTIVE:
+            lock_service = LockService(tip.user)
+            if lock_service.release_lock_after_scoring(tip):
+                scoring.locks_returned += 1
 
-    return ScoreEventResult(event=event, outcome=outcome, awarded_scores=awarded, skipped_tips=skipped)
+    store_tip_results(outcome)
+    return scoring
 
 
 def _outcome_has_selection(outcome: EventOutcome) -> bool:
     return any((outcome.winning_option_id, outcome.winning_generic_option_id))
 
 
+def store_tip_results(outcome: EventOutcome) -> int:
+    """
+    Store the result of every tip on ``outcome``'s event.
+
+    Tips are correct when they match the winner the same way
+    :func:`_tip_matches_outcome` does, void when the match was forfeited, and
+    incorrect otherwise. Outcomes without a winner leave the tips pending.
+
+    Returns:
+        Number of tips updated
+    """
+    tips = UserTip.objects.filter(prediction_event_id=outcome.prediction_event_id)
+    if _is_forfeited_match(outcome):
+        return tips.update(result=UserTip.Result.VOID)
+    if outcome.winning_option_id:
+        correct = Q(prediction_option_id=outcome.winning_option_id)
+        if outcome.winning_option.option_id:
+            correct |= Q(selected_option_id=outcome.winning_option.option_id)
+    elif outcome.winning_generic_option_id:
+        correct = Q(selected_option_id=outcome.winning_generic_option_id)
+    else:
+        return 0
+    updated = tips.update(result=UserTip.Result.INCORRECT)
+    tips.filter(correct).update(result=UserTip.Result.CORRECT)
+    return updated
+
+
+def clear_tip_results(sender, instance: EventOutcome, **kwargs) -> None:
+    """``post_delete`` receiver returning the tips of a deleted outcome to pending."""
+
+    UserTip.objects.filter(prediction_event_id=instance.prediction_event_id).update(
+        result=UserTip.Result.PENDING,
+    )
+
+
 def _tip_matches_outcome(tip: UserTip, outcome: EventOutcome) -> bool:
     # Check if tip matches via PredictionOption
     if outcome.winning_option_id:
@@ -208,134 +421,150 @@ class ProcessAllScoresResult:
     total_locks_returned: int
     total_locks_forfeited: int
     events_with_errors: List[str]
-
-
-def process_all_user_scores(*, force: bool = False) -> ProcessAllScoresResult:
+    total_events_busy: int = 0
+
+
+@dataclass
+class _BatchTally:
+    """Mutable counters of one scoring worker."""
+
+    events_processed: int = 0
+    events_busy: int = 0
+    scores_created: int = 0
+    scores_updated: int = 0
+    tips_skipped: int = 0
+    locks_returned: int = 0
+    locks_forfeited: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def _scoring_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        workers = getattr(settings, 'SCORING_WORKERS', 1)
+    workers = max(1, int(workers))
+    if workers > 1 and connection.vendor == 'sqlite':
+        # SQLite has a single writer, so threads would only wait on each other
+        logger.info('Scoring with one worker on SQLite (%s requested)', workers)
+        return 1
+    return workers
+
+
+def process_all_user_scores(
+    *,
+    force: bool = False,
+    outcome_ids: Optional[Iterable[int]] = None,
+    workers: Optional[int] = None,
+    worker_id: Optional[str] = None,
+) -> ProcessAllScoresResult:
     """Process scores for all user tips that have corresponding event outcomes.
     
     This function goes through all UserTips and creates/updates UserEventScore
-    records based on existing EventOutcomes.
+    records based on existing EventOutcomes. Each event is scored and committed
+    on its own under a scoring lease; events leased by another worker or
+    process are skipped and counted as busy.
     
     Args:
         force: If True, existing UserEventScore records are deleted before processing
+        outcome_ids: Only score these outcomes (all outcomes when omitted)
+        workers: Number of scoring threads (``SCORING_WORKERS`` when omitted)
+        worker_id: Lease owner name (host and process id when omitted)
         
     Returns:
         ProcessAllScoresResult with summary statistics
     """
-    from django.db.models import Q
-    
-    total_events_processed = 0
-    total_scores_created = 0
-    total_scores_updated = 0
-    total_tips_skipped = 0
-    total_locks_returned = 0
-    total_locks_forfeited = 0
-    events_with_errors = []
-    
-    # Get all events that have outcomes
-    events_with_outcomes = PredictionEvent.objects.filter(
-        outcome__isnull=False
-    ).select_related('outcome').prefetch_related('tips__user', 'tips__prediction_option', 'tips__selected_option')
-    
-    with transaction.atomic():
-        if force:
-            # Delete all existing scores if force is True
-            UserEventScore.objects.all().delete()
-        
-        for event in events_with_outcomes:
-            try:
-                outcome = event.outcome
-                
-                # Check if this is a forfeited match - if so, return locks but don't score
-                if _is_forfeited_match(outcome):
-                    # Count locks before returning them
-                    locks_count = event.tips.filter(lock_status=UserTip.LockStatus.ACTIVE).count()
-                    # Return locks
-                    locks_returned_count = _return_locks_for_forfeited_match(outcome)
-                    total_locks_returned += locks_returned_count
-                    # Count all tips as skipped since no scoring occurred
-                    total_tips_skipped += event.tips.count()
-                    total_events_processed += 1
-                    
-                    # Mark outcome as "scored" (processed) to avoid re-processing
-                    if not outcome.scored_at:
-                        outcome.scored_at = timezone.now()
-                        outcome.score_error = 'Forfeited match - no scoring'
-                        outcome.save(update_fields=['scored_at', 'score_error'])
-                    continue
-                
-                if not _outcome_has_selection(outcome):
-                    events_with_errors.append(f"{event.name}: No winning option specified")
-                    continue
-                
-                total_events_processed += 1
-                
-                # Get all tips for this event
-                tips = list(event.tips.all())
-                
-                for tip in tips:
-                    if not _tip_matches_outcome(tip, outcome):
-                        # Handle incorrect predictions with locks - forfeit them
-                        if tip.lock_status == UserTip.LockStatus.ACTIVE:
-                            lock_service = LockService(tip.user)
-                            lock_service.schedule_forfeit(tip, resolved_at=outcome.resolved_at)
-                            total_locks_forfeited += 1
-                        total_tips_skipped += 1
-                        continue
-                    
-                    base_points = event.points
-                    multiplier = _calculate_lock_multiplier(tip)
-                    total_points = base_points * multiplier
-                    defaults = {
-                        'base_points': base_points,
-                        'lock_multiplier': multiplier,
-                        'points_awarded': total_points,
-                        'is_lock_bonus': multiplier > 1,
-                    }
-                    
-                    score, created = UserEventScore.objects.update_or_create(
-                        user=tip.user,
-                        prediction_event=event,
-                        defaults=defaults,
-                    )
-                    
-                    if created:
-                        total_scores_created += 1
-                        # Award hotness for correct prediction (only when score is first created)
-                        from .hotness_service import award_hotness_for_correct_prediction
-                        from .models import Season
-                        active_season = Season.get_active_season()
-                        award_hotness_for_correct_prediction(
-                            user=tip.user,
-                            was_locked=multiplier > 1,
-                            season=active_season
-                        )
-                    else:
-                        total_scores_updated += 1
-                    
-                    # Return lock to user if they had an active lock
-                    # Use WAS_LOCKED status to preserve bonus points for idempotency
-                    if tip.lock_status == UserTip.LockStatus.ACTIVE:
-                        lock_service = LockService(tip.user)
-                        if lock_service.release_lock_after_scoring(tip):
-                            total_locks_returned += 1
-                
-                # Mark the outcome as scored if it wasn't already
-                if not outcome.scored_at:
-                    outcome.scored_at = timezone.now()
-                    outcome.score_error = ''
-                    outcome.save(update_fields=['scored_at', 'score_error'])
-                    
-            except Exception as e:
-                events_with_errors.append(f"{event.name}: {str(e)}")
-                continue
-    
+    outcomes = EventOutcome.objects.all()
+    if outcome_ids is not None:
+        outcomes = outcomes.filter(pk__in=list(outcome_ids))
+    ids = list(outcomes.order_by('pk').values_list('pk', flat=True))
+
+    if force and outcome_ids is None:
+        # Points of events whose outcome was deleted are revoked too
+        UserEventScore.objects.filter(prediction_event__outcome__isnull=True).delete()
+
+    worker_id = worker_id or _default_worker_id()
+    workers = _scoring_workers(workers)
+    if workers == 1:
+        tallies = [_score_outcome_batch(ids, force=force, worker_id=worker_id)]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _score_outcome_batch,
+                    ids[index::workers],
+                    force=force,
+                    worker_id=f'{worker_id}:{index}',
+                    close_connection=True,
+                )
+                for index in range(workers)
+            ]
+            tallies = [future.result() for future in futures]
+
     return ProcessAllScoresResult(
-        total_events_processed=total_events_processed,
-        total_scores_created=total_scores_created,
-        total_scores_updated=total_scores_updated,
-        total_tips_skipped=total_tips_skipped,
-        total_locks_returned=total_locks_returned,
-        total_locks_forfeited=total_locks_forfeited,
-        events_with_errors=events_with_errors,
+        total_events_processed=sum(tally.events_processed for tally in tallies),
+        total_scores_created=sum(tally.scores_created for tally in tallies),
+        total_scores_updated=sum(tally.scores_updated for tally in tallies),
+        total_tips_skipped=sum(tally.tips_skipped for tally in tallies),
+        total_locks_returned=sum(tally.locks_returned for tally in tallies),
+        total_locks_forfeited=sum(tally.locks_forfeited for tally in tallies),
+        events_with_errors=[error for tally in tallies for error in tally.errors],
+        total_events_busy=sum(tally.events_busy for tally in tallies),
+    )
+
+
+def _score_outcome_batch(
+    outcome_ids: List[int],
+    *,
+    force: bool,
+    worker_id: str,
+    close_connection: bool = False,
+) -> _BatchTally:
+    """Lease and score ``outcome_ids`` one by one, committing after each event."""
+
+    tally = _BatchTally()
+    try:
+        for outcome_id in outcome_ids:
+            if not claim_outcome(outcome_id, worker_id):
+                tally.events_busy += 1
+                continue
+            try:
+                _score_outcome_in_batch(outcome_id, force=force, tally=tally, worker_id=worker_id)
+            finally:
+                release_outcome(outcome_id, worker_id)
+    finally:
+        if close_connection:
+            # Worker threads open their own connection
+            connection.close()
+    return tally
+
+
+def _score_outcome_in_batch(outcome_id: int, *, force: bool, tally: _BatchTally, worker_id: str) -> None:
+    outcome = (
+        EventOutcome.objects.select_related('prediction_event', 'winning_option')
+        .filter(pk=outcome_id)
+        .first()
     )
+    if outcome is None:
+        return
+    event = outcome.prediction_event
+
+    try:
+        result = _score_leased_outcome(outcome, force=force, worker_id=worker_id, reuse_scored=False)
+    except MissingWinnerError:
+        tally.errors.append(f"{event.name}: No winning option specified")
+        return
+    except Exception as e:
+        logger.exception('Error processing scores for %s: %s', event.name, e)
+        tally.errors.append(f"{event.name}: {str(e)}")
+        return
+
+    # Counted only once the event's transaction committed
+    tally.events_processed += 1
+    tally.scores_created += result.created_count
+    tally.scores_updated += result.updated_count
+    if result.forfeited:
+        # Count all tips as skipped since no scoring occurred
+        tally.tips_skipped += UserTip.objects.filter(prediction_event=event).count()
+    else:
+        tally.tips_skipped += result.skipped_tips
+    tally.locks_returned += result.locks_returned
+    tally.locks_forfeited += result.locks_forfeited
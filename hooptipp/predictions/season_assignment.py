@@ -0,0 +1,130 @@
+"""Season membership of scores and tips.
+
+Scores and tips store their season so season-scoped aggregations filter on
+an indexed ``season`` foreign key instead of joining event deadline ranges.
+Both a :class:`~hooptipp.predictions.models.UserEventScore` and a
+:class:`~hooptipp.predictions.models.UserTip` belong to the season containing
+their event's deadline, so rescoring an old event keeps its scores in the
+season the event was played in.
+
+New rows get their season on save (or from the batch writers below). When a
+season's timeframe is saved, :func:`season_saved` reassigns the rows inside
+and outside of it; :func:`assign_seasons` (``backfill_season_ids``) repairs
+every season at once.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from .models import Season, UserEventScore, UserTip
+from .standings_version import invalidate_standings
+
+logger = logging.getLogger(__name__)
+
+SEASON_TIMEFRAME_FIELDS = {'start_date', 'start_time', 'end_date', 'end_time'}
+
+
+@dataclass
+class SeasonAssignmentResult:
+    """Number of rows whose season was (or would be) changed."""
+
+    scores_updated: int = 0
+    tips_updated: int = 0
+
+
+def load_seasons() -> List[Season]:
+    """Return all seasons with a complete timeframe."""
+
+    return list(Season.objects.exclude(start_date__isnull=True).exclude(end_date__isnull=True))
+
+
+def find_season(moment: datetime, seasons: Iterable[Season]) -> Optional[Season]:
+    """Return the season from ``seasons`` whose timeframe contains ``moment``."""
+
+    for season in seasons:
+        if season.start_datetime <= moment <= season.end_datetime:
+            return season
+    return None
+
+
+def assign_season(season: Season, *, dry_run: bool = False) -> SeasonAssignmentResult:
+    """
+    Make the stored membership of ``season`` match its current timeframe.
+
+    Rows that left the timeframe lose the season, rows inside it gain it.
+
+    Args:
+        season: Season to reassign
+        dry_run: Only count the rows that would change
+
+    Returns:
+        SeasonAssignmentResult with the changed row counts
+    """
+    start, end = season.start_datetime, season.end_datetime
+    querysets = {
+        'scores_updated': (
+            UserEventScore.objects.filter(season=season).exclude(prediction_event__deadline__range=(start, end)),
+            UserEventScore.objects.filter(prediction_event__deadline__range=(start, end)).exclude(season=season),
+        ),
+        'tips_updated': (
+            UserTip.objects.filter(season=season).exclude(prediction_event__deadline__range=(start, end)),
+            UserTip.objects.filter(prediction_event__deadline__range=(start, end)).exclude(season=season),
+        ),
+    }
+
+    result = SeasonAssignmentResult()
+    for attribute, (leaving, joining) in querysets.items():
+        if dry_run:
+            changed = leaving.count() + joining.count()
+        else:
+            changed = leaving.update(season=None) + joining.update(season=season)
+        setattr(result, attribute, changed)
+    if result.scores_updated or result.tips_updated:
+        invalidate_standings()
+    return result
+
+
+def assign_seasons(*, dry_run: bool = False) -> SeasonAssignmentResult:
+    """Reassign the season of every score and tip (see :func:`assign_season`)."""
+
+    result = SeasonAssignmentResult()
+    seasons = load_seasons()
+    for season in seasons:
+        season_result = assign_season(season, dry_run=dry_run)
+        result.scores_updated += season_result.scores_updated
+        result.tips_updated += season_result.tips_updated
+
+    # Rows pointing at a season that no longer has a complete timeframe
+    season_ids = [season.pk for season in seasons]
+    orphaned_scores = UserEventScore.objects.filter(season__isnull=False).exclude(season_id__in=season_ids)
+    orphaned_tips = UserTip.objects.filter(season__isnull=False).exclude(season_id__in=season_ids)
+    if dry_run:
+        result.scores_updated += orphaned_scores.count()
+        result.tips_updated += orphaned_tips.count()
+    else:
+        result.scores_updated += orphaned_scores.update(season=None)
+        result.tips_updated += orphaned_tips.update(season=None)
+        invalidate_standings()
+    return result
+
+
+def season_saved(sender, instance: Season, created: bool, **kwargs) -> None:
+    """post_save receiver moving scores and tips when a season's timeframe changes."""
+
+    if kwargs.get('raw'):
+        return
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not SEASON_TIMEFRAME_FIELDS & set(update_fields):
+        return
+    result = assign_season(instance)
+    if result.scores_updated or result.tips_updated:
+        logger.info(
+            'Season %s now holds %d more/fewer scores and %d more/fewer tips',
+            instance.pk,
+            result.scores_updated,
+            result.tips_updated,
+        )
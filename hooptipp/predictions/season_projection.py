@@ -0,0 +1,402 @@
+"""Season projection: who can still win.
+
+:func:`project_season` combines the current standings with the season's
+unresolved events and the picks made on them:
+
+- ``max_points``: the current points plus every remaining pick scoring, with
+  the lock bonus on every pick that can still be locked (an upper bound)
+- ``clinched``: no other user can reach the user's current points
+- ``eliminated``: the user cannot reach another user's current points
+- ``win_probability``: share of simulated seasons the user finishes first in
+  (ties split the win), with every unresolved event won by one of its
+  options at random and users without a pick on a still-open event picking
+  at random
+
+The simulation runs vectorised with NumPy, a batch of simulated seasons per
+array operation. Results are cached per change stamp of the standings, so
+they are recomputed after scoring and not on every request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .models import (
+    EventOutcome,
+    PredictionEvent,
+    PredictionOption,
+    Season,
+    UserPreferences,
+    UserTip,
+)
+from .scoring_service import _LOCK_BONUS_STATUSES, LOCK_MULTIPLIER
+from .standings_version import get_standings_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMULATIONS = 1000
+DEFAULT_CACHE_TIMEOUT = 3600
+# Open events close as time passes, so the stamp also rolls over at this interval
+STAMP_TIME_BUCKET = timedelta(minutes=15)
+# Simulated seasons per NumPy batch (bounds the memory of the runs x users arrays)
+SIMULATION_BATCH_SIZE = 200
+
+
+@dataclass(frozen=True)
+class ProjectionRow:
+    """One user's outlook for the rest of the season."""
+
+    user_id: int
+    username: str
+    display_name: str
+    rank: int
+    total_points: int
+    max_points: int
+    clinched: bool
+    eliminated: bool
+    win_probability: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.user_id,
+            'display_name': self.display_name,
+            'rank': self.rank,
+            'total_points': self.total_points,
+            'max_points': self.max_points,
+            'clinched': self.clinched,
+            'eliminated': self.eliminated,
+            'win_probability': round(self.win_probability, 4),
+        }
+
+
+@dataclass
+class SeasonProjection:
+    """Projection of a season's outcome for all of its participants."""
+
+    season_id: int
+    generated_at: datetime
+    remaining_events: int
+    simulations: int
+    duration_ms: int
+    rows: List[ProjectionRow] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['generated_at'] = self.generated_at.isoformat()
+        data['rows'] = [row.as_dict() for row in self.rows]
+        return data
+
+
+@dataclass
+class ProjectionInput:
+    """
+    Remaining season in sparse form.
+
+    ``pickers[e][o]`` lists ``(user_index, points)`` of the users whose pick
+    on event ``e`` is option ``o``; ``open_users[e]`` lists the users without
+    a pick on a still-open event ``e`` with the points a correct pick earns.
+    """
+
+    current: List[int]
+    option_counts: List[int]
+    pickers: List[Dict[int, List[Tuple[int, int]]]]
+    open_users: List[List[Tuple[int, int]]]
+    max_remaining: List[int]
+
+
+def get_projection_stamp(season: Season, *, now: Optional[datetime] = None) -> str:
+    """Return a short hash that changes whenever the projection of ``season`` may change."""
+
+    now = now or timezone.now()
+    parts: List[Any] = [
+        season.pk,
+        season.updated_at.isoformat(),
+        int(now.timestamp() // STAMP_TIME_BUCKET.total_seconds()),
+        # Moved by every score, outcome, tip and enrollment write
+        get_standings_version(),
+    ]
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def get_season_projection(
+    season: Season,
+    *,
+    now: Optional[datetime] = None,
+    stamp: Optional[str] = None,
+) -> SeasonProjection:
+    """Return the cached projection of ``season``, computing it on a stamp change."""
+
+    now = now or timezone.now()
+    stamp = stamp or get_projection_stamp(season, now=now)
+    cache_key = f'predictions:season-projection:{season.pk}:{stamp}'
+    projection = cache.get(cache_key)
+    if projection is None:
+        projection = project_season(season, now=now)
+        cache.set(
+            cache_key,
+            projection,
+            getattr(settings, 'SEASON_PROJECTION_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT),
+        )
+    return projection
+
+
+def project_season(
+    season: Season,
+    *,
+    now: Optional[datetime] = None,
+    simulations: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> SeasonProjection:
+    """
+    Compute the projection of ``season`` (see the module docstring).
+
+    Args:
+        season: Season to project
+        now: Reference time (defaults to now); events due after it can still be picked
+        simulations: Number of simulated seasons (default: ``SEASON_PROJECTION_SIMULATIONS``)
+        seed: Random seed, for reproducible probabilities
+
+    Returns:
+        SeasonProjection with one row per participant, in standings order
+    """
+    from .leaderboard_service import ranked_users
+
+    started = time.perf_counter()
+    now = now or timezone.now()
+    if simulations is None:
+        simulations = getattr(settings, 'SEASON_PROJECTION_SIMULATIONS', DEFAULT_SIMULATIONS)
+
+    standings = list(ranked_users(season).values('id', 'username', 'total_points', 'rank'))
+    data = load_projection_input(
+        season,
+        [user['id'] for user in standings],
+        [user['total_points'] for user in standings],
+        now=now,
+    )
+
+    if not standings:
+        win_shares: List[float] = []
+    else:
+        win_shares = _simulate(data, simulations, seed)
+
+    max_points = [current + remaining for current, remaining in zip(data.current, data.max_remaining)]
+    clinched, eliminated = _clinch_and_elimination(data.current, max_points)
+
+    nicknames = {
+        user_id: nickname.strip()
+        for user_id, nickname in UserPreferences.objects.filter(
+            user_id__in=[user['id'] for user in standings],
+        ).values_list('user_id', 'nickname')
+        if nickname and nickname.strip()
+    }
+    rows = []
+    for index, user in enumerate(standings):
+        win_probability = win_shares[index]
+        if clinched[index]:
+            win_probability = 1.0
+        elif eliminated[index]:
+            win_probability = 0.0
+        rows.append(ProjectionRow(
+            user_id=user['id'],
+            username=user['username'],
+            display_name=nicknames.get(user['id'], user['username']),
+            rank=int(user['rank']),
+            total_points=int(user['total_points']),
+            max_points=max_points[index],
+            clinched=clinched[index],
+            eliminated=eliminated[index],
+            win_probability=win_probability,
+        ))
+
+    projection = SeasonProjection(
+        season_id=season.pk,
+        generated_at=now,
+        remaining_events=len(data.option_counts),
+        simulations=simulations if standings else 0,
+        duration_ms=int((time.perf_counter() - started) * 1000),
+        rows=rows,
+    )
+    logger.debug(
+        'Projected %s: %d users x %d events in %d ms',
+        season, len(rows), projection.remaining_events, projection.duration_ms,
+    )
+    return projection
+
+
+def load_projection_input(
+    season: Season,
+    user_ids: Sequence[int],
+    current_points: Sequence[int],
+    *,
+    now: datetime,
+) -> ProjectionInput:
+    """
+    Load the unresolved events of ``season`` and the picks of ``user_ids`` on them.
+
+    Events without an outcome yet are unresolved. Their outcomes are the
+    event's active options; events without curated options (free selection)
+    are won by one of the picked options or by an option nobody picked.
+    """
+    user_index = {user_id: index for index, user_id in enumerate(user_ids)}
+    events = list(
+        PredictionEvent.objects.filter(
+            is_active=True,
+            deadline__gte=season.start_datetime,
+            deadline__lte=season.end_datetime,
+        )
+        .annotate(has_outcome=Exists(EventOutcome.objects.filter(prediction_event=OuterRef('pk'))))
+        .filter(has_outcome=False)
+        .order_by('deadline', 'pk')
+        .values_list('id', 'points', 'deadline')
+    )
+    event_index = {event_id: index for index, (event_id, _, _) in enumerate(events)}
+
+    # Outcome index per event, keyed by PredictionOption id and by Option id
+    option_keys: List[Dict[Tuple[str, int], int]] = [{} for _ in events]
+    option_counts = [0] * len(events)
+    for event_id, prediction_option_id, option_id in (
+        PredictionOption.objects.filter(event_id__in=list(event_index), is_active=True)
+        .order_by('event_id', 'sort_order', 'pk')
+        .values_list('event_id', 'id', 'option_id')
+    ):
+        index = event_index[event_id]
+        option_keys[index][('prediction', prediction_option_id)] = option_counts[index]
+        option_keys[index][('option', option_id)] = option_counts[index]
+        option_counts[index] += 1
+    curated = [count > 0 for count in option_counts]
+
+    pickers: List[Dict[int, List[Tuple[int, int]]]] = [defaultdict(list) for _ in events]
+    picked: List[set] = [set() for _ in events]
+    max_remaining = [0] * len(user_ids)
+    for user_id, event_id, prediction_option_id, selected_option_id, lock_status in (
+        UserTip.objects.filter(prediction_event_id__in=list(event_index), user_id__in=list(user_index))
+        .values_list('user_id', 'prediction_event_id', 'prediction_option_id', 'selected_option_id', 'lock_status')
+    ):
+        index = event_index[event_id]
+        user = user_index[user_id]
+        keys = option_keys[index]
+        outcome = keys.get(('prediction', prediction_option_id))
+        if outcome is None:
+            outcome = keys.get(('option', selected_option_id))
+        if outcome is None and not curated[index] and selected_option_id is not None:
+            # Free selection: every distinct pick is a possible outcome
+            outcome = keys[('option', selected_option_id)] = option_counts[index]
+            option_counts[index] += 1
+        picked[index].add(user)
+        if outcome is None:
+            # Pick on an option that can no longer win
+            continue
+        points = events[index][1]
+        open_event = events[index][2] > now
+        if lock_status in _LOCK_BONUS_STATUSES or open_event:
+            # Locked already, or can still be locked before the deadline
+            max_remaining[user] += points * LOCK_MULTIPLIER
+        else:
+            max_remaining[user] += points
+        multiplier = LOCK_MULTIPLIER if lock_status in _LOCK_BONUS_STATUSES else 1
+        pickers[index][outcome].append((user, points * multiplier))
+
+    open_users: List[List[Tuple[int, int]]] = []
+    for index, (_, points, deadline) in enumerate(events):
+        if not curated[index]:
+            # Room for an option nobody picked
+            option_counts[index] += 1
+        users_without_pick: List[Tuple[int, int]] = []
+        if deadline > now:
+            for user in range(len(user_ids)):
+                if user not in picked[index]:
+                    users_without_pick.append((user, points))
+                    max_remaining[user] += points * LOCK_MULTIPLIER
+        open_users.append(users_without_pick)
+
+    return ProjectionInput(
+        current=[int(points) for points in current_points],
+        option_counts=option_counts,
+        pickers=[dict(event_pickers) for event_pickers in pickers],
+        open_users=open_users,
+        max_remaining=max_remaining,
+    )
+
+
+def _clinch_and_elimination(current: List[int], max_points: List[int]) -> Tuple[List[bool], List[bool]]:
+    """Return ``(clinched, eliminated)`` flags per user, from the top two of each list."""
+
+    def best_other(values: List[int]) -> List[Optional[int]]:
+        # Highest value among all other users, for every user
+        if len(values) < 2:
+            return [None] * len(values)
+        first = max(range(len(values)), key=values.__getitem__)
+        second = max(value for index, value in enumerate(values) if index != first)
+        return [second if index == first else values[first] for index in range(len(values))]
+
+    others_current = best_other(current)
+    others_max = best_other(max_points)
+    clinched = [
+        others_max[index] is not None and current[index] > others_max[index]
+        for index in range(len(current))
+    ]
+    eliminated = [
+        others_current[index] is not None and max_points[index] < others_current[index]
+        for index in range(len(current))
+    ]
+    return clinched, eliminated
+
+
+def _simulate(data: ProjectionInput, simulations: int, seed: Optional[int]) -> List[float]:
+    """Return each user's share of simulated wins, simulating a batch of runs per array operation.
+
+    Picked points are a ``(event, option) x users`` matrix, so the totals of a
+    batch are one matrix product with the one-hot winners. Random picks are
+    drawn only for the users without a pick on an open event.
+    """
+
+    rng = np.random.default_rng(seed)
+    user_count, event_count = len(data.current), len(data.option_counts)
+    current = np.asarray(data.current, dtype=np.float64)
+    option_counts = np.asarray(data.option_counts, dtype=np.int64)
+    # Row of (event, option) in the points matrix
+    option_rows = np.concatenate(([0], np.cumsum(option_counts)[:-1])) if event_count else option_counts
+    picked_points = np.zeros((int(option_counts.sum()), user_count), dtype=np.float64)
+    open_user, open_event, open_points = [], [], []
+    for index in range(event_count):
+        for outcome, users in data.pickers[index].items():
+            for user, user_points in users:
+                picked_points[option_rows[index] + outcome, user] = user_points
+        for user, user_points in data.open_users[index]:
+            open_user.append(user)
+            open_event.append(index)
+            open_points.append(user_points)
+    # Open picks grouped by user, so each user's hits sum over one slice
+    order = np.argsort(open_user, kind='stable')
+    open_user = np.asarray(open_user, dtype=np.int64)[order]
+    open_chance = 1 / option_counts[np.asarray(open_event, dtype=np.int64)[order]]
+    open_points = np.asarray(open_points, dtype=np.float64)[order]
+    open_users, open_starts = np.unique(open_user, return_index=True)
+
+    wins = np.zeros(user_count, dtype=np.float64)
+    for start in range(0, simulations, SIMULATION_BATCH_SIZE):
+        batch = min(SIMULATION_BATCH_SIZE, simulations - start)
+        # (batch, events): the winning option of every event in every run
+        winners = (rng.random((batch, event_count)) * option_counts).astype(np.int64)
+        winning_rows = np.zeros((batch, picked_points.shape[0]), dtype=np.float64)
+        np.put_along_axis(winning_rows, winners + option_rows, 1.0, axis=1)
+        totals = current + winning_rows @ picked_points
+        if open_users.size:
+            hits = rng.random((batch, open_points.size)) < open_chance
+            totals[:, open_users] += np.add.reduceat(hits * open_points, open_starts, axis=1)
+        leaders = totals == totals.max(axis=1, keepdims=True)
+        wins += (leaders / leaders.sum(axis=1, keepdims=True)).sum(axis=0)
+    return (wins / simulations).tolist() if simulations else wins.tolist()
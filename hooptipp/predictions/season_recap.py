@@ -0,0 +1,229 @@
+"""Precomputed results of ended seasons.
+
+When a season has ended and every active event in it has a scored outcome,
+:func:`create_season_recap` computes its podium, participant and match
+counts and every participant's rank, points, pick count and accuracy and
+stores them as a :class:`~hooptipp.predictions.models.SeasonRecap`. Until
+then the results can still change, so they are computed live and not
+stored. A stored recap is rebuilt when the season or one of its scores
+changed after it was written (e.g. an outcome was corrected and rescored).
+``process_achievements`` writes and rebuilds the recaps; the home page reads
+the row (building it on first access if the command has not run yet).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from .models import (
+    EventOutcome,
+    PredictionEvent,
+    Season,
+    SeasonRecap,
+    UserEventScore,
+    UserTip,
+)
+
+logger = logging.getLogger(__name__)
+
+PODIUM_SIZE = 3
+
+
+@dataclass
+class SeasonRecapResult:
+    """Number of recaps written, rebuilt (or that would be) and skipped."""
+
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+
+def build_season_recap(season: Season) -> SeasonRecap:
+    """
+    Compute the recap of ``season`` without saving it.
+
+    Only enrolled users are ranked and counted, like the season leaderboard.
+    """
+    from .leaderboard_service import ranked_users
+
+    standings = list(ranked_users(season).values('id', 'username', 'total_points', 'rank'))
+    enrolled_user_ids = [user['id'] for user in standings]
+
+    # Correctness is stored on each tip when its outcome is scored; void
+    # (forfeited) picks count as picks but not as resolved ones
+    resolved_results = [UserTip.Result.CORRECT, UserTip.Result.INCORRECT]
+    counts: Dict[int, Dict[str, int]] = defaultdict(lambda: {'picks': 0, 'resolved': 0, 'correct': 0})
+    for row in (
+        UserTip.objects.filter(user_id__in=enrolled_user_ids, season=season)
+        .values('user')
+        .annotate(
+            picks=Count('id'),
+            resolved=Count('id', filter=Q(result__in=resolved_results)),
+            correct=Count('id', filter=Q(result=UserTip.Result.CORRECT)),
+        )
+        .order_by()
+    ):
+        counts[row['user']] = {'picks': row['picks'], 'resolved': row['resolved'], 'correct': row['correct']}
+
+    user_stats = {}
+    for user in standings:
+        user_counts = counts[user['id']]
+        user_stats[str(user['id'])] = {
+            'rank': int(user['rank']),
+            'total_points': int(user['total_points']),
+            **user_counts,
+            'accuracy': (
+                round(user_counts['correct'] / user_counts['resolved'] * 100, 1)
+                if user_counts['resolved'] else 0.0
+            ),
+        }
+
+    podium: List[dict] = [
+        {
+            'user_id': user['id'],
+            'username': user['username'],
+            'rank': int(user['rank']),
+            'total_points': int(user['total_points']),
+        }
+        for user in standings[:PODIUM_SIZE]
+        if user['total_points'] > 0
+    ]
+
+    return SeasonRecap(
+        season=season,
+        participant_count=len(standings),
+        total_matches=PredictionEvent.objects.filter(
+            deadline__gte=season.start_datetime,
+            deadline__lte=season.end_datetime,
+        ).count(),
+        pick_count=sum(user_counts['picks'] for user_counts in counts.values()),
+        resolved_pick_count=sum(user_counts['resolved'] for user_counts in counts.values()),
+        correct_pick_count=sum(user_counts['correct'] for user_counts in counts.values()),
+        podium=podium,
+        user_stats=user_stats,
+    )
+
+
+def season_is_settled(season: Season) -> bool:
+    """Return whether every active event of ``season`` has a scored outcome."""
+
+    scored = EventOutcome.objects.filter(prediction_event=OuterRef('pk'), scored_at__isnull=False)
+    return not (
+        PredictionEvent.objects.filter(
+            is_active=True,
+            deadline__gte=season.start_datetime,
+            deadline__lte=season.end_datetime,
+        )
+        .filter(~Exists(scored))
+        .exists()
+    )
+
+
+def recap_is_stale(recap: SeasonRecap) -> bool:
+    """Return whether the season or one of its scores changed after ``recap`` was written."""
+
+    if recap.season.updated_at > recap.created_at:
+        return True
+    return UserEventScore.objects.filter(season_id=recap.season_id, updated_at__gt=recap.created_at).exists()
+
+
+def _store_season_recap(season: Season) -> SeasonRecap:
+    recap = build_season_recap(season)
+    try:
+        with transaction.atomic():
+            SeasonRecap.objects.filter(season=season).delete()
+            recap.save()
+    except IntegrityError:
+        # Written concurrently by another request or worker
+        return SeasonRecap.objects.get(season=season)
+    logger.info('Stored the recap of %s', season)
+    return recap
+
+
+def create_season_recap(season: Season, *, force: bool = False) -> SeasonRecap:
+    """
+    Return the recap of ``season``, storing it once the season is settled.
+
+    An existing recap is returned unless it is stale (or ``force`` is set).
+    While an event of the season still waits for its outcome or its scoring,
+    the recap is built live and not saved.
+
+    Args:
+        season: Ended season
+        force: Rebuild an existing recap
+
+    Returns:
+        The stored (or existing) SeasonRecap, or an unsaved one while the
+        season is not settled
+    """
+    existing = SeasonRecap.objects.select_related('season').filter(season=season).first()
+    if existing and not force and not recap_is_stale(existing):
+        return existing
+    if not season_is_settled(season):
+        return build_season_recap(season)
+    return _store_season_recap(season)
+
+
+def create_season_recaps(
+    *,
+    now: Optional[datetime] = None,
+    force: bool = False,
+    dry_run: bool = False,
+) -> SeasonRecapResult:
+    """
+    Store the recaps of all settled ended seasons that have none, and rebuild stale ones.
+
+    Seasons whose events are not all scored yet are skipped until they are.
+
+    Args:
+        now: Reference time (defaults to now)
+        force: Rebuild all existing recaps
+        dry_run: Only count the recaps that would be written
+    """
+    now = now or timezone.now()
+    result = SeasonRecapResult()
+    recaps = {recap.season_id: recap for recap in SeasonRecap.objects.select_related('season')}
+    for season in Season.objects.filter(start_date__isnull=False, end_date__lte=timezone.localdate(now)):
+        if season.end_datetime >= now:
+            continue
+        existing = recaps.get(season.pk)
+        if existing and not force and not recap_is_stale(existing):
+            result.skipped += 1
+            continue
+        if not season_is_settled(season):
+            result.skipped += 1
+            continue
+        if existing:
+            result.updated += 1
+        else:
+            result.created += 1
+        if not dry_run:
+            _store_season_recap(season)
+    return result
+
+
+def get_recent_season_recap(*, now: Optional[datetime] = None, days: int = 7) -> Optional[SeasonRecap]:
+    """
+    Return the recap of the most recently ended season if it ended in the last ``days`` days.
+
+    Seasons without participants have no recap to show.
+    """
+    now = now or timezone.now()
+    since = now - timedelta(days=days)
+    for season in Season.objects.filter(
+        end_date__isnull=False,
+        start_date__isnull=False,
+        end_date__gte=since.date(),
+    ).order_by('-end_date', '-end_time'):
+        if season.end_datetime < now:
+            recap = create_season_recap(season)
+            return recap if recap.participant_count else None
+    return None
@@ -0,0 +1,130 @@
+"""Daily standings snapshots for point and rank changes.
+
+:func:`snapshot_standings` stores every enrolled user's rank and totals in
+the active season as one :class:`~hooptipp.predictions.models.StandingsSnapshot`
+row per user and day. It runs after each scoring batch and on the
+``snapshot_standings`` schedule; later runs on the same day overwrite the
+day's rows, so a day's snapshot holds its last standings.
+
+Point and rank changes over the last N days are then the difference between
+the current standings and the latest snapshot taken N or more days ago, read
+with one indexed lookup instead of aggregating the scores of the period. The
+rows also form the season's day-by-day progression.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Mapping, Optional, Tuple
+
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import Season, StandingsSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StandingsChange:
+    """Change of a user's standings since a snapshot."""
+
+    points: int
+    # Positive when the user moved up
+    rank: int
+
+
+def snapshot_standings(
+    season: Optional[Season] = None,
+    *,
+    now: Optional[datetime] = None,
+    dry_run: bool = False,
+) -> int:
+    """
+    Store today's standings of ``season`` (default: the active season).
+
+    Args:
+        season: Season to snapshot
+        now: Reference time (defaults to now); its local date is the snapshot day
+        dry_run: Compute the standings without writing them
+
+    Returns:
+        Number of snapshot rows written (or that would be written)
+    """
+    from .leaderboard_service import ranked_users
+
+    now = now or timezone.now()
+    season = season or Season.get_active_season(now)
+    if season is None:
+        return 0
+
+    day = timezone.localdate(now)
+    snapshots = [
+        StandingsSnapshot(
+            season=season,
+            user_id=user_id,
+            day=day,
+            rank=rank,
+            total_points=total_points,
+            event_count=event_count,
+        )
+        for user_id, total_points, event_count, rank in (
+            ranked_users(season).values_list('id', 'total_points', 'event_count', 'rank')
+        )
+    ]
+    if not dry_run and snapshots:
+        StandingsSnapshot.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=['season', 'day', 'user'],
+            update_fields=['rank', 'total_points', 'event_count', 'updated_at'],
+        )
+        logger.debug('Stored %d standings of %s for %s', len(snapshots), season, day)
+    return len(snapshots)
+
+
+def baseline_day(season: Season, *, days: int, now: Optional[datetime] = None) -> Optional[date]:
+    """Return the latest snapshot day of ``season`` at least ``days`` days ago."""
+
+    latest = timezone.localdate(now or timezone.now()) - timedelta(days=days)
+    return (
+        StandingsSnapshot.objects.filter(season=season, day__lte=latest)
+        .aggregate(day=Max('day'))['day']
+    )
+
+
+def get_standings_changes(
+    season: Season,
+    current: Mapping[int, Tuple[int, int]],
+    *,
+    days: int,
+    now: Optional[datetime] = None,
+) -> Dict[int, StandingsChange]:
+    """
+    Return the changes of the given users since ``days`` days ago.
+
+    Args:
+        season: Season of the standings
+        current: ``{user_id: (rank, total_points)}`` of the current standings
+        days: Age of the baseline snapshot in days
+        now: Reference time (defaults to now)
+
+    Returns:
+        ``{user_id: StandingsChange}`` for users with a baseline snapshot;
+        users without one (no snapshot that old, or enrolled later) are missing.
+    """
+    if not current:
+        return {}
+    day = baseline_day(season, days=days, now=now)
+    if day is None:
+        return {}
+    changes: Dict[int, StandingsChange] = {}
+    for user_id, rank, total_points in (
+        StandingsSnapshot.objects.filter(season=season, day=day, user_id__in=list(current))
+        .values_list('user_id', 'rank', 'total_points')
+    ):
+        current_rank, current_points = current[user_id]
+        changes[user_id] = StandingsChange(points=current_points - total_points, rank=rank - current_rank)
+    return changes
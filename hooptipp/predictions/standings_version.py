@@ -0,0 +1,112 @@
+"""Version of everything the leaderboard and season projection show.
+
+Scores, tips and locks, outcomes, kudos, hotness, achievements, enrollments,
+preferences and users all feed the standings. Instead of aggregating those
+tables on every request, each write sets the single
+:class:`~hooptipp.predictions.models.StandingsVersion` row to a new random
+token in the same transaction (model signals for row saves and deletes,
+explicit calls after bulk updates), and the change stamps read just that
+row. The version lives
+in the database rather than the cache, so a change committed by
+``process_scores``, the scoring job or another web worker moves the stamp of
+every process.
+
+Writers that change many rows in one transaction (scoring an event) wrap
+them in :func:`batched_invalidation`, which moves the version once at the end
+of the block so the row is locked only briefly before the commit.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import StandingsVersion
+
+STANDINGS_VERSION_PK = 1
+
+_batch = threading.local()
+
+
+def get_standings_version() -> str:
+    """Return the current standings version."""
+
+    version = (
+        StandingsVersion.objects.filter(pk=STANDINGS_VERSION_PK)
+        .values_list('version', flat=True)
+        .first()
+    )
+    return version or ''
+
+
+def _bump() -> None:
+    version = uuid.uuid4().hex[:12]
+    updated = StandingsVersion.objects.filter(pk=STANDINGS_VERSION_PK).update(
+        version=version,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        # The row is created by the migration; recreate it after a table flush
+        StandingsVersion.objects.update_or_create(pk=STANDINGS_VERSION_PK, defaults={'version': version})
+
+
+def invalidate_standings() -> None:
+    """Move the standings to a new version (within the current transaction)."""
+
+    if getattr(_batch, 'depth', 0):
+        _batch.changed = True
+        return
+    _bump()
+
+
+@contextmanager
+def batched_invalidation() -> Iterator[None]:
+    """
+    Collect the standings invalidations of a block into one version bump.
+
+    Use inside the transaction that makes the changes, so the bump commits
+    with them.
+    """
+    depth = getattr(_batch, 'depth', 0)
+    _batch.depth = depth + 1
+    succeeded = False
+    try:
+        yield
+        succeeded = True
+    finally:
+        _batch.depth = depth
+        if depth == 0 and getattr(_batch, 'changed', False):
+            _batch.changed = False
+            if succeeded:
+                _bump()
+            elif connection.in_atomic_block:
+                # The block failed: bump only if the transaction still commits
+                transaction.on_commit(_bump)
+            else:
+                _bump()
+
+
+# Saves limited to these fields never change the standings (e.g. logins)
+IGNORED_FIELDS = frozenset({'last_login'})
+
+
+def standings_changed(sender, update_fields=None, **kwargs) -> None:
+    """``post_save``/``post_delete`` receiver for models shown in the standings."""
+
+    if kwargs.get('raw'):
+        return
+    if update_fields and set(update_fields) <= IGNORED_FIELDS:
+        return
+    invalidate_standings()
+
+
+def settings_changed(sender, created: bool = False, **kwargs) -> None:
+    """``post_save`` receiver for singleton settings; creating them with defaults changes nothing."""
+
+    if not created:
+        standings_changed(sender, **kwargs)
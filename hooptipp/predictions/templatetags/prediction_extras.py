@@ -5,6 +5,7 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 
 from ..card_renderers.registry import registry
+from ..pick_stats import load_event_picks
 
 register = template.Library()
 
@@ -33,9 +34,18 @@ def render_prediction_card(context, event, user_tip=None):
     template_name = renderer.get_event_template(event)
     card_context = renderer.get_event_context(event, user=context.get("active_user"))
 
-    # Get users who have predicted this event
+    # Get users who have predicted this event (capped for curated events,
+    # so the total comes from the pick counters)
     event_tip_users = context.get("event_tip_users", {})
     users_who_predicted = event_tip_users.get(event.id, [])
+    pick_count = (context.get("event_pick_counts") or {}).get(event.id, len(users_who_predicted))
+    picks = (context.get("event_picks") or {}).get(event.id)
+    pick_distribution = {}
+    if picks is not None:
+        pick_distribution = {
+            option_id: {"tips": tips, "locks": locks, "share": picks.option_share(option_id)}
+            for option_id, (tips, locks) in picks.option_counts.items()
+        }
 
     # Build render context
     render_context = {
@@ -46,6 +56,8 @@ def render_prediction_card(context, event, user_tip=None):
         "card_context": card_context,
         "palette": context.get("active_theme_palette"),
         "users_who_predicted": users_who_predicted,
+        "pick_count": pick_count,
+        "pick_distribution": pick_distribution,
     }
 
     return render_to_string(template_name, render_context, request=context.get("request"))
@@ -59,8 +71,6 @@ def render_result_card(context, outcome, user_tip=None, is_correct=None):
     Usage:
         {% render_result_card outcome user_tip is_correct %}
     """
-    from ..models import UserTip, UserEventScore
-    
     # Find the appropriate renderer
     renderer = registry.get_renderer(outcome.prediction_event)
 
@@ -68,86 +78,141 @@ def render_result_card(context, outcome, user_tip=None, is_correct=None):
     template_name = renderer.get_result_template(outcome)
     card_context = renderer.get_result_context(outcome, user=context.get("active_user"))
 
-    # Get all users who predicted this event with their correctness and lock status
-    users_who_predicted = []
+    # Get users who predicted this event with their correctness and lock status.
+    # Curated events read the option pick counters (capped recent pickers);
+    # only free-selection events load every tip.
     event = outcome.prediction_event
+    picks = load_event_picks([event]).get(event.id)
+    if picks is not None:
+        users_who_predicted, pick_summary = _result_pickers_from_stats(outcome, picks)
+    else:
+        users_who_predicted = _result_pickers_from_tips(outcome)
+        pick_summary = {
+            "total": len(users_who_predicted),
+            "correct": sum(1 for entry in users_who_predicted if entry["is_correct"]),
+            "locked_correct": sum(
+                1 for entry in users_who_predicted if entry["is_correct"] and entry["was_locked"]
+            ),
+            "lost_lock": sum(1 for entry in users_who_predicted if entry["lost_lock"]),
+        }
+        pick_summary["wrong"] = pick_summary["total"] - pick_summary["correct"]
+
+    # Check if outcome was resolved in the last 24 hours
+    now = timezone.now()
+    twenty_four_hours_ago = now - timedelta(hours=24)
+    is_recent = outcome.resolved_at and outcome.resolved_at >= twenty_four_hours_ago
     
-    # Fetch all tips for this event
-    tips = UserTip.objects.filter(prediction_event=event).select_related('user')
-    
-    # Fetch all scores for this event to check lock bonuses
-    scores = {
-        score.user_id: score
-        for score in UserEventScore.objects.filter(prediction_event=event)
+    # Build render context
+    render_context = {
+        "outcome": outcome,
+        "event": outcome.prediction_event,
+        "user_tip": user_tip,
+        "is_correct": is_correct,
+        "active_user": context.get("active_user"),
+        "card_context": card_context,
+        "user_score": card_context.get("user_score"),  # Extract user_score from card_context
+        "palette": context.get("active_theme_palette"),
+        "users_who_predicted": users_who_predicted,
+        "pick_summary": pick_summary,
+        "is_recent": is_recent,
     }
-    
-    # Fetch display names from UserPreferences
+
+    return render_to_string(template_name, render_context, request=context.get("request"))
+
+
+def _display_name_map(user_ids):
+    """Map user ids to nicknames from UserPreferences (users without one are omitted)."""
     from ..models import UserPreferences
-    user_ids = [tip.user_id for tip in tips]
+
     display_name_map = {}
     if user_ids:
         for prefs in UserPreferences.objects.filter(user_id__in=user_ids):
             nickname = (prefs.nickname or '').strip()
             if nickname:
                 display_name_map[prefs.user_id] = nickname
-    
-    # Helper function to check if tip matches outcome (same logic as scoring_service)
-    def tip_matches_outcome(tip, outcome):
-        if outcome.winning_option_id:
-            if tip.prediction_option_id == outcome.winning_option_id:
-                return True
-            if tip.selected_option_id and outcome.winning_option and outcome.winning_option.option_id:
-                return tip.selected_option_id == outcome.winning_option.option_id
-            return False
-        if outcome.winning_generic_option_id:
-            return tip.selected_option_id == outcome.winning_generic_option_id
-        return False
-    
+    return display_name_map
+
+
+def _result_pickers_from_stats(outcome, picks):
+    """Build result card pickers and totals from the option pick counters."""
+    from django.contrib.auth import get_user_model
+
+    winning_ids = picks.winning_option_ids(outcome)
+    users = get_user_model().objects.in_bulk({picker.user_id for picker in picks.pickers})
+    display_name_map = _display_name_map(list(users))
+
+    users_who_predicted = []
+    for picker in sorted(picks.pickers, key=lambda p: users[p.user_id].username if p.user_id in users else ''):
+        user = users.get(picker.user_id)
+        if user is None:
+            continue
+        is_tip_correct = picker.option_id in winning_ids
+        user.display_name = display_name_map.get(user.id, user.username)
+        users_who_predicted.append({
+            'user': user,
+            'is_correct': is_tip_correct,
+            'was_locked': is_tip_correct and picker.locked,
+            'lost_lock': not is_tip_correct and picker.locked,
+        })
+
+    correct = sum(picks.option_counts[option_id][0] for option_id in winning_ids if option_id in picks.option_counts)
+    locked_correct = sum(
+        picks.option_counts[option_id][1] for option_id in winning_ids if option_id in picks.option_counts
+    )
+    pick_summary = {
+        "total": picks.tip_count,
+        "correct": correct,
+        "locked_correct": locked_correct,
+        "wrong": picks.tip_count - correct,
+        "lost_lock": picks.lock_count - locked_correct,
+    }
+    return users_who_predicted, pick_summary
+
+
+def _result_pickers_from_tips(outcome):
+    """Build result card pickers by loading every tip of the outcome's event."""
+    from ..models import UserTip, UserEventScore
+
+    event = outcome.prediction_event
+
+    # Fetch all tips for this event
+    tips = UserTip.objects.filter(prediction_event=event).select_related('user')
+
+    # Fetch all scores for this event to check lock bonuses
+    scores = {
+        score.user_id: score
+        for score in UserEventScore.objects.filter(prediction_event=event)
+    }
+
+    display_name_map = _display_name_map([tip.user_id for tip in tips])
+
     # Build list of users with their prediction status
+    users_who_predicted = []
     for tip in tips:
-        is_tip_correct = tip_matches_outcome(tip, outcome)
+        # Stored when the outcome was scored
+        is_tip_correct = tip.is_correct is True
         score = scores.get(tip.user_id)
         was_locked = False
         lost_lock = False
-        
+
         # Check if tip was locked (either via lock_status or is_lock_bonus in score)
         if tip.lock_status == UserTip.LockStatus.WAS_LOCKED:
             was_locked = True
         elif score and score.is_lock_bonus:
             was_locked = True
-        
+
         # Check if user lost a lock due to incorrect prediction
         if not is_tip_correct and tip.lock_status == UserTip.LockStatus.FORFEITED:
             lost_lock = True
-        
+
         # Apply display name
         user = tip.user
         user.display_name = display_name_map.get(user.id, user.username)
-        
+
         users_who_predicted.append({
             'user': user,
             'is_correct': is_tip_correct,
             'was_locked': was_locked,
             'lost_lock': lost_lock,
         })
-    
-    # Check if outcome was resolved in the last 24 hours
-    now = timezone.now()
-    twenty_four_hours_ago = now - timedelta(hours=24)
-    is_recent = outcome.resolved_at and outcome.resolved_at >= twenty_four_hours_ago
-    
-    # Build render context
-    render_context = {
-        "outcome": outcome,
-        "event": outcome.prediction_event,
-        "user_tip": user_tip,
-        "is_correct": is_correct,
-        "active_user": context.get("active_user"),
-        "card_context": card_context,
-        "user_score": card_context.get("user_score"),  # Extract user_score from card_context
-        "palette": context.get("active_theme_palette"),
-        "users_who_predicted": users_who_predicted,
-        "is_recent": is_recent,
-    }
-
-    return render_to_string(template_name, render_context, request=context.get("request"))
+    return users_who_predicted
@@ -21,6 +21,7 @@ from hooptipp.predictions.models import (
     PredictionOption,
     Option,
     OptionCategory,
+    ProcessingWatermark,
 )
 from django.contrib.auth import get_user_model
 
@@ -387,6 +388,61 @@ class AchievementCommandTests(TestCase):
             self.assertNotEqual(achievement.description, 'Old description')
             self.assertIn(self.season.name, achievement.description)
 
+    def test_reprocessing_keeps_unchanged_medals(self):
+        """Re-ranking a season keeps the id and award time of medals that did not change."""
+        call_command('process_achievements', stdout=StringIO())
+        before = dict(Achievement.objects.filter(season=self.season).values_list('id', 'awarded_at'))
+        self.assertEqual(len(before), 3)
+
+        call_command('process_achievements', '--force', stdout=StringIO())
+
+        after = dict(Achievement.objects.filter(season=self.season).values_list('id', 'awarded_at'))
+        self.assertEqual(after, before)
+
+    def test_process_achievements_skips_unchanged_seasons(self):
+        """Test that a second run does no work when nothing changed since the last run."""
+        call_command('process_achievements', stdout=StringIO())
+        self.assertTrue(
+            ProcessingWatermark.objects.filter(processor='season_achievements').exists()
+        )
+
+        # Medals removed out-of-band are not recreated because the season did not change
+        Achievement.objects.all().delete()
+        call_command('process_achievements', stdout=StringIO())
+        self.assertEqual(Achievement.objects.count(), 0)
+
+        # --force ignores the watermark
+        call_command('process_achievements', '--force', stdout=StringIO())
+        self.assertEqual(Achievement.objects.filter(season=self.season).count(), 3)
+
+    def test_process_achievements_reprocesses_season_after_score_change(self):
+        """Test that updated scores inside a completed season trigger re-ranking."""
+        call_command('process_achievements', stdout=StringIO())
+        ProcessingWatermark.objects.filter(processor='season_achievements').update(
+            processed_until=timezone.now() - timedelta(minutes=1)
+        )
+
+        # user4 overtakes everyone; save() bumps updated_at
+        score = UserEventScore.objects.get(user=self.user4)
+        score.points_awarded = 100
+        score.save()
+
+        call_command('process_achievements', stdout=StringIO())
+
+        golds = Achievement.objects.filter(
+            season=self.season,
+            achievement_type=Achievement.AchievementType.SEASON_GOLD,
+        )
+        self.assertEqual(list(golds.values_list('user', flat=True)), [self.user4.id])
+        # user3 dropped to fourth and loses the bronze medal
+        self.assertFalse(Achievement.objects.filter(user=self.user3, season=self.season).exists())
+        self.assertEqual(Achievement.objects.filter(season=self.season).count(), 3)
+
+    def test_process_achievements_dry_run_does_not_advance_watermark(self):
+        """Test that dry runs leave the watermark untouched."""
+        call_command('process_achievements', '--dry-run', stdout=StringIO())
+        self.assertFalse(ProcessingWatermark.objects.exists())
+
 
 class AchievementViewIntegrationTests(TestCase):
     """Test achievement integration in views."""
@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from hooptipp.predictions.event_feed import OPEN_PREDICTIONS_MIN, load_event_feed
+from hooptipp.predictions.models import EventOutcome, PredictionEvent, TipType
+
+
+class EventFeedTests(TestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        self.games = TipType.objects.create(
+            name='Weekly Games', slug='weekly-games', deadline=self.now + timedelta(days=7),
+        )
+        self.specials = TipType.objects.create(
+            name='Specials', slug='specials', deadline=self.now + timedelta(days=30),
+        )
+
+    def _event(self, tip_type, name, days, **kwargs):
+        return PredictionEvent.objects.create(
+            tip_type=tip_type,
+            name=name,
+            opens_at=self.now - timedelta(days=1),
+            deadline=self.now + timedelta(days=days, hours=1),
+            **kwargs,
+        )
+
+    def test_groups_events_by_tip_type_and_day(self):
+        game = self._event(self.games, 'Game', 1)
+        special = self._event(self.specials, 'Champion', 20)
+        self._event(self.games, 'Closed', -2)
+        self._event(self.games, 'Hidden', 1, is_active=False)
+
+        feed = load_event_feed(self.now)
+
+        self.assertEqual(
+            [(section['tip_type'], section['events']) for section in feed.sections],
+            [(self.games, [game]), (self.specials, [special])],
+        )
+        self.assertEqual(feed.visible_events, [game, special])
+        self.assertEqual(len(feed.weekday_slots), 7)
+        slot_ids = [event.id for slot in feed.weekday_slots for event in slot['events']]
+        self.assertEqual(slot_ids, [game.id])
+
+    def test_open_predictions_skip_resolved_and_fill_from_later_events(self):
+        resolved = self._event(self.games, 'Resolved', 1)
+        EventOutcome.objects.create(prediction_event=resolved, resolved_at=self.now)
+        this_week = self._event(self.games, 'This week', 2)
+        later = [self._event(self.specials, f'Later {index}', 10 + index) for index in range(6)]
+
+        feed = load_event_feed(self.now)
+
+        self.assertEqual(feed.open_predictions, [this_week, *later[:OPEN_PREDICTIONS_MIN - 1]])
+        self.assertIn(resolved, feed.visible_events)
+
+    def test_inactive_tip_type_events_only_appear_in_open_predictions(self):
+        self.specials.is_active = False
+        self.specials.save()
+        special = self._event(self.specials, 'Champion', 3)
+
+        feed = load_event_feed(self.now)
+
+        self.assertEqual(feed.sections, [])
+        self.assertEqual(feed.open_predictions, [special])
+
+    def test_query_count_is_independent_of_tip_types(self):
+        self._event(self.games, 'Game', 1)
+        with CaptureQueriesContext(connection) as baseline:
+            load_event_feed(self.now)
+
+        for index in range(5):
+            tip_type = TipType.objects.create(
+                name=f'Source {index}', slug=f'source-{index}', deadline=self.now + timedelta(days=index + 1),
+            )
+            self._event(tip_type, f'Event {index}', index + 1)
+        with CaptureQueriesContext(connection) as queries:
+            feed = load_event_feed(self.now)
+
+        self.assertEqual(len(feed.sections), 6)
+        self.assertEqual(len(queries), len(baseline))
@@ -1,4 +1,6 @@
 """Tests for Impressum, Datenschutz, and Teilnahmebedingungen features."""
+from unittest import mock
+
 from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
 
@@ -456,3 +458,63 @@ class TeilnahmebedingungenAPITests(TestCase):
         self.assertEqual(len(data['sections']), 1)
         self.assertEqual(data['sections'][0]['caption'], 'Public Section')
 
+
+
+class LegalSectionRenderingTests(TestCase):
+    """Tests for pre-rendered HTML and conditional responses of the legal APIs."""
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_html_is_rendered_on_save(self):
+        section = ImpressumSection.objects.create(caption='Test', text='**Bold**', order_number=0)
+
+        self.assertIn('<strong>Bold</strong>', section.text_html)
+
+        section.text = '*Changed*'
+        section.save(update_fields=['text'])
+        section.refresh_from_db()
+        self.assertIn('<em>Changed</em>', section.text_html)
+
+    def test_raw_html_is_escaped(self):
+        section = DatenschutzSection.objects.create(
+            caption='Test',
+            text='<script>alert(1)</script>',
+            order_number=0,
+        )
+
+        self.assertNotIn('<script>', section.text_html)
+
+    def test_api_does_not_render_markdown_per_request(self):
+        ImpressumSection.objects.create(caption='Test', text='**Bold**', order_number=0)
+
+        with mock.patch('hooptipp.predictions.markdown_rendering.markdown2.markdown') as render:
+            response = self.client.get('/api/impressum/')
+
+        self.assertEqual(response.status_code, 200)
+        render.assert_not_called()
+        self.assertIn('<strong>Bold</strong>', response.json()['sections'][0]['text_html'])
+
+    def test_etag_revalidation_returns_304(self):
+        TeilnahmebedingungenSection.objects.create(caption='Rules', text='Text', order_number=0)
+
+        response = self.client.get('/api/teilnahmebedingungen/')
+        self.assertTrue(response.has_header('ETag'))
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        revalidated = self.client.get(
+            '/api/teilnahmebedingungen/',
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_etag_changes_when_section_deleted(self):
+        ImpressumSection.objects.create(caption='A', text='A', order_number=0)
+        second = ImpressumSection.objects.create(caption='B', text='B', order_number=1)
+        etag = self.client.get('/api/impressum/')['ETag']
+
+        ImpressumSection.objects.filter(pk=second.pk).delete()
+        response = self.client.get('/api/impressum/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['sections']), 1)
@@ -0,0 +1,273 @@
+"""Tests for the leaderboard service and the cacheable leaderboard API."""
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from hooptipp.predictions.leaderboard_service import (
+    LeaderboardDivider,
+    _build_slice,
+    get_leaderboard,
+    get_leaderboard_slice,
+    window_leaderboard,
+)
+from hooptipp.predictions.models import (
+    HotnessKudos,
+    PredictionEvent,
+    PredictionOption,
+    Option,
+    OptionCategory,
+    Season,
+    SeasonParticipant,
+    TipType,
+    UserEventScore,
+    UserTip,
+)
+
+
+class LeaderboardAPITests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        today = timezone.localdate()
+        self.season = Season.objects.create(
+            name='Current',
+            start_date=today - timedelta(days=10),
+            end_date=today + timedelta(days=10),
+        )
+        self.users = [
+            User.objects.create_user(username=f'user{index}', password='pw12345678')
+            for index in range(8)
+        ]
+        for user in self.users:
+            SeasonParticipant.objects.create(user=user, season=self.season)
+
+        tip_type = TipType.objects.create(
+            name='Games', slug='games', deadline=timezone.now() + timedelta(days=1)
+        )
+        category = OptionCategory.objects.create(slug='teams', name='Teams')
+        option = Option.objects.create(category=category, slug='lal', name='Lakers')
+        self.event = PredictionEvent.objects.create(
+            tip_type=tip_type,
+            name='Game',
+            opens_at=timezone.now() - timedelta(days=2),
+            deadline=timezone.now() - timedelta(days=1),
+        )
+        self.prediction_option = PredictionOption.objects.create(
+            event=self.event, option=option, label='Lakers'
+        )
+        # user0 has the most points, user7 the fewest
+        for index, user in enumerate(self.users):
+            UserEventScore.objects.create(
+                user=user,
+                prediction_event=self.event,
+                base_points=1,
+                points_awarded=len(self.users) - index,
+            )
+
+        self.client.force_login(self.users[7])
+        self.url = reverse('predictions:leaderboard_api')
+
+    def test_returns_full_ranked_standings(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['season']['id'], self.season.id)
+        self.assertEqual(data['total'], 8)
+        self.assertEqual(data['viewer_rank'], 8)
+        self.assertEqual([row['rank'] for row in data['rows']], list(range(1, 9)))
+        self.assertEqual(data['rows'][0]['display_name'], 'user0')
+        self.assertTrue(data['rows'][7]['is_viewer'])
+        self.assertEqual(data['rows'][0]['locks']['available'], 3)
+
+    def test_window_returns_rank_one_divider_and_neighbours(self):
+        data = self.client.get(self.url, {'window': '1'}).json()
+
+        self.assertEqual(data['rows'][0]['rank'], 1)
+        self.assertEqual(data['rows'][1], {'divider': True})
+        self.assertEqual([row['rank'] for row in data['rows'][2:]], [4, 5, 6, 7, 8])
+
+    def test_etag_revalidation_returns_304(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+
+        revalidated = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_etag_changes_when_scores_change(self):
+        etag = self.client.get(self.url)['ETag']
+
+        score = UserEventScore.objects.get(user=self.users[7])
+        score.points_awarded = 100
+        score.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['viewer_rank'], 1)
+
+    def test_etag_changes_when_kudos_given(self):
+        etag = self.client.get(self.url)['ETag']
+
+        HotnessKudos.objects.create(from_user=self.users[7], to_user=self.users[0], season=self.season)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['rows'][0]['kudos_given'])
+        self.assertEqual(response.json()['rows'][0]['kudos_today'], 1)
+
+    def test_etag_changes_when_lock_committed(self):
+        etag = self.client.get(self.url)['ETag']
+
+        UserTip.objects.create(
+            user=self.users[0],
+            tip_type=self.event.tip_type,
+            prediction_event=self.event,
+            prediction_option=self.prediction_option,
+            prediction='Lakers',
+            is_locked=True,
+            lock_status=UserTip.LockStatus.ACTIVE,
+            lock_committed_at=timezone.now(),
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['rows'][0]['locks']['active'], 1)
+
+    def test_unknown_season_returns_404(self):
+        response = self.client.get(self.url, {'season': '9999'})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_past_season_can_be_requested(self):
+        past = Season.objects.create(
+            name='Past', start_date=date(2020, 1, 1), end_date=date(2020, 2, 1)
+        )
+        SeasonParticipant.objects.create(user=self.users[0], season=past)
+
+        data = self.client.get(self.url, {'season': str(past.id)}).json()
+
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['rows'][0]['total_points'], 0)
+
+
+class WindowLeaderboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.users = [
+            User.objects.create_user(username=f'user{index:02d}', password='pw12345678')
+            for index in range(10)
+        ]
+        self.rows = get_leaderboard(None)
+
+    def ranks(self, window):
+        return ['-' if isinstance(row, LeaderboardDivider) else row.rank for row in window]
+
+    def test_top_rows_when_viewer_near_top(self):
+        self.assertEqual(self.ranks(window_leaderboard(self.rows, self.users[4].id)), [1, 2, 3, 4, 5, 6])
+
+    def test_neighbours_when_viewer_in_middle(self):
+        self.assertEqual(self.ranks(window_leaderboard(self.rows, self.users[6].id)), [1, '-', 5, 6, 7, 8, 9])
+
+    def test_more_rows_above_when_viewer_last(self):
+        self.assertEqual(self.ranks(window_leaderboard(self.rows, self.users[9].id)), [1, '-', 6, 7, 8, 9, 10])
+
+    def test_viewer_row_is_a_copy(self):
+        window = window_leaderboard(self.rows, self.users[9].id)
+
+        self.assertTrue(window[-1].is_active_user)
+        self.assertFalse(self.rows[-1].is_active_user)
+
+
+class LeaderboardSliceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        today = timezone.localdate()
+        self.season = Season.objects.create(
+            name='Current', start_date=today - timedelta(days=10), end_date=today + timedelta(days=10),
+        )
+        tip_type = TipType.objects.create(name='Games', slug='games', deadline=timezone.now())
+        self.users = []
+        for index in range(12):
+            user = User.objects.create_user(username=f'user{index:02d}', password='pw12345678')
+            SeasonParticipant.objects.create(user=user, season=self.season)
+            event = PredictionEvent.objects.create(
+                tip_type=tip_type,
+                name=f'Game {index}',
+                opens_at=timezone.now() - timedelta(days=2),
+                deadline=timezone.now() - timedelta(days=1),
+            )
+            UserEventScore.objects.create(
+                user=user, prediction_event=event, base_points=1, points_awarded=20 - index,
+            )
+            self.users.append(user)
+        # Not enrolled: never ranked in the season
+        User.objects.create_user(username='outsider', password='pw12345678')
+
+    def summary(self, rows):
+        return [
+            '-' if isinstance(row, LeaderboardDivider) else (row.rank, row.id, row.total_points, row.is_active_user)
+            for row in rows
+        ]
+
+    def test_slice_matches_window_of_full_standings(self):
+        full = get_leaderboard(self.season)
+        for user in [None, *self.users]:
+            viewer_id = user.id if user else None
+            with self.subTest(viewer=viewer_id):
+                # Rank in the database rather than windowing the cached standings
+                cache.clear()
+                leaderboard_slice = get_leaderboard_slice(self.season, viewer_id)
+                self.assertEqual(
+                    self.summary(leaderboard_slice.rows),
+                    self.summary(window_leaderboard(full, viewer_id)),
+                )
+                self.assertEqual(leaderboard_slice.total, 12)
+
+    def test_viewer_rank_and_ties(self):
+        UserEventScore.objects.filter(user=self.users[5]).update(points_awarded=20)
+
+        leaderboard_slice = get_leaderboard_slice(self.season, self.users[5].id)
+
+        # Equal points and events: the username decides
+        self.assertEqual(leaderboard_slice.viewer_rank, 2)
+        self.assertEqual(get_leaderboard_slice(self.season, self.users[11].id).viewer_rank, 12)
+        outsider = get_user_model().objects.get(username='outsider')
+        self.assertIsNone(get_leaderboard_slice(self.season, outsider.id).viewer_rank)
+
+    def test_query_count_is_independent_of_users(self):
+        now = timezone.now()
+        _build_slice(self.season, self.users[-1].id, size=6, now=now)  # warm the settings caches
+        with CaptureQueriesContext(connection) as baseline:
+            _build_slice(self.season, self.users[-1].id, size=6, now=now)
+
+        for index in range(20):
+            user = get_user_model().objects.create_user(username=f'late{index:02d}', password='pw12345678')
+            SeasonParticipant.objects.create(user=user, season=self.season)
+        with CaptureQueriesContext(connection) as queries:
+            leaderboard_slice = _build_slice(self.season, self.users[-1].id, size=6, now=now)
+
+        self.assertEqual(len(leaderboard_slice.rows), 7)
+        self.assertEqual(len(queries), len(baseline))
+
+    def test_slice_is_cached_until_the_standings_change(self):
+        viewer_id = self.users[-1].id
+        first = get_leaderboard_slice(self.season, viewer_id)
+        with self.assertNumQueries(1):
+            # Only the standings version; the rows come from the cache
+            self.assertEqual(self.summary(get_leaderboard_slice(self.season, viewer_id).rows), self.summary(first.rows))
+
+        score = UserEventScore.objects.get(user=self.users[-1])
+        score.points_awarded = 50
+        score.save()
+
+        self.assertEqual(get_leaderboard_slice(self.season, viewer_id).viewer_rank, 1)
@@ -0,0 +1,119 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from hooptipp.nba.option_sync import OptionUpserter
+from hooptipp.predictions.models import Option, OptionCategory
+from hooptipp.predictions.option_choices import (
+    OptionChoice,
+    OptionSearchIndex,
+    get_option_choices,
+    search_option_choices,
+)
+
+
+class OptionChoicesTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.players = OptionCategory.objects.create(slug='nba-players', name='NBA Players')
+        self.lebron = Option.objects.create(
+            category=self.players,
+            slug='lebron-james',
+            name='LeBron James',
+            short_name='',
+            metadata={'team_abbreviation': 'LAL', 'position': 'F'},
+        )
+        self.luka = Option.objects.create(
+            category=self.players,
+            slug='luka-doncic',
+            name='Luka Dončić',
+            metadata={'team_abbreviation': 'LAL'},
+        )
+        self.tatum = Option.objects.create(
+            category=self.players,
+            slug='jayson-tatum',
+            name='Jayson Tatum',
+            metadata={'team_abbreviation': 'BOS'},
+        )
+        Option.objects.create(category=self.players, slug='retired', name='Larry Bird', is_active=False)
+
+    def test_choices_are_compact_and_cached(self):
+        choices = get_option_choices('nba-players')
+
+        self.assertIn(OptionChoice(id=self.lebron.id, name='LeBron James', short_name='', team='LAL'), choices)
+        self.assertEqual(len(choices), 3)
+        with self.assertNumQueries(2):
+            # The category slug lookup and the version; the list comes from the cache
+            self.assertEqual(get_option_choices('nba-players'), choices)
+        with self.assertNumQueries(1):
+            get_option_choices(self.players)
+
+    def test_option_save_invalidates_choices(self):
+        get_option_choices(self.players)
+
+        self.tatum.name = 'Jayson Christopher Tatum'
+        self.tatum.save()
+        Option.objects.filter(pk=self.luka.pk).get().delete()
+
+        names = [choice.name for choice in get_option_choices(self.players)]
+        self.assertIn('Jayson Christopher Tatum', names)
+        self.assertNotIn('Luka Dončić', names)
+
+    def test_bulk_sync_invalidates_choices(self):
+        get_option_choices(self.players)
+
+        upserter = OptionUpserter(self.players)
+        upserter.add('99', {
+            'slug': 'new-player', 'name': 'New Player', 'short_name': '', 'description': '',
+            'metadata': {}, 'is_active': True, 'sort_order': 0,
+        })
+        upserter.flush()
+
+        self.assertIn('New Player', [choice.name for choice in get_option_choices(self.players)])
+
+    def test_writes_without_signals_change_the_version(self):
+        get_option_choices(self.players)
+
+        # Another process's bulk write leaves this process's cache untouched
+        Option.objects.bulk_create([Option(category=self.players, slug='rookie', name='Rookie Player')])
+        self.assertIn('Rookie Player', [choice.name for choice in get_option_choices(self.players)])
+
+        Option.objects.filter(slug='rookie').update(name='Renamed Rookie', updated_at=timezone.now())
+        names = [choice.name for choice in get_option_choices(self.players)]
+        self.assertIn('Renamed Rookie', names)
+        self.assertNotIn('Rookie Player', names)
+        self.assertEqual([c.name for c in search_option_choices(self.players, 'renam')], ['Renamed Rookie'])
+
+    def test_search_matches_word_prefixes_and_accents(self):
+        self.assertEqual([c.id for c in search_option_choices(self.players, 'leb')], [self.lebron.id])
+        self.assertEqual([c.id for c in search_option_choices(self.players, 'james')], [self.lebron.id])
+        self.assertEqual([c.id for c in search_option_choices(self.players, 'donc')], [self.luka.id])
+        self.assertEqual(search_option_choices(self.players, 'bird'), [])
+
+    def test_search_falls_back_to_trigrams(self):
+        results = search_option_choices(self.players, 'jaysn tatm')
+
+        self.assertEqual(results[0].id, self.tatum.id)
+
+    def test_search_index_ranks_full_name_prefix_first(self):
+        index = OptionSearchIndex([
+            OptionChoice(id=1, name='Anthony Davis', short_name='', team='LAL'),
+            OptionChoice(id=2, name='Davis Bertans', short_name='', team='CHA'),
+        ])
+
+        self.assertEqual([choice.id for choice in index.search('davis')], [2, 1])
+
+    def test_search_endpoint(self):
+        response = self.client.get(reverse('predictions:option_search'), {'category': 'nba-players', 'q': 'tat'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{'id': self.tatum.id, 'name': 'Jayson Tatum', 'short_name': '', 'team': 'BOS'}],
+        )
+
+    def test_search_endpoint_unknown_category(self):
+        response = self.client.get(reverse('predictions:option_search'), {'category': 'nope', 'q': 'a'})
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,168 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from hooptipp.predictions.lock_service import LockService
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    TipType,
+    UserTip,
+)
+from hooptipp.predictions.pick_stats import (
+    RECENT_PICKERS_LIMIT,
+    load_event_picks,
+    rebuild_pick_stats,
+)
+
+
+class PickStatsTests(TestCase):
+    def setUp(self) -> None:
+        self.user_model = get_user_model()
+        self.alice = self.user_model.objects.create_user(username='alice', password='pw')
+        self.bob = self.user_model.objects.create_user(username='bob', password='pw')
+        teams = OptionCategory.objects.create(slug='nba-teams', name='NBA Teams')
+        self.lakers = Option.objects.create(category=teams, slug='lal', name='Los Angeles Lakers')
+        self.celtics = Option.objects.create(category=teams, slug='bos', name='Boston Celtics')
+        self.tip_type = TipType.objects.create(
+            name='Weekly Games',
+            slug='weekly-games',
+            deadline=timezone.now() + timedelta(days=1),
+        )
+        self.event = PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name='BOS @ LAL',
+            opens_at=timezone.now() - timedelta(hours=2),
+            deadline=timezone.now() + timedelta(hours=2),
+        )
+        self.lakers_option = PredictionOption.objects.create(event=self.event, label='Lakers', option=self.lakers)
+        self.celtics_option = PredictionOption.objects.create(event=self.event, label='Celtics', option=self.celtics)
+
+    def _tip(self, user, option):
+        return UserTip.objects.create(
+            user=user,
+            tip_type=self.tip_type,
+            prediction_event=self.event,
+            prediction_option=option,
+            selected_option=option.option,
+            prediction=option.label,
+        )
+
+    def _stats(self, option):
+        option.refresh_from_db()
+        return option.tip_count, option.lock_count, option.recent_pickers
+
+    def test_new_tips_are_counted(self):
+        self._tip(self.alice, self.lakers_option)
+        self._tip(self.bob, self.lakers_option)
+
+        self.assertEqual(
+            self._stats(self.lakers_option),
+            (2, 0, [[self.bob.id, False], [self.alice.id, False]]),
+        )
+        self.assertEqual(self._stats(self.celtics_option), (0, 0, []))
+
+    def test_changing_pick_moves_the_count(self):
+        self._tip(self.alice, self.lakers_option)
+        tip = UserTip.objects.get(user=self.alice)
+
+        tip.prediction_option = self.celtics_option
+        tip.selected_option = self.celtics
+        tip.save()
+
+        self.assertEqual(self._stats(self.lakers_option), (0, 0, []))
+        self.assertEqual(self._stats(self.celtics_option), (1, 0, [[self.alice.id, False]]))
+
+    def test_lock_toggle_updates_lock_count(self):
+        tip = self._tip(self.alice, self.lakers_option)
+        service = LockService(self.alice)
+
+        service.ensure_locked(tip)
+        self.assertEqual(self._stats(self.lakers_option), (1, 1, [[self.alice.id, True]]))
+
+        service.release_lock(tip)
+        self.assertEqual(self._stats(self.lakers_option), (1, 0, [[self.alice.id, False]]))
+
+    def test_deleting_tip_removes_it(self):
+        tip = self._tip(self.alice, self.lakers_option)
+        self._tip(self.bob, self.lakers_option)
+
+        tip.delete()
+
+        self.assertEqual(self._stats(self.lakers_option), (1, 0, [[self.bob.id, False]]))
+
+    def test_recent_pickers_are_capped(self):
+        for index in range(RECENT_PICKERS_LIMIT + 2):
+            user = self.user_model.objects.create_user(username=f'user{index}', password='pw')
+            self._tip(user, self.celtics_option)
+
+        tip_count, _, recent = self._stats(self.celtics_option)
+        self.assertEqual(tip_count, RECENT_PICKERS_LIMIT + 2)
+        self.assertEqual(len(recent), RECENT_PICKERS_LIMIT)
+
+    def test_rebuild_repairs_bulk_created_tips(self):
+        UserTip.objects.bulk_create([
+            UserTip(
+                user=self.alice,
+                tip_type=self.tip_type,
+                prediction_event=self.event,
+                prediction_option=self.lakers_option,
+                selected_option=self.lakers,
+                prediction='Lakers',
+                lock_status=UserTip.LockStatus.ACTIVE,
+                is_locked=True,
+            ),
+        ])
+        self.assertEqual(self._stats(self.lakers_option), (0, 0, []))
+
+        out = StringIO()
+        call_command('rebuild_pick_stats', stdout=out)
+
+        self.assertIn('Rebuilt pick statistics for 1 options', out.getvalue())
+        self.assertEqual(self._stats(self.lakers_option), (1, 1, [[self.alice.id, True]]))
+        self.assertEqual(rebuild_pick_stats(), 0)
+
+    def test_load_event_picks_summarises_options(self):
+        self._tip(self.alice, self.lakers_option)
+        self._tip(self.bob, self.celtics_option)
+
+        picks = load_event_picks([self.event])[self.event.id]
+
+        self.assertEqual(picks.tip_count, 2)
+        self.assertEqual(picks.option_share(self.lakers_option.id), 50)
+        self.assertEqual({picker.user_id for picker in picks.pickers}, {self.alice.id, self.bob.id})
+
+    def test_result_card_reads_counters(self):
+        self._tip(self.alice, self.lakers_option)
+        self._tip(self.bob, self.celtics_option)
+        outcome = EventOutcome.objects.create(
+            prediction_event=self.event,
+            winning_option=self.lakers_option,
+            winning_generic_option=self.lakers,
+            resolved_at=timezone.now(),
+        )
+
+        with self.assertNumQueries(3):
+            # Option counters, picker users and their nicknames
+            users_who_predicted = self._result_pickers(outcome)
+
+        self.assertEqual(
+            [(entry['user'].username, entry['is_correct']) for entry in users_who_predicted],
+            [('alice', True), ('bob', False)],
+        )
+
+    def _result_pickers(self, outcome):
+        from hooptipp.predictions.templatetags import prediction_extras
+
+        picks = load_event_picks([self.event])[self.event.id]
+        users_who_predicted, summary = prediction_extras._result_pickers_from_stats(outcome, picks)
+        self.assertEqual(summary['correct'], 1)
+        self.assertEqual(summary['wrong'], 1)
+        return users_who_predicted
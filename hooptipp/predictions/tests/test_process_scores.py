@@ -413,9 +413,10 @@ class ProcessScoresCommandTest(TestCase):
     def test_error_handling(self):
         """Test that errors are handled gracefully."""
         # Mock the scoring service to raise an exception
-        with patch('hooptipp.predictions.management.commands.process_scores.transaction.atomic') as mock_atomic:
-            mock_atomic.side_effect = Exception('Database Error')
-            
+        with patch(
+            'hooptipp.predictions.management.commands.process_scores.process_all_user_scores',
+            side_effect=Exception('Database Error'),
+        ):
             # Should raise CommandError
             with self.assertRaises(CommandError):
                 call_command('process_scores')
@@ -0,0 +1,164 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image, ImageFile
+
+from hooptipp.predictions import profile_pictures
+from hooptipp.predictions.leaderboard_service import build_leaderboard
+from hooptipp.predictions.models import UserPreferences
+from hooptipp.predictions.profile_pictures import (
+    AVATAR_SIZES,
+    get_avatar,
+    pending_profile_pictures,
+    process_profile_picture,
+    variant_name,
+)
+
+
+def make_upload(color='red', size=(300, 300), name='avatar.png'):
+    buffer = BytesIO()
+    Image.new('RGBA', size, color).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+class ProfilePicturePipelineTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = get_user_model().objects.create_user(username='picture-user', password='pw')
+        self.preferences = UserPreferences.objects.create(user=self.user, profile_picture=make_upload())
+
+    def test_upload_is_hashed_without_processing(self):
+        self.assertEqual(len(self.preferences.profile_picture_hash), 64)
+        self.assertEqual(self.preferences.avatar_hash, '')
+        self.assertIn(self.preferences, pending_profile_pictures())
+
+        # The original file is left untouched during the request
+        with Image.open(self.preferences.profile_picture.path) as image:
+            self.assertEqual(image.size, (300, 300))
+
+    def test_processing_writes_all_variants(self):
+        result = process_profile_picture(self.preferences)
+
+        self.assertTrue(result.processed)
+        self.assertIsNone(result.error)
+        content_hash = self.preferences.profile_picture_hash
+        for size in AVATAR_SIZES:
+            for extension, pil_format in (('jpg', 'JPEG'), ('webp', 'WEBP')):
+                name = variant_name(content_hash, size, extension)
+                self.assertTrue(default_storage.exists(name), name)
+                with default_storage.open(name) as stored, Image.open(stored) as image:
+                    self.assertEqual(image.size, (size, size))
+                    self.assertEqual(image.format, pil_format)
+
+        self.preferences.refresh_from_db()
+        self.assertEqual(self.preferences.avatar_hash, content_hash)
+        self.assertNotIn(self.preferences, pending_profile_pictures())
+
+    def test_source_is_decoded_once_for_all_variants(self):
+        with mock.patch.object(profile_pictures.Image, 'open', wraps=Image.open) as image_open:
+            process_profile_picture(self.preferences)
+
+        self.assertEqual(image_open.call_count, 1)
+
+    def test_unchanged_content_is_not_reprocessed(self):
+        process_profile_picture(self.preferences)
+
+        with mock.patch.object(profile_pictures, 'render_variants') as render:
+            result = process_profile_picture(self.preferences)
+        self.assertFalse(result.processed)
+        render.assert_not_called()
+
+        # Saving other preferences keeps the hashes
+        self.preferences.theme = 'golden-state-warriors'
+        self.preferences.save()
+        self.preferences.refresh_from_db()
+        self.assertEqual(self.preferences.avatar_hash, self.preferences.profile_picture_hash)
+
+    def test_identical_upload_reuses_existing_variants(self):
+        process_profile_picture(self.preferences)
+        other_user = get_user_model().objects.create_user(username='same-picture', password='pw')
+        other = UserPreferences.objects.create(user=other_user, profile_picture=make_upload(name='copy.png'))
+
+        with mock.patch.object(profile_pictures, 'render_variants') as render:
+            result = process_profile_picture(other)
+        render.assert_not_called()
+        self.assertTrue(result.processed)
+        self.assertEqual(other.avatar_hash, self.preferences.profile_picture_hash)
+
+    def test_new_upload_changes_hash(self):
+        process_profile_picture(self.preferences)
+        old_hash = self.preferences.avatar_hash
+
+        self.preferences.profile_picture = make_upload(color='blue')
+        self.preferences.save()
+
+        self.assertNotEqual(self.preferences.profile_picture_hash, old_hash)
+        self.assertEqual(self.preferences.avatar_hash, old_hash)
+        self.assertIn(self.preferences, pending_profile_pictures())
+
+    def test_clearing_picture_clears_hashes(self):
+        process_profile_picture(self.preferences)
+
+        self.preferences.profile_picture = None
+        self.preferences.save()
+
+        self.assertEqual(self.preferences.profile_picture_hash, '')
+        self.assertEqual(self.preferences.avatar_hash, '')
+
+    def test_management_command_processes_pending_pictures(self):
+        out = StringIO()
+        call_command('process_profile_pictures', stdout=out)
+        self.assertIn('Processed 1 profile picture(s), 0 error(s)', out.getvalue())
+
+        out = StringIO()
+        call_command('process_profile_pictures', stdout=out)
+        self.assertIn('No profile pictures need processing', out.getvalue())
+
+    def test_management_command_dry_run(self):
+        out = StringIO()
+        call_command('process_profile_pictures', '--dry-run', stdout=out)
+
+        self.assertIn('Would process picture-user', out.getvalue())
+        self.preferences.refresh_from_db()
+        self.assertEqual(self.preferences.avatar_hash, '')
+
+    def test_leaderboard_serves_avatar_at_displayed_size(self):
+        self.assertIsNone(build_leaderboard(None)[0].avatar)
+
+        process_profile_picture(self.preferences)
+        row = build_leaderboard(None)[0]
+        content_hash = self.preferences.avatar_hash
+
+        self.assertEqual(row.avatar, get_avatar(content_hash, 32))
+        self.assertTrue(row.avatar.webp.endswith(f'{content_hash}-32.webp'))
+        self.assertTrue(row.avatar.jpeg_2x.endswith(f'{content_hash}-64.jpg'))
+        self.assertEqual(row.as_dict()['avatar']['size'], 32)
+
+    def test_avatar_has_no_webp_urls_without_webp_support(self):
+        with mock.patch.object(profile_pictures.features, 'check', return_value=False):
+            process_profile_picture(self.preferences)
+            avatar = get_avatar(self.preferences.avatar_hash, 32)
+
+        self.assertEqual((avatar.webp, avatar.webp_2x), ('', ''))
+        self.assertTrue(default_storage.exists(avatar.jpeg.removeprefix(default_storage.base_url)))
+        self.assertFalse(default_storage.exists(variant_name(self.preferences.avatar_hash, 32, 'webp')))
+
+    def test_square_validation_does_not_decode_the_upload(self):
+        other = get_user_model().objects.create_user(username='other-user', password='pw')
+        with mock.patch.object(ImageFile.ImageFile, 'load', side_effect=AssertionError('decoded')):
+            UserPreferences(user=other, profile_picture=make_upload()).full_clean()
+            with self.assertRaisesMessage(ValidationError, 'Image must be square (1:1 ratio). Current dimensions: 300x200.'):
+                UserPreferences(user=other, profile_picture=make_upload(size=(300, 200))).full_clean()
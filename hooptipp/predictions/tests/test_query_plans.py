@@ -0,0 +1,117 @@
+"""EXPLAIN-based regression checks for the hot query shapes.
+
+Every entry of :data:`HOT_QUERIES` builds its queryset with the function the
+app itself uses on each page view or scoring pass, so the check follows the
+queries as they change. The test builds the synthetic league, captures the
+plan of each query and fails when a listed table is read with a sequential
+scan, i.e. when a change to the query or the indexes leaves it without a
+usable index. On PostgreSQL sequential scans are disabled for the check, so
+the plan shows whether an index *can* serve the query regardless of the
+table size.
+"""
+
+import re
+from typing import Callable, Dict, List, NamedTuple
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from hooptipp.demo.synthetic import generate_synthetic_league
+from hooptipp.predictions.leaderboard_service import (
+    kudos_given_today,
+    kudos_received_today,
+    recent_points_by_user,
+)
+from hooptipp.predictions.lock_service import expired_forfeits, pending_forfeit_counts
+from hooptipp.predictions.management.commands.process_achievements import season_point_totals
+from hooptipp.predictions.models import Season
+from hooptipp.predictions.views import _recent_scores, _recently_resolved_outcomes, _user_scores
+
+
+class HotQuery(NamedTuple):
+    build: Callable[[dict], object]
+    tables: List[str]
+
+
+HOT_QUERIES: Dict[str, HotQuery] = {
+    # LockService.refresh
+    'lock_refresh_expired': HotQuery(
+        lambda ctx: expired_forfeits(ctx['user'], ctx['now']),
+        ['predictions_usertip'],
+    ),
+    # lock_service.get_lock_summaries (leaderboard rows)
+    'lock_summaries_pending': HotQuery(
+        lambda ctx: pending_forfeit_counts(ctx['user_ids'], now=ctx['now'], active_season=ctx['season']),
+        ['predictions_usertip'],
+    ),
+    # home
+    'recent_scores': HotQuery(
+        lambda ctx: _recent_scores(_user_scores(ctx['user'], ctx['season'])),
+        ['predictions_usereventscore'],
+    ),
+    'recent_outcomes': HotQuery(lambda ctx: _recently_resolved_outcomes(), ['predictions_eventoutcome']),
+    # leaderboard_service._build_rows
+    'leaderboard_recent_points': HotQuery(
+        lambda ctx: recent_points_by_user(ctx['user_ids'], ctx['season'], now=ctx['now']),
+        ['predictions_usereventscore'],
+    ),
+    'kudos_received_today': HotQuery(
+        lambda ctx: kudos_received_today(ctx['user_ids'], now=ctx['now']),
+        ['predictions_hotnesskudos'],
+    ),
+    # leaderboard_service.get_kudos_given_today
+    'kudos_given_today': HotQuery(
+        lambda ctx: kudos_given_today(ctx['user'], ctx['user_ids'], now=ctx['now']),
+        ['predictions_hotnesskudos'],
+    ),
+    # process_achievements
+    'season_totals': HotQuery(lambda ctx: season_point_totals(ctx['season']), ['predictions_usereventscore']),
+}
+
+
+def sequential_scans(plan: str, tables: List[str]) -> List[str]:
+    """Return the plan lines that read one of ``tables`` without an index."""
+
+    if connection.vendor == 'postgresql':
+        patterns = [re.compile(rf'Seq Scan on {table}\b') for table in tables]
+    else:
+        # SQLite: "SCAN <table>" without "USING [COVERING] INDEX"
+        patterns = [re.compile(rf'\bSCAN (TABLE )?{table}\b(?!.*USING)') for table in tables]
+    return [line.strip() for line in plan.splitlines() if any(p.search(line) for p in patterns)]
+
+
+def explain(queryset) -> str:
+    """Capture the plan of ``queryset`` (sequential scans disabled on PostgreSQL)."""
+
+    if connection.vendor != 'postgresql':
+        return queryset.explain()
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        return queryset.explain()
+
+
+class HotQueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        generate_synthetic_league(users=20, events=30)
+
+    def setUp(self) -> None:
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest(f'No plan checks for {connection.vendor}')
+        now = timezone.now()
+        user_ids = list(get_user_model().objects.order_by('id').values_list('id', flat=True)[:10])
+        self.context = {
+            'now': now,
+            'user': get_user_model().objects.get(pk=user_ids[0]),
+            'user_ids': user_ids,
+            'season': Season.get_active_season(now),
+        }
+
+    def test_hot_queries_use_indexes(self):
+        for name, hot_query in HOT_QUERIES.items():
+            with self.subTest(query=name):
+                plan = explain(hot_query.build(self.context))
+                self.assertEqual(sequential_scans(plan, hot_query.tables), [], f'{name} plan:\n{plan}')
@@ -0,0 +1,175 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from hooptipp.jobs import run_next
+from hooptipp.models import Job
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    TipType,
+    UserEventScore,
+    UserTip,
+)
+from hooptipp.predictions.scoring_queue import (
+    SCORING_JOB,
+    enqueue_scoring_job,
+    score_pending_outcomes,
+    scoring_batch,
+)
+from hooptipp.predictions.scoring_service import claim_outcome, release_outcome
+
+
+@override_settings(SCORING_QUEUE_ENABLED=True)
+class ScoringQueueTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(username='alice', password='pw')
+        self.teams = OptionCategory.objects.create(slug='nba-teams', name='NBA Teams')
+        self.lakers = Option.objects.create(category=self.teams, slug='lal', name='Los Angeles Lakers')
+        self.celtics = Option.objects.create(category=self.teams, slug='bos', name='Boston Celtics')
+        self.tip_type = TipType.objects.create(
+            name='Weekly Games',
+            slug='weekly-games',
+            deadline=timezone.now() + timedelta(days=1),
+        )
+
+    def _event(self, index):
+        event = PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name=f'BOS @ LAL {index}',
+            points=2,
+            opens_at=timezone.now() - timedelta(hours=2),
+            deadline=timezone.now() - timedelta(hours=1),
+        )
+        lakers = PredictionOption.objects.create(event=event, label='Lakers', option=self.lakers)
+        celtics = PredictionOption.objects.create(event=event, label='Celtics', option=self.celtics)
+        UserTip.objects.create(
+            user=self.user,
+            tip_type=self.tip_type,
+            prediction_event=event,
+            prediction_option=lakers,
+            selected_option=self.lakers,
+            prediction='Lakers',
+        )
+        return event, lakers, celtics
+
+    def _create_outcome(self, event, option):
+        return EventOutcome.objects.create(
+            prediction_event=event,
+            winning_option=option,
+            winning_generic_option=option.option,
+            resolved_at=timezone.now(),
+        )
+
+    def test_batch_of_outcomes_queues_one_debounced_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(10):
+                event, lakers, _ = self._event(index)
+                self._create_outcome(event, lakers)
+
+        job = Job.objects.get()
+        self.assertEqual(job.name, SCORING_JOB)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertEqual(EventOutcome.objects.filter(score_requested_at__isnull=False).count(), 10)
+
+        result = score_pending_outcomes()
+
+        self.assertEqual(result.scored, 10)
+        self.assertEqual(UserEventScore.objects.count(), 10)
+        self.assertFalse(EventOutcome.objects.filter(score_requested_at__isnull=False).exists())
+
+    @override_settings(SCORING_DEBOUNCE_SECONDS=0)
+    def test_winner_change_rescores_outcome(self):
+        event, lakers, celtics = self._event(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            outcome = self._create_outcome(event, lakers)
+        run_next('worker-1')
+        self.assertEqual(UserEventScore.objects.get().points_awarded, 2)
+
+        outcome = EventOutcome.objects.get(pk=outcome.pk)
+        outcome.winning_option = celtics
+        outcome.winning_generic_option = self.celtics
+        with self.captureOnCommitCallbacks(execute=True):
+            outcome.save()
+        run_next('worker-1')
+
+        self.assertFalse(UserEventScore.objects.exists())
+        outcome.refresh_from_db()
+        self.assertIsNone(outcome.score_requested_at)
+
+    def test_unchanged_winner_does_not_request_scoring(self):
+        event, lakers, _ = self._event(1)
+        outcome = self._create_outcome(event, lakers)
+        score_pending_outcomes()
+
+        outcome = EventOutcome.objects.get(pk=outcome.pk)
+        outcome.notes = 'Checked'
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            outcome.save()
+
+        self.assertNotIn(enqueue_scoring_job, callbacks)
+        outcome.refresh_from_db()
+        self.assertIsNone(outcome.score_requested_at)
+
+    @override_settings(SCORING_QUEUE_ENABLED=False)
+    def test_without_queue_outcomes_are_scored_after_commit(self):
+        event, lakers, _ = self._event(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            outcome = self._create_outcome(event, lakers)
+
+        self.assertFalse(Job.objects.exists())
+        self.assertEqual(UserEventScore.objects.get().points_awarded, 2)
+        outcome.refresh_from_db()
+        self.assertIsNotNone(outcome.scored_at)
+        self.assertIsNone(outcome.score_requested_at)
+
+    @override_settings(SCORING_QUEUE_ENABLED=False)
+    def test_without_queue_a_batch_is_scored_once_at_its_end(self):
+        events = [self._event(index) for index in range(3)]
+        with mock.patch(
+            'hooptipp.predictions.scoring_queue.score_pending_outcomes',
+            wraps=score_pending_outcomes,
+        ) as score, self.captureOnCommitCallbacks(execute=True):
+            with scoring_batch():
+                for event, lakers, _ in events:
+                    # One transaction per outcome, like the sync commands
+                    with transaction.atomic():
+                        self._create_outcome(event, lakers)
+                score.assert_not_called()
+
+        score.assert_called_once()
+        self.assertEqual(UserEventScore.objects.count(), 3)
+        self.assertFalse(EventOutcome.objects.filter(score_requested_at__isnull=False).exists())
+
+    def test_direct_scoring_clears_pending_request(self):
+        from hooptipp.predictions.scoring_service import score_event_outcome
+
+        event, lakers, _ = self._event(1)
+        outcome = self._create_outcome(event, lakers)
+
+        score_event_outcome(outcome)
+
+        outcome.refresh_from_db()
+        self.assertIsNone(outcome.score_requested_at)
+        self.assertEqual(score_pending_outcomes().scored, 0)
+
+    def test_outcome_leased_elsewhere_stays_pending(self):
+        event, lakers, _ = self._event(0)
+        outcome = self._create_outcome(event, lakers)
+        claim_outcome(outcome.pk, 'process_scores')
+
+        result = score_pending_outcomes()
+
+        self.assertEqual((result.scored, result.busy), (0, 1))
+        self.assertTrue(EventOutcome.objects.filter(pk=outcome.pk, score_requested_at__isnull=False).exists())
+        self.assertTrue(Job.objects.filter(name=SCORING_JOB).exists())
+
+        release_outcome(outcome.pk, 'process_scores')
+        self.assertEqual(score_pending_outcomes().scored, 1)
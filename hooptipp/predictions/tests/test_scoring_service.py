@@ -1,6 +1,8 @@
 from datetime import timedelta
+from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
 from django.utils import timezone
 
@@ -12,9 +14,21 @@ from hooptipp.predictions.models import (
     PredictionOption,
     TipType,
     UserEventScore,
+    UserHotness,
     UserTip,
 )
-from hooptipp.predictions.scoring_service import LOCK_MULTIPLIER, score_event_outcome, process_all_user_scores
+from hooptipp.predictions import scoring_service
+from hooptipp.predictions.scoring_service import (
+    FORFEIT_SCORE_ERROR,
+    LOCK_MULTIPLIER,
+    ScoringLeaseError,
+    _scoring_workers,
+    claim_outcome,
+    process_all_user_scores,
+    release_outcome,
+    renew_outcome,
+    score_event_outcome,
+)
 
 
 class ScoreEventOutcomeTests(TestCase):
@@ -1089,3 +1103,155 @@ class ForfeitedMatchTests(TestCase):
         self.assertEqual(tip.lock_status, UserTip.LockStatus.NONE)
         self.assertIsNotNone(tip.lock_released_at)
         self.assertIsNone(tip.lock_releases_at)  # No scheduled forfeit return
+
+
+class ScoringLeaseTests(TestCase):
+    def setUp(self) -> None:
+        now = timezone.now()
+        category = OptionCategory.objects.create(slug='nba-teams', name='NBA Teams')
+        lakers = Option.objects.create(category=category, slug='lal', name='Los Angeles Lakers')
+        tip_type = TipType.objects.create(name='Weekly Games', slug='weekly-games', deadline=now)
+        self.event = PredictionEvent.objects.create(
+            tip_type=tip_type,
+            name='BOS @ LAL',
+            points=3,
+            opens_at=now - timedelta(days=1),
+            deadline=now - timedelta(hours=1),
+        )
+        choice = PredictionOption.objects.create(event=self.event, label='Lakers', option=lakers)
+        self.user = get_user_model().objects.create_user('alice', 'alice@example.com', 'password')
+        UserTip.objects.create(
+            user=self.user,
+            tip_type=tip_type,
+            prediction_event=self.event,
+            prediction_option=choice,
+            selected_option=lakers,
+            prediction='Lakers',
+        )
+        self.outcome = EventOutcome.objects.create(
+            prediction_event=self.event, winning_option=choice, winning_generic_option=lakers,
+        )
+
+    def test_lease_is_exclusive_until_released_or_expired(self) -> None:
+        self.assertTrue(claim_outcome(self.outcome.pk, 'worker-a'))
+        self.assertFalse(claim_outcome(self.outcome.pk, 'worker-b'))
+
+        # Only the holder can release it
+        release_outcome(self.outcome.pk, 'worker-b')
+        self.assertFalse(claim_outcome(self.outcome.pk, 'worker-b'))
+        release_outcome(self.outcome.pk, 'worker-a')
+        self.assertTrue(claim_outcome(self.outcome.pk, 'worker-b'))
+
+        # A crashed worker's lease expires
+        EventOutcome.objects.filter(pk=self.outcome.pk).update(
+            score_locked_until=timezone.now() - timedelta(seconds=1),
+        )
+        self.assertTrue(claim_outcome(self.outcome.pk, 'worker-c'))
+
+    def test_renewal_extends_only_the_holders_lease(self) -> None:
+        claim_outcome(self.outcome.pk, 'worker-a', lease=timedelta(seconds=1))
+
+        renew_outcome(self.outcome.pk, 'worker-a')
+
+        self.outcome.refresh_from_db()
+        self.assertGreater(self.outcome.score_locked_until, timezone.now() + timedelta(seconds=60))
+        with self.assertRaises(ScoringLeaseError):
+            renew_outcome(self.outcome.pk, 'worker-b')
+
+    def test_lost_lease_rolls_the_event_back(self) -> None:
+        renew = scoring_service.renew_outcome
+
+        def taken_over(outcome_id, worker_id, **kwargs):
+            # The lease expired and another worker claimed the outcome
+            EventOutcome.objects.filter(pk=outcome_id).update(score_locked_by='worker-b')
+            return renew(outcome_id, worker_id, **kwargs)
+
+        with mock.patch.object(scoring_service, 'renew_outcome', side_effect=taken_over):
+            with self.assertRaises(ScoringLeaseError):
+                score_event_outcome(self.outcome, worker_id='worker-a')
+
+        self.outcome.refresh_from_db()
+        self.assertIsNone(self.outcome.scored_at)
+        self.assertFalse(UserEventScore.objects.exists())
+
+    def test_forfeit_marks_the_outcome_scored(self) -> None:
+        self.outcome.metadata = {'is_forfeit': True}
+        self.outcome.save()
+
+        score_event_outcome(self.outcome)
+
+        self.outcome.refresh_from_db()
+        self.assertIsNotNone(self.outcome.scored_at)
+        self.assertEqual(self.outcome.score_error, FORFEIT_SCORE_ERROR)
+        self.assertIsNone(self.outcome.score_requested_at)
+        self.assertFalse(UserEventScore.objects.exists())
+
+    def test_bulk_rescan_marks_forfeits_like_single_scoring(self) -> None:
+        EventOutcome.objects.filter(pk=self.outcome.pk).update(
+            scored_at=timezone.now() - timedelta(days=1),
+            score_requested_at=timezone.now(),
+            metadata={'is_forfeit': True},
+        )
+
+        result = process_all_user_scores(force=True)
+
+        self.outcome.refresh_from_db()
+        self.assertEqual(result.total_events_processed, 1)
+        self.assertEqual(result.total_tips_skipped, 1)
+        self.assertEqual(self.outcome.score_error, FORFEIT_SCORE_ERROR)
+        self.assertGreater(self.outcome.scored_at, timezone.now() - timedelta(minutes=1))
+        self.assertIsNone(self.outcome.score_requested_at)
+
+    def test_bulk_rescan_counts_only_committed_events(self) -> None:
+        UserTip.objects.filter(prediction_event=self.event).update(
+            is_locked=True, lock_status=UserTip.LockStatus.ACTIVE,
+        )
+        self.outcome.metadata = {'is_forfeit': True}
+        self.outcome.save()
+
+        with mock.patch.object(scoring_service, 'store_tip_results', side_effect=RuntimeError('boom')):
+            result = process_all_user_scores()
+
+        self.assertEqual(result.total_events_processed, 0)
+        self.assertEqual(result.total_locks_returned, 0)
+        self.assertEqual(len(result.events_with_errors), 1)
+        self.assertTrue(UserTip.objects.get().is_locked)
+
+    def test_leased_events_are_skipped(self) -> None:
+        claim_outcome(self.outcome.pk, 'other-process')
+
+        with self.assertRaises(ScoringLeaseError):
+            score_event_outcome(self.outcome)
+        result = process_all_user_scores()
+
+        self.assertEqual(result.total_events_busy, 1)
+        self.assertEqual(result.total_events_processed, 0)
+        self.assertFalse(UserEventScore.objects.exists())
+
+    def test_scoring_releases_the_lease(self) -> None:
+        process_all_user_scores()
+        score_event_outcome(self.outcome, force=True)
+
+        self.outcome.refresh_from_db()
+        self.assertEqual(self.outcome.score_locked_by, '')
+        self.assertIsNone(self.outcome.score_locked_until)
+        self.assertEqual(UserEventScore.objects.get().points_awarded, 3)
+
+    def test_hotness_is_awarded_once_per_event(self) -> None:
+        score_event_outcome(self.outcome)
+        hotness = UserHotness.objects.get(user=self.user).score
+        self.assertGreater(hotness, 0)
+
+        # Rescoring recreates the score but must not award hotness again
+        score_event_outcome(self.outcome, force=True)
+        process_all_user_scores(force=True)
+        process_all_user_scores()
+
+        self.assertAlmostEqual(UserHotness.objects.get(user=self.user).score, hotness, places=2)
+
+    def test_sqlite_scores_with_one_worker(self) -> None:
+        result = process_all_user_scores(workers=4)
+
+        self.assertEqual(result.total_scores_created, 1)
+        if connection.vendor == 'sqlite':
+            self.assertEqual(_scoring_workers(4), 1)
@@ -0,0 +1,121 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    Season,
+    TipType,
+    UserEventScore,
+    UserHotness,
+    UserTip,
+)
+from hooptipp.predictions.scoring_service import score_event_outcome
+
+
+class SeasonAssignmentTests(TestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        today = timezone.localdate(self.now)
+        self.user = get_user_model().objects.create_user(username='alice', password='pw')
+        self.season = Season.objects.create(
+            name='Current Season',
+            start_date=today - timedelta(days=10),
+            end_date=today + timedelta(days=10),
+        )
+        self.tip_type = TipType.objects.create(
+            name='Weekly Games', slug='weekly-games', deadline=self.now + timedelta(days=7),
+        )
+        self.event = self._event('In season', days=2)
+        self.late_event = self._event('After season', days=30)
+
+    def _event(self, name, days):
+        return PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name=name,
+            opens_at=self.now + timedelta(days=days - 1),
+            deadline=self.now + timedelta(days=days),
+        )
+
+    def _tip(self, event):
+        return UserTip.objects.create(
+            user=self.user, tip_type=self.tip_type, prediction_event=event, prediction='Pick',
+        )
+
+    def _score(self, event):
+        return UserEventScore.objects.create(
+            user=self.user, prediction_event=event, base_points=1, points_awarded=1,
+        )
+
+    def test_new_rows_get_their_season(self):
+        self.assertEqual(self._tip(self.event).season, self.season)
+        self.assertIsNone(self._tip(self.late_event).season)
+        self.assertEqual(self._score(self.event).season, self.season)
+
+    def test_scores_follow_the_event_deadline(self):
+        # Awarded during the season, but the event ends after it
+        self.assertIsNone(self._score(self.late_event).season)
+
+    def test_rescoring_a_past_season_event_keeps_its_season(self):
+        today = timezone.localdate(self.now)
+        past = Season.objects.create(
+            name='Past Season', start_date=today - timedelta(days=60), end_date=today - timedelta(days=30),
+        )
+        event = self._event('Past game', days=-40)
+        option = Option.objects.create(
+            category=OptionCategory.objects.create(slug='teams', name='Teams'), slug='lal', name='Lakers',
+        )
+        choice = PredictionOption.objects.create(event=event, option=option, label='Lakers')
+        UserTip.objects.create(
+            user=self.user, tip_type=self.tip_type, prediction_event=event,
+            prediction_option=choice, selected_option=option, prediction='Lakers',
+        )
+        outcome = EventOutcome.objects.create(prediction_event=event, winning_option=choice, resolved_at=self.now)
+
+        # Scored (and rescored) while the current season is active
+        score_event_outcome(outcome)
+        score_event_outcome(outcome, force=True)
+
+        self.assertEqual(UserEventScore.objects.get(prediction_event=event).season, past)
+        self.assertEqual(list(UserHotness.objects.values_list('season', flat=True)), [past.pk])
+
+    def test_changing_the_season_timeframe_moves_rows(self):
+        score = self._score(self.event)
+        late_tip = self._tip(self.late_event)
+
+        self.season.end_date = timezone.localdate(self.now) + timedelta(days=40)
+        self.season.save()
+        late_tip.refresh_from_db()
+        self.assertEqual(late_tip.season, self.season)
+
+        self.season.start_date = timezone.localdate(self.now) + timedelta(days=3)
+        self.season.save()
+        score.refresh_from_db()
+        self.assertIsNone(score.season)
+
+    def test_backfill_command_assigns_bulk_written_rows(self):
+        UserTip.objects.bulk_create([
+            UserTip(user=self.user, tip_type=self.tip_type, prediction_event=self.event, prediction='Pick'),
+        ])
+        UserEventScore.objects.bulk_create([
+            UserEventScore(user=self.user, prediction_event=self.event, base_points=1, points_awarded=1),
+        ])
+
+        out = StringIO()
+        call_command('backfill_season_ids', '--dry-run', stdout=out)
+        self.assertIn('1 scores and 1 tips have the wrong season', out.getvalue())
+        self.assertFalse(UserTip.objects.filter(season=self.season).exists())
+
+        out = StringIO()
+        call_command('backfill_season_ids', stdout=out)
+        self.assertIn('Updated the season of 1 scores and 1 tips', out.getvalue())
+        self.assertEqual(UserTip.objects.get().season, self.season)
+        self.assertEqual(UserEventScore.objects.get().season, self.season)
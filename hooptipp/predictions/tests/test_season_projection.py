@@ -0,0 +1,183 @@
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    Season,
+    SeasonParticipant,
+    TipType,
+    UserEventScore,
+    UserTip,
+)
+from hooptipp.predictions.season_projection import ProjectionInput, _simulate, project_season
+
+
+class SeasonProjectionTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.now = timezone.now()
+        today = timezone.localdate(self.now)
+        self.season = Season.objects.create(
+            name='Current', start_date=today - timedelta(days=20), end_date=today + timedelta(days=20),
+        )
+        self.alice, self.bob, self.carol = [
+            get_user_model().objects.create_user(username=name, password='pw')
+            for name in ('alice', 'bob', 'carol')
+        ]
+        for user in (self.alice, self.bob, self.carol):
+            SeasonParticipant.objects.create(user=user, season=self.season)
+        self.tip_type = TipType.objects.create(name='Games', slug='games', deadline=self.now)
+        category = OptionCategory.objects.create(slug='teams', name='Teams')
+        self.lakers = Option.objects.create(category=category, slug='lal', name='Lakers')
+        self.celtics = Option.objects.create(category=category, slug='bos', name='Celtics')
+
+        scored, scored_lakers, _ = self._event_with_options('Scored', days=-5)
+        EventOutcome.objects.create(prediction_event=scored, winning_option=scored_lakers, resolved_at=self.now)
+        self._score(self.alice, scored, 10)
+        self._score(self.bob, scored, 9)
+
+        # Closed but unresolved: bob picked the Lakers with a lock, carol the Celtics
+        self.closed, self.closed_lakers, self.closed_celtics = self._event_with_options('Closed', days=-1)
+        self._tip(self.bob, self.closed, self.closed_lakers, lock_status=UserTip.LockStatus.ACTIVE)
+        self._tip(self.carol, self.closed, self.closed_celtics)
+
+    def _event(self, name, *, days, points=1):
+        return PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name=name,
+            points=points,
+            opens_at=self.now - timedelta(days=10),
+            deadline=self.now + timedelta(days=days),
+        )
+
+    def _event_with_options(self, name, *, days):
+        event = self._event(name, days=days)
+        return (
+            event,
+            PredictionOption.objects.create(event=event, option=self.lakers, label='Lakers'),
+            PredictionOption.objects.create(event=event, option=self.celtics, label='Celtics'),
+        )
+
+    def _score(self, user, event, points):
+        UserEventScore.objects.create(
+            user=user, prediction_event=event, base_points=points, points_awarded=points, awarded_at=self.now,
+        )
+
+    def _tip(self, user, event, option, **kwargs):
+        UserTip.objects.create(
+            user=user,
+            tip_type=self.tip_type,
+            prediction_event=event,
+            prediction_option=option,
+            selected_option=option.option,
+            prediction=option.label,
+            **kwargs,
+        )
+
+    def _rows(self, **kwargs):
+        projection = project_season(self.season, now=self.now, seed=1, **kwargs)
+        return {row.username: row for row in projection.rows}
+
+    def test_bounds_clinch_and_elimination(self):
+        rows = self._rows()
+
+        # bob's locked pick is worth 2 points
+        self.assertEqual([rows[name].max_points for name in ('alice', 'bob', 'carol')], [10, 11, 1])
+        self.assertFalse(rows['alice'].clinched)
+        self.assertFalse(rows['bob'].eliminated)
+        self.assertAlmostEqual(rows['bob'].win_probability, 0.5, delta=0.1)
+        self.assertTrue(rows['carol'].eliminated)
+        self.assertEqual(rows['carol'].win_probability, 0.0)
+
+        UserEventScore.objects.filter(user=self.bob).update(points_awarded=6)
+        rows = self._rows()
+
+        self.assertTrue(rows['alice'].clinched)
+        self.assertEqual(rows['alice'].win_probability, 1.0)
+        self.assertTrue(rows['bob'].eliminated)
+
+    def test_open_events_count_for_users_without_a_pick(self):
+        UserEventScore.objects.filter(user=self.bob).update(points_awarded=6)
+        self._event('Open', days=2, points=3)
+
+        rows = self._rows()
+
+        # Nobody picked yet: a correct locked pick is worth 6 points to everyone
+        self.assertEqual([rows[name].max_points for name in ('alice', 'bob', 'carol')], [16, 14, 7])
+        self.assertFalse(rows['alice'].clinched)
+        self.assertFalse(rows['bob'].eliminated)
+        self.assertTrue(rows['carol'].eliminated)
+        self.assertAlmostEqual(sum(row.win_probability for row in rows.values()), 1.0)
+        self.assertGreater(rows['alice'].win_probability, rows['bob'].win_probability)
+
+    def test_simulation_matches_exact_odds(self):
+        # alice 2 points ahead; bob wins only if both coin flips go his way
+        data = ProjectionInput(
+            current=[2, 0],
+            option_counts=[2, 2],
+            pickers=[{0: [(1, 1)]}, {0: [(1, 2)]}],
+            open_users=[[], []],
+            max_remaining=[0, 3],
+        )
+        shares = _simulate(data, 4000, seed=3)
+        # bob: 3 with p=1/4 (win), 2 with p=1/4 (tie, half a win)
+        self.assertAlmostEqual(shares[1], 0.375, delta=0.03)
+        self.assertAlmostEqual(sum(shares), 1.0)
+
+    def test_simulation_matches_exact_odds_of_random_picks(self):
+        # bob has no pick on an open 3-option event: he overtakes alice only on a hit
+        data = ProjectionInput(
+            current=[1, 0],
+            option_counts=[3],
+            pickers=[{}],
+            open_users=[[(1, 2)]],
+            max_remaining=[0, 2],
+        )
+        shares = _simulate(data, 6000, seed=5)
+        self.assertAlmostEqual(shares[1], 1 / 3, delta=0.03)
+        self.assertAlmostEqual(sum(shares), 1.0)
+
+    def test_simulation_is_fast_for_large_seasons(self):
+        users, events = 500, 100
+        data = ProjectionInput(
+            current=[index % 40 for index in range(users)],
+            option_counts=[2] * events,
+            pickers=[{0: [(user, 1) for user in range(event % 2, users, 2)]} for event in range(events)],
+            open_users=[[(user, 1) for user in range(1, users, 2)] for _ in range(events)],
+            max_remaining=[events] * users,
+        )
+        started = time.perf_counter()
+        shares = _simulate(data, 1000, seed=1)
+        self.assertLess(time.perf_counter() - started, 1.0)
+        self.assertAlmostEqual(sum(shares), 1.0)
+
+    def test_api_and_command(self):
+        url = reverse('predictions:season_projection_api')
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['season']['id'], self.season.id)
+        self.assertEqual(data['remaining_events'], 1)
+        self.assertEqual([row['display_name'] for row in data['rows']], ['alice', 'bob', 'carol'])
+        self.assertFalse(data['rows'][0]['clinched'])
+        self.assertTrue(data['rows'][2]['eliminated'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(url, {'season': '9999'}).status_code, 404)
+
+        out = StringIO()
+        call_command('project_season', '--seed', '1', stdout=out)
+        self.assertIn('eliminated', out.getvalue())
+        self.assertIn('Projected 3 participants', out.getvalue())
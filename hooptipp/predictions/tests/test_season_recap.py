@@ -0,0 +1,161 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    Season,
+    SeasonParticipant,
+    SeasonRecap,
+    TipType,
+    UserEventScore,
+    UserTip,
+)
+from hooptipp.predictions.scoring_service import store_tip_results
+from hooptipp.predictions.season_recap import create_season_recaps, get_recent_season_recap
+
+
+class SeasonRecapTests(TestCase):
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        today = timezone.localdate(self.now)
+        self.season = Season.objects.create(
+            name='Ended', start_date=today - timedelta(days=30), end_date=today - timedelta(days=2),
+        )
+        self.alice, self.bob, self.carol = [
+            get_user_model().objects.create_user(username=name, password='pw')
+            for name in ('alice', 'bob', 'carol')
+        ]
+        for user in (self.alice, self.bob, self.carol):
+            SeasonParticipant.objects.create(user=user, season=self.season)
+
+        category = OptionCategory.objects.create(slug='teams', name='Teams')
+        self.lakers = Option.objects.create(category=category, slug='lal', name='Lakers')
+        self.celtics = Option.objects.create(category=category, slug='bos', name='Celtics')
+        tip_type = TipType.objects.create(name='Games', slug='games', deadline=self.now)
+        self.event = PredictionEvent.objects.create(
+            tip_type=tip_type,
+            name='BOS @ LAL',
+            opens_at=self.now - timedelta(days=12),
+            deadline=self.now - timedelta(days=10),
+        )
+        lakers = PredictionOption.objects.create(event=self.event, option=self.lakers, label='Lakers')
+        celtics = PredictionOption.objects.create(event=self.event, option=self.celtics, label='Celtics')
+        for user, option in ((self.alice, lakers), (self.bob, celtics)):
+            UserTip.objects.create(
+                user=user,
+                tip_type=tip_type,
+                prediction_event=self.event,
+                prediction_option=option,
+                selected_option=option.option,
+                prediction=option.label,
+            )
+        outcome = EventOutcome.objects.create(
+            prediction_event=self.event,
+            winning_option=lakers,
+            winning_generic_option=self.lakers,
+            resolved_at=self.now - timedelta(days=9),
+            scored_at=self.now - timedelta(days=9),
+        )
+        store_tip_results(outcome)
+        UserEventScore.objects.create(
+            user=self.alice,
+            prediction_event=self.event,
+            base_points=3,
+            points_awarded=3,
+            awarded_at=self.now - timedelta(days=9),
+        )
+
+    def test_recap_holds_podium_and_accuracy(self):
+        self.assertEqual(create_season_recaps(now=self.now).created, 1)
+
+        recap = SeasonRecap.objects.get(season=self.season)
+        self.assertEqual(recap.participant_count, 3)
+        self.assertEqual(recap.total_matches, 1)
+        self.assertEqual((recap.pick_count, recap.resolved_pick_count, recap.correct_pick_count), (2, 2, 1))
+        self.assertEqual(recap.correct_pick_rate, 50.0)
+        self.assertEqual([entry['username'] for entry in recap.podium], ['alice'])
+        self.assertEqual(recap.stats_for(self.alice.id)['accuracy'], 100.0)
+        self.assertEqual(recap.stats_for(self.bob.id)['rank'], 2)
+        self.assertEqual(recap.stats_for(self.carol.id)['picks'], 0)
+
+    def test_unchanged_recap_is_not_rebuilt(self):
+        create_season_recaps(now=self.now)
+        # Queryset updates bypass updated_at: only `force` picks them up
+        UserEventScore.objects.filter(user=self.alice).update(points_awarded=30)
+
+        self.assertEqual(create_season_recaps(now=self.now).skipped, 1)
+        self.assertEqual(SeasonRecap.objects.get().podium[0]['total_points'], 3)
+
+        create_season_recaps(now=self.now, force=True)
+        self.assertEqual(SeasonRecap.objects.get().podium[0]['total_points'], 30)
+
+    def test_recap_waits_for_the_last_event_to_be_scored(self):
+        late_event = PredictionEvent.objects.create(
+            tip_type=self.event.tip_type,
+            name='LAL @ BOS',
+            opens_at=self.now - timedelta(days=5),
+            deadline=self.now - timedelta(days=3),
+        )
+        UserTip.objects.create(
+            user=self.bob, tip_type=self.event.tip_type, prediction_event=late_event, prediction='Celtics',
+        )
+
+        self.assertEqual(create_season_recaps(now=self.now).skipped, 1)
+        self.assertFalse(SeasonRecap.objects.exists())
+        # Shown live meanwhile
+        recap = get_recent_season_recap(now=self.now)
+        self.assertIsNone(recap.pk)
+        self.assertEqual(recap.total_matches, 2)
+
+        outcome = EventOutcome.objects.create(prediction_event=late_event, winning_generic_option=self.celtics)
+        outcome.scored_at = self.now
+        outcome.save()
+        self.assertEqual(create_season_recaps(now=self.now).created, 1)
+
+    def test_recap_is_rebuilt_when_a_score_changes(self):
+        create_season_recaps(now=self.now)
+        score = UserEventScore.objects.get(user=self.alice)
+        score.points_awarded = 30
+        score.save()
+
+        self.assertEqual(create_season_recaps(now=self.now).updated, 1)
+        self.assertEqual(SeasonRecap.objects.get().podium[0]['total_points'], 30)
+        self.assertEqual(create_season_recaps(now=self.now).skipped, 1)
+
+    def test_running_seasons_get_no_recap(self):
+        self.season.end_date = timezone.localdate(self.now) + timedelta(days=1)
+        self.season.save()
+
+        self.assertEqual(create_season_recaps(now=self.now).created, 0)
+        self.assertIsNone(get_recent_season_recap(now=self.now))
+
+    def test_process_achievements_writes_recaps(self):
+        call_command('process_achievements', stdout=StringIO())
+
+        self.assertTrue(SeasonRecap.objects.filter(season=self.season).exists())
+
+    def test_home_reads_the_recap(self):
+        create_season_recaps(now=self.now)
+        self.client.force_login(self.bob)
+
+        with self.assertNumQueries(3):
+            # The season, its recap and the staleness check
+            recap = get_recent_season_recap(now=self.now)
+        self.assertEqual(recap.season, self.season)
+
+        response = self.client.get(reverse('predictions:home'))
+
+        season_results = response.context['season_results']
+        self.assertEqual(season_results['correct_pick_rate'], 50.0)
+        self.assertEqual([user['display_name'] for user in season_results['top_users']], ['alice'])
+        self.assertEqual(season_results['viewer_stats']['rank'], 2)
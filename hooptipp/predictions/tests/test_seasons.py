@@ -66,6 +66,23 @@ class SeasonModelTests(TestCase):
         self.assertEqual(season.end_time, end_time)
         self.assertEqual(str(season), 'Test Season')
 
+    def test_season_descriptions_are_rendered_on_save(self):
+        """Test that season descriptions are stored as rendered HTML."""
+        season = Season.objects.create(
+            name='Rendered Season',
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            description='**Welcome**',
+            season_end_description='*Thanks*',
+        )
+        self.assertIn('<strong>Welcome</strong>', season.description_html)
+        self.assertIn('<em>Thanks</em>', season.season_end_description_html)
+
+        season.description = ''
+        season.save(update_fields=['description'])
+        season.refresh_from_db()
+        self.assertEqual(season.description_html, '')
+
     def test_season_end_date_before_start_date_validation(self):
         """Test that end_datetime cannot be before start_datetime."""
         season = Season(
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from hooptipp.predictions.leaderboard_service import build_leaderboard
+from hooptipp.predictions.models import (
+    PredictionEvent,
+    Season,
+    SeasonParticipant,
+    StandingsSnapshot,
+    TipType,
+    UserEventScore,
+)
+from hooptipp.predictions.standings_snapshots import get_standings_changes, snapshot_standings
+
+
+class StandingsSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.now = timezone.now()
+        today = timezone.localdate(self.now)
+        self.season = Season.objects.create(
+            name='Current', start_date=today - timedelta(days=20), end_date=today + timedelta(days=20),
+        )
+        self.tip_type = TipType.objects.create(name='Games', slug='games', deadline=self.now)
+        self.alice, self.bob, self.carol = [
+            get_user_model().objects.create_user(username=name, password='pw')
+            for name in ('alice', 'bob', 'carol')
+        ]
+        for user in (self.alice, self.bob, self.carol):
+            SeasonParticipant.objects.create(user=user, season=self.season)
+        self._score(self.alice, 5, days_ago=10)
+        self._score(self.bob, 3, days_ago=10)
+
+    def _score(self, user, points, *, days_ago):
+        event = PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name=f'Game {PredictionEvent.objects.count()}',
+            opens_at=self.now - timedelta(days=days_ago + 1),
+            deadline=self.now - timedelta(days=days_ago),
+        )
+        return UserEventScore.objects.create(
+            user=user,
+            prediction_event=event,
+            base_points=points,
+            points_awarded=points,
+            awarded_at=self.now - timedelta(days=days_ago),
+        )
+
+    def test_snapshot_stores_ranks_and_overwrites_the_day(self):
+        self.assertEqual(snapshot_standings(self.season, now=self.now), 3)
+        self._score(self.carol, 9, days_ago=0)
+        snapshot_standings(self.season, now=self.now)
+
+        snapshots = StandingsSnapshot.objects.filter(day=timezone.localdate(self.now))
+        self.assertEqual(
+            list(snapshots.values_list('user__username', 'rank', 'total_points')),
+            [('carol', 1, 9), ('alice', 2, 5), ('bob', 3, 3)],
+        )
+
+    def test_changes_use_the_latest_snapshot_old_enough(self):
+        snapshot_standings(self.season, now=self.now - timedelta(days=5))
+        snapshot_standings(self.season, now=self.now - timedelta(days=1))
+
+        changes = get_standings_changes(
+            self.season, {self.alice.id: (2, 5), self.bob.id: (1, 10)}, days=3, now=self.now,
+        )
+
+        self.assertEqual(changes[self.bob.id].points, 7)
+        self.assertEqual(changes[self.bob.id].rank, 1)
+        self.assertEqual(changes[self.alice.id].rank, -1)
+        self.assertEqual(get_standings_changes(self.season, {self.bob.id: (1, 10)}, days=7, now=self.now), {})
+
+    def test_leaderboard_reads_deltas_from_snapshots(self):
+        snapshot_standings(self.season, now=self.now - timedelta(days=8))
+        self._score(self.carol, 9, days_ago=5)
+        snapshot_standings(self.season, now=self.now - timedelta(days=4))
+        self._score(self.bob, 4, days_ago=1)
+
+        rows = {row.username: row for row in build_leaderboard(self.season, now=self.now)}
+
+        self.assertEqual((rows['carol'].rank, rows['carol'].rank_change_3d), (1, 0))
+        self.assertEqual((rows['bob'].points_change_3d, rows['bob'].points_change_7d), (4, 4))
+        self.assertEqual((rows['bob'].rank, rows['bob'].rank_change_3d), (2, 1))
+        self.assertEqual(rows['carol'].points_change_7d, 9)
+        self.assertEqual(rows['alice'].rank_change_3d, -1)
+
+    def test_leaderboard_falls_back_without_snapshots(self):
+        self._score(self.carol, 2, days_ago=1)
+
+        rows = {row.username: row for row in build_leaderboard(self.season, now=self.now)}
+
+        self.assertEqual(rows['carol'].points_change_3d, 2)
+        self.assertIsNone(rows['carol'].rank_change_3d)
+
+    def test_command_snapshots_the_active_season(self):
+        out = StringIO()
+        call_command('snapshot_standings', '--dry-run', stdout=out)
+        self.assertIn('Would store the standings of 3 users', out.getvalue())
+        self.assertFalse(StandingsSnapshot.objects.exists())
+
+        call_command('snapshot_standings', stdout=StringIO())
+        self.assertEqual(StandingsSnapshot.objects.filter(season=self.season).count(), 3)
@@ -0,0 +1,64 @@
+"""Tests for the standings version that keys the leaderboard and projection caches."""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from hooptipp.predictions.leaderboard_service import get_change_stamp
+from hooptipp.predictions.models import PredictionEvent, StandingsVersion, TipType, UserEventScore
+from hooptipp.predictions.standings_version import batched_invalidation, get_standings_version
+
+
+class StandingsVersionTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='alice', password='pw12345678')
+        tip_type = TipType.objects.create(name='Games', slug='games', deadline=timezone.now())
+        self.events = [
+            PredictionEvent.objects.create(
+                tip_type=tip_type,
+                name=f'Game {index}',
+                opens_at=timezone.now() - timedelta(days=2),
+                deadline=timezone.now() - timedelta(days=1),
+            )
+            for index in range(3)
+        ]
+
+    def test_version_is_shared_through_the_database(self):
+        stamp = get_change_stamp(None)
+
+        # A write from another process: this process's cache plays no part
+        UserEventScore.objects.create(user=self.user, prediction_event=self.events[0], base_points=1, points_awarded=1)
+        cache.clear()
+
+        self.assertNotEqual(get_change_stamp(None), stamp)
+        self.assertEqual(get_standings_version(), StandingsVersion.objects.get().version)
+
+    def test_batched_writes_move_the_version_once(self):
+        version = get_standings_version()
+
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic(), batched_invalidation():
+                for event in self.events:
+                    UserEventScore.objects.create(
+                        user=self.user, prediction_event=event, base_points=1, points_awarded=1,
+                    )
+
+        bumps = [query for query in queries if 'predictions_standingsversion' in query['sql']]
+        self.assertEqual(len(bumps), 1)
+        self.assertNotEqual(get_standings_version(), version)
+
+    def test_failed_batch_does_not_move_the_version(self):
+        version = get_standings_version()
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic(), batched_invalidation():
+                UserEventScore.objects.create(
+                    user=self.user, prediction_event=self.events[0], base_points=1, points_awarded=1,
+                )
+                raise RuntimeError('scoring failed')
+
+        self.assertEqual(get_standings_version(), version)
@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from hooptipp.predictions.models import (
+    EventOutcome,
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    TipType,
+    UserTip,
+)
+from hooptipp.predictions.scoring_service import process_all_user_scores, score_event_outcome
+from hooptipp.predictions.templatetags.prediction_extras import _result_pickers_from_tips
+
+
+class TipResultTests(TestCase):
+    def setUp(self) -> None:
+        now = timezone.now()
+        self.alice, self.bob = [
+            get_user_model().objects.create_user(username=name, password='pw')
+            for name in ('alice', 'bob')
+        ]
+        category = OptionCategory.objects.create(slug='teams', name='Teams')
+        self.lakers = Option.objects.create(category=category, slug='lal', name='Lakers')
+        self.celtics = Option.objects.create(category=category, slug='bos', name='Celtics')
+        self.tip_type = TipType.objects.create(name='Games', slug='games', deadline=now)
+        self.event = PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name='BOS @ LAL',
+            points=3,
+            opens_at=now - timedelta(days=2),
+            deadline=now - timedelta(hours=1),
+        )
+        self.lakers_choice = PredictionOption.objects.create(event=self.event, option=self.lakers, label='Lakers')
+        self.celtics_choice = PredictionOption.objects.create(event=self.event, option=self.celtics, label='Celtics')
+        self.alice_tip = self._tip(self.alice, self.lakers_choice)
+        self.bob_tip = self._tip(self.bob, self.celtics_choice)
+
+    def _tip(self, user, choice):
+        return UserTip.objects.create(
+            user=user,
+            tip_type=self.tip_type,
+            prediction_event=self.event,
+            prediction_option=choice,
+            selected_option=choice.option,
+            prediction=choice.label,
+        )
+
+    def _results(self):
+        self.alice_tip.refresh_from_db()
+        self.bob_tip.refresh_from_db()
+        return self.alice_tip.result, self.bob_tip.result
+
+    def test_tips_are_pending_until_scored(self):
+        self.assertEqual(self._results(), (UserTip.Result.PENDING, UserTip.Result.PENDING))
+        self.assertIsNone(self.alice_tip.is_correct)
+
+    def test_scoring_stores_results(self):
+        outcome = EventOutcome.objects.create(
+            prediction_event=self.event, winning_option=self.lakers_choice, resolved_at=timezone.now(),
+        )
+        score_event_outcome(outcome)
+
+        self.assertEqual(self._results(), (UserTip.Result.CORRECT, UserTip.Result.INCORRECT))
+        self.assertTrue(self.alice_tip.is_correct)
+        self.assertFalse(self.bob_tip.is_correct)
+
+        # A changed winner is picked up when the event is rescored
+        outcome.winning_option = self.celtics_choice
+        outcome.save()
+        score_event_outcome(outcome, force=True)
+
+        self.assertEqual(self._results(), (UserTip.Result.INCORRECT, UserTip.Result.CORRECT))
+
+    def test_generic_winner_and_bulk_processing(self):
+        EventOutcome.objects.create(
+            prediction_event=self.event, winning_generic_option=self.celtics, resolved_at=timezone.now(),
+        )
+        process_all_user_scores()
+
+        self.assertEqual(self._results(), (UserTip.Result.INCORRECT, UserTip.Result.CORRECT))
+
+    def test_forfeit_voids_and_deletion_clears_results(self):
+        outcome = EventOutcome.objects.create(
+            prediction_event=self.event,
+            winning_option=self.lakers_choice,
+            resolved_at=timezone.now(),
+            metadata={'is_forfeit': True},
+        )
+        score_event_outcome(outcome)
+
+        self.assertEqual(self._results(), (UserTip.Result.VOID, UserTip.Result.VOID))
+        self.assertIsNone(self.alice_tip.is_correct)
+
+        outcome.delete()
+
+        self.assertEqual(self._results(), (UserTip.Result.PENDING, UserTip.Result.PENDING))
+
+    def test_result_pickers_read_the_stored_result(self):
+        outcome = EventOutcome.objects.create(
+            prediction_event=self.event, winning_option=self.lakers_choice, resolved_at=timezone.now(),
+        )
+        score_event_outcome(outcome)
+        # Stored results win over recomputing from the current winner
+        EventOutcome.objects.filter(pk=outcome.pk).update(winning_option=self.celtics_choice)
+        outcome.refresh_from_db()
+
+        pickers = {picker['user'].username: picker for picker in _result_pickers_from_tips(outcome)}
+
+        self.assertTrue(pickers['alice']['is_correct'])
+        self.assertFalse(pickers['bob']['is_correct'])
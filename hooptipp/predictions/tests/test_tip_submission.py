@@ -0,0 +1,142 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from hooptipp.predictions.lock_service import LOCK_LIMIT, LockService
+from hooptipp.predictions.models import (
+    Option,
+    OptionCategory,
+    PredictionEvent,
+    PredictionOption,
+    TipType,
+    UserTip,
+)
+from hooptipp.predictions.tip_submission import save_tip_submission
+
+
+class SaveTipSubmissionTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(username='alice', password='pw')
+        teams = OptionCategory.objects.create(slug='nba-teams', name='NBA Teams')
+        self.lakers = Option.objects.create(category=teams, slug='lal', name='Los Angeles Lakers')
+        self.celtics = Option.objects.create(category=teams, slug='bos', name='Boston Celtics')
+        self.tip_type = TipType.objects.create(
+            name='Weekly Games',
+            slug='weekly-games',
+            deadline=timezone.now() + timedelta(days=7),
+        )
+        self.events = []
+        for index in range(7):
+            event = PredictionEvent.objects.create(
+                tip_type=self.tip_type,
+                name=f'Game {index}',
+                opens_at=timezone.now() - timedelta(days=1),
+                deadline=timezone.now() + timedelta(days=index + 1),
+                sort_order=index,
+            )
+            PredictionOption.objects.create(event=event, label='Lakers', option=self.lakers, sort_order=1)
+            PredictionOption.objects.create(event=event, label='Celtics', option=self.celtics, sort_order=2)
+            self.events.append(event)
+
+    def _events(self):
+        return list(
+            PredictionEvent.objects.filter(pk__in=[event.pk for event in self.events])
+            .prefetch_related('options__option')
+            .order_by('sort_order')
+        )
+
+    def _lakers_option(self, event):
+        return PredictionOption.objects.get(event=event, option=self.lakers)
+
+    def _save(self, data, events=None):
+        events = events or self._events()
+        user_tips = {tip.prediction_event_id: tip for tip in UserTip.objects.filter(user=self.user)}
+        return save_tip_submission(self.user, events, data, user_tips=user_tips)
+
+    def test_week_of_picks_is_saved_in_a_few_queries(self):
+        events = self._events()
+        data = {f'prediction_{event.id}': str(self._lakers_option(event).id) for event in events}
+        data.update({f'lock_{event.id}': '1' for event in events[:2]})
+
+        with CaptureQueriesContext(connection) as queries:
+            result = self._save(data, events)
+
+        self.assertEqual(result.saved, 7)
+        self.assertEqual(UserTip.objects.filter(user=self.user).count(), 7)
+        self.assertEqual(UserTip.objects.filter(user=self.user, is_locked=True).count(), 2)
+        # One statement per step, independent of the number of events
+        self.assertLessEqual(len(queries), 25)
+        self.assertEqual(self._lakers_option(events[0]).tip_count, 1)
+        self.assertEqual(self._lakers_option(events[0]).lock_count, 1)
+
+    def test_changed_pick_updates_tip_and_counters(self):
+        event = self._events()[0]
+        lakers = self._lakers_option(event)
+        celtics = PredictionOption.objects.get(event=event, option=self.celtics)
+        self._save({f'prediction_{event.id}': str(lakers.id)})
+
+        self._save({f'prediction_{event.id}': str(celtics.id)})
+
+        tip = UserTip.objects.get(user=self.user, prediction_event=event)
+        self.assertEqual(tip.prediction_option, celtics)
+        self.assertEqual(tip.selected_option, self.celtics)
+        self.assertEqual(tip.prediction, 'Celtics')
+        lakers.refresh_from_db()
+        celtics.refresh_from_db()
+        self.assertEqual((lakers.tip_count, celtics.tip_count), (0, 1))
+
+    def test_invalid_choices_are_skipped(self):
+        event = self._events()[0]
+        other_event_option = self._lakers_option(self.events[1])
+
+        result = self._save({
+            f'prediction_{event.id}': str(other_event_option.id),
+            f'prediction_{self.events[1].id}': 'not-a-number',
+        })
+
+        self.assertEqual(result.saved, 0)
+        self.assertFalse(UserTip.objects.exists())
+
+    def test_locks_beyond_the_limit_are_refused_in_order(self):
+        events = self._events()
+        data = {f'prediction_{event.id}': str(self._lakers_option(event).id) for event in events}
+        data.update({f'lock_{event.id}': '1' for event in events})
+
+        result = self._save(data, events)
+
+        self.assertEqual([event.id for event in result.insufficient_lock_events], [e.id for e in events[LOCK_LIMIT:]])
+        locked = UserTip.objects.filter(user=self.user, is_locked=True).values_list('prediction_event_id', flat=True)
+        self.assertEqual(sorted(locked), [event.id for event in events[:LOCK_LIMIT]])
+        self.assertEqual(LockService(self.user).refresh().available, 0)
+
+    def test_existing_pick_without_submission_can_be_unlocked(self):
+        event = self._events()[0]
+        self._save({f'prediction_{event.id}': str(self._lakers_option(event).id), f'lock_{event.id}': '1'})
+
+        self._save({})
+
+        tip = UserTip.objects.get(user=self.user, prediction_event=event)
+        self.assertFalse(tip.is_locked)
+        self.assertEqual(tip.lock_status, UserTip.LockStatus.NONE)
+        self.assertEqual(self._lakers_option(event).lock_count, 0)
+
+    def test_any_mode_generic_choice(self):
+        event = PredictionEvent.objects.create(
+            tip_type=self.tip_type,
+            name='Champion',
+            target_kind=PredictionEvent.TargetKind.GENERIC,
+            selection_mode=PredictionEvent.SelectionMode.ANY,
+            opens_at=timezone.now() - timedelta(days=1),
+            deadline=timezone.now() + timedelta(days=30),
+        )
+
+        self._save({f'prediction_{event.id}': str(self.celtics.id)}, events=[event])
+
+        tip = UserTip.objects.get(user=self.user, prediction_event=event)
+        self.assertIsNone(tip.prediction_option)
+        self.assertEqual(tip.selected_option, self.celtics)
+        self.assertEqual(tip.prediction, 'Boston Celtics')
@@ -0,0 +1,258 @@
+"""Batch saving of the picks submitted with the home page form.
+
+The form posts ``prediction_<event id>`` (the chosen option) and
+``lock_<event id>`` (``'1'`` to lock) for every visible event. All choices are
+resolved through id-keyed lookups and validated before anything is written;
+the tips are then upserted with a single ``bulk_create`` and locks are
+allocated and returned in one pass, so saving a week of picks costs a
+handful of queries instead of several per event.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from django.db import transaction
+from django.utils import timezone
+
+from .lock_service import LockService
+from .models import Option, PredictionEvent, UserTip
+from .option_choices import OptionChoice
+from .pick_stats import apply_pick_changes, as_pick
+from .season_assignment import find_season, load_seasons
+from .standings_version import invalidate_standings
+
+TIP_UPSERT_FIELDS = ['tip_type', 'prediction', 'prediction_option', 'selected_option', 'season', 'updated_at']
+
+
+@dataclass
+class TipSubmissionResult:
+    """Summary of a saved pick submission."""
+
+    saved: int = 0
+    insufficient_lock_events: List[PredictionEvent] = field(default_factory=list)
+    deadline_locked_events: List[PredictionEvent] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _ResolvedPick:
+    event: PredictionEvent
+    option_id: Optional[int]
+    selected_option_id: Optional[int]
+    label: str
+    should_lock: bool
+
+
+def save_tip_submission(
+    user,
+    events: Iterable[PredictionEvent],
+    data: Mapping[str, str],
+    *,
+    user_tips: Dict[int, UserTip],
+    team_choices: Iterable[OptionChoice] = (),
+    player_choices: Iterable[OptionChoice] = (),
+    lock_service: Optional[LockService] = None,
+    now: Optional[datetime] = None,
+) -> TipSubmissionResult:
+    """
+    Validate and save the picks in ``data`` for ``events``.
+
+    Invalid or unknown choices are skipped. Events without a submitted choice
+    keep the user's existing pick, so only their lock can change.
+
+    Args:
+        user: User making the picks
+        events: Events shown on the form (with ``options`` prefetched)
+        data: Submitted form data
+        user_tips: The user's existing tips keyed by event id; updated in place
+        team_choices: Teams selectable in ANY-mode team events (cached choices)
+        player_choices: Players selectable in ANY-mode player events (cached choices)
+        lock_service: Lock service for ``user`` (created if omitted)
+        now: Current time (default: now)
+
+    Returns:
+        TipSubmissionResult with the number of saved picks and the events whose
+        lock could not be set or removed
+    """
+    now = now or timezone.now()
+    events = list(events)
+    picks = _resolve_picks(events, data, user_tips, team_choices, player_choices)
+    result = TipSubmissionResult(saved=len(picks))
+    if not picks:
+        return result
+
+    lock_service = lock_service or LockService(user)
+    event_ids = [pick.event.id for pick in picks]
+    with transaction.atomic():
+        # Re-read the current tips so the pick counters start from the stored state
+        current = {
+            tip.prediction_event_id: tip
+            for tip in UserTip.objects.select_for_update().filter(user=user, prediction_event_id__in=event_ids)
+        }
+        upserts, changes = _changed_tips(user, picks, current)
+        if upserts:
+            # Bulk inserts skip UserTip.save(), which assigns the season
+            seasons = load_seasons()
+            for tip in upserts:
+                tip.season = find_season(tip.prediction_event.deadline, seasons)
+            UserTip.objects.bulk_create(
+                upserts,
+                update_conflicts=True,
+                unique_fields=['user', 'prediction_event'],
+                update_fields=TIP_UPSERT_FIELDS,
+            )
+            apply_pick_changes(changes)
+            invalidate_standings()
+            current = {
+                tip.prediction_event_id: tip
+                for tip in UserTip.objects.filter(user=user, prediction_event_id__in=event_ids)
+            }
+        user_tips.update(current)
+
+        to_lock: List[UserTip] = []
+        to_release: List[UserTip] = []
+        for pick in picks:
+            tip = current[pick.event.id]
+            if pick.should_lock:
+                to_lock.append(tip)
+            elif tip.is_locked:
+                if pick.event.deadline <= now:
+                    result.deadline_locked_events.append(pick.event)
+                else:
+                    to_release.append(tip)
+
+        refused = lock_service.ensure_locked_many(to_lock)
+        lock_service.release_locks(to_release)
+
+    refused_ids = {tip.prediction_event_id for tip in refused}
+    result.insufficient_lock_events = [pick.event for pick in picks if pick.event.id in refused_ids]
+    return result
+
+
+def _resolve_picks(
+    events: List[PredictionEvent],
+    data: Mapping[str, str],
+    user_tips: Dict[int, UserTip],
+    team_choices: Iterable[OptionChoice],
+    player_choices: Iterable[OptionChoice],
+) -> List[_ResolvedPick]:
+    """Resolve every submitted choice before anything is written."""
+
+    teams_by_id = {team.id: team for team in team_choices}
+    players_by_id = {player.id: player for player in player_choices}
+
+    # Generic ANY-mode choices are loaded with one query
+    generic_ids = {
+        _parse_id(data.get(f'prediction_{event.id}'))
+        for event in events
+        if event.selection_mode != PredictionEvent.SelectionMode.CURATED
+        and event.target_kind not in (PredictionEvent.TargetKind.TEAM, PredictionEvent.TargetKind.PLAYER)
+    }
+    generic_ids.discard(None)
+    generic_options = Option.objects.in_bulk(generic_ids) if generic_ids else {}
+
+    picks: List[_ResolvedPick] = []
+    for event in events:
+        submitted_value = data.get(f'prediction_{event.id}')
+        should_lock = data.get(f'lock_{event.id}') == '1'
+
+        if not submitted_value:
+            existing_tip = user_tips.get(event.id)
+            if existing_tip is None:
+                continue
+            picks.append(_ResolvedPick(
+                event=event,
+                option_id=existing_tip.prediction_option_id,
+                selected_option_id=existing_tip.selected_option_id,
+                label=existing_tip.prediction,
+                should_lock=should_lock,
+            ))
+            continue
+
+        choice = _resolve_choice(event, _parse_id(submitted_value), teams_by_id, players_by_id, generic_options)
+        if choice is None:
+            continue
+        option_id, selected_option_id, label = choice
+        picks.append(_ResolvedPick(
+            event=event,
+            option_id=option_id,
+            selected_option_id=selected_option_id,
+            label=label,
+            should_lock=should_lock,
+        ))
+    return picks
+
+
+def _resolve_choice(
+    event: PredictionEvent,
+    choice_id: Optional[int],
+    teams_by_id: Dict[int, OptionChoice],
+    players_by_id: Dict[int, OptionChoice],
+    generic_options: Dict[int, Option],
+) -> Optional[Tuple[Optional[int], int, str]]:
+    """Return ``(prediction_option_id, selected_option_id, label)`` or None for an invalid choice."""
+
+    if choice_id is None:
+        return None
+
+    if event.selection_mode == PredictionEvent.SelectionMode.CURATED:
+        option = {item.id: item for item in event.options.all()}.get(choice_id)
+        if option is None:
+            return None
+        return option.id, option.option_id, option.label
+
+    selected: Union[OptionChoice, Option, None]
+    if event.target_kind == PredictionEvent.TargetKind.TEAM:
+        selected = teams_by_id.get(choice_id)
+    elif event.target_kind == PredictionEvent.TargetKind.PLAYER:
+        selected = players_by_id.get(choice_id)
+    else:
+        selected = generic_options.get(choice_id)
+    if selected is None:
+        return None
+    return None, selected.id, selected.name
+
+
+def _parse_id(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _changed_tips(user, picks: List[_ResolvedPick], current: Dict[int, UserTip]):
+    """Return the tips to upsert and the matching pick counter changes."""
+
+    upserts: List[UserTip] = []
+    changes = []
+    for pick in picks:
+        option_id = pick.option_id
+        selected_id = pick.selected_option_id
+        existing = current.get(pick.event.id)
+        if existing is not None and (
+            existing.tip_type_id,
+            existing.prediction,
+            existing.prediction_option_id,
+            existing.selected_option_id,
+        ) == (pick.event.tip_type_id, pick.label, option_id, selected_id):
+            continue
+
+        upserts.append(UserTip(
+            user=user,
+            prediction_event=pick.event,
+            tip_type_id=pick.event.tip_type_id,
+            prediction=pick.label,
+            prediction_option_id=option_id,
+            selected_option_id=selected_id,
+        ))
+        if existing is None:
+            changes.append((user.id, None, as_pick(option_id, UserTip.LockStatus.NONE)))
+        else:
+            changes.append((
+                user.id,
+                as_pick(existing.prediction_option_id, existing.lock_status),
+                as_pick(option_id, existing.lock_status),
+            ))
+    return upserts, changes
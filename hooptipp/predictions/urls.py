@@ -9,6 +9,9 @@ urlpatterns = [
     path('api/save-prediction/', views.save_prediction, name='save_prediction'),
     path('api/toggle-lock/', views.toggle_lock, name='toggle_lock'),
     path('api/lock-summary/', views.get_lock_summary, name='lock_summary'),
+    path('api/leaderboard/', views.leaderboard_api, name='leaderboard_api'),
+    path('api/season/projection/', views.season_projection_api, name='season_projection_api'),
+    path('api/options/search/', views.option_search_api, name='option_search'),
     path('api/impressum/', views.get_impressum, name='impressum_api'),
     path('api/datenschutz/', views.get_datenschutz, name='datenschutz_api'),
     path('api/teilnahmebedingungen/', views.get_teilnahmebedingungen, name='teilnahmebedingungen_api'),
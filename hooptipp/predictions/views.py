@@ -1,28 +1,36 @@
 from collections import defaultdict
+from dataclasses import replace
 from datetime import timedelta
 from typing import Iterable
 
-import markdown2
-
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.db.models import Case, Count, F, IntegerField, Q, Sum, When
+from django.db.models import Case, Count, F, IntegerField, Max, Q, Sum, When
 from django.db.models.functions import Coalesce
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.encoding import force_str
 from django.utils.http import urlsafe_base64_decode
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 import json
 
 from hooptipp.nba.managers import NbaPlayerManager, NbaTeamManager
 from hooptipp.user_context import get_active_user, set_active_user, clear_active_user
 
+from .event_feed import load_event_feed
 from .forms import UserPreferencesForm
+from .leaderboard_service import (
+    LeaderboardDivider,
+    get_change_stamp,
+    get_kudos_given_today,
+    get_leaderboard,
+    get_leaderboard_slice,
+)
 from .lock_service import LockLimitError, LockService
 from .models import (
     DatenschutzSection,
@@ -35,12 +43,16 @@ from .models import (
     Season,
     SeasonParticipant,
     TeilnahmebedingungenSection,
-    TipType,
     UserPreferences,
     UserEventScore,
     UserTip,
 )
+from .option_choices import DEFAULT_SEARCH_LIMIT, OptionChoice, get_option_choices, search_option_choices
+from .pick_stats import load_event_picks
+from .season_projection import get_projection_stamp, get_season_projection
+from .season_recap import get_recent_season_recap
 from .theme_palettes import DEFAULT_THEME_KEY, get_theme_palette
+from .tip_submission import save_tip_submission
 
 
 def _build_display_name_map(user_ids: Iterable[int]) -> dict[int, str]:
@@ -64,6 +76,35 @@ def _apply_display_metadata(user, display_name_map: dict[int, str]) -> None:
     user.display_initial = display_name[:1].upper() if display_name else ''
 
 
+def _user_scores(user, season):
+    """The user's scores, of ``season`` if given."""
+
+    score_queryset = UserEventScore.objects.filter(user=user)
+    if season:
+        score_queryset = score_queryset.filter(season=season)
+    return score_queryset
+
+
+def _recent_scores(score_queryset):
+    """The latest five of ``score_queryset``, newest first."""
+
+    return score_queryset.select_related('prediction_event__tip_type').order_by('-awarded_at', '-id')[:5]
+
+
+def _recently_resolved_outcomes():
+    """The last five resolved predictions, with their event and winner."""
+
+    return (
+        EventOutcome.objects.select_related(
+            'prediction_event__tip_type',
+            'winning_option__option',
+            'winning_generic_option',
+        )
+        .prefetch_related('prediction_event__options__option')
+        .order_by('-resolved_at')[:5]
+    )
+
+
 @require_http_methods(["GET", "POST"])
 def home(request):
     # Sync events via event sources if needed
@@ -77,34 +118,11 @@ def home(request):
 
     now = timezone.now()
 
-    tip_types = list(TipType.objects.filter(is_active=True).order_by('deadline'))
-    sections: list[dict] = []
-
-    for tip_type in tip_types:
-        events = list(
-            PredictionEvent.objects.filter(
-                tip_type=tip_type,
-                is_active=True,
-                opens_at__lte=now,
-            )
-            .exclude(deadline__lt=now)
-            .select_related('scheduled_game')
-            .prefetch_related('options__option__category')
-            .order_by('deadline', 'sort_order', 'name')
-        )
-        if not events:
-            continue
-
-        sections.append({'tip_type': tip_type, 'events': events})
-
-    visible_events: list[PredictionEvent] = []
-    seen_event_ids: set[int] = set()
-    for section in sections:
-        for event in section['events']:
-            if event.id in seen_event_ids:
-                continue
-            seen_event_ids.add(event.id)
-            visible_events.append(event)
+    # All open events in one query, grouped into sections, weekday slots and
+    # the open predictions list
+    event_feed = load_event_feed(now)
+    sections = event_feed.sections
+    visible_events = event_feed.visible_events
 
     requires_team_choices = any(
         event.selection_mode == PredictionEvent.SelectionMode.ANY
@@ -117,9 +135,11 @@ def home(request):
         for event in visible_events
     )
 
-    # Load team choices for prediction events that allow team selection
-    team_choices = list(NbaTeamManager.all()) if requires_team_choices else []
-    player_choices = list(NbaPlayerManager.all()) if requires_player_choices else []
+    # Load compact cached choice lists for prediction events that allow free
+    # selection. The player picker searches /api/options/search/ on demand,
+    # so players are only loaded to validate submitted picks.
+    team_choices = get_option_choices(NbaTeamManager.CATEGORY_SLUG) if requires_team_choices else []
+    player_choices: list[OptionChoice] = []
 
     user_tips: dict[int, UserTip] = {}
     if active_user and visible_events:
@@ -157,114 +177,24 @@ def home(request):
                 messages.error(request, 'No prediction events are available right now.')
                 return redirect('predictions:home')
 
+            if requires_player_choices:
+                player_choices = get_option_choices(NbaPlayerManager.CATEGORY_SLUG)
+
             lock_service = LockService(active_user)
             lock_service.refresh()
-            insufficient_lock_events: list[PredictionEvent] = []
-            deadline_locked_events: list[PredictionEvent] = []
-            saved = 0
-            for event in visible_events:
-                key = f'prediction_{event.id}'
-                submitted_value = request.POST.get(key)
-                lock_key = f'lock_{event.id}'
-                should_lock = request.POST.get(lock_key) == '1'
-
-                if not submitted_value:
-                    existing_tip = user_tips.get(event.id)
-                    if existing_tip is None:
-                        continue
-                    option = existing_tip.prediction_option
-                    selected_option = existing_tip.selected_option
-                    prediction_label = existing_tip.prediction
-                else:
-                    option = None
-                    selected_option = None
-                    prediction_label = ''
-
-                    if event.selection_mode == PredictionEvent.SelectionMode.CURATED:
-                        try:
-                            option_id = int(submitted_value)
-                        except (TypeError, ValueError):
-                            continue
-                        option = next(
-                            (
-                                item
-                                for item in event.options.all()
-                                if item.id == option_id
-                            ),
-                            None,
-                        )
-                        if not option:
-                            continue
-                        # Get the underlying generic option
-                        selected_option = option.option
-                        prediction_label = option.label
-                    else:
-                        # ANY selection mode - select from available options
-                        if event.target_kind == PredictionEvent.TargetKind.TEAM:
-                            try:
-                                team_id = int(submitted_value)
-                            except (TypeError, ValueError):
-                                continue
-                            selected_team = next(
-                                (team for team in team_choices if team.id == team_id),
-                                None,
-                            )
-                            if not selected_team:
-                                continue
-                            prediction_label = selected_team.name
-                            # Team choice is already an Option
-                            selected_option = selected_team
-                        elif event.target_kind == PredictionEvent.TargetKind.PLAYER:
-                            try:
-                                player_id = int(submitted_value)
-                            except (TypeError, ValueError):
-                                continue
-                            selected_player = next(
-                                (player for player in player_choices if player.id == player_id),
-                                None,
-                            )
-                            if not selected_player:
-                                continue
-                            prediction_label = selected_player.name
-                            # Player choice is already an Option
-                            selected_option = selected_player
-                        else:
-                            # Generic option selection
-                            try:
-                                generic_option_id = int(submitted_value)
-                            except (TypeError, ValueError):
-                                continue
-                            selected_option = Option.objects.filter(
-                                id=generic_option_id
-                            ).first()
-                            if not selected_option:
-                                continue
-                            prediction_label = selected_option.name
-
-                tip = user_tips.get(event.id)
-                if tip is None:
-                    tip = UserTip(
-                        user=active_user,
-                        prediction_event=event,
-                    )
-                tip.tip_type = event.tip_type
-                tip.prediction = prediction_label
-                tip.prediction_option = option
-                tip.selected_option = selected_option
-                tip.save()
-                user_tips[event.id] = tip
-                saved += 1
-
-                if should_lock:
-                    try:
-                        lock_service.ensure_locked(tip)
-                    except LockLimitError:
-                        insufficient_lock_events.append(event)
-                elif tip.is_locked:
-                    if event.deadline <= now:
-                        deadline_locked_events.append(event)
-                    else:
-                        lock_service.release_lock(tip)
+            submission = save_tip_submission(
+                active_user,
+                visible_events,
+                request.POST,
+                user_tips=user_tips,
+                team_choices=team_choices,
+                player_choices=player_choices,
+                lock_service=lock_service,
+                now=now,
+            )
+            saved = submission.saved
+            insufficient_lock_events = submission.insufficient_lock_events
+            deadline_locked_events = submission.deadline_locked_events
 
             if saved:
                 messages.success(request, 'Your picks have been saved!')
@@ -327,18 +257,11 @@ def home(request):
         now = timezone.now()
         season_has_ended = displayed_season.end_datetime < now
         
-        # Render markdown description - use season_end_description if season has ended
-        description_text = None
+        # Pre-rendered description - use season_end_description if season has ended
         if season_has_ended and displayed_season.season_end_description:
-            description_text = displayed_season.season_end_description
+            season_description_html = displayed_season.season_end_description_html
         elif displayed_season.description:
-            description_text = displayed_season.description
-        
-        if description_text:
-            season_description_html = markdown2.markdown(
-                description_text,
-                extras=['fenced-code-blocks', 'tables', 'break-on-newline', 'cuddled-lists']
-            )
+            season_description_html = displayed_season.description_html
         
         # Calculate countdown
         if displayed_season.start_datetime > now:
@@ -352,160 +275,48 @@ def home(request):
             days_until = delta.days
             countdown_text = f"{days_until} Tag{'e' if days_until != 1 else ''} bis zum Ende"
     
-    # Calculate season results for recently ended seasons (within 7 days)
+    # Results of a season that ended in the last 7 days, precomputed once
     season_results = None
     if active_user:
-        now = timezone.now()
-        seven_days_ago = now - timedelta(days=7)
-        
-        # Get all seasons that ended in the last 7 days
-        # We need to check the actual end_datetime, not just the date
-        recently_ended_seasons = []
-        for season in Season.objects.filter(
-            end_date__isnull=False,
-            start_date__isnull=False,
-            end_date__gte=seven_days_ago.date()
-        ).order_by('-end_date', '-end_time'):
-            try:
-                # Only include seasons that have actually ended (end_datetime < now)
-                if season.end_datetime < now:
-                    recently_ended_seasons.append(season)
-            except (ValueError, AttributeError):
-                # Skip seasons with invalid data
-                continue
-        
-        # Take the most recently ended season
-        ended_season = recently_ended_seasons[0] if recently_ended_seasons else None
-        
-        if ended_season:
-            
-            # Get top 3 users for this season (only enrolled users)
-            season_filter = Q(
-                usereventscore__awarded_at__gte=ended_season.start_datetime,
-                usereventscore__awarded_at__lte=ended_season.end_datetime
-            )
-            
-            # Filter to only include enrolled users for the ended season
-            enrolled_user_ids = SeasonParticipant.objects.filter(season=ended_season).values_list('user_id', flat=True)
-            
-            User = get_user_model()
-            top_users = User.objects.filter(id__in=enrolled_user_ids).annotate(
-                total_points=Coalesce(
-                    Sum('usereventscore__points_awarded', filter=season_filter),
-                    0
-                ),
-            ).filter(
-                total_points__gt=0
-            ).order_by('-total_points')[:3]
-            
-            # Calculate correct pick rate (only for enrolled users)
-            # Get all tips within the season datetime range from enrolled users only
-            season_tips = UserTip.objects.filter(
-                user_id__in=enrolled_user_ids,
-                prediction_event__deadline__gte=ended_season.start_datetime,
-                prediction_event__deadline__lte=ended_season.end_datetime
-            ).select_related('prediction_option', 'selected_option', 'prediction_option__option')
-            
-            # Get all outcomes for events in this season
-            season_events = PredictionEvent.objects.filter(
-                deadline__gte=ended_season.start_datetime,
-                deadline__lte=ended_season.end_datetime
-            )
-            season_outcomes = {
-                outcome.prediction_event_id: outcome
-                for outcome in EventOutcome.objects.filter(
-                    prediction_event__in=season_events
-                ).select_related('winning_option', 'winning_generic_option', 'winning_option__option')
-            }
-            
-            # Count correct and incorrect picks (using same logic as scoring_service.py)
-            correct_picks = 0
-            total_picks_with_outcomes = 0
-            
-            for tip in season_tips:
-                outcome = season_outcomes.get(tip.prediction_event_id)
-                if outcome:
-                    total_picks_with_outcomes += 1
-                    # Check if tip matches outcome (same logic as in scoring_service.py)
-                    is_correct = False
-                    if outcome.winning_option_id:
-                        if tip.prediction_option_id == outcome.winning_option_id:
-                            is_correct = True
-                        elif tip.selected_option_id and outcome.winning_option and outcome.winning_option.option_id:
-                            is_correct = (tip.selected_option_id == outcome.winning_option.option_id)
-                    elif outcome.winning_generic_option_id:
-                        is_correct = (tip.selected_option_id == outcome.winning_generic_option_id)
-                    
-                    if is_correct:
-                        correct_picks += 1
-            
-            # Calculate correct pick rate as percentage
-            if total_picks_with_outcomes > 0:
-                correct_pick_rate = round((correct_picks / total_picks_with_outcomes) * 100, 1)
-            else:
-                # No picks with outcomes yet - show 0%
-                correct_pick_rate = 0.0
-            
-            # Count total matches (events) in the season
-            total_matches = season_events.count()
-            
-            # Count participants
-            season_participant_count = SeasonParticipant.objects.filter(
-                season=ended_season
-            ).count()
-            
-            # Only show season results if there were participants
-            if season_participant_count > 0:
-                # Render markdown description - use season_end_description if available, otherwise description
-                season_results_description_html = ''
-                description_text = None
-                if ended_season.season_end_description:
-                    description_text = ended_season.season_end_description
-                elif ended_season.description:
-                    description_text = ended_season.description
-                
-                if description_text:
-                    season_results_description_html = markdown2.markdown(
-                        description_text,
-                        extras=['fenced-code-blocks', 'tables', 'break-on-newline', 'cuddled-lists']
-                    )
-                
-                # Apply display names to top_users (using nicknames if available)
-                top_users_list = list(top_users)
-                top_user_ids = [user.id for user in top_users_list]
-                top_users_display_name_map = _build_display_name_map(top_user_ids)
-                for user in top_users_list:
-                    user.display_name = top_users_display_name_map.get(user.id, user.username)
-                
-                season_results = {
-                    'season': ended_season,
-                    'top_users': top_users_list,
-                    'correct_pick_rate': correct_pick_rate,
-                    'total_matches': total_matches,
-                    'participant_count': season_participant_count,
-                    'description_html': season_results_description_html,
+        recap = get_recent_season_recap(now=timezone.now())
+        if recap:
+            ended_season = recap.season
+            # Pre-rendered description - use season_end_description if available, otherwise description
+            season_results_description_html = ''
+            if ended_season.season_end_description:
+                season_results_description_html = ended_season.season_end_description_html
+            elif ended_season.description:
+                season_results_description_html = ended_season.description_html
+
+            # Podium with current display names (using nicknames if available)
+            top_users_display_name_map = _build_display_name_map([entry['user_id'] for entry in recap.podium])
+            top_users_list = [
+                {
+                    **entry,
+                    'display_name': top_users_display_name_map.get(entry['user_id'], entry['username']),
                 }
-    
+                for entry in recap.podium
+            ]
+
+            season_results = {
+                'season': ended_season,
+                'top_users': top_users_list,
+                'correct_pick_rate': recap.correct_pick_rate,
+                'total_matches': recap.total_matches,
+                'participant_count': recap.participant_count,
+                'viewer_stats': recap.stats_for(active_user.id),
+                'description_html': season_results_description_html,
+            }
+
     lock_summary = None
     scoreboard_summary = None
     recent_scores: list[UserEventScore] = []
     if active_user:
         lock_summary = LockService(active_user).refresh()
 
-        score_queryset = (
-            UserEventScore.objects.filter(user=active_user)
-            .select_related('prediction_event__tip_type')
-            .order_by('-awarded_at', '-id')
-        )
-        
         # Filter by active season if one exists
-        if active_season:
-            score_queryset = score_queryset.filter(
-                awarded_at__gte=active_season.start_datetime,
-                awarded_at__lte=active_season.end_datetime
-            )
-        
-        recent_scores = list(score_queryset[:5])
+        score_queryset = _user_scores(active_user, active_season)
+        recent_scores = list(_recent_scores(score_queryset))
         for score in recent_scores:
             score.lock_bonus_value = max(score.points_awarded - score.base_points, 0)
 
@@ -546,56 +357,38 @@ def home(request):
         bonus_event_points_total = scoreboard_summary.get('bonus_event_points', 0)
         scoreboard_summary['standard_points'] = max(base_points_total - bonus_event_points_total, 0)
 
+    # Pickers per event: curated events read the denormalised option counters
+    # (capped recent pickers); only free-selection events load their tips
     event_tip_users: dict[int, list] = defaultdict(list)
+    event_pick_counts: dict[int, int] = {}
     tip_user_objects: list = []
-    if visible_events:
+    event_picks = load_event_picks(visible_events)
+    if event_picks:
+        picker_ids = {picker.user_id for picks in event_picks.values() for picker in picks.pickers}
+        picker_users = get_user_model().objects.in_bulk(picker_ids)
+        tip_user_objects.extend(picker_users.values())
+        for event_id, picks in event_picks.items():
+            event_pick_counts[event_id] = picks.tip_count
+            users = [picker_users[p.user_id] for p in picks.pickers if p.user_id in picker_users]
+            if users:
+                event_tip_users[event_id] = sorted(users, key=lambda user: user.username)
+    uncounted_events = [event for event in visible_events if event.id not in event_picks]
+    if uncounted_events:
         for tip in (
             UserTip.objects.filter(
-                prediction_event__in=visible_events,
+                prediction_event__in=uncounted_events,
             )
             .select_related('user')
             .order_by('user__username')
         ):
             event_tip_users[tip.prediction_event_id].append(tip.user)
             tip_user_objects.append(tip.user)
+        for event in uncounted_events:
+            event_pick_counts[event.id] = len(event_tip_users.get(event.id, []))
 
-    upcoming_range_start = timezone.localdate(now)
-    upcoming_range_end = upcoming_range_start + timedelta(days=6)
-
-    def event_sort_key(event: PredictionEvent) -> tuple:
-        return (
-            event.deadline,
-            event.sort_order,
-            event.name.lower(),
-        )
-
-    upcoming_events = [
-        event
-        for event in visible_events
-        if event.deadline is not None
-        and upcoming_range_start
-        <= timezone.localdate(event.deadline)
-        <= upcoming_range_end
-    ]
-
-    upcoming_events.sort(key=event_sort_key)
-
-    events_by_day: dict = defaultdict(list)
-    for event in upcoming_events:
-        deadline_date = timezone.localdate(event.deadline)
-        events_by_day[deadline_date].append(event)
-
-    for event_list in events_by_day.values():
-        event_list.sort(key=event_sort_key)
-
-    weekday_slots = []
-    for offset in range(7):
-        slot_date = upcoming_range_start + timedelta(days=offset)
-        day_events = events_by_day.get(slot_date, [])
-        weekday_slots.append({'date': slot_date, 'events': day_events})
-
-    week_start = upcoming_range_start
-    week_end = upcoming_range_end
+    weekday_slots = event_feed.weekday_slots
+    week_start = event_feed.week_start
+    week_end = event_feed.week_end
 
     if preferences_form is None and preferences is not None:
         preferences_form = UserPreferencesForm(instance=preferences)
@@ -619,313 +412,49 @@ def home(request):
         _apply_display_metadata(user, display_name_map)
     _apply_display_metadata(active_user, display_name_map)
 
-    # Fetch leaderboard data for dashboard
-    # (active_season already retrieved above for scoreboard_summary)
-    bonus_event_points_expr = Case(
-        When(
-            usereventscore__prediction_event__is_bonus_event=True,
-            then=F('usereventscore__base_points'),
-        ),
-        default=0,
-        output_field=IntegerField(),
-    )
-    lock_bonus_points_expr = Case(
-        When(
-            usereventscore__is_lock_bonus=True,
-            then=F('usereventscore__points_awarded') - F('usereventscore__base_points'),
-        ),
-        default=0,
-        output_field=IntegerField(),
-    )
-
-    # Build base queryset for leaderboard
-    # Include all users, even those with no scores
-    
-    # Build conditional expressions for filtering scores by season
-    if active_season:
-        # Only count scores within the active season's datetime range
-        season_filter = Q(
-            usereventscore__awarded_at__gte=active_season.start_datetime,
-            usereventscore__awarded_at__lte=active_season.end_datetime
-        )
-        
-        # Filter leaderboard to only include enrolled users for the active season
-        enrolled_user_ids = SeasonParticipant.objects.filter(season=active_season).values_list('user_id', flat=True)
-        
-        User = get_user_model()
-        leaderboard_users = User.objects.filter(id__in=enrolled_user_ids).annotate(
-            total_points=Coalesce(
-                Sum('usereventscore__points_awarded', filter=season_filter),
-                0
-            ),
-            event_count=Coalesce(
-                Count('usereventscore__prediction_event', distinct=True, filter=season_filter),
-                0
-            ),
-        ).order_by('-total_points', '-event_count', 'username')
-    else:
-        # No active season, count all scores
-        User = get_user_model()
-        leaderboard_users = User.objects.annotate(
-            total_points=Coalesce(Sum('usereventscore__points_awarded'), 0),
-            event_count=Coalesce(Count('usereventscore__prediction_event', distinct=True), 0),
-        ).order_by('-total_points', '-event_count', 'username')
-
-    leaderboard_rows = list(leaderboard_users)
-    leaderboard_user_ids = [row.id for row in leaderboard_rows]
-    leaderboard_display_name_map = _build_display_name_map(leaderboard_user_ids)
-
-    # Fetch achievements for all leaderboard users
-    from .models import Achievement
-    achievements_by_user = {}
-    if leaderboard_user_ids:
-        achievements = Achievement.objects.filter(
-            user_id__in=leaderboard_user_ids
-        ).select_related('season').order_by('awarded_at')
-        
-        for achievement in achievements:
-            user_id = achievement.user_id
-            if user_id not in achievements_by_user:
-                achievements_by_user[user_id] = []
-            achievements_by_user[user_id].append(achievement)
-
-    # Calculate 3-day score change for each user
-    three_days_ago = now - timedelta(days=3)
-    for index, row in enumerate(leaderboard_rows, start=1):
-        row.display_name = leaderboard_display_name_map.get(row.id, row.username)
-        row.total_points = int(row.total_points)
-        row.event_count = int(row.event_count)
-        row.rank = index
-        
-        # Calculate points awarded in the last 3 days
-        points_filter = Q(user=row, awarded_at__gte=three_days_ago)
-        if active_season:
-            points_filter &= Q(
-                awarded_at__gte=active_season.start_datetime,
-                awarded_at__lte=active_season.end_datetime
-            )
-        points_last_3_days = UserEventScore.objects.filter(points_filter).aggregate(
-            total=Coalesce(Sum('points_awarded'), 0)
-        )['total']
-        row.points_change_3d = int(points_last_3_days) if points_last_3_days else 0
-        
-        # Add achievements for this user (use different name to avoid conflict with related manager)
-        row.user_achievements = achievements_by_user.get(row.id, [])
-        
-        # Add hotness data for each user
-        from .hotness_service import get_or_create_hotness, get_kudos_count_today
-        hotness = get_or_create_hotness(row, active_season)
-        row.hotness_score = hotness.score
-        row.hotness_level = hotness.get_level()
-        row.kudos_today = get_kudos_count_today(row)
-        
-        # Add lock summary for each user
-        try:
-            lock_service = LockService(row)
-            row.lock_summary = lock_service.get_summary()
-        except Exception:
-            # If there's any issue getting lock data, default to all locks available
-            from .lock_service import LockSummary
-            row.lock_summary = LockSummary(total=3, available=3, active=0, pending=0, next_return_at=None)
-    
-    # Get kudos status for active user
+    # Leaderboard: rank 1 and the window around the active user, ranked in the
+    # database (active_season already retrieved above for scoreboard_summary)
+    leaderboard_slice = get_leaderboard_slice(active_season, active_user.id if active_user else None, now=now)
+    leaderboard_rows = leaderboard_slice.rows
     if active_user:
-        from .hotness_service import get_user_kudos_given_today
-        kudos_status = get_user_kudos_given_today(active_user, leaderboard_rows)
+        kudos_status = get_kudos_given_today(
+            active_user,
+            [row for row in leaderboard_rows if not getattr(row, 'is_divider', False)],
+            now=now,
+        )
     else:
         kudos_status = {}
-    
-    # Filter leaderboard rows based on requirements (max 6 users):
-    # - If less than 6 users total: show all users
-    # - If 6 or more users:
-    #   - Always show 1st place
-    #   - Show nearest 4 users around the active user
-    #   - Examples:
-    #     - User in 1st: Show 1st + 5 users after = 6 total
-    #     - User in last: Show 1st + 4 before + active = 6 total
-    #     - User in 3rd: Show places 1-6 = 6 total
-    #     - User in 6th: Show 1st + 2 before + active + 2 after = 6 total
-    #     - User in 21st: Show 1st + 2 before + active + 2 after = 6 total
-    if len(leaderboard_rows) <= 6:
-        # Less than or equal to 6 users, show all
-        filtered_leaderboard = leaderboard_rows
-        if active_user:
-            # Mark active user if present
-            for row in filtered_leaderboard:
-                if row.id == active_user.id:
-                    row.is_active_user = True
-                    break
-    elif active_user and leaderboard_rows:
-        # More than 6 users, find active user's rank
-        active_user_rank = None
-        for idx, row in enumerate(leaderboard_rows, start=1):
-            if row.id == active_user.id:
-                active_user_rank = idx
-                break
-        
-        if active_user_rank:
-            total_users = len(leaderboard_rows)
-            
-            if active_user_rank == 1:
-                # User is 1st: Show 1st + 5 users after = 6 total
-                filtered_leaderboard = leaderboard_rows[:6]
-                filtered_leaderboard[0].is_active_user = True
-            elif active_user_rank == total_users:
-                # User is last: Show 1st + 4 before + active = 6 total
-                rank_1 = [leaderboard_rows[0]]
-                # Show 4 users before active (positions active-4 to active-1)
-                start_idx = active_user_rank - 4 - 1  # -1 because index is 0-based
-                users_before = leaderboard_rows[start_idx:active_user_rank - 1]  # 4 users before active
-                active_user_row = [leaderboard_rows[active_user_rank - 1]]
-                active_user_row[0].is_active_user = True
-                
-                # Add divider if rank 1 is not adjacent to the users before section
-                class DividerMarker:
-                    def __init__(self):
-                        self.is_divider = True
-                filtered_leaderboard = rank_1 + [DividerMarker()] + users_before + active_user_row
-            else:
-                # User is in the middle: Show 1st + nearest 4 users around active (2 before + 2 after when possible)
-                rank_1 = [leaderboard_rows[0]]
-                
-                # Try to show 2 before and 2 after (4 users around active)
-                # Examples:
-                # - User in 3rd: Show 1-6 (rank 1 + positions 2,3,4,5,6)
-                # - User in 6th: Show 1st + 4,5,6,7,8 (2 before + active + 2 after)
-                # - User in 21st: Show 1st + 19,20,21,22,23 (2 before + active + 2 after)
-                
-                # Start with ideal: 2 before + active + 2 after = 5 users (plus 1st = 6 total)
-                users_before_count = 2
-                users_after_count = 2
-                
-                # Check if active is in positions 2-5 (can show continuous 1-6)
-                # Position 6+ should show with divider to match example: "User in 6th? Show 2 users before + 2 users after + 1st"
-                if active_user_rank <= 5:
-                    # Can show continuous range 1-6 for positions 2-5 (cleaner UX, no divider needed)
-                    filtered_leaderboard = leaderboard_rows[:6]
-                    for row in filtered_leaderboard:
-                        if row.id == active_user.id:
-                            row.is_active_user = True
-                            break
-                else:
-                    # Active is position 7 or later - need divider
-                    # Adjust if we're too close to the end
-                    max_after = total_users - active_user_rank
-                    if max_after < 2:
-                        # Can't show 2 after, show more before
-                        users_after_count = max_after
-                        users_before_count = 4 - users_after_count
-                    
-                    # Adjust if we're too close to rank 1 (shouldn't happen since rank > 6)
-                    if active_user_rank - users_before_count <= 1:
-                        # Edge case: active is at position 2-5 but somehow got here
-                        users_before_count = max(0, active_user_rank - 2)
-                        users_after_count = 4 - users_before_count
-                    
-                    start_idx = active_user_rank - 1 - users_before_count
-                    users_before = leaderboard_rows[start_idx:active_user_rank - 1]
-                    
-                    active_user_row = [leaderboard_rows[active_user_rank - 1]]
-                    active_user_row[0].is_active_user = True
-                    
-                    end_idx = active_user_rank + users_after_count
-                    users_after = leaderboard_rows[active_user_rank:end_idx]
-                    
-                    # Add divider since rank 1 is not adjacent
-                    class DividerMarker:
-                        def __init__(self):
-                            self.is_divider = True
-                    filtered_leaderboard = rank_1 + [DividerMarker()] + users_before + active_user_row + users_after
-        else:
-            # Active user not in leaderboard, show top 6
-            filtered_leaderboard = leaderboard_rows[:6]
-    else:
-        # No active user, show top 6
-        filtered_leaderboard = leaderboard_rows[:6]
-    
-    leaderboard_rows = filtered_leaderboard
 
     # Fetch recently resolved predictions (last 5)
-    resolved_predictions = list(
-        EventOutcome.objects.select_related(
-            'prediction_event__tip_type',
-            'winning_option__option',
-            'winning_generic_option',
-        )
-        .prefetch_related('prediction_event__options__option')
-        .order_by('-resolved_at')[:5]
-    )
+    resolved_predictions = list(_recently_resolved_outcomes())
 
-    # For each resolved prediction, get user tips if active user exists
+    # The active user's tips on them, with the correctness stored at scoring
+    resolved_tips = {}
+    if active_user and resolved_predictions:
+        resolved_tips = {
+            tip.prediction_event_id: tip
+            for tip in UserTip.objects.filter(
+                user=active_user,
+                prediction_event_id__in=[outcome.prediction_event_id for outcome in resolved_predictions],
+            ).select_related('prediction_option', 'selected_option')
+        }
     resolved_predictions_data = []
-    if resolved_predictions:
-        for outcome in resolved_predictions:
-            outcome_data = {
-                'outcome': outcome,
-                'user_tip': None,
-                'is_correct': False,
-            }
-            if active_user:
-                try:
-                    user_tip = UserTip.objects.get(
-                        user=active_user,
-                        prediction_event=outcome.prediction_event
-                    )
-                    outcome_data['user_tip'] = user_tip
-                    # Check if the user's prediction was correct
-                    if outcome.winning_option and user_tip.prediction_option:
-                        outcome_data['is_correct'] = (user_tip.prediction_option.id == outcome.winning_option.id)
-                    elif outcome.winning_generic_option and user_tip.selected_option:
-                        outcome_data['is_correct'] = (user_tip.selected_option.id == outcome.winning_generic_option.id)
-                except UserTip.DoesNotExist:
-                    pass
-            resolved_predictions_data.append(outcome_data)
-
-    # Get open predictions with due dates in the upcoming week
-    upcoming_range_start = timezone.localdate(now)
-    upcoming_range_end = upcoming_range_start + timedelta(days=6)
-    
-    # First, get all events from the next 7 days
-    open_predictions = list(
-        PredictionEvent.objects.filter(
-            is_active=True,
-            opens_at__lte=now,
-            deadline__gte=now,
-            deadline__date__gte=upcoming_range_start,
-            deadline__date__lte=upcoming_range_end,
-        )
-        .exclude(outcome__isnull=False)  # Exclude events that have outcomes
-        .select_related('scheduled_game', 'tip_type')
-        .prefetch_related('options__option__category')
-        .order_by('deadline', 'sort_order', 'name')
-    )
-    
-    # If we have less than 5 events, fill up with upcoming events from future dates
-    if len(open_predictions) < 5:
-        needed_count = 5 - len(open_predictions)
-        existing_ids = {event.id for event in open_predictions}
-        
-        # Get additional events from future dates (beyond the 7-day window)
-        additional_events = list(
-            PredictionEvent.objects.filter(
-                is_active=True,
-                opens_at__lte=now,
-                deadline__gte=now,
-                deadline__date__gt=upcoming_range_end,
-            )
-            .exclude(outcome__isnull=False)  # Exclude events that have outcomes
-            .exclude(id__in=existing_ids)  # Exclude events we already have
-            .select_related('scheduled_game', 'tip_type')
-            .prefetch_related('options__option__category')
-            .order_by('deadline', 'sort_order', 'name')[:needed_count]
-        )
-        
-        open_predictions.extend(additional_events)
+    for outcome in resolved_predictions:
+        user_tip = resolved_tips.get(outcome.prediction_event_id)
+        resolved_predictions_data.append({
+            'outcome': outcome,
+            'user_tip': user_tip,
+            'is_correct': bool(user_tip and user_tip.is_correct),
+        })
+
+    open_predictions = event_feed.open_predictions
 
     context = {
         'active_user': active_user,
         'user_tips': user_tips,
         'event_tip_users': event_tip_users,
+        'event_pick_counts': event_pick_counts,
+        'event_picks': event_picks,
         'now': now,
         'weekday_slots': weekday_slots,
         'week_start': week_start,
@@ -934,7 +463,7 @@ def home(request):
         'preferences_form': preferences_form,
         'event_sections': sections,
         'team_choices': team_choices,
-        'player_choices': player_choices,
+        'player_search_category': NbaPlayerManager.CATEGORY_SLUG if requires_player_choices else None,
         'lock_summary': lock_summary,
         'scoreboard_summary': scoreboard_summary,
         'recent_scores': recent_scores,
@@ -1207,20 +736,171 @@ def get_lock_summary(request):
 
 
 @require_http_methods(["GET"])
+def leaderboard_api(request):
+    """
+    Return the ranked standings for a season as JSON.
+
+    Query parameters:
+        season: Season id (defaults to the active season, or all-time scores
+            when no season is active)
+        window: When set, only rank 1 and the rows around the viewer are returned
+
+    Responses carry an ETag derived from the latest standings change, so
+    clients can revalidate with If-None-Match and receive a 304.
+    """
+    active_user = get_active_user(request)
+    now = timezone.now()
+
+    season_id = request.GET.get('season')
+    if season_id:
+        try:
+            season = Season.objects.get(pk=int(season_id))
+        except (ValueError, Season.DoesNotExist):
+            return JsonResponse({'error': 'Season not found'}, status=404)
+    else:
+        season = Season.get_active_season(now)
+    windowed = request.GET.get('window', '').lower() in ('1', 'true', 'yes')
+
+    stamp = get_change_stamp(season, now=now)
+    etag = '"{}-{}-{}"'.format(stamp, active_user.id if active_user else 0, 'w' if windowed else 'f')
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        patch_cache_control(not_modified, private=True, no_cache=True)
+        return not_modified
+
+    if windowed:
+        # Same cached path as the home page
+        leaderboard_slice = get_leaderboard_slice(
+            season, active_user.id if active_user else None, now=now, stamp=stamp,
+        )
+        visible_rows = leaderboard_slice.rows
+        total, viewer_rank = leaderboard_slice.total, leaderboard_slice.viewer_rank
+    else:
+        rows = get_leaderboard(season, now=now, stamp=stamp)
+        viewer_row = next((row for row in rows if active_user and row.id == active_user.id), None)
+        visible_rows = [
+            replace(row, is_active_user=True) if row is viewer_row else row
+            for row in rows
+        ]
+        total, viewer_rank = len(rows), viewer_row.rank if viewer_row else None
+    kudos_status = get_kudos_given_today(
+        active_user,
+        [row for row in visible_rows if not isinstance(row, LeaderboardDivider)],
+        now=now,
+    ) if active_user else {}
+
+    response = JsonResponse({
+        'season': {'id': season.id, 'name': season.name} if season else None,
+        'total': total,
+        'viewer_rank': viewer_rank,
+        'rows': [
+            {'divider': True}
+            if isinstance(row, LeaderboardDivider)
+            else row.as_dict(kudos_given=kudos_status.get(row.id, False))
+            for row in visible_rows
+        ],
+    })
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+@require_http_methods(["GET"])
+def season_projection_api(request):
+    """
+    Return who can still win a season as JSON.
+
+    Query parameters:
+        season: Season id (defaults to the active season)
+
+    Each row holds the user's current and maximum possible points, the
+    clinched/eliminated flags and the simulated win probability. Responses
+    carry an ETag derived from the projection's change stamp.
+    """
+    now = timezone.now()
+    season_id = request.GET.get('season')
+    if season_id:
+        try:
+            season = Season.objects.get(pk=int(season_id))
+        except (ValueError, Season.DoesNotExist):
+            return JsonResponse({'error': 'Season not found'}, status=404)
+    else:
+        season = Season.get_active_season(now)
+        if season is None:
+            return JsonResponse({'error': 'No active season'}, status=404)
+
+    stamp = get_projection_stamp(season, now=now)
+    etag = f'"{stamp}"'
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        patch_cache_control(not_modified, private=True, no_cache=True)
+        return not_modified
+
+    projection = get_season_projection(season, now=now, stamp=stamp)
+    response = JsonResponse({
+        'season': {'id': season.id, 'name': season.name},
+        **projection.as_dict(),
+    })
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+@require_http_methods(["GET"])
+def option_search_api(request):
+    """
+    Typeahead search over the active Options of a category.
+
+    Query parameters:
+        category: OptionCategory slug (e.g. ``nba-players``)
+        q: Search text; prefix matches on any word come first, then fuzzy
+            trigram matches
+        limit: Maximum number of results (default 20, at most 50)
+    """
+    slug = request.GET.get('category', '')
+    category = OptionCategory.objects.filter(slug=slug, is_active=True).first() if slug else None
+    if category is None:
+        return JsonResponse({'error': 'Category not found'}, status=404)
+
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_SEARCH_LIMIT))
+    except ValueError:
+        limit = DEFAULT_SEARCH_LIMIT
+
+    results = search_option_choices(category, request.GET.get('q', ''), limit)
+    response = JsonResponse({
+        'category': category.slug,
+        'results': [choice.as_dict() for choice in results],
+    })
+    patch_cache_control(response, max_age=60)
+    return response
+
+
+def _legal_sections_etag(model) -> str:
+    """ETag for a legal section API: changes on any edit, addition or deletion."""
+    stats = model.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    latest = stats['latest'].isoformat() if stats['latest'] else ''
+    return f"{model._meta.model_name}-{stats['count']}-{latest}"
+
+
+def _legal_sections_last_modified(model):
+    return model.objects.aggregate(latest=Max('updated_at'))['latest']
+
+
+@require_http_methods(["GET"])
+@condition(
+    etag_func=lambda request: _legal_sections_etag(ImpressumSection),
+    last_modified_func=lambda request: _legal_sections_last_modified(ImpressumSection),
+)
 def get_impressum(request):
-    """Get Impressum sections with markdown-rendered content. Public access."""
+    """Get Impressum sections with pre-rendered markdown content. Public access."""
     sections = ImpressumSection.objects.all().order_by('order_number', 'caption')
     
     sections_data = []
     for section in sections:
-        # Use markdown2 with extras for better list support
-        html = markdown2.markdown(
-            section.text,
-            extras=['fenced-code-blocks', 'tables', 'break-on-newline', 'cuddled-lists']
-        )
         sections_data.append({
             'caption': section.caption,
-            'text_html': html,
+            'text_html': section.text_html,
             'order_number': section.order_number,
         })
     
@@ -1230,20 +910,19 @@ def get_impressum(request):
 
 
 @require_http_methods(["GET"])
+@condition(
+    etag_func=lambda request: _legal_sections_etag(DatenschutzSection),
+    last_modified_func=lambda request: _legal_sections_last_modified(DatenschutzSection),
+)
 def get_datenschutz(request):
-    """Get Datenschutz sections with markdown-rendered content. Public access."""
+    """Get Datenschutz sections with pre-rendered markdown content. Public access."""
     sections = DatenschutzSection.objects.all().order_by('order_number', 'caption')
     
     sections_data = []
     for section in sections:
-        # Use markdown2 with extras for better list support
-        html = markdown2.markdown(
-            section.text,
-            extras=['fenced-code-blocks', 'tables', 'break-on-newline', 'cuddled-lists']
-        )
         sections_data.append({
             'caption': section.caption,
-            'text_html': html,
+            'text_html': section.text_html,
             'order_number': section.order_number,
         })
     
@@ -1253,20 +932,19 @@ def get_datenschutz(request):
 
 
 @require_http_methods(["GET"])
+@condition(
+    etag_func=lambda request: _legal_sections_etag(TeilnahmebedingungenSection),
+    last_modified_func=lambda request: _legal_sections_last_modified(TeilnahmebedingungenSection),
+)
 def get_teilnahmebedingungen(request):
-    """Get Teilnahmebedingungen sections with markdown-rendered content. Public access."""
+    """Get Teilnahmebedingungen sections with pre-rendered markdown content. Public access."""
     sections = TeilnahmebedingungenSection.objects.all().order_by('order_number', 'caption')
     
     sections_data = []
     for section in sections:
-        # Use markdown2 with extras for better list support
-        html = markdown2.markdown(
-            section.text,
-            extras=['fenced-code-blocks', 'tables', 'break-on-newline', 'cuddled-lists']
-        )
         sections_data.append({
             'caption': section.caption,
-            'text_html': html,
+            'text_html': section.text_html,
             'order_number': section.order_number,
         })
     
@@ -0,0 +1,121 @@
+"""Per-request performance metrics for HindSight.
+
+:class:`hooptipp.middleware.RequestMetricsMiddleware` opens a
+:class:`RequestMetrics` collector for every request. Code that talks to caches
+or external APIs reports into the collector of the current request through
+:func:`record_cache_access` and :func:`track_external_call`; both are no-ops
+outside of an instrumented request (management commands, workers, tests).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+_current_metrics: ContextVar[Optional['RequestMetrics']] = ContextVar('request_metrics', default=None)
+
+
+@dataclass
+class RequestMetrics:
+    """Counters collected while handling a single request."""
+
+    sql_count: int = 0
+    sql_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    external_time: Dict[str, float] = field(default_factory=dict)
+    external_calls: Dict[str, int] = field(default_factory=dict)
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """``connection.execute_wrapper`` hook counting and timing SQL statements."""
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.sql_count += 1
+
+    def add_external_call(self, service: str, duration: float) -> None:
+        self.external_time[service] = self.external_time.get(service, 0.0) + duration
+        self.external_calls[service] = self.external_calls.get(service, 0) + 1
+
+    def server_timing(self, total: float) -> str:
+        """Return the metrics formatted as a ``Server-Timing`` header value."""
+
+        entries: List[str] = [
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.sql_count} queries"',
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+        ]
+        for service in sorted(self.external_time):
+            entries.append(
+                f'{service};dur={self.external_time[service] * 1000:.1f};'
+                f'desc="{self.external_calls[service]} calls"'
+            )
+        entries.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(entries)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serialisable dict for structured logs."""
+
+        return {
+            'sql_count': self.sql_count,
+            'sql_ms': round(self.sql_time * 1000, 1),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'external_ms': {
+                service: round(duration * 1000, 1)
+                for service, duration in sorted(self.external_time.items())
+            },
+            'external_calls': dict(sorted(self.external_calls.items())),
+        }
+
+
+def start_request_metrics() -> tuple[RequestMetrics, Any]:
+    """Open a collector for the current context and return it with its reset token."""
+
+    metrics = RequestMetrics()
+    return metrics, _current_metrics.set(metrics)
+
+
+def stop_request_metrics(token: Any) -> None:
+    """Close the collector opened by :func:`start_request_metrics`."""
+
+    _current_metrics.reset(token)
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    """Return the collector of the current request, if any."""
+
+    return _current_metrics.get()
+
+
+def record_cache_access(hit: bool) -> None:
+    """Count a cache lookup against the current request."""
+
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+@contextmanager
+def track_external_call(service: str) -> Iterator[None]:
+    """Time an outbound API call (e.g. ``balldontlie`` or ``slapi``) for the current request."""
+
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_external_call(service, time.perf_counter() - start)
@@ -99,6 +99,20 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Request metrics
+# When enabled, every response carries a Server-Timing header (SQL, cache and
+# external API time) and a structured log line. Views exceeding their budget
+# in REQUEST_QUERY_BUDGETS (keyed by URL name) log a warning.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'False').lower() == 'true'
+if REQUEST_METRICS_ENABLED:
+    MIDDLEWARE.insert(0, 'hooptipp.middleware.RequestMetricsMiddleware')
+
+REQUEST_QUERY_BUDGETS = {
+    'predictions:home': {'queries': 80, 'total_ms': 500},
+    'predictions:save_prediction': {'queries': 15, 'total_ms': 150},
+    'predictions:toggle_lock': {'queries': 15, 'total_ms': 150},
+}
+
 ROOT_URLCONF = 'hooptipp.urls'
 
 TEMPLATES = [
@@ -365,6 +379,44 @@ else:
     # Console backend or other backends - set DEFAULT_FROM_EMAIL if provided
     DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@localhost')
 
+# Email Outbox
+# When enabled, emails are only queued by web requests and commands and are
+# delivered by `python manage.py run_mail_dispatcher`. When disabled, queued
+# emails are delivered immediately in-process.
+EMAIL_OUTBOX_ENABLED = os.environ.get('EMAIL_OUTBOX_ENABLED', 'False').lower() == 'true'
+EMAIL_OUTBOX_BATCH_SIZE = int(os.environ.get('EMAIL_OUTBOX_BATCH_SIZE', '50'))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', '5'))
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = int(os.environ.get('EMAIL_OUTBOX_RETRY_BASE_SECONDS', '60'))
+
+# Background jobs (run_worker): lease length of a running job, retry backoff
+# base, and the periodic schedules (seconds between runs) the workers enqueue
+JOB_LEASE_SECONDS = int(os.environ.get('JOB_LEASE_SECONDS', str(15 * 60)))
+JOB_RETRY_BASE_SECONDS = int(os.environ.get('JOB_RETRY_BASE_SECONDS', '60'))
+JOB_SCHEDULES = {
+    'sync_nba_games': {'interval': 5 * 60},
+    'process_game_outcomes': {'interval': 10 * 60},
+    'update_dbb_matches': {'interval': 6 * 3600},
+    'process_dbb_results': {'interval': 30 * 60},
+    'process_achievements': {'interval': 24 * 3600},
+    'send_reminder_emails': {'interval': 24 * 3600},
+    'process_profile_pictures': {'interval': 60},
+    'snapshot_standings': {'interval': 3600},
+}
+
+# When enabled, saved outcomes are scored by the predictions.score_outcomes job
+# of `python manage.py run_worker`. When disabled, they are scored in-process
+# as soon as the save commits.
+SCORING_QUEUE_ENABLED = os.environ.get('SCORING_QUEUE_ENABLED', 'False').lower() == 'true'
+# Seconds to wait after an outcome is saved before the scoring job runs, so
+# outcomes from one sync are scored in a single background batch
+SCORING_DEBOUNCE_SECONDS = int(os.environ.get('SCORING_DEBOUNCE_SECONDS', '5'))
+
+# Scoring leases each event while it is scored, so the admin buttons, the
+# scoring job and process_scores never score the same event concurrently.
+# SCORING_WORKERS threads share bulk rescoring (ignored on SQLite).
+SCORING_LEASE_SECONDS = int(os.environ.get('SCORING_LEASE_SECONDS', '300'))
+SCORING_WORKERS = int(os.environ.get('SCORING_WORKERS', '1'))
+
 # Cache Configuration (for rate limiting and other features)
 # Default to local memory cache - can be overridden via CACHES environment variable
 CACHES = {
@@ -374,5 +426,30 @@ CACHES = {
     }
 }
 
+# Leaderboard standings are cached per change stamp for this many seconds
+LEADERBOARD_CACHE_TIMEOUT = int(os.environ.get('LEADERBOARD_CACHE_TIMEOUT', '300'))
+
+# Season projection ("who can still win"): simulated seasons per run and
+# cache lifetime
+SEASON_PROJECTION_SIMULATIONS = int(os.environ.get('SEASON_PROJECTION_SIMULATIONS', '1000'))
+SEASON_PROJECTION_CACHE_TIMEOUT = int(os.environ.get('SEASON_PROJECTION_CACHE_TIMEOUT', '3600'))
+
+# Compact Option choice lists are cached per category version (the category's
+# Option count and latest change) for this many seconds
+OPTION_CHOICES_CACHE_TIMEOUT = int(os.environ.get('OPTION_CHOICES_CACHE_TIMEOUT', str(24 * 3600)))
+
+# HoopsHype roster scraping: concurrent requests and minimum seconds between
+# request starts per host, and how long raw pages are kept for revalidation
+HOOPSHYPE_MAX_CONCURRENCY = int(os.environ.get('HOOPSHYPE_MAX_CONCURRENCY', '4'))
+HOOPSHYPE_MIN_INTERVAL = float(os.environ.get('HOOPSHYPE_MIN_INTERVAL', '0.25'))
+HOOPSHYPE_HTML_CACHE_TIMEOUT = int(os.environ.get('HOOPSHYPE_HTML_CACHE_TIMEOUT', str(7 * 24 * 3600)))
+
+# Local NBA game mirror (sync_nba_games): seconds between list pages, how long
+# an in-progress mirrored score is shown on live cards, and how long other
+# non-final mirrored games are trusted by outcome processing
+NBA_GAME_SYNC_THROTTLE_SECONDS = float(os.environ.get('NBA_GAME_SYNC_THROTTLE_SECONDS', '1.0'))
+NBA_LIVE_GAME_MAX_AGE_SECONDS = int(os.environ.get('NBA_LIVE_GAME_MAX_AGE_SECONDS', '60'))
+NBA_GAME_MIRROR_MAX_AGE_SECONDS = int(os.environ.get('NBA_GAME_MIRROR_MAX_AGE_SECONDS', '600'))
+
 # Hotness System Configuration
 HOTNESS_DECAY_PER_HOUR = float(os.environ.get('HOTNESS_DECAY_PER_HOUR', '0.5'))
@@ -0,0 +1,192 @@
+"""Tests for the background job queue and the run_worker command."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from hooptipp import jobs
+from hooptipp.models import Job, JobSchedule
+
+
+calls = []
+
+
+@jobs.job('tests.record', max_attempts=2)
+def record_job(context, value=None, fail=False):
+    context.set_progress(50, 'Halfway', force=True)
+    calls.append(value)
+    if fail:
+        raise RuntimeError('boom')
+    return {'value': value}
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_deduplicates_active_jobs(self):
+        first = jobs.enqueue('tests.record', kwargs={'value': 1})
+        second = jobs.enqueue('tests.record', kwargs={'value': 2})
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_finished_job_allows_new_enqueue(self):
+        jobs.enqueue('tests.record')
+        jobs.run_next('worker-1')
+
+        jobs.enqueue('tests.record')
+
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_enqueue_unknown_job_raises(self):
+        with self.assertRaises(LookupError):
+            jobs.enqueue('tests.missing')
+
+    def test_run_next_records_result_and_progress(self):
+        jobs.enqueue('tests.record', kwargs={'value': 7})
+
+        job = jobs.run_next('worker-1')
+
+        self.assertEqual(calls, [7])
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(job.result, {'value': 7})
+        self.assertEqual(job.progress, 100)
+        self.assertEqual(job.progress_message, 'Halfway')
+        self.assertEqual(job.locked_by, 'worker-1')
+        self.assertIsNone(job.locked_until)
+        self.assertIsNone(jobs.run_next('worker-1'))
+
+    def test_failed_job_is_retried_then_marked_failed(self):
+        jobs.enqueue('tests.record', kwargs={'fail': True})
+
+        job = jobs.run_next('worker-1')
+        self.assertEqual(job.status, Job.Status.QUEUED)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn('boom', job.last_error)
+
+        Job.objects.update(run_at=timezone.now())
+        job = jobs.run_next('worker-1')
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_future_jobs_are_not_claimed(self):
+        jobs.enqueue('tests.record', run_at=timezone.now() + timedelta(minutes=5))
+
+        self.assertIsNone(jobs.claim_next('worker-1'))
+
+    def test_running_job_is_not_claimed_twice(self):
+        jobs.enqueue('tests.record')
+
+        self.assertIsNotNone(jobs.claim_next('worker-1'))
+        self.assertIsNone(jobs.claim_next('worker-2'))
+
+    def test_same_name_jobs_do_not_overlap(self):
+        jobs.enqueue('tests.record', dedup_key='first')
+        jobs.enqueue('tests.record', dedup_key='second')
+
+        self.assertIsNotNone(jobs.claim_next('worker-1'))
+        self.assertIsNone(jobs.claim_next('worker-2'))
+
+    def test_interleaved_same_name_claims_do_not_overlap(self):
+        jobs.enqueue('tests.record', dedup_key='first')
+        jobs.enqueue('tests.record', dedup_key='second')
+        lock_job_name = jobs._lock_job_name
+        interleaved = {}
+
+        def claim_in_between(name):
+            # worker-1 claims after worker-2 listed its candidates and before
+            # worker-2 takes the name lock and updates its candidate
+            if 'job' not in interleaved:
+                interleaved['job'] = None
+                interleaved['job'] = jobs.claim_next('worker-1')
+            lock_job_name(name)
+
+        with mock.patch.object(jobs, '_lock_job_name', side_effect=claim_in_between):
+            self.assertIsNone(jobs.claim_next('worker-2'))
+
+        self.assertEqual(interleaved['job'].locked_by, 'worker-1')
+        self.assertEqual(Job.objects.filter(status=Job.Status.RUNNING).count(), 1)
+
+    def test_expired_lease_is_reclaimed(self):
+        jobs.enqueue('tests.record')
+        jobs.claim_next('worker-1')
+        Job.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+
+        job = jobs.claim_next('worker-2')
+
+        self.assertEqual(job.locked_by, 'worker-2')
+        self.assertEqual(job.attempts, 2)
+
+    def test_command_job_captures_output(self):
+        jobs.register_command('tests.check', 'check')
+        jobs.enqueue('tests.check')
+
+        job = jobs.run_next('worker-1')
+
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertIn('no issues', job.result['output'])
+
+
+@override_settings(JOB_SCHEDULES={'record': {'job': 'tests.record', 'interval': 600, 'kwargs': {'value': 'scheduled'}}})
+class JobScheduleTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_due_schedule_is_enqueued_once_per_interval(self):
+        now = timezone.now()
+
+        first = jobs.enqueue_due_schedules(now)
+        again = jobs.enqueue_due_schedules(now + timedelta(minutes=1))
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual(first[0].kwargs, {'value': 'scheduled'})
+        self.assertEqual(again, [])
+        schedule = JobSchedule.objects.get(name='record')
+        self.assertEqual(schedule.next_run_at, now + timedelta(seconds=600))
+
+    def test_schedule_does_not_overlap_active_run(self):
+        now = timezone.now()
+        job = jobs.enqueue_due_schedules(now)[0]
+        jobs.claim_next('worker-1')
+
+        next_run = jobs.enqueue_due_schedules(now + timedelta(minutes=11))
+
+        self.assertEqual([queued.pk for queued in next_run], [job.pk])
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_run_worker_once_runs_scheduled_jobs(self):
+        out = StringIO()
+
+        call_command('run_worker', '--once', stdout=out)
+
+        self.assertEqual(calls, ['scheduled'])
+        self.assertIn('[OK] tests.record', out.getvalue())
+        self.assertIn('Jobs: 1 succeeded, 0 failed', out.getvalue())
+
+
+class RunWorkerCommandTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    @override_settings(JOB_SCHEDULES={})
+    def test_enqueue_option_runs_job(self):
+        out = StringIO()
+
+        call_command('run_worker', '--once', '--enqueue', 'tests.record', stdout=out)
+
+        self.assertEqual(calls, [None])
+        self.assertEqual(Job.objects.get().status, Job.Status.SUCCEEDED)
+
+    def test_list_shows_registered_jobs(self):
+        out = StringIO()
+
+        call_command('run_worker', '--list', stdout=out)
+
+        names = out.getvalue().split()
+        for name in ('nba.sync_players', 'process_game_outcomes', 'process_dbb_results', 'send_reminder_emails'):
+            self.assertIn(name, names)
@@ -0,0 +1,155 @@
+"""Tests for the durable email outbox and the mail dispatcher command."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from hooptipp.email_verification import send_verification_email
+from hooptipp.mail_outbox import dispatch_pending, queue_mail, _retry_delay
+from hooptipp.models import OutboundEmail
+
+
+User = get_user_model()
+
+
+class QueueMailImmediateModeTests(TestCase):
+    """With the outbox disabled, queued mail is delivered right away."""
+
+    def test_queue_mail_sends_immediately_and_records_row(self):
+        email = queue_mail(
+            subject='Hello',
+            message='Body',
+            recipient_list=['a@example.com'],
+            html_message='<p>Body</p>',
+        )
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['a@example.com'])
+        self.assertEqual(mail.outbox[0].alternatives[0][1], 'text/html')
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.SENT)
+        self.assertEqual(email.attempts, 1)
+        self.assertIsNotNone(email.sent_at)
+
+    def test_idempotency_key_deduplicates(self):
+        queue_mail(subject='A', message='B', recipient_list=['a@example.com'], idempotency_key='same')
+        queue_mail(subject='A', message='B', recipient_list=['a@example.com'], idempotency_key='same')
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+
+    def test_failed_immediate_delivery_raises_and_is_marked_failed(self):
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=ConnectionError('SES unavailable'),
+        ):
+            with self.assertRaises(ConnectionError):
+                queue_mail(subject='A', message='B', recipient_list=['a@example.com'])
+
+        # No dispatcher runs without the outbox, so the row is not left pending
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.Status.FAILED)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn('SES unavailable', email.last_error)
+        self.assertEqual(dispatch_pending().claimed, 0)
+
+
+@override_settings(EMAIL_OUTBOX_ENABLED=True)
+class QueueMailOutboxModeTests(TestCase):
+    """With the outbox enabled, callers only enqueue mail."""
+
+    def test_verification_email_is_only_queued(self):
+        user = User.objects.create_user(
+            username='newuser', email='new@example.com', password='pw12345678', is_active=False
+        )
+        send_verification_email(user, RequestFactory().get('/'))
+
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(email.recipients, ['new@example.com'])
+        self.assertTrue(email.idempotency_key.startswith(f'verify-email:{user.pk}:'))
+
+    def test_dispatch_pending_sends_batch(self):
+        for index in range(3):
+            queue_mail(subject=f'Mail {index}', message='Body', recipient_list=[f'u{index}@example.com'])
+
+        result = dispatch_pending(batch_size=2)
+
+        self.assertEqual(result.claimed, 2)
+        self.assertEqual(result.sent, 2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            OutboundEmail.objects.filter(status=OutboundEmail.Status.PENDING).count(),
+            1,
+        )
+
+    def test_dispatch_skips_emails_not_yet_due(self):
+        email = queue_mail(subject='Later', message='Body', recipient_list=['a@example.com'])
+        OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now() + timedelta(hours=1))
+
+        result = dispatch_pending()
+
+        self.assertEqual(result.claimed, 0)
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_failed_delivery_backs_off_then_gives_up(self):
+        email = queue_mail(subject='Flaky', message='Body', recipient_list=['a@example.com'])
+
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=ConnectionError('boom'),
+        ):
+            result = dispatch_pending()
+            self.assertEqual(result.retried, 1)
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+            OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+            result = dispatch_pending()
+            self.assertEqual(result.failed, 1)
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.FAILED)
+        self.assertEqual(email.attempts, 2)
+
+    def test_stale_sending_rows_are_reclaimed(self):
+        email = queue_mail(subject='Stuck', message='Body', recipient_list=['a@example.com'])
+        OutboundEmail.objects.filter(pk=email.pk).update(
+            status=OutboundEmail.Status.SENDING,
+            updated_at=timezone.now() - timedelta(hours=1),
+        )
+
+        result = dispatch_pending()
+
+        self.assertEqual(result.sent, 1)
+
+    def test_retry_delay_grows_exponentially_and_is_capped(self):
+        self.assertEqual(_retry_delay(1), timedelta(seconds=60))
+        self.assertEqual(_retry_delay(3), timedelta(seconds=240))
+        self.assertEqual(_retry_delay(50), timedelta(hours=6))
+
+    def test_run_mail_dispatcher_once_drains_outbox(self):
+        for index in range(3):
+            queue_mail(subject=f'Mail {index}', message='Body', recipient_list=[f'u{index}@example.com'])
+
+        out = StringIO()
+        call_command(
+            'run_mail_dispatcher',
+            '--once',
+            '--batch-size', '2',
+            '--backend', 'django.core.mail.backends.locmem.EmailBackend',
+            stdout=out,
+        )
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn('Sent: 3', out.getvalue())
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT).exists())
@@ -0,0 +1,83 @@
+"""Tests for the request metrics middleware and collectors."""
+
+import json
+
+from django.test import TestCase, modify_settings, override_settings
+
+from hooptipp.predictions.models import ImpressumSection
+from hooptipp.request_metrics import (
+    get_request_metrics,
+    record_cache_access,
+    start_request_metrics,
+    stop_request_metrics,
+    track_external_call,
+)
+
+
+@modify_settings(MIDDLEWARE={'prepend': 'hooptipp.middleware.RequestMetricsMiddleware'})
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        ImpressumSection.objects.create(caption='Kontakt', text='**Mail**', order_number=1)
+
+    def test_response_has_server_timing_header(self):
+        response = self.client.get('/api/impressum/')
+
+        self.assertEqual(response.status_code, 200)
+        header = response['Server-Timing']
+        self.assertIn('db;dur=', header)
+        self.assertIn('cache;desc=', header)
+        self.assertIn('total;dur=', header)
+        self.assertNotIn('desc="0 queries"', header)
+
+    def test_structured_log_line_is_emitted(self):
+        with self.assertLogs('hooptipp.request_metrics', level='INFO') as logs:
+            self.client.get('/api/impressum/')
+
+        message = logs.records[0].getMessage()
+        self.assertTrue(message.startswith('request_metrics '))
+        payload = json.loads(message[len('request_metrics '):])
+        self.assertEqual(payload['view'], 'predictions:impressum_api')
+        self.assertEqual(payload['status'], 200)
+        self.assertGreater(payload['sql_count'], 0)
+
+    @override_settings(REQUEST_QUERY_BUDGETS={'predictions:impressum_api': {'queries': 0}})
+    def test_exceeding_query_budget_logs_warning(self):
+        with self.assertLogs('hooptipp.request_metrics', level='WARNING') as logs:
+            self.client.get('/api/impressum/')
+
+        self.assertIn('Query budget exceeded for predictions:impressum_api', logs.output[0])
+
+    @override_settings(REQUEST_QUERY_BUDGETS={'predictions:impressum_api': {'queries': 1000}})
+    def test_request_within_budget_does_not_warn(self):
+        with self.assertLogs('hooptipp.request_metrics', level='INFO') as logs:
+            self.client.get('/api/impressum/')
+
+        self.assertFalse(any(record.levelname == 'WARNING' for record in logs.records))
+
+
+class RequestMetricsCollectorTests(TestCase):
+    def test_helpers_are_noops_outside_a_request(self):
+        self.assertIsNone(get_request_metrics())
+        record_cache_access(True)
+        with track_external_call('slapi'):
+            pass
+        self.assertIsNone(get_request_metrics())
+
+    def test_collector_records_cache_and_external_calls(self):
+        metrics, token = start_request_metrics()
+        try:
+            record_cache_access(True)
+            record_cache_access(False)
+            record_cache_access(False)
+            with track_external_call('balldontlie'):
+                pass
+            with track_external_call('balldontlie'):
+                pass
+        finally:
+            stop_request_metrics(token)
+
+        self.assertEqual(metrics.cache_hits, 1)
+        self.assertEqual(metrics.cache_misses, 2)
+        self.assertEqual(metrics.external_calls, {'balldontlie': 2})
+        self.assertIn('balldontlie;dur=', metrics.server_timing(0.01))
+        self.assertIsNone(get_request_metrics())